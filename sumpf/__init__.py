@@ -18,5 +18,10 @@
 
 # pylint: disable=wildcard-import;    wildcard imports shall be allowed here, since all submodules have their __all__-variables defined
 
+from . import config
+
 from ._data import *
 from ._blocks import *
+
+from . import parallel
+from .parallel import load_many, save_many
@@ -19,9 +19,12 @@
 network.
 """
 
+from ._assemble import *
 from ._concatenate import *
+from ._iir import *
 from ._merge_signals import *
 from ._merge_spectrums import *
+from ._stft import *
 
 try:
     from ._jack import *
@@ -0,0 +1,99 @@
+# This file is a part of the "SuMPF" package
+# Copyright (C) 2018-2019 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Contains the :class:`~sumpf.SignalAssembler` class."""
+
+import connectors
+import sumpf
+import sumpf._internal as sumpf_internal
+
+__all__ = ("SignalAssembler",)
+
+
+class SignalAssembler:
+    """Assembles a signal from blocks, like the ones from :meth:`sumpf.Signal.blocks`.
+
+    The channels of the assembled signal are allocated once, when the first block
+    is added, with the precision of that block's samples. Each added block is added to the samples at the position,
+    that is defined by the block's offset, so that overlapping blocks are overlap-added.
+    Samples of the blocks, that are outside the assembled signal, are cropped.
+    Blocks with a single channel are added to all channels of the assembled signal.
+
+    >>> import numpy, sumpf
+    >>> signal = sumpf.Signal(channels=numpy.array([(1.0, 2.0, 3.0, 4.0, 5.0)]))
+    >>> assembler = sumpf.SignalAssembler(length=signal.length())
+    >>> for block in signal.blocks(block_length=2):
+    ...     _ = assembler.add(block * 2.0)
+    >>> assembler.output().channels()
+    array([[ 2.,  4.,  6.,  8., 10.]])
+
+    The methods of this class are enhanced with the functionality of the *Connectors*
+    package, so that instances of this class can be connected in a processing network.
+    """
+
+    def __init__(self, length, number_of_channels=1, sampling_rate=48000.0, offset=0, labels=None):
+        """
+        :param length: the number of samples per channel of the assembled signal
+        :param number_of_channels: the number of channels of the assembled signal
+        :param sampling_rate: the sampling rate of the assembled signal
+        :param offset: the offset of the assembled signal, which is the position
+                       of its first sample on the same scale as the offsets of the blocks
+        :param labels: a sequence of string labels for the channels
+        """
+        self.__shape = (number_of_channels, length)
+        self.__channels = None
+        self.__sampling_rate = sampling_rate
+        self.__offset = offset
+        self.__labels = labels
+
+    @connectors.Output()
+    def output(self):
+        """Returns the assembled signal.
+
+        The channels of the returned signal are not copied, so that they are modified,
+        when further blocks are added. If no block has been added yet, the channels
+        are allocated with the default precision (see :attr:`sumpf.config.precision`).
+
+        :returns: a :class:`~sumpf.Signal` instance
+        """
+        if self.__channels is None:
+            self.__allocate(sumpf_internal.float_dtype())
+        return sumpf.Signal(channels=self.__channels,
+                            sampling_rate=self.__sampling_rate,
+                            offset=self.__offset,
+                            labels=self.__labels)
+
+    @connectors.Input("output")
+    def add(self, block):
+        """Adds the samples of the given block to the assembled signal.
+
+        :param block: a :class:`~sumpf.Signal` instance
+        """
+        if self.__channels is None:
+            self.__allocate(block.channels().dtype)
+        start = block.offset() - self.__offset
+        stop = start + block.length()
+        length = self.__channels.shape[1]
+        if stop > 0 and start < length:
+            self.__channels[:, max(start, 0):min(stop, length)] += block.channels()[:, max(-start, 0):min(length - start, block.length())]
+
+    def __allocate(self, dtype):
+        """Allocates the channels of the assembled signal and sets them to zero.
+
+        :param dtype: the data type of the channels
+        """
+        self.__channels = sumpf_internal.allocate_array(shape=self.__shape, dtype=dtype)
+        self.__channels[:] = 0.0
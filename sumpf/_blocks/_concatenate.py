@@ -17,7 +17,6 @@
 """Contains the :class:`~sumpf.ConcatenateSignals` class."""
 
 import connectors
-import numpy
 import sumpf
 import sumpf._internal as sumpf_internal
 
@@ -70,7 +69,9 @@ class ConcatenateSignals:
             # allocate an array for the concatenated channels
             offset = min(i[0] for i in indices)
             length = max(i[1] for i in indices) - offset
-            channels = sumpf_internal.allocate_array(shape=(number_of_channels, length), dtype=numpy.float64)
+            precision = sumpf_internal.get_precision(*(i[2] for i in indices))
+            dtype = sumpf_internal.float_dtype(precision)
+            channels = sumpf_internal.allocate_array(shape=(number_of_channels, length), dtype=dtype)
             # copy the first signal
             start, stop, signal_channels = indices[0]
             start -= offset
@@ -0,0 +1,137 @@
+# This file is a part of the "SuMPF" package
+# Copyright (C) 2018-2019 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Contains the :class:`~sumpf.IIRProcessor` class."""
+
+import numpy
+import sumpf
+import sumpf._internal as sumpf_internal
+
+__all__ = ("IIRProcessor",)
+
+
+class IIRProcessor:
+    """Applies a :class:`~sumpf.Filter` to a signal, that is passed in chunks of
+    arbitrary length, as a digital IIR filter in second order sections.
+
+    The filter is converted with the bilinear transform (see :meth:`~sumpf.Filter.second_order_sections`),
+    when this instance is created. The internal states of the IIR filters are
+    kept between the chunks, so that the concatenated results are the same as
+    the result of filtering the concatenated chunks.
+
+    If the filter has only one channel, it is applied to all channels of the
+    signal. If the signal has only one channel, it is filtered with each channel
+    of the filter. Otherwise, the channels of the filter and the signal are paired
+    and surplus channels of the signal are copied to the output without filtering.
+
+    This class requires :mod:`scipy` to be installed.
+
+    >>> import numpy
+    >>> import sumpf
+    >>> signal = sumpf.GaussianNoise(length=1000)
+    >>> processor = sumpf.IIRProcessor(sumpf.ButterworthFilter(cutoff_frequency=1000.0), sampling_rate=48000.0)
+    >>> blocks = [processor.process(block) for block in signal.blocks(block_length=250)]
+    >>> whole = sumpf.ButterworthFilter(cutoff_frequency=1000.0).apply(signal, method="iir")
+    >>> numpy.allclose(numpy.concatenate([b.channels() for b in blocks], axis=1), whole.channels())
+    True
+    """
+
+    def __init__(self, filter_, sampling_rate=48000.0):
+        """
+        :param filter_: the :class:`~sumpf.Filter`, whose transfer functions are
+                        rational functions of ``s`` (see :meth:`~sumpf.Filter.second_order_sections`)
+        :param sampling_rate: the sampling rate of the signals, that shall be filtered
+        :raises ValueError: if the filter cannot be converted to IIR filters
+        """
+        self.__sampling_rate = sampling_rate
+        self.__sections = filter_.second_order_sections(sampling_rate)
+        self.__states = None
+
+    def sampling_rate(self):
+        """Returns the sampling rate of the signals, that can be filtered with this instance.
+
+        :returns: a float
+        """
+        return self.__sampling_rate
+
+    def process(self, signal):
+        """Filters the given chunk of a signal. The chunks are assumed to be consecutive,
+        so the filtering continues with the states of the IIR filters after the
+        previous chunk.
+
+        :param signal: a :class:`~sumpf.Signal`
+        :returns: the filtered :class:`~sumpf.Signal` with the same offset and
+                  labels as the given one
+        :raises ValueError: if the sampling rate of the signal does not match that
+                            of this instance
+        """
+        import scipy.signal
+        if signal.sampling_rate() != self.__sampling_rate:
+            raise ValueError(f"The signal's sampling rate ({signal.sampling_rate()}) does not match "
+                             f"that of the IIR filter ({self.__sampling_rate})")
+        channels = signal.channels()
+        sections = self.__sections
+        if len(sections) == 1:
+            number_of_channels = len(channels)
+        elif len(channels) == 1:
+            number_of_channels = len(sections)
+        else:
+            number_of_channels = len(channels)
+        dtype = channels.dtype if channels.dtype in (numpy.float32, numpy.float64) else numpy.float64
+        output = sumpf_internal.allocate_array(shape=(number_of_channels, signal.length()), dtype=dtype)
+        if signal.length() == 0:
+            pass    # an empty chunk neither produces output nor changes the states of the filters
+        elif len(sections) == 1:
+            # vectorize the filtering of all channels with the same filter
+            states = self.__get_states(shape=(len(sections[0]), number_of_channels, 2))
+            output[:], self.__states = scipy.signal.sosfilt(sections[0], channels, axis=1, zi=states)
+        else:
+            states = self.__get_states(shape=(min(number_of_channels, len(sections)),))
+            for i, (s, z) in enumerate(zip(sections, states)):
+                channel = channels[0] if len(channels) == 1 else channels[i]
+                output[i], states[i] = scipy.signal.sosfilt(s, channel, zi=z)
+            output[len(states):] = channels[len(states):]
+        return sumpf.Signal(channels=output,
+                            sampling_rate=signal.sampling_rate(),
+                            offset=signal.offset(),
+                            labels=signal.labels())
+
+    def reset(self):
+        """Resets the states of the IIR filters, so that this instance can be
+        used to filter another signal.
+        """
+        self.__states = None
+
+    def __get_states(self, shape):
+        """Returns the states of the IIR filters and initializes them with zeros,
+        if this is the first chunk, that is filtered.
+
+        :param shape: the shape of the states array, if the filter has only one
+                      channel, or a one-tuple with the number of filtered channels
+                      otherwise
+        :returns: either an array or a list of arrays with the states
+        """
+        if self.__states is None:
+            if len(self.__sections) == 1:
+                self.__states = numpy.zeros(shape)
+            else:
+                self.__states = [numpy.zeros((len(s), 2)) for s in self.__sections[0:shape[0]]]
+        elif len(self.__sections) == 1:
+            if self.__states.shape != shape:
+                raise ValueError("The number of channels of the signal has changed since the previous chunk")
+        elif len(self.__states) != shape[0]:
+            raise ValueError("The number of channels of the signal has changed since the previous chunk")
+        return self.__states
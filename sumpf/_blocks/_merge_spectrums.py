@@ -17,7 +17,6 @@
 """Contains the :class:`~sumpf.MergeSpectrums` class"""
 
 import connectors
-import numpy
 import sumpf
 import sumpf._internal as sumpf_internal
 
@@ -59,7 +58,9 @@ class MergeSpectrums:
             # find the number of channels and the merged spectrum's length
             number_of_channels = sum(len(s) for s in self.__spectrums.values())
             length = max(s.length() for s in self.__spectrums.values())
-            channels = sumpf_internal.allocate_array(shape=(number_of_channels, length), dtype=numpy.complex128)
+            precision = sumpf_internal.get_precision(*(s.channels() for s in self.__spectrums.values()))
+            dtype = sumpf_internal.complex_dtype(precision)
+            channels = sumpf_internal.allocate_array(shape=(number_of_channels, length), dtype=dtype)
             labels = [""] * number_of_channels
             # fill in the data
             if self.__mode == MergeSpectrums.modes.FIRST_DATASET_FIRST:
@@ -0,0 +1,340 @@
+# This file is a part of the "SuMPF" package
+# Copyright (C) 2018-2019 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Contains the :class:`~sumpf.StreamingSTFT` and :class:`~sumpf.StreamingISTFT` classes."""
+
+import math
+import numpy
+import sumpf
+import sumpf._internal as sumpf_internal
+
+__all__ = ("StreamingSTFT", "StreamingISTFT")
+
+
+class StreamingSTFT:
+    """Computes a short time Fourier transform of a signal, that is passed in chunks
+    of arbitrary length, like the blocks of a live recording or of a file, that
+    is read piece by piece.
+
+    The frames of the spectrogram are returned, as soon as all of their samples
+    have been passed. The samples, that are needed for the next frames, are kept
+    internally. The results are identical to those of the :meth:`~sumpf.Signal.short_time_fourier_transform`
+    method of the concatenated chunks.
+
+    This class requires :mod:`scipy` to be installed.
+
+    >>> import sumpf
+    >>> signal = sumpf.SineWave(length=1000)
+    >>> stft = sumpf.StreamingSTFT(window=64)
+    >>> frames = [stft.process(block) for block in signal.blocks(block_length=250)]
+    >>> frames.append(stft.flush())
+    >>> [f.length() for f in frames]
+    [7, 8, 8, 8, 2]
+    >>> signal.short_time_fourier_transform(window=64).length()
+    33
+    """
+
+    def __init__(self, window=4096, overlap=0.5, pad=True):
+        """
+        :param window: the window function, that is used to segment the signal.
+                       It can be passed as a :class:`~sumpf.Signal`, as an iterable
+                       or an integer window length. See :func:`~sumpf._internal._functions.get_window`
+                       for details.
+        :param overlap: the overlap of the signal segments. It can be passed as
+                        an integer number of samples or a float fraction of the
+                        window's length. Negative numbers will be added to the
+                        window's length.
+        :param pad: True, if the signal shall be padded with zeros to fit an integer
+                    number of segments. False, if the samples at the end of the
+                    signal, that do not fit a full segment, shall be ignored.
+        """
+        self.__window = window
+        self.__overlap = overlap
+        self.__pad = pad
+        self.__state = None
+
+    def process(self, chunk):
+        """Adds a chunk of the signal and returns the frames of the spectrogram,
+        that have been completed by it. The chunks are assumed to be consecutive,
+        so only the offset of the first chunk after the creation of this instance
+        or after a call of :meth:`flush` is taken into account.
+
+        :param chunk: a :class:`~sumpf.Signal` instance
+        :returns: a :class:`~sumpf.Spectrogram`, which may have zero frames
+        """
+        if self.__state is None:
+            self.__state = _STFTState(chunk, self.__window, self.__overlap, self.__pad)
+        state = self.__state
+        state.length += chunk.length()
+        state.buffer = numpy.concatenate((state.buffer, chunk.channels()), axis=1)
+        return self.__frames()
+
+    def flush(self):
+        """Returns the remaining frames of the spectrogram, which are padded with
+        zeros, if this instance has been created with ``pad=True``, and resets
+        this instance, so that it can be used for another signal.
+
+        :returns: a :class:`~sumpf.Spectrogram`, which may have zero frames
+        """
+        state = self.__state
+        if state is None:
+            return sumpf.Spectrogram()
+        if self.__pad:
+            extension = state.window_length // 2
+            extended_length = state.length + 2 * extension
+            extension += (-(extended_length - state.window_length) % state.step) % state.window_length
+            zeros = numpy.zeros(shape=(len(state.buffer), extension), dtype=state.buffer.dtype)
+            state.buffer = numpy.concatenate((state.buffer, zeros), axis=1)
+        frames = self.__frames()
+        self.__state = None
+        return frames
+
+    def __frames(self):
+        """Transforms the completed frames in the buffer and removes the samples
+        from it, that are not needed anymore.
+        """
+        import scipy.signal
+        state = self.__state
+        window_channels = state.window.channels()
+        number_of_frames = max(0, (state.buffer.shape[1] - state.window_length) // state.step + 1)
+        if number_of_frames:
+            segment = state.buffer[:, 0:state.window_length + (number_of_frames - 1) * state.step]
+            if len(window_channels) == 1:
+                stft = scipy.signal.stft(segment,
+                                         fs=state.sampling_rate,
+                                         window=window_channels[0],
+                                         nperseg=state.window_length,
+                                         noverlap=state.overlap,
+                                         boundary=None,
+                                         padded=self.__pad)[2]
+            else:
+                stft = []
+                for c, w in zip(segment, window_channels):
+                    stft.append(scipy.signal.stft(c,
+                                                  fs=state.sampling_rate,
+                                                  window=w,
+                                                  nperseg=state.window_length,
+                                                  noverlap=state.overlap,
+                                                  boundary=None,
+                                                  padded=self.__pad)[2])
+            shape = numpy.shape(stft)
+            state.buffer = state.buffer[:, number_of_frames * state.step:].copy()
+        else:
+            shape = (state.number_of_channels, state.window_length // 2 + 1, 0)
+        channels = sumpf_internal.allocate_array(shape=shape, dtype=state.dtype)
+        if number_of_frames:
+            channels[:] = stft
+            if state.compensation is not None:
+                for c in channels:
+                    t = c.transpose()
+                    t *= state.compensation
+        spectrogram = sumpf.Spectrogram(channels=channels,
+                                        resolution=state.sampling_rate / state.window_length,
+                                        sampling_rate=state.sampling_rate / state.step,
+                                        offset=state.offset,
+                                        labels=state.labels)
+        state.offset += number_of_frames
+        return spectrogram
+
+
+class StreamingISTFT:
+    """Computes an inverse short time Fourier transform of a spectrogram, that
+    is passed in chunks of frames, like the ones, that are returned by a
+    :class:`~sumpf.StreamingSTFT`.
+
+    The samples of the signal are returned, as soon as all frames, that overlap
+    with them, have been passed. The results are identical to those of the
+    :meth:`~sumpf.Spectrogram.inverse_short_time_fourier_transform` method of
+    the concatenated chunks.
+
+    This class requires :mod:`scipy` to be installed.
+    """
+
+    def __init__(self, window=4096, overlap=0.5, pad=True):
+        """
+        :param window: the window function, that was used to compute the spectrogram.
+                       It can be passed as a :class:`~sumpf.Signal`, as an iterable
+                       or an integer window length. See :func:`~sumpf._internal._functions.get_window`
+                       for details.
+        :param overlap: the overlap of the windowed segments. It can be passed as
+                        an integer number of samples or a float fraction of the
+                        window's length. Negative numbers will be added to the
+                        window's length.
+        :param pad: True, if the signal was padded with zeros to fit an integer
+                    number of segments. False, if the samples at the end of the
+                    signal, that did not fit a full segment, were ignored.
+        """
+        self.__window = window
+        self.__overlap = overlap
+        self.__pad = pad
+        self.__state = None
+
+    def process(self, chunk):
+        """Adds a chunk of frames of the spectrogram and returns the samples of
+        the signal, that have been completed by it. The chunks are assumed to be
+        consecutive, so only the offset of the first chunk after the creation of
+        this instance or after a call of :meth:`flush` is taken into account.
+
+        :param chunk: a :class:`~sumpf.Spectrogram` instance
+        :returns: a :class:`~sumpf.Signal`, which may have zero samples
+        """
+        import scipy.fft
+        if self.__state is None:
+            self.__state = _ISTFTState(chunk, self.__window, self.__overlap, self.__pad)
+        state = self.__state
+        number_of_frames = chunk.length()
+        if number_of_frames:
+            window_channels = state.window.channels()
+            spectrogram = chunk.channels() + 0j
+            frequencies = spectrogram.shape[1]
+            if state.window_length == 2 * (frequencies - 1) + 1:
+                n = state.window_length
+            else:
+                n = 2 * (frequencies - 1)
+            if len(window_channels) == 1:
+                groups = [(spectrogram, window_channels[0])]
+            else:
+                groups = list(zip(spectrogram, window_channels))
+            samples = []
+            for i, (z, w) in enumerate(groups):
+                segments = scipy.fft.irfft(z, axis=-2, n=n)[..., :state.window_length, :]
+                if numpy.result_type(w, segments) != segments.dtype:
+                    w = w.astype(segments.dtype)
+                segments *= w.sum()
+                # overlap-add the segments to the samples, that have been kept from the previous chunk
+                length = state.overlap + number_of_frames * state.step
+                x = numpy.zeros(list(z.shape[:-2]) + [length], dtype=segments.dtype)
+                norm = numpy.zeros(length, dtype=segments.dtype)
+                if state.tails[i] is not None:
+                    x[..., 0:state.overlap], norm[0:state.overlap] = state.tails[i]
+                for ii in range(number_of_frames):
+                    x[..., ii * state.step:ii * state.step + state.window_length] += segments[..., ii] * w
+                    norm[ii * state.step:ii * state.step + state.window_length] += w ** 2
+                completed = number_of_frames * state.step
+                state.tails[i] = (x[..., completed:].copy(), norm[completed:].copy())
+                x = x[..., 0:completed]
+                x /= numpy.where(norm[0:completed] > 1e-10, norm[0:completed], 1.0)
+                samples.append(x.real)
+            state.append(samples)
+        return self.__samples(final=False)
+
+    def flush(self):
+        """Returns the remaining samples of the signal and resets this instance,
+        so that it can be used for another spectrogram.
+
+        :returns: a :class:`~sumpf.Signal`, which may have zero samples
+        """
+        state = self.__state
+        if state is None:
+            return sumpf.Signal()
+        if state.tails[0] is not None:
+            samples = []
+            for x, norm in state.tails:
+                x /= numpy.where(norm > 1e-10, norm, 1.0)
+                samples.append(x.real)
+            state.append(samples)
+        signal = self.__samples(final=True)
+        self.__state = None
+        return signal
+
+    def __samples(self, final):
+        """Returns the completed samples, except for those, which are cropped at
+        the beginning and the end of the signal, if it was padded.
+        """
+        state = self.__state
+        stop = max(state.pending.shape[1] - state.crop, 0)
+        start = min(state.skip, stop)
+        state.skip -= start
+        channels = sumpf_internal.allocate_array(shape=(len(state.pending), stop - start), dtype=state.dtype)
+        channels[:] = state.pending[:, start:stop]
+        state.pending = state.pending[:, stop:]
+        if final:
+            state.pending = state.pending[:, 0:0]
+        signal = sumpf.Signal(channels=channels,
+                              sampling_rate=state.sampling_rate,
+                              offset=state.offset,
+                              labels=state.labels)
+        state.offset += stop - start
+        return signal
+
+
+class _STFTState:
+    """Helper class for the internal state of a :class:`~sumpf.StreamingSTFT`."""
+
+    def __init__(self, chunk, window, overlap, pad):
+        self.sampling_rate = chunk.sampling_rate()
+        self.window = sumpf_internal.get_window(window=window,
+                                                overlap=overlap,
+                                                symmetric=False,
+                                                sampling_rate=self.sampling_rate)
+        self.window_length = self.window.length()
+        self.overlap = sumpf_internal.index(overlap, self.window_length)
+        self.step = self.window_length - self.overlap
+        self.number_of_channels = _number_of_channels(chunk, self.window)
+        self.labels = chunk.labels()
+        self.dtype = sumpf_internal.complex_dtype(sumpf_internal.get_precision(chunk.channels()))
+        self.length = 0
+        if pad:
+            self.buffer = numpy.zeros(shape=(len(chunk), self.window_length // 2), dtype=chunk.channels().dtype)
+        else:
+            self.buffer = numpy.empty(shape=(len(chunk), 0), dtype=chunk.channels().dtype)
+        # deal with the offset like the short_time_fourier_transform method of the Signal class
+        self.offset = int(round(chunk.offset() / self.step))
+        offset_remainder = chunk.offset() - (self.offset * self.step)
+        if offset_remainder:
+            max_frequency = (self.window_length - 1) * (self.sampling_rate / self.window_length)
+            self.compensation = numpy.linspace(0.0, max_frequency, self.window_length // 2 + 1, dtype=numpy.complex128)
+            self.compensation *= -1j * 2.0 * math.pi * (offset_remainder / self.sampling_rate)
+            numpy.exp(self.compensation, out=self.compensation)
+        else:
+            self.compensation = None
+
+
+class _ISTFTState:
+    """Helper class for the internal state of a :class:`~sumpf.StreamingISTFT`."""
+
+    def __init__(self, chunk, window, overlap, pad):
+        self.window = sumpf_internal.get_window(window=window,
+                                                overlap=overlap,
+                                                symmetric=False,
+                                                sampling_rate=chunk.sampling_rate())
+        self.window_length = self.window.length()
+        self.overlap = sumpf_internal.index(overlap, self.window_length)
+        self.step = self.window_length - self.overlap
+        self.sampling_rate = chunk.sampling_rate() * self.step
+        self.offset = chunk.offset() * self.step
+        self.labels = chunk.labels()
+        self.dtype = sumpf_internal.float_dtype(sumpf_internal.get_precision(chunk.channels()))
+        number_of_channels = _number_of_channels(chunk, self.window)
+        self.tails = [None] * (1 if len(self.window) == 1 else number_of_channels)   # the samples and the normalization of the last frames, to which the next frames are added
+        self.pending = numpy.empty(shape=(number_of_channels, 0), dtype=self.dtype)
+        self.skip = self.window_length // 2 if pad else 0   # the number of samples, that are cropped at the beginning
+        self.crop = self.window_length // 2 if pad else 0   # the number of samples, that are cropped at the end
+
+    def append(self, samples):
+        """Appends the samples, that have been completed, to the pending samples."""
+        if len(self.window) == 1:
+            self.pending = numpy.concatenate((self.pending, samples[0]), axis=1)
+        else:
+            self.pending = numpy.concatenate((self.pending, numpy.array(samples)), axis=1)
+
+
+def _number_of_channels(data, window):
+    """Returns the number of channels of a transform of the given data set with the given window."""
+    if len(window) == 1:
+        return len(data)
+    else:
+        return min(len(data), len(window))
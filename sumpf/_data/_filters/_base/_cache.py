@@ -0,0 +1,195 @@
+# This file is a part of the "SuMPF" package
+# Copyright (C) 2018-2019 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Contains a cache for the sampled transfer functions of filters."""
+
+import collections
+import hashlib
+import threading
+import numpy
+import sumpf
+from ._terms._base import Term
+
+__all__ = ("SpectrumCache", "structural_key")
+
+
+class SpectrumCache:
+    """A least recently used cache for the sampled transfer functions of filters,
+    so that filters, which are sampled repeatedly with the same resolution and
+    length, only have to be evaluated once.
+
+    The entries are identified by the structure of the transfer functions (see
+    :func:`structural_key`) rather than by the filter instances, so that equal
+    filters, which have been created independently, share their entries. The
+    cached arrays are read-only, because they are shared by all spectrums, that
+    are returned for the same parameters.
+
+    The maximum number of entries is defined by :attr:`sumpf.config.filter_cache_size`
+    and the maximum number of bytes of their channels by :attr:`sumpf.config.filter_cache_bytes`.
+    """
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__entries = collections.OrderedDict()
+        self.__bytes = 0
+        self.__hits = 0
+        self.__misses = 0
+
+    def get(self, key):
+        """Returns the cached channels for the given key.
+
+        :param key: a tuple of the structural key of the transfer functions and
+                    the parameters of the sampling
+        :returns: a read-only two-dimensional :func:`numpy.array` or None, if
+                  nothing is cached for the given key
+        """
+        with self.__lock:
+            channels = self.__entries.get(key)
+            if channels is None:
+                self.__misses += 1
+            else:
+                self.__hits += 1
+                self.__entries.move_to_end(key)
+            return channels
+
+    def store(self, key, channels):
+        """Makes the given channels read-only and stores them in the cache. If
+        the cache is full, the least recently used entries are removed. If the
+        cache size is zero or if the entry is larger than the cache's limit for
+        the number of bytes, nothing is stored and the channels remain writable.
+        The size of an entry is the number of bytes of its channels and of the
+        hashes in its key.
+
+        :param key: a tuple of the structural key of the transfer functions and
+                    the parameters of the sampling
+        :param channels: a two-dimensional :func:`numpy.array` with the sampled transfer functions
+        """
+        size = sumpf.config.filter_cache_size
+        limit = sumpf.config.filter_cache_bytes
+        entry_size = _entry_size(key, channels)
+        with self.__lock:
+            if size > 0 and entry_size <= limit:
+                channels.flags.writeable = False
+                self.__bytes -= self.__remove(key)
+                self.__entries[key] = channels
+                self.__bytes += entry_size
+            while self.__entries and (len(self.__entries) > size or self.__bytes > limit):
+                removed = self.__entries.popitem(last=False)
+                self.__bytes -= _entry_size(*removed)
+
+    def invalidate(self, filter_):
+        """Removes the cached entries for the given filter.
+
+        :param filter_: a :class:`~sumpf.Filter` instance
+        """
+        key = structural_key(filter_.transfer_functions())
+        with self.__lock:
+            for k in [k for k in self.__entries if k[0] == key]:
+                self.__bytes -= self.__remove(k)
+
+    def clear(self):
+        """Removes all entries from the cache."""
+        with self.__lock:
+            self.__entries.clear()
+            self.__bytes = 0
+
+    def statistics(self):
+        """Returns the statistics about the usage of this cache.
+
+        :returns: a dictionary with the number of requests, that have been served
+                  from the cache (``"hits"``), that required the evaluation of the
+                  transfer functions (``"misses"``), the number of cached spectrums
+                  (``"entries"``) and the number of bytes of their channels and keys (``"bytes"``)
+        """
+        with self.__lock:
+            return {"hits": self.__hits,
+                    "misses": self.__misses,
+                    "entries": len(self.__entries),
+                    "bytes": self.__bytes}
+
+    def reset_statistics(self):
+        """Sets the numbers of hits and misses to zero."""
+        with self.__lock:
+            self.__hits = 0
+            self.__misses = 0
+
+    def __remove(self, key):
+        """Removes the entry for the given key, if it exists. This method must be
+        called, while the lock is acquired.
+
+        :param key: the key of the entry
+        :returns: the size of the removed entry or zero, if no entry has been removed
+        """
+        channels = self.__entries.pop(key, None)
+        if channels is None:
+            return 0
+        return _entry_size(key, channels)
+
+
+def _entry_size(key, channels):
+    """Returns the number of bytes, that an entry of the cache occupies.
+
+    :param key: a tuple of the structural key of the transfer functions and
+                the parameters of the sampling
+    :param channels: a two-dimensional :func:`numpy.array` with the sampled transfer functions
+    :returns: the number of bytes of the channels and of the hashes in the key
+    """
+    return channels.nbytes + sum(len(k) for k in key[0])
+
+
+def structural_key(transfer_functions):
+    """Returns a key, which identifies the given transfer functions by their structure.
+    The key contains a hash for each transfer function, which is computed from
+    the types of its terms and all of their parameters, so that equal transfer
+    functions have equal keys. Arrays in the terms are hashed with their data
+    type and their raw bytes, so that their values are distinguished exactly
+    without formatting them as strings.
+
+    :param transfer_functions: a sequence of terms
+    :returns: a tuple of bytes objects
+    """
+    keys = []
+    for tf in transfer_functions:
+        digest = hashlib.sha256()
+        _hash_parameter(tf, digest)
+        keys.append(digest.digest())
+    return tuple(keys)
+
+
+def _hash_parameter(parameter, digest):
+    """Updates the given hash with a term or one of its parameters.
+
+    :param parameter: a term, an array, a sequence or a scalar parameter of a term
+    :param digest: a :mod:`hashlib` hash object
+    """
+    if isinstance(parameter, Term):
+        digest.update(f"<{type(parameter).__name__}".encode())
+        for name, value in sorted(vars(parameter).items()):  # the attributes of the terms are the parameters of their constructors
+            digest.update(f"{name}=".encode())
+            _hash_parameter(value, digest)
+        digest.update(b">")
+    elif isinstance(parameter, numpy.ndarray):
+        digest.update(f"[{parameter.dtype.str}{parameter.shape}".encode())
+        digest.update(numpy.ascontiguousarray(parameter).tobytes())
+        digest.update(b"]")
+    elif isinstance(parameter, (tuple, list)):
+        digest.update(b"(")
+        for p in parameter:
+            _hash_parameter(p, digest)
+            digest.update(b",")
+        digest.update(b")")
+    else:
+        digest.update(f"{parameter!r};".encode())
@@ -0,0 +1,337 @@
+# This file is a part of the "SuMPF" package
+# Copyright (C) 2018-2019 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Contains a compiler, that converts the term trees of transfer functions to
+flat programs, which evaluate the transfer functions with preallocated buffers."""
+
+import warnings
+import numpy
+from . import _terms as terms
+
+__all__ = ("Program", "BandsProgram", "compile_term", "compile_terms")
+
+
+class Program:
+    """A flat list of instructions, which evaluates a transfer function in place.
+
+    The instructions operate on a fixed set of registers, which are arrays with
+    the same shape as the frequency variable ``s``. The first register is the
+    array for the result, while the others are buffers for intermediate results.
+    The registers are reused, as soon as their intermediate results have been
+    consumed, so the number of buffers only depends on the nesting depth of the
+    term tree and not on its size.
+
+    The evaluation gives the same results as calling the term, because the
+    instructions are executed in the same order and with the same :mod:`numpy`
+    functions as in the recursive evaluation of the term tree.
+    """
+
+    def __init__(self, term):
+        """
+        :param term: the transfer function as a :class:`~sumpf._data._filters._base._terms._base.Term`
+        """
+        self.__instructions = []
+        self.__registers = 1    # the register for the result is always required
+        self.__free = []
+        self.__emit(term, target=0, transformed=False)
+        self.__free = None
+
+    def buffers(self):
+        """Returns the number of buffers for intermediate results, that have to
+        be passed to :meth:`__call__`.
+
+        :returns: an integer
+        """
+        return self.__registers - 1
+
+    def instructions(self):
+        """Returns the number of instructions of this program.
+
+        :returns: an integer
+        """
+        return len(self.__instructions)
+
+    def __call__(self, s, out, buffers=()):
+        """Evaluates the transfer function.
+
+        :param s: an :class:`sumpf._data._filters._base._s.S` instance
+        :param out: an array of complex values, in which the result shall be stored
+        :param buffers: a sequence of at least :meth:`buffers` arrays with the
+                        same shape and dtype as ``out``. If it is shorter, the
+                        missing buffers are allocated.
+        :returns: ``out``
+        """
+        registers = [out]
+        registers.extend(buffers[0:self.__registers - 1])
+        while len(registers) < self.__registers:
+            registers.append(numpy.empty_like(out))
+        for function, parameters in self.__instructions:
+            function(s, registers, *parameters)
+        return out
+
+    def __emit(self, term, target, transformed, out=True):
+        """Appends the instructions for evaluating the given term to the instruction list.
+
+        :param term: the :class:`~sumpf._data._filters._base._terms._base.Term`
+        :param target: the index of the register, in which the result shall be stored
+        :param transformed: True, if the term is evaluated for ``1 / s`` because of
+                            the lowpass-to-highpass transforms of its parent terms
+        :param out: True, if the recursive evaluation would pass an ``out`` array
+                    to the term, False if it would let the term allocate its result
+        :returns: True, if the recursive evaluation would return a real valued array,
+                  so that the following computations have to be done with the
+                  real parts of the registers in order to get the same results
+        """
+        own = transformed != term.transform    # whether this term is evaluated for 1 / s
+        if isinstance(term, terms.Constant):
+            self.__instructions.append((_fill, (target, own, term.value)))
+            real = not out and not numpy.iscomplexobj(term.value)
+        elif isinstance(term, terms.Polynomial):
+            self.__instructions.append((_polynomial, (target, own, numpy.asarray(term.coefficients))))
+            real = False
+        elif isinstance(term, terms.Exp):
+            self.__instructions.append((_exp, (target, own, term.coefficient)))
+            real = False
+        elif isinstance(term, terms.Absolute):
+            self.__emit(term.value, target, own, out)
+            self.__instructions.append((_absolute, (target,)))
+            real = not out
+        elif isinstance(term, terms.Negative):
+            real = self.__emit(term.value, target, own, out)
+            self.__instructions.append((_negative, (target, real)))
+        elif isinstance(term, terms.Sum):
+            real = self.__emit_operation(numpy.add, term.summands, target, own, out, accumulate=True)
+        elif isinstance(term, terms.Product):
+            real = self.__emit_operation(numpy.multiply, term.factors, target, own, out, accumulate=True)
+        elif isinstance(term, terms.Difference):
+            real = self.__emit_operation(numpy.subtract, (term.minuend, term.subtrahend), target, own, out, accumulate=False)
+        elif isinstance(term, terms.Quotient):
+            real = self.__emit_operation(_divide, (term.numerator, term.denominator), target, own, out, accumulate=False)
+        else:
+            # terms without a specialized instruction (like Bands) are called directly
+            self.__instructions.append((_call, (target, transformed, term)))
+            return False
+        self.__instructions.append((_fix, (target, own)))
+        return real
+
+    def __emit_operation(self, function, operands, target, transformed, out, accumulate):
+        """Appends the instructions for combining the given operands with a binary
+        function to the instruction list.
+
+        :param function: a :mod:`numpy` function with the signature ``function(a, b, out)``
+        :param operands: a sequence of terms, that shall be combined
+        :param target: the index of the register, in which the result shall be stored
+        :param transformed: True, if the operands are evaluated for ``1 / s``
+        :param out: True, if the recursive evaluation would pass an ``out`` array to the term
+        :param accumulate: True, if the recursive evaluation passes the ``out`` array
+                           to the first operand and accumulates the others in it
+                           (like in a sum), False, if it evaluates all operands
+                           without an ``out`` array (like in a quotient)
+        :returns: True, if the result would be a real valued array (see :meth:`__emit`)
+        """
+        if not operands:    # empty sums and products evaluate to zero
+            self.__instructions.append((_fill, (target, transformed, 0.0)))
+            return not out
+        real = self.__emit(operands[0], target, transformed, out and accumulate)
+        if len(operands) > 1:
+            if self.__free:
+                register = self.__free.pop()
+            else:
+                register = self.__registers
+                self.__registers += 1
+            for operand in operands[1:]:
+                real = self.__emit(operand, register, transformed, out=False) and real
+                self.__instructions.append((_combine, (function, target, register, real)))
+            self.__free.append(register)
+        return real and not out
+
+
+class BandsProgram:
+    """Evaluates the transfer functions of several channels, which are bands terms
+    with equal supporting points and equal interpolation and extrapolation functions,
+    in one pass. The channels share the interpolation plan for the frequencies
+    (see :class:`sumpf._internal.interpolation.Plan`), which is applied to a two-dimensional
+    array of the function values of all channels.
+
+    It has the same interface as a :class:`Program`, except for expecting a
+    two-dimensional array with a row for each channel as ``out``.
+    """
+
+    def __init__(self, bands):
+        """
+        :param bands: a sequence of :class:`~sumpf._data._filters._base._terms._primitive.Bands`
+                      terms with equal supporting points and flags
+        """
+        first = bands[0]
+        self.__xs = first.xs
+        self.__interpolation = first.interpolation
+        self.__extrapolation = first.extrapolation
+        self.__ys = numpy.array([b.ys for b in bands])
+
+    def buffers(self):  # pylint: disable=no-self-use; the method is required by the interface
+        """Returns the number of buffers for intermediate results, which is zero.
+
+        :returns: an integer
+        """
+        return 0
+
+    def instructions(self):     # pylint: disable=no-self-use; the method is required by the interface
+        """Returns the number of instructions of this program, which is one.
+
+        :returns: an integer
+        """
+        return 1
+
+    def __call__(self, s, out, buffers=()):     # pylint: disable=unused-argument; all programs have the same interface
+        """Evaluates the transfer functions.
+
+        :param s: an :class:`sumpf._data._filters._base._s.S` instance
+        :param out: a two-dimensional array of complex values, in which the results
+                    shall be stored
+        :param buffers: neglected, since no buffers are required
+        :returns: ``out``
+        """
+        if self.__xs.size:
+            s.interpolation_plan(self.__xs, self.__interpolation, self.__extrapolation)(self.__ys, out=out)
+        else:
+            out[:] = 0.0
+        for channel in out:
+            s.fix(channel)
+        return out
+
+
+def compile_term(term):
+    """Compiles the given transfer function to a :class:`Program`.
+
+    :param term: the transfer function as a :class:`~sumpf._data._filters._base._terms._base.Term`
+    :returns: a :class:`Program` instance
+    """
+    return Program(term)
+
+
+def compile_terms(transfer_functions):
+    """Compiles the transfer functions of a filter's channels. Consecutive bands
+    terms with equal supporting points and flags are compiled to a common
+    :class:`BandsProgram`, while the other transfer functions are compiled to
+    a :class:`Program` each.
+
+    :param transfer_functions: a sequence of :class:`~sumpf._data._filters._base._terms._base.Term` instances
+    :returns: a tuple of pairs of an index and a program. The index is either
+              an integer for the channel of a :class:`Program` or a :class:`slice`
+              for the channels of a :class:`BandsProgram`.
+    """
+    programs = []
+    start = 0
+    while start < len(transfer_functions):
+        stop = start + 1
+        term = transfer_functions[start]
+        if type(term) is terms.Bands:   # pylint: disable=unidiomatic-typecheck; subclasses might be evaluated differently
+            while stop < len(transfer_functions) and _same_supporting_points(term, transfer_functions[stop]):
+                stop += 1
+        if stop - start > 1:
+            programs.append((slice(start, stop), BandsProgram(transfer_functions[start:stop])))
+        else:
+            programs.append((start, Program(term)))
+        start = stop
+    return tuple(programs)
+
+
+def _same_supporting_points(bands, term):
+    """Returns, whether the given term is a bands term with the same supporting
+    points and flags as the given bands term. The function values must also have
+    the same data type, because real and complex values are interpolated differently."""
+    return (type(term) is terms.Bands and     # pylint: disable=unidiomatic-typecheck
+            term.interpolation is bands.interpolation and
+            term.extrapolation is bands.extrapolation and
+            term.xs.shape == bands.xs.shape and
+            term.ys.shape == bands.ys.shape and
+            term.ys.dtype == bands.ys.dtype and
+            numpy.array_equal(term.xs, bands.xs))
+
+
+################
+# instructions #
+################
+
+
+def _variable(s, transformed):
+    """Returns the manager for ``1 / s``, if ``transformed`` is True, or the given manager otherwise."""
+    if transformed:
+        return s.transform()
+    return s
+
+
+def _fill(s, registers, target, transformed, value):
+    """Fills a register with a constant value."""
+    _variable(s, transformed)()     # compute s like in the recursive evaluation, because this initializes the fix for 0Hz
+    registers[target][:] = value
+
+
+def _polynomial(s, registers, target, transformed, coefficients):
+    """Evaluates a polynomial of ``s`` with the same algorithm as :func:`numpy.polyval`."""
+    x = _variable(s, transformed)()
+    result = registers[target]
+    result[:] = 0.0
+    for c in coefficients:
+        numpy.multiply(result, x, out=result)
+        numpy.add(result, c, out=result)
+
+
+def _exp(s, registers, target, transformed, coefficient):
+    """Evaluates an exponential function of ``s``."""
+    result = registers[target]
+    numpy.multiply(coefficient, _variable(s, transformed)(), out=result)
+    numpy.exp(result, out=result)
+
+
+def _absolute(s, registers, target):    # pylint: disable=unused-argument; all instructions have the same signature
+    """Computes the magnitude of a register in place."""
+    numpy.absolute(registers[target], out=registers[target])
+
+
+def _negative(s, registers, target, real):  # pylint: disable=unused-argument; all instructions have the same signature
+    """Inverts the sign of a register in place."""
+    result = registers[target].real if real else registers[target]
+    numpy.negative(result, out=result)
+
+
+def _combine(s, registers, function, target, operand, real):    # pylint: disable=unused-argument; all instructions have the same signature
+    """Combines two registers with a binary function and stores the result in the first one.
+    If ``real`` is True, only the real parts of the registers are combined."""
+    if real:
+        function(registers[target].real, registers[operand].real, out=registers[target].real)
+    else:
+        function(registers[target], registers[operand], out=registers[target])
+
+
+def _divide(a, b, out):
+    """Divides two arrays without warnings about divisions by zero."""
+    with warnings.catch_warnings():
+        warnings.simplefilter(action="ignore", category=RuntimeWarning)
+        return numpy.divide(a, b, out=out)
+
+
+def _fix(s, registers, target, transformed):
+    """Replaces the invalid samples for 0Hz, if a lowpass-to-highpass transform
+    is involved (see :meth:`sumpf._data._filters._base._s.S.fix`)."""
+    _variable(s, transformed).fix(registers[target])
+
+
+def _call(s, registers, target, transformed, term):
+    """Evaluates a term by calling it."""
+    result = term(_variable(s, transformed), out=registers[target])
+    if result is not registers[target]:
+        registers[target][:] = result
@@ -20,6 +20,9 @@ import numpy
 import sumpf
 import sumpf._internal as sumpf_internal
 from ._s import S
+from . import _cache as cache
+from . import _compiler as compiler
+from . import _sos as sos
 from . import _terms as terms
 
 __all__ = ("Filter",)
@@ -118,6 +121,8 @@ class Filter:
 
     # supported file formats
     file_formats = sumpf_internal.filter_writers.FilterFormats  #: an enumeration with file formats, whose flags can be passed to :meth:`~sumpf.Filter.save`
+    application_methods = sumpf_internal.FilterApplicationMethod    #: an enumeration with methods for the :meth:`~sumpf.Filter.apply` method (see the :class:`~sumpf._internal._enums.FilterApplicationMethod` class).
+    spectrum_cache = cache.SpectrumCache()  #: the cache for the sampled transfer functions of :meth:`~sumpf.Filter.spectrum` (see the :class:`~sumpf._data._filters._base._cache.SpectrumCache` class)
 
     def __init__(self, transfer_functions=(Constant(1.0),), labels=("",)):
         """
@@ -126,6 +131,8 @@ class Filter:
         """
         self.__transfer_functions = transfer_functions
         self.__labels = sumpf_internal.sanitize_labels(labels=labels, number=len(transfer_functions))
+        self.__programs = None
+        self.__key = None
 
     ###########################################
     # overloaded operators (non math-related) #
@@ -310,12 +317,14 @@ class Filter:
                               labels=self.__labels)
         elif isinstance(other, sumpf.Spectrum):
             filter_ = self.spectrum(resolution=other.resolution(),
-                                    length=other.length())
+                                    length=other.length(),
+                                    precision=sumpf_internal.get_precision(other.channels()))
             return filter_ * other
         elif isinstance(other, sumpf.Signal):
             spectrum = other.fourier_transform()
             filter_ = self.spectrum(resolution=spectrum.resolution(),
-                                    length=spectrum.length())
+                                    length=spectrum.length(),
+                                    precision=sumpf_internal.get_precision(other.channels()))
             filtered = filter_ * spectrum
             return filtered.inverse_fourier_transform()
         else:
@@ -391,21 +400,188 @@ class Filter:
     # convenience methods #
     #######################
 
-    def spectrum(self, resolution, length):
+    def spectrum(self, resolution, length, precision=None):
         """Samples the transfer functions with the given resolution and given number
         of samples and returns the result as a spectrum.
 
+        The transfer functions are compiled to flat programs, when this method
+        is called for the first time, which evaluate them with a small and constant
+        number of buffers for intermediate results (see :class:`~sumpf._data._filters._base._compiler.Program`).
+        Channels with bands terms, that share their supporting points, are evaluated
+        in one pass (see :class:`~sumpf._data._filters._base._compiler.BandsProgram`).
+        The sampled transfer functions are cached in the :attr:`~sumpf.Filter.spectrum_cache`,
+        so that sampling equal filters with the same parameters again does not
+        require their evaluation. Therefore, the channels of the returned spectrum
+        are read-only, unless they are too large to be cached (see :attr:`sumpf.config.filter_cache_bytes`).
+
         :param resolution: the frequency resolution of the resulting spectrum
         :param length: the number of samples per channel of the resulting spectrum
+        :param precision: ``"single"`` or ``"double"`` for the precision of the
+                          resulting spectrum or None for the precision from
+                          :attr:`sumpf.config.precision`
         :returns: a :class:`~sumpf.Spectrum` instance
         """
-        frequencies = numpy.linspace(0.0, (length - 1) * resolution, length)
-        s = S(frequencies)
-        channels = sumpf_internal.allocate_array(shape=(len(self.__transfer_functions), length), dtype=numpy.complex128)
-        for tf, c in zip(self.__transfer_functions, channels):
-            tf(s, out=c)
+        dtype = sumpf_internal.complex_dtype(precision)
+        if self.__key is None:
+            self.__key = cache.structural_key(self.__transfer_functions)
+        key = (self.__key, resolution, length, dtype)
+        channels = Filter.spectrum_cache.get(key)
+        if channels is None:
+            frequencies = numpy.linspace(0.0, (length - 1) * resolution, length)
+            s = S(frequencies)
+            channels = sumpf_internal.allocate_array(shape=(len(self.__transfer_functions), length), dtype=dtype)
+            if self.__programs is None:
+                self.__programs = compiler.compile_terms(self.__transfer_functions)
+            buffers = [sumpf_internal.allocate_array(shape=(length,), dtype=dtype)
+                       for _ in range(max((p.buffers() for _, p in self.__programs), default=0))]
+            for index, program in self.__programs:
+                program(s, out=channels[index], buffers=buffers)
+            Filter.spectrum_cache.store(key, channels)
         return sumpf.Spectrum(channels=channels, resolution=resolution, labels=self.__labels)
 
+    def apply(self, signal, method=None, block_length=None, kernel_length=None):
+        """Applies this filter to the given signal.
+
+        With the ``SPECTRUM`` method, this is the same as ``filter_ * signal``.
+        With the ``IIR`` method, the filter is applied in the time domain as a
+        digital IIR filter (see :meth:`second_order_sections`). With the ``FIR``
+        method, the filter is sampled once and applied as an FIR filter in blocks
+        (see :meth:`fir_kernel`), so that long signals can be filtered with a small
+        amount of memory for the transforms.
+        With the latter two methods, the filtered signal has the same length, offset
+        and labels as the given signal. If the numbers of channels of the filter
+        and the signal differ and neither of them has only one channel, the surplus
+        channels of the signal are not filtered.
+
+        :param signal: the :class:`~sumpf.Signal`, that shall be filtered
+        :param method: a flag from the :attr:`~sumpf.Filter.application_methods`
+                       enumeration or its value as a string (e.g. ``"iir"``).
+                       If None, the ``FIR`` method is used, when a block length
+                       or a kernel length is given, and the ``SPECTRUM`` method otherwise.
+        :param block_length: the length of the blocks for the ``FIR`` method or
+                             None to derive it from the kernel length
+        :param kernel_length: the length of the FIR filter for the ``FIR`` method
+                              or None for a length of 8192 samples
+        :returns: the filtered :class:`~sumpf.Signal`
+        """
+        if method is None:
+            if block_length is None and kernel_length is None:
+                method = Filter.application_methods.SPECTRUM
+            else:
+                method = Filter.application_methods.FIR
+        method = Filter.application_methods(method)
+        if method == Filter.application_methods.IIR:
+            return sumpf.IIRProcessor(self, sampling_rate=signal.sampling_rate()).process(signal)
+        elif method == Filter.application_methods.FIR:
+            return self.__apply_fir(signal, block_length, 8192 if kernel_length is None else kernel_length)
+        else:
+            return self * signal
+
+    def fir_kernel(self, sampling_rate, length=8192, precision=None):
+        """Samples the transfer functions and converts them to the impulse responses
+        of FIR filters with the given length.
+
+        The impulse responses are centered at the time zero, so that also non-causal
+        filters like zero phase filters can be represented, and they are windowed
+        with a Hann window to reduce the effects of the truncation. The returned
+        signal therefore has a negative offset of ``-(length // 2)`` samples.
+        The frequency resolution of the sampled transfer functions is ``sampling_rate / length``,
+        so details of the transfer functions, that are finer than that, and delays,
+        that are longer than half the length, are lost.
+
+        :param sampling_rate: the sampling rate of the FIR filters
+        :param length: the even number of samples of the impulse responses
+        :param precision: ``"single"`` or ``"double"`` for the precision of the
+                          impulse responses or None for the precision from
+                          :attr:`sumpf.config.precision`
+        :returns: a :class:`~sumpf.Signal` with one impulse response for each
+                  channel of this filter
+        :raises ValueError: if the length is not a positive even number
+        """
+        if length < 2 or length % 2:
+            raise ValueError(f"The length of the FIR filter must be a positive even number, not {length}")
+        spectrum = self.spectrum(resolution=sampling_rate / length, length=length // 2 + 1, precision=precision)
+        impulse_responses = sumpf_internal.irfft(spectrum.channels(), n=length)
+        channels = sumpf_internal.allocate_array(shape=impulse_responses.shape, dtype=impulse_responses.dtype)
+        channels[:] = numpy.roll(impulse_responses, length // 2, axis=1)
+        channels *= numpy.hanning(length + 1)[0:length]
+        return sumpf.Signal(channels=channels, sampling_rate=sampling_rate, offset=-(length // 2), labels=self.__labels)
+
+    def simplify(self):
+        """Collapses the transfer functions, which are rational functions of ``s``,
+        to quotients of two polynomials (see :meth:`~sumpf._data._filters._base._terms._base.Term.to_rational`).
+        This reduces the cost of sampling deeply nested transfer functions like
+        those of high order :class:`~sumpf.ButterworthFilter` instances. Transfer
+        functions, which are not rational functions, are not changed.
+
+        Other than the original transfer functions, the simplified ones do not
+        contain lowpass-to-highpass transforms, so their values at 0Hz are not
+        set to zero, but computed from the polynomials.
+
+        :returns: a :class:`~sumpf.Filter` instance
+        """
+        transfer_functions = []
+        for tf in self.__transfer_functions:
+            try:
+                transfer_functions.append(tf.to_rational())
+            except (ValueError, ZeroDivisionError):
+                transfer_functions.append(tf)
+        return Filter(transfer_functions=tuple(transfer_functions), labels=self.__labels)
+
+    def second_order_sections(self, sampling_rate):
+        """Converts the transfer functions of this filter to digital IIR filters
+        in second order sections with the bilinear transform.
+
+        This requires the transfer functions to be rational functions of ``s``,
+        which are composed of constants, polynomials, sums, differences, products,
+        quotients and lowpass-to-highpass transforms of them, like the transfer
+        functions of the :class:`~sumpf.ButterworthFilter` and the :class:`~sumpf.Chebyshev1Filter`.
+        The bilinear transform maps the frequency axis of the transfer functions
+        non-linearly to that of the digital filters, so that their frequency responses
+        deviate close to the Nyquist frequency.
+
+        This method requires :mod:`scipy` to be installed.
+
+        :param sampling_rate: the sampling rate of the digital filters
+        :returns: a tuple with one two-dimensional array for each channel, which
+                  contains a row of the six coefficients ``b0, b1, b2, a0, a1, a2``
+                  for each second order section like in :func:`scipy.signal.sosfilt`
+        :raises ValueError: if a transfer function cannot be converted to an IIR filter
+        """
+        return tuple(sos.second_order_sections(tf, sampling_rate) for tf in self.__transfer_functions)
+
+    def __apply_fir(self, signal, block_length, kernel_length):
+        """Applies this filter with the ``FIR`` method (see :meth:`apply`).
+
+        :param signal: the :class:`~sumpf.Signal`, that shall be filtered
+        :param block_length: the length of the blocks or None
+        :param kernel_length: the length of the FIR filter
+        :returns: the filtered :class:`~sumpf.Signal`
+        """
+        channels = signal.channels()
+        kernel = self.fir_kernel(sampling_rate=signal.sampling_rate(),
+                                 length=kernel_length,
+                                 precision=sumpf_internal.get_precision(channels))
+        kernels = kernel.channels()
+        if len(kernels) == 1:
+            number_of_channels = filtered = len(channels)
+        elif len(channels) == 1:
+            number_of_channels = filtered = len(kernels)
+        else:
+            number_of_channels = len(channels)
+            filtered = min(len(channels), len(kernels))
+        output = sumpf_internal.allocate_array(shape=(number_of_channels, signal.length()), dtype=kernels.dtype)
+        sumpf_internal.partitioned_overlap_save(inputs=channels[0:filtered],
+                                                kernels=kernels[0:filtered],
+                                                block_length=block_length,
+                                                out=output[0:filtered],
+                                                skip=-kernel.offset())
+        output[filtered:] = channels[filtered:]
+        return sumpf.Signal(channels=output,
+                            sampling_rate=signal.sampling_rate(),
+                            offset=signal.offset(),
+                            labels=signal.labels())
+
     #######################
     # persistence methods #
     #######################
@@ -19,6 +19,7 @@
 import math
 import weakref
 import numpy
+import sumpf._internal as sumpf_internal
 
 __all__ = ("S",)
 
@@ -26,7 +27,8 @@ __all__ = ("S",)
 class S:
     """Instances of this class compute and store the frequency variable ``s = 2j * pi * f``
     for sampling a filter's transfer function. If required, they also create and
-    cache a manager for ``1 / s``, if a lowpass-to-highpass transformation requires it.
+    cache a manager for ``1 / s``, if a lowpass-to-highpass transformation requires it,
+    and the plans for interpolating the supporting points of bands terms.
     """
 
     def __init__(self, frequencies):
@@ -36,6 +38,7 @@ class S:
         self.__frequencies = frequencies
         self.__s = None
         self.__transformed = None
+        self.__plans = {}
 
     def __call__(self):
         """Returns the values for ``s``
@@ -77,6 +80,23 @@ class S:
             self.__transformed = TransformedS(self)
         return self.__transformed
 
+    def interpolation_plan(self, xs, interpolation, extrapolation):
+        """Returns a plan for interpolating supporting points at the frequencies
+        of this manager. The plans are cached, so that terms with equal supporting
+        points and interpolation functions share the index searches.
+
+        :param xs: a non-empty array of frequencies of the supporting points in ascending order
+        :param interpolation: a flag from the :class:`sumpf.Bands.interpolations` enumeration
+        :param extrapolation: a flag from the :class:`sumpf.Bands.interpolations` enumeration
+        :returns: a :class:`sumpf._internal.interpolation.Plan` instance
+        """
+        key = (xs.dtype.str, xs.tobytes(), interpolation, extrapolation)
+        plan = self.__plans.get(key)
+        if plan is None:
+            plan = sumpf_internal.interpolation.Plan(self.__frequencies, xs, interpolation, extrapolation)
+            self.__plans[key] = plan
+        return plan
+
 
 class TransformedS:
     """Computes the values of ``1 / s`` for sampling a lowpass-to-highpass-transformed
@@ -116,6 +136,18 @@ class TransformedS:
         """
         return self.__origin.frequencies()
 
+    def interpolation_plan(self, xs, interpolation, extrapolation):
+        """Returns a plan for interpolating supporting points at the frequencies
+        of this manager, which is shared with the original manager, since the
+        frequencies are not affected by a lowpass-to-highpass transform.
+
+        :param xs: a non-empty array of frequencies of the supporting points in ascending order
+        :param interpolation: a flag from the :class:`sumpf.Bands.interpolations` enumeration
+        :param extrapolation: a flag from the :class:`sumpf.Bands.interpolations` enumeration
+        :returns: a :class:`sumpf._internal.interpolation.Plan` instance
+        """
+        return self.__origin.interpolation_plan(xs, interpolation, extrapolation)
+
     def fix(self, result):
         """Replaces the samples of the filter's transfer function for 0Hz with 0.0,
         if a lowpass-to-highpass transform has made them invalid, because ``1 / s``
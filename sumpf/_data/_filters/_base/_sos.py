@@ -0,0 +1,60 @@
+# This file is a part of the "SuMPF" package
+# Copyright (C) 2018-2019 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Contains functions for converting transfer functions to digital IIR filters"""
+
+import numpy
+
+__all__ = ("second_order_sections",)
+
+
+def second_order_sections(term, sampling_rate):
+    """Converts a transfer function, that is a rational function of ``s``, to
+    a digital IIR filter in second order sections with the bilinear transform.
+
+    The bilinear transform maps the frequency axis of the continuous transfer
+    function to that of the digital filter non-linearly, so that the frequency
+    response of the digital filter deviates from the transfer function at frequencies
+    close to the Nyquist frequency.
+
+    The transfer function is collapsed to a quotient of two polynomials with
+    :meth:`~sumpf._data._filters._base._terms._base.Term.to_rational`, so terms,
+    which are not rational functions, like :class:`~sumpf._data._filters._base._terms._primitive.Exp`,
+    :class:`~sumpf._data._filters._base._terms._primitive.Bands` or :class:`~sumpf._data._filters._base._terms._unary.Absolute`,
+    cause a :exc:`ValueError`.
+
+    This function requires :mod:`scipy` to be installed.
+
+    :param term: the transfer function as a :class:`~sumpf._data._filters._base._terms._base.Term`
+    :param sampling_rate: the sampling rate of the digital filter
+    :returns: a two-dimensional array with a row of the six coefficients ``b0, b1, b2, a0, a1, a2``
+              for each second order section like in :func:`scipy.signal.sosfilt`
+    """
+    import scipy.signal
+    numerator, denominator = term.to_rational().polynomials()
+    numerator = numpy.trim_zeros(numerator, "f")
+    denominator = numpy.trim_zeros(denominator, "f")
+    coefficients = numpy.concatenate((numerator, denominator))
+    if numpy.abs(numpy.imag(coefficients)).max() > 1e-9 * numpy.abs(coefficients).max():    # tolerate rounding errors from the products of conjugate complex zeros and poles
+        raise ValueError("A transfer function with complex coefficients cannot be realized with a real valued IIR filter")
+    if len(numerator) > len(denominator):
+        raise ValueError("The transfer function has more zeros than poles, so it cannot be realized as an IIR filter")
+    if len(numerator) == 0:     # pylint: disable=len-as-condition; numerator is a NumPy array, where __nonzero__ is not equivalent to len(.)
+        zeros, poles, gain = numpy.empty(0), numpy.roots(numpy.real(denominator)), 0.0
+    else:
+        zeros, poles, gain = scipy.signal.tf2zpk(numpy.real(numerator), numpy.real(denominator))
+    zeros, poles, gain = scipy.signal.bilinear_zpk(zeros, poles, gain, fs=sampling_rate)
+    return scipy.signal.zpk2sos(zeros, poles, gain)
@@ -16,6 +16,8 @@
 
 """Contains the base class for terms with which the transfer functions of filters can be constructed."""
 
+import numpy
+
 __all__ = ("Term",)
 
 
@@ -69,6 +71,72 @@ class Term:
         """
         raise NotImplementedError("This method has to be implemented in a derived class")
 
+    def polynomials(self):
+        """Returns the coefficients of the numerator and the denominator polynomials,
+        if this term is a rational function of ``s``. Terms, that are not rational
+        functions, like exponential functions, bands or magnitudes, raise a :exc:`ValueError`.
+
+        The polynomials are not simplified, so they can have common factors.
+
+        :returns: a tuple ``(numerator, denominator)`` of arrays with the polynomial
+                  coefficients, in which the first coefficient is that of the highest
+                  power of ``s``.
+        :raises ValueError: if this term is not a rational function of ``s``
+        """
+        numerator, denominator = self._polynomials()
+        if self.transform:
+            # n(1/s) / d(1/s) = s**(len(d) - len(n)) * reversed(n) / reversed(d)
+            numerator = numpy.trim_zeros(numerator, "f")
+            denominator = numpy.trim_zeros(denominator, "f")
+            difference = len(denominator) - len(numerator)
+            numerator = numpy.concatenate((numerator[::-1], numpy.zeros(max(difference, 0))))
+            denominator = numpy.concatenate((denominator[::-1], numpy.zeros(max(-difference, 0))))
+        return numerator, denominator
+
+    def _polynomials(self):
+        """A method, in which sub-classes, which are rational functions of ``s``,
+        can implement the computation of the numerator and denominator polynomials.
+        The lowpass-to-highpass transform is applied by :meth:`polynomials`.
+
+        :returns: a tuple ``(numerator, denominator)`` of arrays with polynomial coefficients
+        :raises ValueError: if this term is not a rational function of ``s``
+        """
+        raise ValueError(f"The term {self!r} is not a rational function of s")
+
+    def to_rational(self):
+        """Collapses this term to a quotient of two polynomials of ``s``, which
+        can be evaluated with fewer operations than a deeply nested term. Common
+        factors of ``s`` are cancelled and the polynomials are normalized, so
+        that the first coefficient of the denominator is one.
+
+        Other than the original term, the collapsed term does not contain a
+        lowpass-to-highpass transform, so its value at 0Hz is not set to zero,
+        but computed from the polynomials.
+
+        :returns: an instance of a subclass of :class:`~sumpf._data._filters._base._terms._base.Term`
+        :raises ValueError: if this term is not a rational function of ``s``
+        :raises ZeroDivisionError: if the denominator is zero
+        """
+        from ._primitive import Constant, Polynomial  # pylint: disable=cyclic-import
+        from ._binary import Quotient                 # pylint: disable=cyclic-import
+        numerator, denominator = self.polynomials()
+        numerator = numpy.trim_zeros(numerator, "f")
+        denominator = numpy.trim_zeros(denominator, "f")
+        if len(denominator) == 0:     # pylint: disable=len-as-condition; denominator is a NumPy array, where __nonzero__ is not equivalent to len(.)
+            raise ZeroDivisionError("The denominator of the transfer function is zero")
+        elif len(numerator) == 0:     # pylint: disable=len-as-condition; numerator is a NumPy array, where __nonzero__ is not equivalent to len(.)
+            return Constant(0.0)
+        # cancel common factors of s
+        common = min(len(numerator) - len(numpy.trim_zeros(numerator, "b")),
+                     len(denominator) - len(numpy.trim_zeros(denominator, "b")))
+        if common:
+            numerator = numerator[0:-common]
+            denominator = denominator[0:-common]
+        numerator = numerator / denominator[0]
+        if len(denominator) == 1:
+            return Polynomial.factory(numerator)
+        return Quotient.factory(Polynomial.factory(numerator), Polynomial.factory(denominator / denominator[0]))
+
     def is_zero(self):  # pylint: disable=no-self-use; the overrides in derived classes do use self
         """Returns, whether this term evaluates to zero for all frequencies.
         For this check, the term is not evaluated. Instead, the parameters are
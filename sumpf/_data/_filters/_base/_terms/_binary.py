@@ -84,6 +84,15 @@ class Sum(Term):
             result = numpy.zeros(numpy.shape(s()))
             return functions.copy_to_out(result, out)
 
+    def _polynomials(self):
+        """Returns the coefficients of the numerator and the denominator polynomials
+        (see :meth:`~sumpf._data._filters._base._terms._base.Term.polynomials`).
+        """
+        numerator, denominator = numpy.zeros(1), numpy.ones(1)
+        for summand in self.summands:
+            numerator, denominator = _add(numerator, denominator, *summand.polynomials())
+        return numerator, denominator
+
     def is_zero(self):
         """Returns, whether this term evaluates to zero for all frequencies.
         For this check, the term is not evaluated. Instead, the parameters are
@@ -193,6 +202,13 @@ class Difference(Term):
                               self.subtrahend(s),
                               out=out)
 
+    def _polynomials(self):
+        """Returns the coefficients of the numerator and the denominator polynomials
+        (see :meth:`~sumpf._data._filters._base._terms._base.Term.polynomials`).
+        """
+        numerator, denominator = self.subtrahend.polynomials()
+        return _add(*self.minuend.polynomials(), numpy.negative(numerator), denominator)
+
     def is_zero(self):
         """Returns, whether this term evaluates to zero for all frequencies.
         For this check, the term is not evaluated. Instead, the parameters are
@@ -321,6 +337,19 @@ class Product(Term):
             result = numpy.zeros(numpy.shape(s()))
             return functions.copy_to_out(result, out)
 
+    def _polynomials(self):
+        """Returns the coefficients of the numerator and the denominator polynomials
+        (see :meth:`~sumpf._data._filters._base._terms._base.Term.polynomials`).
+        """
+        numerator, denominator = numpy.ones(1), numpy.ones(1)
+        for f in self.factors:
+            n, d = f.polynomials()
+            numerator = numpy.polymul(numerator, n)
+            denominator = numpy.polymul(denominator, d)
+        if not self.factors:
+            numerator = numpy.zeros(1)
+        return numerator, denominator
+
     def is_zero(self):
         """Returns, whether this term evaluates to zero for all frequencies.
         For this check, the term is not evaluated. Instead, the parameters are
@@ -433,6 +462,14 @@ class Quotient(Term):
                                 self.denominator(s),
                                 out=out)
 
+    def _polynomials(self):
+        """Returns the coefficients of the numerator and the denominator polynomials
+        (see :meth:`~sumpf._data._filters._base._terms._base.Term.polynomials`).
+        """
+        n1, d1 = self.numerator.polynomials()
+        n2, d2 = self.denominator.polynomials()
+        return numpy.polymul(n1, d2), numpy.polymul(d1, n2)
+
     def is_zero(self):
         """Returns, whether this term evaluates to zero for all frequencies.
         For this check, the term is not evaluated. Instead, the parameters are
@@ -482,3 +519,15 @@ class Quotient(Term):
                 "numerator": self.numerator.as_dict(),
                 "denominator": self.denominator.as_dict(),
                 "transform": self.transform}
+
+
+def _add(numerator1, denominator1, numerator2, denominator2):
+    """A helper function, that adds two rational functions, which are given by
+    the coefficients of their numerator and denominator polynomials.
+
+    :returns: a tuple ``(numerator, denominator)`` of arrays with polynomial coefficients
+    """
+    if numpy.array_equal(denominator1, denominator2):
+        return numpy.polyadd(numerator1, numerator2), denominator1
+    return (numpy.polyadd(numpy.polymul(numerator1, denominator2), numpy.polymul(numerator2, denominator1)),
+            numpy.polymul(denominator1, denominator2))
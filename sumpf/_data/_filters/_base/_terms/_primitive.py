@@ -61,6 +61,12 @@ class Constant(Term):
         result = numpy.full(shape=s().shape, fill_value=self.value)
         return functions.copy_to_out(result, out)
 
+    def _polynomials(self):
+        """Returns the coefficients of the numerator and the denominator polynomials
+        (see :meth:`~sumpf._data._filters._base._terms._base.Term.polynomials`).
+        """
+        return numpy.array([self.value]), numpy.ones(1)
+
     def invert_transform(self):
         """Creates a copy of the term, with the lowpass-to-highpass-transform inverted.
 
@@ -217,6 +223,12 @@ class Polynomial(Term):
         result = numpy.polyval(self.coefficients, s())
         return functions.copy_to_out(result, out)
 
+    def _polynomials(self):
+        """Returns the coefficients of the numerator and the denominator polynomials
+        (see :meth:`~sumpf._data._filters._base._terms._base.Term.polynomials`).
+        """
+        return numpy.array(self.coefficients), numpy.ones(1)
+
     def is_zero(self):
         """Returns, whether this term evaluates to zero for all frequencies.
         For this check, the term is not evaluated. Instead, the parameters are
@@ -441,12 +453,8 @@ class Bands(Term):
         if out is None:
             out = numpy.empty(shape=f.shape, dtype=numpy.complex128)
         if self.xs.size:
-            mask = (f < self.xs[0]) | (self.xs[-1] < f)
-            extrapolation = sumpf_internal.interpolation.get(self.extrapolation)
-            out[mask] = extrapolation(x=f[mask], xs=self.xs, ys=self.ys)
-            mask = ~mask
-            interpolation = sumpf_internal.interpolation.get(self.interpolation)
-            out[mask] = interpolation(x=f[mask], xs=self.xs, ys=self.ys)
+            plan = s.interpolation_plan(self.xs, self.interpolation, self.extrapolation)
+            plan(self.ys, out=out)
         else:
             out[:] = 0.0
         return out
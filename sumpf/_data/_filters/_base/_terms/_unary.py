@@ -147,6 +147,13 @@ class Negative(Term):
         """
         return numpy.negative(self.value(s, out=out), out=out)
 
+    def _polynomials(self):
+        """Returns the coefficients of the numerator and the denominator polynomials
+        (see :meth:`~sumpf._data._filters._base._terms._base.Term.polynomials`).
+        """
+        numerator, denominator = self.value.polynomials()
+        return numpy.negative(numerator), denominator
+
     def is_zero(self):
         """Returns, whether this term evaluates to zero for all frequencies.
         For this check, the term is not evaluated. Instead, the parameters are
@@ -23,13 +23,19 @@ import sumpf._internal as sumpf_internal
 class SampledData:
     """Base class for data containers with channels of sampled data and labels."""
 
-    def __init__(self, channels, labels):
+    def __init__(self, channels, labels, sanitized=False):
         """
         :param channels: a two-dimensional :func:`numpy.array`
         :param labels: a sequence of string labels for the channels
+        :param sanitized: True, if the labels are a tuple, that has already been
+                          sanitized for the given channels (e.g. the labels of
+                          another data set with the same number of channels)
         """
         self._channels = channels
-        self._labels = sumpf_internal.sanitize_labels(labels=labels, number=len(channels))
+        if sanitized:
+            self._labels = labels
+        else:
+            self._labels = sumpf_internal.sanitize_labels(labels=labels, number=len(channels))
         self._length = channels.shape[-1]   # the number of samples per channel
 
     ###########################################
@@ -67,6 +73,26 @@ class SampledData:
     # overloaded binary math operators #
     ####################################
 
+    def _float_dtype(self, *others):
+        """Protected helper method, that returns the dtype for real valued results
+        of computations with this data set and the given other operands (see
+        :func:`sumpf._internal.get_precision`).
+
+        :param `*others`: the other operands of the computation
+        :returns: either :class:`numpy.float32` or :class:`numpy.float64`
+        """
+        return sumpf_internal.float_dtype(sumpf_internal.get_precision(self._channels, *others))
+
+    def _complex_dtype(self, *others):
+        """Protected helper method, that returns the dtype for complex results
+        of computations with this data set and the given other operands (see
+        :func:`sumpf._internal.get_precision`).
+
+        :param `*others`: the other operands of the computation
+        :returns: either :class:`numpy.complex64` or :class:`numpy.complex128`
+        """
+        return sumpf_internal.complex_dtype(sumpf_internal.get_precision(self._channels, *others))
+
     def _algebra_function(self, other, function, other_pivot, label):
         """Abstract helper function that shall implement the broadcasting of data
         sets with different shapes when using the overloaded math operators.
@@ -166,3 +192,13 @@ class SampledData:
         :returns: a tuple of integers (number of channels, number of samples)
         """
         return self._channels.shape
+
+    def precision(self):
+        """Returns the precision of the floating point numbers in the channels.
+        Computations with this data set return results with the same precision,
+        unless they are combined with data of a higher precision.
+
+        :returns: ``"single"`` for :class:`numpy.float32` and :class:`numpy.complex64`
+                  channels or ``"double"`` otherwise
+        """
+        return sumpf_internal.get_precision(self._channels)
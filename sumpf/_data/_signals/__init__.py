@@ -17,6 +17,8 @@
 """Contains the container classes for signals"""
 
 from ._signal import *
+from ._convolution_kernel import *
+from ._signal_file_writer import *
 
 from ._constant import *
 from ._energy_decay import *
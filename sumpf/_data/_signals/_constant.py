@@ -16,7 +16,6 @@
 
 """Contains the :class:`~sumpf.ConstantSignal` class."""
 
-import numpy
 import sumpf._internal as sumpf_internal
 from ._signal import Signal
 
@@ -33,7 +32,7 @@ class ConstantSignal(Signal):
                               an integer or a float
         :param length: the number of samples of the signal
         """
-        channels = sumpf_internal.allocate_array(shape=(1, length), dtype=numpy.float64)
+        channels = sumpf_internal.allocate_array(shape=(1, length), dtype=sumpf_internal.float_dtype())
         channels[:] = value
         Signal.__init__(self,
                         channels=channels,
@@ -0,0 +1,118 @@
+# This file is a part of the "SuMPF" package
+# Copyright (C) 2018-2019 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Contains the :class:`~sumpf.ConvolutionKernel` class."""
+
+import collections
+import numpy
+import sumpf._internal as sumpf_internal
+
+__all__ = ("ConvolutionKernel",)
+
+
+class ConvolutionKernel:
+    """A wrapper for a :class:`~sumpf.Signal`, with which many other signals shall
+    be convolved or correlated, like a compensation filter or an inverse sweep.
+
+    An instance of this class can be passed to the :meth:`~sumpf.Signal.convolve`
+    and :meth:`~sumpf.Signal.correlate` methods instead of the wrapped signal.
+    In the ``SPECTRUM_PADDED`` mode, the kernel's spectrum is cached for each length
+    of the transform, with which it has been used, so that a repeated convolution
+    with signals of the same length only requires one forward and one inverse
+    transform. When the cache is full, the least recently used spectrums are
+    removed. In the other modes, the wrapped signal is used directly.
+    """
+
+    def __init__(self, signal, cache_size=8):
+        """
+        :param signal: the :class:`~sumpf.Signal`, with which the other signals
+                       shall be convolved or correlated
+        :param cache_size: the maximum number of cached spectrums
+        """
+        self.__signal = signal
+        self.__cache_size = cache_size
+        self.__spectrums = collections.OrderedDict()
+
+    def signal(self):
+        """Returns the wrapped signal.
+
+        :returns: a :class:`~sumpf.Signal` instance
+        """
+        return self.__signal
+
+    def channels(self):
+        """Returns the channels of the wrapped signal.
+
+        :returns: a two-dimensional :func:`numpy.array`
+        """
+        return self.__signal.channels()
+
+    def offset(self):
+        """Returns the offset of the wrapped signal.
+
+        :returns: the integer number of samples, by which the signal is delayed
+        """
+        return self.__signal.offset()
+
+    def length(self):
+        """Returns the number of samples per channel of the wrapped signal.
+
+        :returns: an integer
+        """
+        return self.__signal.length()
+
+    def spectrum(self, length, shifted=False):
+        """Returns the transform of the wrapped signal's channels, which are zero
+        padded to the given length. The transforms are cached, so that they are
+        only computed once for each combination of parameters, as long as they
+        are not removed from the cache by more recently used combinations.
+
+        :param length: the length of the padded channels
+        :param shifted: False, if the zeros shall be appended to the channels,
+                        True, if they shall be prepended, which is required for
+                        the computation of a correlation.
+        :returns: a two-dimensional :func:`numpy.array` of complex numbers
+        """
+        key = (length, shifted)
+        spectrum = self.__spectrums.get(key)
+        if spectrum is not None:
+            self.__spectrums.move_to_end(key)
+        else:
+            channels = self.__signal.channels()
+            kc, kl = channels.shape
+            padded = numpy.zeros(shape=(kc, length), dtype=channels.dtype)
+            if shifted:
+                padded[:, length - kl:] = channels
+            else:
+                padded[:, 0:kl] = channels
+            spectrum = sumpf_internal.rfft(padded)
+            spectrum.flags.writeable = False
+            if self.__cache_size > 0:
+                self.__spectrums[key] = spectrum
+                while len(self.__spectrums) > self.__cache_size:
+                    self.__spectrums.popitem(last=False)
+        return spectrum
+
+    def cached_lengths(self):
+        """Returns the lengths of the transforms, for which the kernel's spectrum has been cached.
+
+        :returns: a sorted tuple of integers
+        """
+        return tuple(sorted({length for length, _ in self.__spectrums}))
+
+    def clear_cache(self):
+        """Removes the cached spectrums, in order to free their memory."""
+        self.__spectrums.clear()
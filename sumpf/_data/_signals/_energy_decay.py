@@ -48,7 +48,8 @@ class EnergyDecayCurve(Signal):
         :param impulse_response: the impulse response :class:`~sumpf.Signal`, from
                                  which this energy decay curve shall be computed.
         """
-        channels = sumpf_internal.allocate_array(shape=impulse_response.shape())
+        channels = sumpf_internal.allocate_array(shape=impulse_response.shape(),
+                                                 dtype=sumpf_internal.float_dtype(impulse_response.precision()))
         numpy.square(impulse_response.channels(), out=channels)
         numpy.cumsum(channels[:, ::-1], axis=1, out=channels[:, ::-1])
         Signal.__init__(self,
@@ -97,7 +98,7 @@ class EnergyDecayCurve(Signal):
         :param stop: the sample index of the first sample after the segment
         :returns: a :class:`~sumpf.Signal`
         """
-        channels = sumpf_internal.allocate_array(shape=self.shape())
+        channels = sumpf_internal.allocate_array(shape=self.shape(), dtype=self._float_dtype())
         i = numpy.arange(self._length)
         for c, (m, n) in zip(channels, self.__solve(start, stop)):
             c[:] = numpy.power(10.0, (m / 10.0) * i + (n / 10.0))
@@ -81,7 +81,7 @@ class Fade(Signal):
         :param length: the number of samples of the fade signal
         """
         # allocate shared memory for the channels
-        channels = sumpf_internal.allocate_array(shape=(1, length), dtype=numpy.float64)
+        channels = sumpf_internal.allocate_array(shape=(1, length), dtype=sumpf_internal.float_dtype())
         channel = channels[0]
         # parse the raise and fall intervals
         if rise_interval is None:
@@ -18,7 +18,6 @@
 
 import math
 import random
-import numpy
 import scipy.signal
 import sumpf._internal as sumpf_internal
 from ._signal import Signal
@@ -65,7 +64,7 @@ class MaximumLengthSequence(Signal):
         if True not in state:
             state[random_.randint(0, len(state) - 1)] = True
         sequence = scipy.signal.max_len_seq(bits, state, length)[0]
-        channels = sumpf_internal.allocate_array(shape=(1, len(sequence)), dtype=numpy.float64)
+        channels = sumpf_internal.allocate_array(shape=(1, len(sequence)), dtype=sumpf_internal.float_dtype())
         channels[0, :] = sequence
         channels *= 2.0
         channels -= 1.0
@@ -40,7 +40,7 @@ class Noise(Signal):
         :param length: the number of samples of the noise signal
         """
         self.__seed = seed
-        channels = sumpf_internal.allocate_array(shape=(1, length), dtype=numpy.float64)
+        channels = sumpf_internal.allocate_array(shape=(1, length), dtype=sumpf_internal.float_dtype())
         channels[0, :] = self._function(length)
         Signal.__init__(self, channels=channels, sampling_rate=sampling_rate, offset=0, labels=(label,))
 
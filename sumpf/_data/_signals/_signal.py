@@ -21,6 +21,7 @@ import numpy
 import sumpf
 import sumpf._internal as sumpf_internal
 from .._sampled_data import SampledData
+from ._convolution_kernel import ConvolutionKernel
 
 __all__ = ("Signal",)
 
@@ -76,8 +77,9 @@ class Signal(SampledData):
     file_formats = sumpf_internal.signal_writers.Formats    #: an enumeration with file formats, whose flags can be passed to :meth:`~sumpf.Signal.save` (see the :class:`sumpf._internal._signal_writers.Formats` class).
     convolution_modes = sumpf_internal.ConvolutionMode      #: an enumeration with modes for the :meth:`~sumpf.Signal.convolve` and :meth:`~sumpf.Signal.correlate` methods (see the :class:`~sumpf._internal._enums.ConvolutionMode` class).
     shift_modes = sumpf_internal.ShiftMode                  #: an enumeration with modes for the :meth:`~sumpf.Signal.shift` method (see the :class:`~sumpf._internal._enums.ShiftMode` class).
+    fourier_transform_batch_size = 64                       #: the maximum number of segments, that are transformed at once in a block-wise :meth:`~sumpf.Signal.fourier_transform`. This limits the memory consumption of the transform.
 
-    def __init__(self, channels=numpy.empty(shape=(1, 0)), sampling_rate=48000.0, offset=0, labels=None):
+    def __init__(self, channels=numpy.empty(shape=(1, 0)), sampling_rate=48000.0, offset=0, labels=None, *, _sanitized=False):
         """
         :param channels: a two-dimensional :func:`numpy.array` of channels with float samples.
         :param sampling_rate: the sampling rate of the signal as a float or integer.
@@ -85,8 +87,11 @@ class Signal(SampledData):
                        the channel is delayed virtually. The offset can also be
                        negative, if the signal shall be non-causal.
         :param labels: a sequence of string labels for the channels.
+        :param _sanitized: for internal use only. True, if the labels have already
+                           been sanitized for the given channels, so that sanitizing
+                           them again can be skipped.
         """
-        SampledData.__init__(self, channels, labels)
+        SampledData.__init__(self, channels, labels, sanitized=_sanitized)
         self.__sampling_rate = sampling_rate
         self.__offset = offset
 
@@ -169,7 +174,7 @@ class Signal(SampledData):
 
         :returns: a :class:`~sumpf.Signal` instance
         """
-        return Signal(channels=numpy.fabs(self._channels, out=sumpf_internal.allocate_array(self.shape())),
+        return Signal(channels=numpy.fabs(self._channels, out=sumpf_internal.allocate_array(self.shape(), self._float_dtype())),
                       sampling_rate=self.__sampling_rate,
                       offset=self.__offset,
                       labels=self._labels)
@@ -195,7 +200,7 @@ class Signal(SampledData):
 
         :returns: a :class:`~sumpf.Signal` instance
         """
-        return Signal(channels=numpy.negative(self._channels, out=sumpf_internal.allocate_array(self.shape())),
+        return Signal(channels=numpy.negative(self._channels, out=sumpf_internal.allocate_array(self.shape(), self._float_dtype())),
                       sampling_rate=self.__sampling_rate,
                       offset=self.__offset,
                       labels=self._labels)
@@ -233,17 +238,17 @@ class Signal(SampledData):
 
         :returns: a :class:`~sumpf.Signal` instance
         """
-        channels = sumpf_internal.allocate_array(shape=self.shape())
+        channels = sumpf_internal.allocate_array(shape=self.shape(), dtype=self._float_dtype())
         if self._length % 2 == 0:
-            spectrum = numpy.fft.rfft(self._channels)
-            channels[:] = numpy.fft.irfft(1.0 / spectrum)
+            spectrum = sumpf_internal.rfft(self._channels)
+            channels[:] = sumpf_internal.irfft(1.0 / spectrum)
         else:
             # odd-length signals require zero padding, so that there is no sample lost in the FFT
-            padded = numpy.empty((len(self), 2 * self._length))
+            padded = numpy.empty((len(self), 2 * self._length), dtype=channels.dtype)
             padded[:, 0:self._length] = self._channels
             padded[:, self._length:] = 0.0
-            spectrum = numpy.fft.rfft(padded)
-            padded = numpy.fft.irfft(1.0 / spectrum)
+            spectrum = sumpf_internal.rfft(padded)
+            padded = sumpf_internal.irfft(1.0 / spectrum)
             channels[:] = padded[:, 0:self._length]
             channels += padded[:, self._length:]
         return Signal(channels=channels,
@@ -307,7 +312,7 @@ class Signal(SampledData):
         if length == self._length:
             return self
         else:
-            channels = sumpf_internal.allocate_array(shape=(len(self), length))
+            channels = sumpf_internal.allocate_array(shape=(len(self), length), dtype=self._float_dtype())
             if length < self._length:
                 channels[:] = self._channels[:, 0:length]
             else:
@@ -318,6 +323,24 @@ class Signal(SampledData):
                           offset=self.__offset,
                           labels=self._labels)
 
+    def to_precision(self, precision):
+        """Returns a signal, whose channels have the given precision.
+
+        :param precision: ``"single"`` for :class:`numpy.float32` samples, ``"double"``
+                          for :class:`numpy.float64` samples or None for the precision
+                          from :attr:`sumpf.config.precision`
+        :returns: a :class:`~sumpf.Signal`, which is this signal, if it already has the requested precision
+        """
+        dtype = sumpf_internal.float_dtype(precision)
+        if self._channels.dtype == dtype:
+            return self
+        channels = sumpf_internal.allocate_array(shape=self.shape(), dtype=dtype)
+        channels[:] = self._channels
+        return Signal(channels=channels,
+                      sampling_rate=self.__sampling_rate,
+                      offset=self.__offset,
+                      labels=self._labels)
+
     def shift(self, shift, mode=sumpf_internal.ShiftMode.OFFSET):
         """Returns a signal, which is shifted in time.
 
@@ -349,7 +372,7 @@ class Signal(SampledData):
                               labels=self._labels)
         else:
             if mode == Signal.shift_modes.CROP:
-                channels = sumpf_internal.allocate_array(shape=self._channels.shape)
+                channels = sumpf_internal.allocate_array(shape=self._channels.shape, dtype=self._float_dtype())
                 if shift < 0:
                     channels[:, 0:shift] = self._channels[:, -shift:]
                     channels[:, shift:] = 0.0
@@ -357,7 +380,7 @@ class Signal(SampledData):
                     channels[:, 0:shift] = 0.0
                     channels[:, shift:] = self._channels[:, 0:-shift]
             elif mode == Signal.shift_modes.PAD:
-                channels = sumpf_internal.allocate_array(shape=(len(self), self._length + abs(shift)))
+                channels = sumpf_internal.allocate_array(shape=(len(self), self._length + abs(shift)), dtype=self._float_dtype())
                 if shift < 0:
                     channels[:, 0:self._length] = self._channels
                     channels[:, self._length:] = 0.0
@@ -365,7 +388,7 @@ class Signal(SampledData):
                     channels[:, 0:shift] = 0.0
                     channels[:, shift:] = self._channels
             elif mode == Signal.shift_modes.CYCLE:
-                channels = sumpf_internal.allocate_array(shape=self._channels.shape)
+                channels = sumpf_internal.allocate_array(shape=self._channels.shape, dtype=self._float_dtype())
                 channels[:, 0:shift] = self._channels[:, -shift:]
                 channels[:, shift:] = self._channels[:, 0:-shift]
             return Signal(channels=channels,
@@ -373,6 +396,67 @@ class Signal(SampledData):
                           offset=self.__offset,
                           labels=self._labels)
 
+    def blocks(self, block_length, overlap=0, pad=True):
+        """A generator, that yields consecutive blocks of this signal, for example
+        for processing long recordings at a constant memory consumption.
+
+        The blocks are :class:`~sumpf.Signal` instances, whose channels are views
+        of this signal's channels, so that no samples are copied. Their offsets
+        are set according to their position in this signal, so that the processed
+        blocks can be overlap-added to a complete signal again with a :class:`~sumpf.SignalAssembler`.
+        Only the blocks at the end of the signal, that have to be padded with zeros,
+        are copied.
+
+        >>> import numpy, sumpf
+        >>> signal = sumpf.Signal(channels=numpy.array([(1.0, 2.0, 3.0, 4.0, 5.0)]), offset=10)
+        >>> for block in signal.blocks(block_length=2):
+        ...     print(block.offset(), block.channels())
+        10 [[1. 2.]]
+        12 [[3. 4.]]
+        14 [[5. 0.]]
+
+        :param block_length: the number of samples per block
+        :param overlap: the overlap of subsequent blocks. It can be passed as an
+                        integer number of samples or a float fraction of the block
+                        length. Negative numbers will be added to the block length.
+        :param pad: True, if the last block shall be padded with zeros, if the
+                    remaining samples do not fill a full block. False, if the
+                    samples at the end of the signal, that do not fit a full block,
+                    shall be ignored.
+        :returns: a generator of :class:`~sumpf.Signal` instances
+        """
+        overlap = sumpf_internal.index(overlap, block_length)
+        step = block_length - overlap
+        if block_length < 1 or step < 1:
+            raise ValueError(f"Invalid block length {block_length} or overlap {overlap}")
+        positions = range(0, self._length - block_length + 1, step)
+        for start in positions:
+            yield self.__block(channels=self._channels[:, start:start + block_length], offset=self.__offset + start)
+        if pad:
+            # add padded blocks, until all samples have been covered
+            first = positions[-1] + step if positions else 0
+            for start in range(first, max(self._length - overlap, min(self._length, 1)), step):
+                channels = sumpf_internal.allocate_array(shape=(len(self._channels), block_length),
+                                                         dtype=self._channels.dtype)
+                remaining = self._length - start
+                channels[:, 0:remaining] = self._channels[:, start:]
+                channels[:, remaining:] = 0.0
+                yield self.__block(channels=channels, offset=self.__offset + start)
+
+    def __block(self, channels, offset):
+        """Creates a block for :meth:`blocks`, without sanitizing the labels, which
+        have already been sanitized for this signal, again for every block.
+
+        :param channels: the channels of the block
+        :param offset: the offset of the block
+        :returns: a :class:`~sumpf.Signal` instance
+        """
+        return Signal(channels=channels,
+                      sampling_rate=self.__sampling_rate,
+                      offset=offset,
+                      labels=self._labels,
+                      _sanitized=True)
+
     #############################
     # signal processing methods #
     #############################
@@ -418,15 +502,15 @@ class Signal(SampledData):
         length = self._length // 2 + 1
         if len(self._channels) == 0:                                            # pylint: disable=len-as-condition; self._channels is a numpy array, that does not evaluate to False if empty
             resolution = self.__sampling_rate / max(self._length, 1)
-            channels = sumpf_internal.allocate_array(shape=(0, length), dtype=numpy.complex128)
+            channels = sumpf_internal.allocate_array(shape=(0, length), dtype=self._complex_dtype())
         elif self._length == 0:
             resolution = self.__sampling_rate
-            channels = sumpf_internal.allocate_array(shape=(len(self._channels), 1), dtype=numpy.complex128)
+            channels = sumpf_internal.allocate_array(shape=(len(self._channels), 1), dtype=self._complex_dtype())
             channels[:, :] = 0.0
         else:
             resolution = self.__sampling_rate / self._length
-            channels = sumpf_internal.allocate_array(shape=(len(self._channels), length), dtype=numpy.complex128)
-            spectrum = numpy.fft.rfft(self._channels)
+            channels = sumpf_internal.allocate_array(shape=(len(self._channels), length), dtype=self._complex_dtype())
+            spectrum = sumpf_internal.rfft(self._channels)
             if self.__offset == 0:
                 channels[:, :] = spectrum
             else:  # add a group delay for the offset
@@ -444,60 +528,73 @@ class Signal(SampledData):
         if len(self._channels) == 0 or len(window) == 0 or window_length == 0:  # pylint: disable=len-as-condition; these are numpy arrays, that do not evaluate to False if empty
             resolution = window.sampling_rate() / max(window_length, 1)
             channels = sumpf_internal.allocate_array(shape=(max(len(self._channels), len(window)), length),
-                                                     dtype=numpy.complex128)
+                                                     dtype=self._complex_dtype())
             channels[:, :] = 0.0
         else:
             window_channels = window.channels()
             overlap = sumpf_internal.index(overlap, window_length)
             resolution = window.sampling_rate() / window_length
             channels = sumpf_internal.allocate_array(shape=(max(len(self._channels), len(window)), length),
-                                                     dtype=numpy.complex128)
+                                                     dtype=self._complex_dtype())
             channels[:, :] = 0.0
-            windowed = numpy.empty(shape=(max(len(self._channels), len(window)), window_length))
-            compensated = numpy.empty(shape=channels.shape, dtype=channels.dtype)
-            compensation_factor = (length - 1) * resolution * -2j * math.pi
-            step = window_length - overlap
-            if pad:
-                for i in range(-step, -window_length, -step):
-                    l = min(window_length + i, self._length)
-                    windowed[:, 0:-i] = 0.0
-                    windowed[:, l - i:] = 0.0
-                    numpy.multiply(self._channels[:, 0:l],
-                                   window_channels[:, -i:l - i],
-                                   out=windowed[:, -i:l - i])
-                    spectrum = numpy.fft.rfft(windowed)
-                    max_compensation = compensation_factor * (self.__offset + i) / self.__sampling_rate
-                    compensation = numpy.linspace(0.0, max_compensation, length, dtype=numpy.complex128)
-                    numpy.exp(compensation, out=compensated)
-                    compensated *= spectrum
-                    channels += compensated
-            i = 0
-            for i in range(0, self._length - window_length + 1, step):
-                numpy.multiply(self._channels[:, i:window_length + i],
-                               window_channels,
-                               out=windowed)
-                spectrum = numpy.fft.rfft(windowed)
-                max_compensation = compensation_factor * (self.__offset + i) / self.__sampling_rate
-                compensation = numpy.linspace(0.0, max_compensation, length, dtype=numpy.complex128)
-                numpy.exp(compensation, out=compensated)
-                compensated *= spectrum
-                channels += compensated
-            if pad:
-                for i in range(i + step, self._length, step):
-                    k = self._length - i
-                    windowed[:, k:] = 0.0
-                    numpy.multiply(self._channels[:, i:],
-                                   window_channels[:, 0:k],
-                                   out=windowed[:, 0:k])
-                    spectrum = numpy.fft.rfft(windowed)
-                    max_compensation = compensation_factor * (self.__offset + i) / self.__sampling_rate
-                    compensation = numpy.linspace(0.0, max_compensation, length, dtype=numpy.complex128)
-                    numpy.exp(compensation, out=compensated)
-                    compensated *= spectrum
-                    channels += compensated
+            compensation_factor = ((length - 1) * resolution * -2j * math.pi).imag
+            ramp = numpy.arange(length, dtype=numpy.complex128)
+            for positions, frames in self.__segments(window_length, window_length - overlap, pad):
+                # apply the window and transform all segments of the batch at once
+                spectrums = sumpf_internal.rfft(numpy.multiply(frames, window_channels))
+                # compute the group delay compensation for the positions of the segments
+                # (this is done like in numpy.linspace, so that the results are identical to a sequential computation)
+                max_compensations = numpy.zeros(len(positions), dtype=numpy.complex128)
+                max_compensations.imag = compensation_factor * (self.__offset + positions) / self.__sampling_rate
+                compensations = numpy.multiply.outer(max_compensations / max(length - 1, 1), ramp)
+                if length > 1:
+                    compensations[:, -1] = max_compensations
+                numpy.exp(compensations, out=compensations)
+                numpy.multiply(compensations[:, numpy.newaxis, :], spectrums, out=spectrums)   # the order of the factors matters for the rounding errors
+                # accumulate the segments in the same order as a sequential computation
+                spectrums[0] += channels
+                numpy.add.accumulate(spectrums, axis=0, out=spectrums)
+                channels[:] = spectrums[-1]
             channels.transpose()[:] *= sumpf_internal.scaling_factor(window, overlap)
         return channels, resolution
 
+    def __segments(self, window_length, step, pad):
+        """Helper generator for the block-wise Fourier transform, that yields the
+        segments of this signal in batches of at most :attr:`~sumpf.Signal.fourier_transform_batch_size`
+        segments. Each batch is a tuple of an array with the positions of the segments
+        and a three-dimensional array view of the segments' samples with the shape
+        ``(segments, channels, window length)``. The segments, which are padded
+        with zeros at the beginning are yielded first in reverse order, followed
+        by the full segments and the segments, that are padded at the end.
+        """
+        batch_size = max(1, self.fourier_transform_batch_size)
+        number_of_channels = len(self._channels)
+        sources = []
+        if pad:
+            positions = range(-step, -window_length, -step)
+            if positions:
+                start = positions[-1]
+                head = numpy.zeros(shape=(number_of_channels, window_length - step - start), dtype=self._channels.dtype)
+                l = min(window_length - step, self._length)
+                head[:, -start:l - start] = self._channels[:, 0:l]
+                segments = numpy.lib.stride_tricks.sliding_window_view(head, window_length, axis=1)
+                sources.append((positions, segments[:, ::step].transpose(1, 0, 2)[::-1]))
+        positions = range(0, self._length - window_length + 1, step)
+        if positions:
+            segments = numpy.lib.stride_tricks.sliding_window_view(self._channels, window_length, axis=1)
+            sources.append((positions, segments[:, ::step].transpose(1, 0, 2)))
+        if pad:
+            positions = range(positions[-1] + step if positions else step, self._length, step)
+            if positions:
+                start = positions[0]
+                tail = numpy.zeros(shape=(number_of_channels, positions[-1] + window_length - start), dtype=self._channels.dtype)
+                tail[:, 0:self._length - start] = self._channels[:, start:]
+                segments = numpy.lib.stride_tricks.sliding_window_view(tail, window_length, axis=1)
+                sources.append((positions, segments[:, ::step].transpose(1, 0, 2)))
+        for positions, segments in sources:
+            for i in range(0, len(positions), batch_size):
+                yield numpy.array(positions[i:i + batch_size]), segments[i:i + batch_size]
+
     def short_time_fourier_transform(self, window=4096, overlap=0.5, pad=True):
         """Computes a :class:`~sumpf.Spectrogram` from this signal.
 
@@ -547,7 +644,7 @@ class Signal(SampledData):
                                               noverlap=overlap,
                                               boundary="zeros" if pad else None,
                                               padded=pad)[2])
-        channels = sumpf_internal.allocate_array(shape=numpy.shape(stft), dtype=numpy.complex128)
+        channels = sumpf_internal.allocate_array(shape=numpy.shape(stft), dtype=self._complex_dtype())
         channels[:] = stft
         # deal with the offset
         resolution = self.__sampling_rate / window_length
@@ -603,7 +700,7 @@ class Signal(SampledData):
             return abs(self)
         half_window_length_float = (window_length - 1.0) / 2.0
         half_window_length = int(math.ceil(half_window_length_float))
-        channels = sumpf_internal.allocate_array(shape=self._channels.shape)
+        channels = sumpf_internal.allocate_array(shape=self._channels.shape, dtype=self._float_dtype())
         if 1 + half_window_length >= self._length:
             # if half the integration time is longer than the whole signal, the level is constant over time
             if pad:
@@ -656,36 +753,49 @@ class Signal(SampledData):
                             offset=self.__offset,
                             labels=self._labels)
 
-    def convolve(self, other, mode=sumpf_internal.ConvolutionMode.SPECTRUM_PADDED):
+    def convolve(self, other, mode=sumpf_internal.ConvolutionMode.SPECTRUM_PADDED, block_length=None):
         """Convolves this signal with another signal or an :func:`~numpy.array`.
 
         The convolution can be performed in different modes, which can be specified
         by passing a flag from the :class:`sumpf.Signal.convolution_modes` enumeration
         as the ``mode`` parameter of this method.
 
-        :param other: the :class:`~sumpf.Signal` or :func:`~numpy.array`, with which
-                      this signal shall be convolved
+        :param other: the :class:`~sumpf.Signal`, :class:`~sumpf.ConvolutionKernel`
+                      or :func:`~numpy.array`, with which this signal shall be convolved
         :param mode: a flag from the :class:`sumpf.Signal.convolution_modes` enumeration
+        :param block_length: the length of the blocks, in which the data is processed
+                             in the ``PARTITIONED`` mode or in the automatic modes,
+                             if they choose the partitioned computation. If None,
+                             the block length is chosen automatically. This parameter
+                             is ignored by the other modes.
         :returns: the convolution result as a :class:`~sumpf.Signal`
         """
         if isinstance(other, Signal):
             channels, offset = self.__convolve_with_array(other=other.channels(),
                                                           other_offset=other.offset(),
                                                           function=sumpf_internal.convolution,
-                                                          mode=mode)
+                                                          mode=mode,
+                                                          block_length=block_length)
+            labels = ("Convolution",) * len(self._channels)
+        elif isinstance(other, ConvolutionKernel):
+            channels, offset = self.__convolve_with_kernel(kernel=other,
+                                                           function=sumpf_internal.convolution,
+                                                           mode=mode,
+                                                           block_length=block_length)
             labels = ("Convolution",) * len(self._channels)
         else:
             channels, offset = self.__convolve_with_array(other=other,
                                                           other_offset=0,
                                                           function=sumpf_internal.convolution,
-                                                          mode=mode)
+                                                          mode=mode,
+                                                          block_length=block_length)
             labels = self._labels
         return Signal(channels=channels,
                       sampling_rate=self.__sampling_rate,
                       offset=offset,
                       labels=labels)
 
-    def correlate(self, other, mode=sumpf_internal.ConvolutionMode.SPECTRUM_PADDED):
+    def correlate(self, other, mode=sumpf_internal.ConvolutionMode.SPECTRUM_PADDED, block_length=None):
         """Computes the cross-correlation between this signal and a given signal
         or :func:`~numpy.array`.
 
@@ -701,22 +811,35 @@ class Signal(SampledData):
         correlation results are the reverse of :mod:`numpy`'s. For the ``SAME`` mode,
         *SuMPF* uses :func:`~numpy.convolve` with the first data set reversed.
 
-        :param other: the :class:`~sumpf.Signal` or :func:`~numpy.array`, with which
-                      this signal shall be correlated
+        :param other: the :class:`~sumpf.Signal`, :class:`~sumpf.ConvolutionKernel`
+                      or :func:`~numpy.array`, with which this signal shall be correlated
         :param mode: a flag from the :class:`sumpf.Signal.convolution_modes` enumeration
+        :param block_length: the length of the blocks, in which the data is processed
+                             in the ``PARTITIONED`` mode or in the automatic modes,
+                             if they choose the partitioned computation. If None,
+                             the block length is chosen automatically. This parameter
+                             is ignored by the other modes.
         :returns: the cross correlation result as a :class:`~sumpf.Signal`
         """
         if isinstance(other, Signal):
             channels, offset = self.__convolve_with_array(other=other.channels(),
                                                           other_offset=other.offset(),
                                                           function=sumpf_internal.correlation,
-                                                          mode=mode)
+                                                          mode=mode,
+                                                          block_length=block_length)
+            labels = ("Correlation",) * len(self._channels)
+        elif isinstance(other, ConvolutionKernel):
+            channels, offset = self.__convolve_with_kernel(kernel=other,
+                                                           function=sumpf_internal.correlation,
+                                                           mode=mode,
+                                                           block_length=block_length)
             labels = ("Correlation",) * len(self._channels)
         else:
             channels, offset = self.__convolve_with_array(other=other,
                                                           other_offset=0,
                                                           function=sumpf_internal.correlation,
-                                                          mode=mode)
+                                                          mode=mode,
+                                                          block_length=block_length)
             labels = self._labels
         return Signal(channels=channels,
                       sampling_rate=self.__sampling_rate,
@@ -803,17 +926,40 @@ class Signal(SampledData):
     #######################
 
     @staticmethod
-    def load(path):
+    def load(path, mmap=False, start=0, stop=None, channels=None):
         """A static method to load a :class:`~sumpf.Signal` instance from a file.
 
+        An excerpt of the file can be loaded by specifying the indices of the
+        samples and channels. Like for slicing, negative indices count from the
+        end. The offset of the loaded signal is shifted by the index of the first
+        loaded sample. For WAV, AIFF, FLAC and OGG files as well as for :mod:`numpy`
+        array files (``.npy``), only the selected part of the file is read, while
+        files in the other formats are loaded completely before selecting the excerpt.
+
         :param path: the path to the file.
+        :param mmap: True, if the file shall be mapped into memory instead of being
+                     read, so that the samples are only read, when they are accessed.
+                     This is supported for :mod:`numpy` array files (``.npy``) and
+                     uncompressed WAV files. The channels of the returned signal
+                     are read-only.
+        :param start: the index of the first sample, that shall be loaded
+        :param stop: the index behind the last sample, that shall be loaded or None
+                     to load the samples until the end of the file
+        :param channels: a sequence of the indices of the channels, that shall be
+                         loaded or None to load all channels
         :raises ValueError: if the file cannot be read (e.g. because the library
                             for the file's format is missing)
         :returns: the loaded :class:`~sumpf.Signal`
         """
+        if mmap:
+            signal = sumpf_internal.signal_readers.map_file(path)
+            return sumpf_internal.signal_readers.select(signal, start, stop, channels)
         return sumpf_internal.read_file(path=path,
                                         readers=sumpf_internal.signal_readers.readers,
-                                        reader_base_class=sumpf_internal.signal_readers.Reader)
+                                        reader_base_class=sumpf_internal.signal_readers.Reader,
+                                        start=start,
+                                        stop=stop,
+                                        channels=channels)
 
     def save(self, path, file_format=file_formats.AUTO):
         """Saves the signal to a file. The file will be created if it does not exist.
@@ -878,13 +1024,13 @@ class Signal(SampledData):
         :param function: a function, that implements the computation for arrays (e.g. numpy.add)
         :returns: a :class:`~sumpf.Signal` instance
         """
-        return Signal(channels=function(other, self._channels, out=sumpf_internal.allocate_array(self.shape())),
+        return Signal(channels=function(other, self._channels, out=sumpf_internal.allocate_array(self.shape(), self._float_dtype(other))),
                       sampling_rate=self.__sampling_rate,
                       offset=self.__offset,
                       labels=self._labels)
 
     def __algebra_function_signals_overlap(self, other, function, label):
-        channels = sumpf_internal.allocate_array(shape=self.shape())
+        channels = sumpf_internal.allocate_array(shape=self.shape(), dtype=self._float_dtype(other.channels()))
         function(self._channels, other.channels(), out=channels)
         return Signal(channels=channels,
                       sampling_rate=self.__sampling_rate,
@@ -892,7 +1038,7 @@ class Signal(SampledData):
                       labels=(label,) * len(self))
 
     def __algebra_function_self_has_one_channel(self, other, function, label):
-        channels = sumpf_internal.allocate_array(shape=other.shape())
+        channels = sumpf_internal.allocate_array(shape=other.shape(), dtype=self._float_dtype(other.channels()))
         function(self._channels[0], other.channels(), out=channels)
         return Signal(channels=channels,
                       sampling_rate=self.__sampling_rate,
@@ -900,7 +1046,7 @@ class Signal(SampledData):
                       labels=(label,) * len(other))
 
     def __algebra_function_other_has_one_channel(self, other, function, label):
-        channels = sumpf_internal.allocate_array(shape=self.shape())
+        channels = sumpf_internal.allocate_array(shape=self.shape(), dtype=self._float_dtype(other.channels()))
         function(self._channels, other.channels()[0], out=channels)
         return Signal(channels=channels,
                       sampling_rate=self.__sampling_rate,
@@ -914,7 +1060,7 @@ class Signal(SampledData):
         length = stop - start
         channelcount = max(len(self), len(other))
         shape = (channelcount, length)
-        channels = sumpf_internal.allocate_array(shape)
+        channels = sumpf_internal.allocate_array(shape, self._float_dtype(other.channels()))
         # copy the two signals
         channels[:] = 0.0
         channels[0:len(self), self.__offset - start:self.__offset + self._length - start] = self._channels
@@ -958,7 +1104,7 @@ class Signal(SampledData):
                       labels=(label,) * channelcount)
 
     def __algebra_function_different_type(self, other, function):
-        channels = sumpf_internal.allocate_array(self.shape())
+        channels = sumpf_internal.allocate_array(self.shape(), self._float_dtype(other))
         try:
             function(self._channels, other, out=channels)
         except TypeError:
@@ -969,28 +1115,41 @@ class Signal(SampledData):
                           offset=self.__offset,
                           labels=self._labels)
 
-    def __convolve_with_array(self, other, other_offset, function, mode):
+    def __convolve_with_array(self, other, other_offset, function, mode, block_length):
         shape = numpy.shape(other)
         if len(shape) == 0:     # pylint: disable=len-as-condition; this is more consistent, since the length is compared to one below
             return self.__convolve_with_scalar(other)
-        elif len(shape) == 1:
-            return function[mode].with_vector(matrix=self._channels,
+        implementation = sumpf_internal.get_implementation(function, mode, block_length)
+        if len(shape) == 1:
+            return implementation.with_vector(matrix=self._channels,
                                               vector=other,
                                               offsets=(self.__offset, other_offset))
         elif len(other) == 1:
-            return function[mode].with_vector(matrix=self._channels,
+            return implementation.with_vector(matrix=self._channels,
                                               vector=other[0],
                                               offsets=(self.__offset, other_offset))
         elif len(self) == 1:
-            return function[mode].with_vector2(vector=self._channels[0],
+            return implementation.with_vector2(vector=self._channels[0],
                                                matrix=other,
                                                offsets=(self.__offset, other_offset))
         else:
-            return function[mode].with_matrix(a=self._channels,
+            return implementation.with_matrix(a=self._channels,
                                               b=other,
                                               offsets=(self.__offset, other_offset))
 
+    def __convolve_with_kernel(self, kernel, function, mode, block_length):
+        if mode is sumpf_internal.ConvolutionMode.SPECTRUM_PADDED:
+            return function[mode].with_kernel(matrix=self._channels,
+                                              kernel=kernel,
+                                              offsets=(self.__offset, kernel.offset()))
+        else:
+            return self.__convolve_with_array(other=kernel.channels(),
+                                              other_offset=kernel.offset(),
+                                              function=function,
+                                              mode=mode,
+                                              block_length=block_length)
+
     def __convolve_with_scalar(self, other):
-        channels = sumpf_internal.allocate_array(shape=self._channels.shape)
+        channels = sumpf_internal.allocate_array(shape=self._channels.shape, dtype=self._float_dtype(other))
         numpy.multiply(self._channels, other, out=channels)
         return channels, self.__offset
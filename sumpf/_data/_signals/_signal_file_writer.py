@@ -0,0 +1,134 @@
+# This file is a part of the "SuMPF" package
+# Copyright (C) 2018-2019 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Contains the :class:`~sumpf.SignalFileWriter` class."""
+
+import sumpf._internal as sumpf_internal
+from ._signal import Signal
+
+__all__ = ("SignalFileWriter",)
+
+
+class SignalFileWriter:
+    """Writes a signal to a file block by block, so that long recordings or the
+    results of a block-wise processing can be saved without keeping the whole
+    signal in memory.
+
+    The file is opened, when the first block is appended. All blocks must have
+    the same number of channels and the same sampling rate. Their offsets are
+    neglected, so that the blocks are concatenated without gaps, and the offset
+    of the first block becomes the offset of the saved signal, if the file format
+    supports storing it. The file is finalized, when :meth:`close` is called,
+    which is done automatically, when the writer is used as a context manager::
+
+       with sumpf.SignalFileWriter("recording.wav") as writer:
+           for block in blocks:
+               writer.append(block)
+
+    Writing incrementally is supported for WAV, AIFF, FLAC and OGG files as well
+    as for :mod:`numpy` array files (``.npy``). The formats other than integer
+    WAV and AIFF formats require the :mod:`soundfile` library.
+    """
+
+    def __init__(self, path, file_format=Signal.file_formats.AUTO):
+        """
+        :param path: the path to the file
+        :param file_format: an optional flag from the :attr:`sumpf.Signal.file_formats`
+                            enumeration, that specifies the file format, in which
+                            the signal shall be stored. If this parameter is omitted
+                            or set to :attr:`~sumpf.Signal.file_formats`.\\ ``AUTO``,
+                            the format will be guessed from the ending of the filename.
+        """
+        self.__path = path
+        self.__file_format = file_format
+        self.__stream = None
+        self.__sampling_rate = None
+        self.__number_of_channels = None
+        self.__length = 0
+        self.__closed = False
+
+    def __enter__(self):
+        """Returns the writer, when it is used as a context manager.
+
+        :returns: this writer
+        """
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        """Closes the file, when the context is left. If the context is left due
+        to an exception, no empty file is created, when no block has been appended,
+        and errors from closing the file are suppressed, so that they do not hide
+        the original exception.
+        """
+        if exception_type is None:
+            self.close()
+        elif self.__stream is not None and not self.__closed:
+            self.__closed = True
+            try:
+                self.__stream.close()
+            except Exception:   # pylint: disable=broad-except; the original exception is more relevant
+                pass
+
+    def append(self, signal):
+        """Writes the samples of the given signal to the end of the file.
+
+        :param signal: a :class:`~sumpf.Signal` with a block of samples
+        :raises ValueError: if the writer has already been closed, if the signal's
+                            number of channels or sampling rate differs from that
+                            of the previous blocks or if the file cannot be written
+                            incrementally
+        :returns: this writer
+        """
+        if self.__closed:
+            raise ValueError("The writer has already been closed")
+        if self.__stream is None:
+            self.__open(sampling_rate=signal.sampling_rate(), number_of_channels=len(signal), offset=signal.offset())
+        elif len(signal) != self.__number_of_channels:
+            raise ValueError(f"The signal has {len(signal)} channels instead of {self.__number_of_channels}")
+        elif signal.sampling_rate() != self.__sampling_rate:
+            raise ValueError(f"The signal has the sampling rate {signal.sampling_rate()} instead of {self.__sampling_rate}")
+        self.__stream.write(signal.channels())
+        self.__length += signal.length()
+        return self
+
+    def length(self):
+        """Returns the number of samples per channel, that have been written to the file.
+
+        :returns: an integer
+        """
+        return self.__length
+
+    def close(self):
+        """Finalizes the file and closes it. If no block has been appended, an
+        empty signal is written to the file. Closing the writer more than once
+        has no effect.
+        """
+        if not self.__closed:
+            if self.__stream is None:
+                empty = Signal()
+                self.__open(sampling_rate=empty.sampling_rate(), number_of_channels=len(empty), offset=empty.offset())
+            self.__stream.close()
+            self.__closed = True
+
+    def __open(self, sampling_rate, number_of_channels, offset):
+        """Opens the file with the properties of the first block."""
+        self.__stream = sumpf_internal.signal_writers.open_stream(path=self.__path,
+                                                                  file_format=self.__file_format,
+                                                                  sampling_rate=sampling_rate,
+                                                                  number_of_channels=number_of_channels,
+                                                                  offset=offset)
+        self.__sampling_rate = sampling_rate
+        self.__number_of_channels = number_of_channels
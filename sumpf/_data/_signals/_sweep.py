@@ -71,10 +71,10 @@ def apply_delay(channels, sampling_rate, delay, out):
     with ``exp(2j * pi * f * delay)`` in the frequency domain
     """
     if channels.size:
-        spectrum = numpy.fft.rfft(channels)
+        spectrum = sumpf_internal.rfft(channels)
         f = numpy.linspace(0.0, sampling_rate / 2.0, spectrum.shape[-1])
         spectrum *= numpy.exp(2j * math.pi * f * delay)
-        signal = numpy.fft.irfft(spectrum, n=channels.shape[-1])
+        signal = sumpf_internal.irfft(spectrum, n=channels.shape[-1])
         out[:, 0:signal.shape[1]] = signal[:, 0:out.shape[1]]
     else:
         out[:] = channels[:]
@@ -205,7 +205,7 @@ class BaseExponentialSweep(Sweep):
         if length is not None:
             channel_count, harmonic_length = channels.shape
             if harmonic_length < length:
-                new_channels = sumpf_internal.allocate_array(shape=(channel_count, length))
+                new_channels = sumpf_internal.allocate_array(shape=(channel_count, length), dtype=channels.dtype)
                 new_channels[:, 0:harmonic_length] = channels
                 new_channels[:, harmonic_length:] = 0.0
                 if remaining_delay is not None:
@@ -216,7 +216,7 @@ class BaseExponentialSweep(Sweep):
                 channels = new_channels
             elif harmonic_length > channel_count:
                 if remaining_delay is not None:
-                    new_channels = sumpf_internal.allocate_array(shape=(channel_count, length))
+                    new_channels = sumpf_internal.allocate_array(shape=(channel_count, length), dtype=channels.dtype)
                     apply_delay(channels=channels,
                                 sampling_rate=sampling_rate,
                                 delay=remaining_delay,
@@ -266,7 +266,7 @@ class LinearSweep(Sweep):
         :param length: the number of samples of the sweep
         """
         # allocate shared memory for the channels
-        channels = sumpf_internal.allocate_array(shape=(1, length), dtype=numpy.float64)
+        channels = sumpf_internal.allocate_array(shape=(1, length), dtype=sumpf_internal.float_dtype())
         # generate the sweep
         _, _, t, _, sweep_offset, a, b, k = linear_sweep_parameters(start_frequency=start_frequency,
                                                                     stop_frequency=stop_frequency,
@@ -329,7 +329,7 @@ class InverseLinearSweep(Sweep):
         :param length: the number of samples of the sweep
         """
         # allocate shared memory for the channels
-        channels = sumpf_internal.allocate_array(shape=(1, length), dtype=numpy.float64)
+        channels = sumpf_internal.allocate_array(shape=(1, length), dtype=sumpf_internal.float_dtype())
         # generate the sweep
         start, stop, t, T, sweep_offset, a, b, k = linear_sweep_parameters(start_frequency=start_frequency,
                                                                            stop_frequency=stop_frequency,
@@ -385,7 +385,7 @@ class ExponentialSweep(BaseExponentialSweep):
         :param length: the number of samples of the sweep
         """
         # allocate shared memory for the channels
-        channels = sumpf_internal.allocate_array(shape=(1, length), dtype=numpy.float64)
+        channels = sumpf_internal.allocate_array(shape=(1, length), dtype=sumpf_internal.float_dtype())
         # generate the sweep
         _, _, t, _, sweep_offset, l, a = exponential_sweep_parameters(start_frequency,
                                                                       stop_frequency,
@@ -457,7 +457,7 @@ class InverseExponentialSweep(BaseExponentialSweep):
         :param length: the number of samples of the inverse sweep
         """
         # allocate shared memory for the channels
-        channels = sumpf_internal.allocate_array(shape=(1, length), dtype=numpy.float64)
+        channels = sumpf_internal.allocate_array(shape=(1, length), dtype=sumpf_internal.float_dtype())
         # generate the sweep
         start, stop, t, T, sweep_offset, l, a = exponential_sweep_parameters(start_frequency,
                                                                              stop_frequency,
@@ -57,7 +57,7 @@ class SineWave(Wave):
                               an integer or a float
         :param length: the number of samples of the sine wave
         """
-        channels = sumpf_internal.allocate_array(shape=(1, length), dtype=numpy.float64)
+        channels = sumpf_internal.allocate_array(shape=(1, length), dtype=sumpf_internal.float_dtype())
         duration = (length - 1) / sampling_rate
         omega_t_plus_phase = numpy.linspace(phase, 2.0 * math.pi * frequency * duration + phase, length)
         numpy.sin(omega_t_plus_phase, out=channels[0])
@@ -80,7 +80,7 @@ class SquareWave(Wave):
                               an integer or a float
         :param length: the number of samples of the sine wave
         """
-        channels = sumpf_internal.allocate_array(shape=(1, length), dtype=numpy.float64)
+        channels = sumpf_internal.allocate_array(shape=(1, length), dtype=sumpf_internal.float_dtype())
         duration = (length - 1) / sampling_rate
         omega_t_plus_phase = numpy.linspace(phase, 2.0 * math.pi * frequency * duration + phase, length)
         numpy.sin(omega_t_plus_phase, out=channels[0])
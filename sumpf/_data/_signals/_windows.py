@@ -50,7 +50,7 @@ class Window(Signal):
         """
         self.__symmetric = symmetric
         self.__plateau = sumpf_internal.index(plateau, length)
-        channels = sumpf_internal.allocate_array(shape=(1, length), dtype=numpy.float64)
+        channels = sumpf_internal.allocate_array(shape=(1, length), dtype=sumpf_internal.float_dtype())
         if self.__plateau == 0:
             if symmetric:
                 channels[0, :] = self._function(length)
@@ -108,7 +108,7 @@ class Window(Signal):
         padded_channel = numpy.empty(oversampling * self._length)
         padded_channel[0:self._length] = self._channels[0]
         padded_channel[self._length:] = 0.0
-        spectrum = numpy.fft.rfft(padded_channel)
+        spectrum = sumpf_internal.rfft(padded_channel)
         magnitude = numpy.abs(spectrum)
         threshold = magnitude[0] / math.sqrt(2.0)
         i = 0
@@ -139,7 +139,7 @@ class Window(Signal):
         padded_channel = numpy.empty(2 * self._length)
         padded_channel[0:self._length] = self._channels[0]
         padded_channel[self._length:] = 0.0
-        spectrum = numpy.fft.rfft(padded_channel)
+        spectrum = sumpf_internal.rfft(padded_channel)
         # due to the doubled frequency resolution, the amplitude error at the
         # 0.5-frequency bins in the original resolution is now the ratio between
         # the first and the second bin
@@ -178,7 +178,7 @@ class Spectrogram(SampledData):
 
         :returns: a :class:`sumpf.Spectrogram` instance
         """
-        return Spectrogram(channels=numpy.absolute(self._channels, out=sumpf_internal.allocate_array(self.shape())),
+        return Spectrogram(channels=numpy.absolute(self._channels, out=sumpf_internal.allocate_array(self.shape(), self._float_dtype())),
                            resolution=self.__resolution,
                            sampling_rate=self.__sampling_rate,
                            offset=self.__offset,
@@ -189,7 +189,7 @@ class Spectrogram(SampledData):
 
         :returns: a :class:`sumpf.Spectrogram` instance
         """
-        channels = sumpf_internal.allocate_array(shape=self.shape(), dtype=numpy.complex128)
+        channels = sumpf_internal.allocate_array(shape=self.shape(), dtype=self._complex_dtype())
         numpy.negative(self._channels, out=channels)
         return Spectrogram(channels=channels,
                            resolution=self.__resolution,
@@ -313,7 +313,7 @@ class Spectrogram(SampledData):
             return self
         else:
             channels = sumpf_internal.allocate_array(shape=(len(self), self.__frequencies, length),
-                                                     dtype=numpy.complex128)
+                                                     dtype=self._complex_dtype())
             if length < self._length:
                 channels[:] = self._channels[:, :, 0:length]
             else:
@@ -358,7 +358,7 @@ class Spectrogram(SampledData):
                                    labels=self._labels)
         else:
             if mode == Spectrogram.shift_modes.CROP:
-                channels = sumpf_internal.allocate_array(shape=self._channels.shape, dtype=numpy.complex128)
+                channels = sumpf_internal.allocate_array(shape=self._channels.shape, dtype=self._complex_dtype())
                 if shift < 0:
                     channels[:, :, 0:shift] = self._channels[:, :, -shift:]
                     channels[:, :, shift:] = 0.0
@@ -369,7 +369,7 @@ class Spectrogram(SampledData):
                 channels = sumpf_internal.allocate_array(shape=(len(self),
                                                                 self.__frequencies,
                                                                 self._length + abs(shift)),
-                                                         dtype=numpy.complex128)
+                                                         dtype=self._complex_dtype())
                 if shift < 0:
                     channels[:, :, 0:self._length] = self._channels
                     channels[:, :, self._length:] = 0.0
@@ -377,7 +377,7 @@ class Spectrogram(SampledData):
                     channels[:, :, 0:shift] = 0.0
                     channels[:, :, shift:] = self._channels
             elif mode == Spectrogram.shift_modes.CYCLE:
-                channels = sumpf_internal.allocate_array(shape=self._channels.shape, dtype=numpy.complex128)
+                channels = sumpf_internal.allocate_array(shape=self._channels.shape, dtype=self._complex_dtype())
                 channels[:, :, 0:shift] = self._channels[:, :, -shift:]
                 channels[:, :, shift:] = self._channels[:, :, 0:-shift]
             return Spectrogram(channels=channels,
@@ -386,12 +386,31 @@ class Spectrogram(SampledData):
                                offset=self.__offset,
                                labels=self._labels)
 
+    def to_precision(self, precision):
+        """Returns a spectrogram, whose channels have the given precision.
+
+        :param precision: ``"single"`` for :class:`numpy.complex64` samples, ``"double"``
+                          for :class:`numpy.complex128` samples or None for the precision
+                          from :attr:`sumpf.config.precision`
+        :returns: a :class:`~sumpf.Spectrogram`, which is this spectrogram, if it already has the requested precision
+        """
+        dtype = sumpf_internal.complex_dtype(precision)
+        if self._channels.dtype == dtype:
+            return self
+        channels = sumpf_internal.allocate_array(shape=self.shape(), dtype=dtype)
+        channels[:] = self._channels
+        return Spectrogram(channels=channels,
+                           resolution=self.__resolution,
+                           sampling_rate=self.__sampling_rate,
+                           offset=self.__offset,
+                           labels=self._labels)
+
     def conjugate(self):
         """Returns a spectrogram with the complex conjugate of this spectrogram's channels.
 
         :returns: a :class:`sumpf.Spectrogram`
         """
-        channels = sumpf_internal.allocate_array(shape=self.shape(), dtype=numpy.complex128)
+        channels = sumpf_internal.allocate_array(shape=self.shape(), dtype=self._complex_dtype())
         numpy.conjugate(self._channels, out=channels)
         return Spectrogram(channels=channels,
                            resolution=self.__resolution,
@@ -447,7 +466,7 @@ class Spectrogram(SampledData):
                                                 nperseg=window_length,
                                                 noverlap=overlap,
                                                 boundary=pad)[1])
-        channels = sumpf_internal.allocate_array(shape=numpy.shape(istft))
+        channels = sumpf_internal.allocate_array(shape=numpy.shape(istft), dtype=self._float_dtype())
         channels[:] = istft
         # return the spectrogram
         return sumpf.Signal(channels=channels,
@@ -543,7 +562,7 @@ class Spectrogram(SampledData):
         :param function: a function, that implements the computation for arrays (e.g. numpy.add)
         :returns: a :class:`~sumpf.Signal` instance
         """
-        channels = sumpf_internal.allocate_array(shape=self.shape(), dtype=numpy.complex128)
+        channels = sumpf_internal.allocate_array(shape=self.shape(), dtype=self._complex_dtype(other))
         try:
             function(other, self._channels, out=channels)
         except TypeError:
@@ -556,7 +575,7 @@ class Spectrogram(SampledData):
                                labels=self._labels)
 
     def __algebra_function_spectrograms_overlap(self, other, function, label):
-        channels = sumpf_internal.allocate_array(shape=self.shape(), dtype=numpy.complex128)
+        channels = sumpf_internal.allocate_array(shape=self.shape(), dtype=self._complex_dtype(other.channels()))
         function(self._channels, other.channels(), out=channels)
         return Spectrogram(channels=channels,
                            resolution=self.__resolution,
@@ -565,7 +584,7 @@ class Spectrogram(SampledData):
                            labels=(label,) * len(self))
 
     def __algebra_function_self_has_one_channel(self, other, function, label):
-        channels = sumpf_internal.allocate_array(shape=other.shape(), dtype=numpy.complex128)
+        channels = sumpf_internal.allocate_array(shape=other.shape(), dtype=self._complex_dtype(other.channels()))
         function(self._channels[0], other.channels(), out=channels)
         return Spectrogram(channels=channels,
                            resolution=self.__resolution,
@@ -574,7 +593,7 @@ class Spectrogram(SampledData):
                            labels=(label,) * len(self))
 
     def __algebra_function_other_has_one_channel(self, other, function, label):
-        channels = sumpf_internal.allocate_array(shape=self.shape(), dtype=numpy.complex128)
+        channels = sumpf_internal.allocate_array(shape=self.shape(), dtype=self._complex_dtype(other.channels()))
         function(self._channels, other.channels()[0], out=channels)
         return Spectrogram(channels=channels,
                            resolution=self.__resolution,
@@ -590,7 +609,7 @@ class Spectrogram(SampledData):
         frequencies = max(self.__frequencies, other.number_of_frequencies())
         channelcount = max(len(self), len(other))
         shape = (channelcount, frequencies, length)
-        channels = sumpf_internal.allocate_array(shape=shape, dtype=numpy.complex128)
+        channels = sumpf_internal.allocate_array(shape=shape, dtype=self._complex_dtype(other.channels()))
         # compute a few indices to make the slicing more readable
         sc = len(self)
         sf = self.__frequencies
@@ -646,7 +665,7 @@ class Spectrogram(SampledData):
                            labels=(label,) * channelcount)
 
     def __algebra_function_different_type(self, other, function):
-        channels = sumpf_internal.allocate_array(shape=self.shape(), dtype=numpy.complex128)
+        channels = sumpf_internal.allocate_array(shape=self.shape(), dtype=self._complex_dtype(other))
         try:
             function(self._channels, other, out=channels)
         except TypeError:
@@ -16,7 +16,6 @@
 
 """Contains the :class:`RudinShapiroNoiseSpectrum`-class."""
 
-import numpy
 import sumpf._internal as sumpf_internal
 from ._spectrum import Spectrum
 
@@ -52,7 +51,7 @@ class RudinShapiroNoiseSpectrum(Spectrum):
         else:
             sequence_length = min(int(round(stop_frequency / resolution)), length) - offset
         # generate the channel
-        channels = sumpf_internal.allocate_array(shape=(1, length), dtype=numpy.complex128)
+        channels = sumpf_internal.allocate_array(shape=(1, length), dtype=sumpf_internal.complex_dtype())
         channel = channels[0]
         channel[0:offset] = 0.0
         if offset < length and sequence_length > 0:
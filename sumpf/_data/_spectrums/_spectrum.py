@@ -153,7 +153,7 @@ class Spectrum(SampledData):
 
         :returns: a :class:`~sumpf.Spectrum` instance
         """
-        return Spectrum(channels=numpy.absolute(self._channels, out=sumpf_internal.allocate_array(self.shape())),
+        return Spectrum(channels=numpy.absolute(self._channels, out=sumpf_internal.allocate_array(self.shape(), self._float_dtype())),
                         resolution=self.__resolution,
                         labels=self._labels)
 
@@ -163,7 +163,7 @@ class Spectrum(SampledData):
         :returns: a :class:`~sumpf.Spectrum` instance
         """
         return Spectrum(channels=numpy.negative(self._channels, out=sumpf_internal.allocate_array(self.shape(),
-                                                                                                  numpy.complex128)),
+                                                                                                  self._complex_dtype())),
                         resolution=self.__resolution,
                         labels=self._labels)
 
@@ -185,21 +185,22 @@ class Spectrum(SampledData):
         :returns: a :class:`~sumpf.Spectrum` instance
         """
         if isinstance(other, Spectrum):
+            dtype = self._complex_dtype(other.channels())
             if len(self) == 1:
-                channels = sumpf_internal.allocate_array(shape=(len(other), self._length), dtype=numpy.complex128)
+                channels = sumpf_internal.allocate_array(shape=(len(other), self._length), dtype=dtype)
                 function(self._channels[0], other.channels(), out=channels)
             elif len(other) == 1:
-                channels = sumpf_internal.allocate_array(shape=self.shape(), dtype=numpy.complex128)
+                channels = sumpf_internal.allocate_array(shape=self.shape(), dtype=dtype)
                 function(self._channels, other.channels()[0], out=channels)
             elif len(self) < len(other):
-                channels = sumpf_internal.allocate_array(shape=(len(other), self._length), dtype=numpy.complex128)
+                channels = sumpf_internal.allocate_array(shape=(len(other), self._length), dtype=dtype)
                 function(self._channels, other.channels()[0:len(self)], out=channels[0:len(self)])
                 if other_pivot is None:
                     channels[len(self):] = other.channels()[len(self):]
                 else:
                     function(other_pivot, other.channels()[len(self):], out=channels[len(self):])
             else:
-                channels = sumpf_internal.allocate_array(shape=self.shape(), dtype=numpy.complex128)
+                channels = sumpf_internal.allocate_array(shape=self.shape(), dtype=dtype)
                 function(self._channels[0:len(other)], other.channels(), out=channels[0:len(other)])
                 channels[len(other):] = self._channels[len(other):]
             return Spectrum(channels=channels, resolution=self.__resolution, labels=(label,) * len(channels))
@@ -207,7 +208,7 @@ class Spectrum(SampledData):
             try:
                 return Spectrum(channels=function(self._channels,
                                                   other,
-                                                  out=sumpf_internal.allocate_array(self.shape(), numpy.complex128)),
+                                                  out=sumpf_internal.allocate_array(self.shape(), self._complex_dtype(other))),
                                 resolution=self.__resolution,
                                 labels=self._labels)
             except TypeError:
@@ -222,7 +223,7 @@ class Spectrum(SampledData):
         """
         return Spectrum(channels=function(other,
                                           self._channels,
-                                          out=sumpf_internal.allocate_array(self.shape(), numpy.complex128)),
+                                          out=sumpf_internal.allocate_array(self.shape(), self._complex_dtype(other))),
                         resolution=self.__resolution,
                         labels=self._labels)
 
@@ -238,7 +239,7 @@ class Spectrum(SampledData):
         """
         return Spectrum(channels=numpy.divide(1.0,
                                               self._channels,
-                                              out=sumpf_internal.allocate_array(self.shape(), numpy.complex128)),
+                                              out=sumpf_internal.allocate_array(self.shape(), self._complex_dtype())),
                         resolution=self.__resolution,
                         labels=self._labels)
 
@@ -317,7 +318,7 @@ class Spectrum(SampledData):
         if length == self._length:
             return self
         else:
-            channels = sumpf_internal.allocate_array(shape=(len(self), length), dtype=numpy.complex128)
+            channels = sumpf_internal.allocate_array(shape=(len(self), length), dtype=self._complex_dtype())
             if length < self._length:
                 channels[:] = self._channels[:, 0:length]
             else:
@@ -327,12 +328,29 @@ class Spectrum(SampledData):
                             resolution=self.__resolution,
                             labels=self._labels)
 
+    def to_precision(self, precision):
+        """Returns a spectrum, whose channels have the given precision.
+
+        :param precision: ``"single"`` for :class:`numpy.complex64` samples, ``"double"``
+                          for :class:`numpy.complex128` samples or None for the precision
+                          from :attr:`sumpf.config.precision`
+        :returns: a :class:`~sumpf.Spectrum`, which is this spectrum, if it already has the requested precision
+        """
+        dtype = sumpf_internal.complex_dtype(precision)
+        if self._channels.dtype == dtype:
+            return self
+        channels = sumpf_internal.allocate_array(shape=self.shape(), dtype=dtype)
+        channels[:] = self._channels
+        return Spectrum(channels=channels,
+                        resolution=self.__resolution,
+                        labels=self._labels)
+
     def conjugate(self):
         """Returns a spectrum with the complex conjugate of this spectrum's channels.
 
         :returns: a :class:`~sumpf.Spectrum`
         """
-        channels = sumpf_internal.allocate_array(shape=self.shape(), dtype=numpy.complex128)
+        channels = sumpf_internal.allocate_array(shape=self.shape(), dtype=self._complex_dtype())
         numpy.conjugate(self._channels, out=channels)
         return Spectrum(channels=channels, resolution=self.__resolution, labels=self._labels)
 
@@ -346,14 +364,14 @@ class Spectrum(SampledData):
         :returns: a :class:`~sumpf.Signal` instance
         """
         if self._length == 0:
-            return sumpf.Signal(channels=numpy.empty(shape=(len(self), 0)),
+            return sumpf.Signal(channels=numpy.empty(shape=(len(self), 0), dtype=self._float_dtype()),
                                 sampling_rate=0.0,
                                 offset=0,
                                 labels=self._labels)
         length = max(1, (self._length - 1) * 2)
         sampling_rate = self.__resolution * length
-        channels = sumpf_internal.allocate_array(shape=(len(self._channels), length))
-        channels[:, :] = numpy.fft.irfft(self._channels, n=length)
+        channels = sumpf_internal.allocate_array(shape=(len(self._channels), length), dtype=self._float_dtype())
+        channels[:, :] = sumpf_internal.irfft(self._channels, n=length)
         return sumpf.Signal(channels=channels,
                             sampling_rate=sampling_rate,
                             offset=0,
@@ -18,8 +18,10 @@
 
 from ._persistence import *
 
+from ._allocators import *
 from ._convolution import *
 from ._enums import *
+from ._fft import *
 from ._indexing import *
 from ._functions import *
 from ._text import *
@@ -0,0 +1,240 @@
+# This file is a part of the "SuMPF" package
+# Copyright (C) 2018-2019 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Contains the strategies, with which the arrays for the channels of the data
+sets and for intermediate results are allocated."""
+
+import ctypes
+import functools
+import math
+import threading
+import weakref
+from multiprocessing import sharedctypes
+import numpy
+import sumpf
+
+__all__ = ("Allocator", "NumpyAllocator", "SharedMemoryAllocator", "PoolAllocator",
+           "allocators", "get_allocator")
+
+
+class Allocator:
+    """Base class for the strategies, with which arrays are allocated. Additional
+    strategies can be added to the :attr:`allocators` dictionary.
+
+    The allocators keep statistics about the allocated memory, which can be retrieved
+    with the :meth:`statistics` method. For this, derived classes have to register
+    each array, that they return, with the :meth:`_track` method.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self.__allocated = 0
+        self.__reused = 0
+        self.__in_use = 0
+        self.__peak = 0
+
+    def allocate(self, shape, dtype):
+        """Abstract method, that has to be implemented in derived classes.
+
+        :param shape: the shape of the array as a tuple of integers
+        :param dtype: the dtype of the numbers, that shall be stored in the array
+        :returns: an uninitialized :func:`numpy.array`
+        """
+        raise NotImplementedError("This method should have been implemented in a derived class.")
+
+    def statistics(self):
+        """Returns the statistics about the memory, that has been allocated with
+        this allocator.
+
+        :returns: a dictionary with the number of bytes, that have been allocated
+                  from the operating system (``"allocated"``), that have been served
+                  by recycling previously freed buffers (``"reused"``), that are
+                  currently held by arrays (``"in_use"``) and the maximum of the
+                  bytes in use (``"peak"``)
+        """
+        with self._lock:
+            return {"allocated": self.__allocated,
+                    "reused": self.__reused,
+                    "in_use": self.__in_use,
+                    "peak": self.__peak}
+
+    def reset_statistics(self):
+        """Sets the numbers of allocated and reused bytes to zero and the peak to
+        the number of bytes, that are currently in use.
+        """
+        with self._lock:
+            self.__allocated = 0
+            self.__reused = 0
+            self.__peak = self.__in_use
+
+    def _track(self, owner, size, reused, callback=None):
+        """Protected helper method, that updates the statistics for a newly handed
+        out buffer and registers a finalizer, that is called, when the buffer is
+        no longer in use.
+
+        :param owner: the object, whose lifetime determines, how long the buffer
+                      is in use. This has to be an object, that is referenced by
+                      all views of the returned array.
+        :param size: the size of the buffer in bytes
+        :param reused: True, if the buffer has been recycled, False if it has been newly allocated
+        :param callback: an optional callable without parameters, that is called,
+                         when the owner is garbage collected, e.g. for recycling the buffer
+        """
+        with self._lock:
+            if reused:
+                self.__reused += size
+            else:
+                self.__allocated += size
+            self.__in_use += size
+            self.__peak = max(self.__peak, self.__in_use)
+        finalizer = weakref.finalize(owner, self.__release, size, callback)
+        finalizer.atexit = False
+
+    def __release(self, size, callback):
+        with self._lock:
+            self.__in_use -= size
+            if callback is not None:
+                callback()
+
+
+class NumpyAllocator(Allocator):
+    """Allocates the arrays on the heap with :func:`numpy.empty`."""
+
+    def allocate(self, shape, dtype):
+        """Allocates an array with :func:`numpy.empty` (see :meth:`Allocator.allocate`)."""
+        array = numpy.empty(shape=shape, dtype=dtype)
+        self._track(array, array.nbytes, reused=False)
+        return array
+
+
+class SharedMemoryAllocator(Allocator):
+    """Allocates the arrays in shared memory with :func:`multiprocessing.sharedctypes.RawArray`,
+    so that they can be passed to other processes without copying them. The arrays
+    are zero initialized.
+    """
+
+    def allocate(self, shape, dtype):
+        """Allocates an array in shared memory (see :meth:`Allocator.allocate`)."""
+        # compute the required memory in multiples of a double, so that the array is aligned for all dtypes
+        count = int(numpy.prod(shape))
+        size = -(-count * numpy.dtype(dtype).itemsize // ctypes.sizeof(ctypes.c_double))
+        # allocate a flat array in the shared memory
+        flat_array = numpy.frombuffer(sharedctypes.RawArray(ctypes.c_double, size), dtype=dtype, count=count)
+        self._track(flat_array, size * ctypes.sizeof(ctypes.c_double), reused=False)
+        # cast the array into a NumPy array with the desired shape
+        return flat_array.reshape(shape)
+
+
+class PoolAllocator(Allocator):
+    """Recycles the buffers of arrays, that are no longer used.
+
+    The buffers are grouped in size classes, of which there are four between two
+    consecutive powers of two, so that at most a quarter of a buffer is wasted.
+    When an array, that has been allocated by this allocator, is garbage collected,
+    its buffer is returned to the pool, from where it can be reused for the next
+    allocation of the same size class. This saves the allocation of new memory in
+    loops, in which intermediate results of the same size are created repeatedly.
+    Other than with the :class:`SharedMemoryAllocator`, the buffers are neither
+    zero initialized nor in shared memory, and the unused buffers are kept until
+    :meth:`clear` is called, so that they are not returned to the operating system.
+    """
+
+    minimum_size = 64   #: the size of the smallest size class in bytes
+
+    def __init__(self, maximum_pooled_bytes=2 ** 28):
+        """
+        :param maximum_pooled_bytes: the maximum number of bytes of the unused
+                                     buffers, that are kept for recycling. Buffers,
+                                     that would exceed this limit, are freed.
+        """
+        Allocator.__init__(self)
+        self.__maximum_pooled_bytes = maximum_pooled_bytes
+        self.__pool = {}
+        self.__pooled_bytes = 0
+
+    def allocate(self, shape, dtype):
+        """Allocates an array with a recycled buffer, if one is available, or with
+        a newly allocated buffer otherwise (see :meth:`Allocator.allocate`).
+        """
+        try:
+            shape = tuple(map(int, shape))
+        except TypeError:
+            shape = (int(shape),)
+        count = math.prod(shape)
+        size = self.size_class(count * numpy.dtype(dtype).itemsize)
+        with self._lock:
+            buffers = self.__pool.get(size)
+            if buffers:
+                buffer = buffers.pop()
+                self.__pooled_bytes -= size
+                reused = True
+            else:
+                buffer = numpy.empty(size, dtype=numpy.uint8)
+                reused = False
+        # wrap the buffer in a ctypes object, which is referenced by all views of
+        # the returned array, so that its lifetime determines, when the buffer can be recycled
+        owner = (ctypes.c_char * size).from_buffer(buffer)
+        self._track(owner, size, reused, functools.partial(self.__recycle, buffer))
+        return numpy.frombuffer(owner, dtype=dtype, count=count).reshape(shape)
+
+    def pooled_bytes(self):
+        """Returns the number of bytes of the unused buffers, that are kept for recycling.
+
+        :returns: an integer
+        """
+        return self.__pooled_bytes
+
+    def clear(self):
+        """Frees the unused buffers, that are kept for recycling."""
+        with self._lock:
+            self.__pool.clear()
+            self.__pooled_bytes = 0
+
+    @classmethod
+    def size_class(cls, size):
+        """Returns the size of the buffers, that are used for arrays of the given size.
+
+        :param size: the required size in bytes
+        :returns: the size of the size class in bytes
+        """
+        if size <= cls.minimum_size:
+            return cls.minimum_size
+        step = 1 << ((size - 1).bit_length() - 3)
+        return -(-size // step) * step
+
+    def __recycle(self, buffer):
+        with self._lock:
+            size = len(buffer)
+            if self.__pooled_bytes + size <= self.__maximum_pooled_bytes:
+                self.__pool.setdefault(size, []).append(buffer)
+                self.__pooled_bytes += size
+
+
+allocators = {"numpy": NumpyAllocator(),
+              "shared": SharedMemoryAllocator(),
+              "pool": PoolAllocator()}  #: a dictionary, that maps the names of the allocation strategies to instances of :class:`Allocator`
+
+
+def get_allocator():
+    """Returns the allocator, that is selected by the :attr:`sumpf.config.allocator` setting.
+
+    :returns: an :class:`Allocator` instance
+    """
+    name = sumpf.config.allocator
+    try:
+        return allocators[name]
+    except KeyError:
+        raise ValueError(f"Unknown allocator: {name}. Available allocators are: {', '.join(allocators)}")
@@ -16,11 +16,17 @@
 
 """Contains helper classes for the computation of convolutions and correlations."""
 
+import math
+import time
 import numpy
-from ._functions import allocate_array
+import sumpf
+from ._fft import rfft, irfft, fft_length, get_fft_backend
+from ._functions import allocate_array, complex_dtype, float_dtype, get_precision
 from ._enums import ConvolutionMode
 
-__all__ = ("convolution", "correlation")
+__all__ = ("convolution", "correlation", "get_implementation",
+           "choose_convolution_method", "calibrate_convolution_costs",
+           "partitioned_overlap_save")
 
 
 class Convolution:
@@ -60,7 +66,7 @@ class FullConvolution(Convolution):
         :param offsets: a tuple with the offsets of the signals, from which the given data is taken
         """
         mc, ml = matrix.shape
-        channels = allocate_array(shape=(mc, ml + len(vector) - 1))
+        channels = allocate_array(shape=(mc, ml + len(vector) - 1), dtype=result_dtype(matrix, vector))
         for c, channel in zip(matrix, channels):
             channel[:] = numpy.convolve(c, vector, mode="full")
         return channels, sum(offsets)
@@ -74,7 +80,7 @@ class FullConvolution(Convolution):
         """
         ac, al = a.shape
         bc, bl = b.shape
-        channels = allocate_array(shape=(min(ac, bc), al + bl - 1))
+        channels = allocate_array(shape=(min(ac, bc), al + bl - 1), dtype=result_dtype(a, b))
         for c, d, channel in zip(a, b, channels):
             channel[:] = numpy.convolve(c, d, mode="full")
         return channels, sum(offsets)
@@ -94,7 +100,7 @@ class SameConvolution(Convolution):
         """
         mc, ml = matrix.shape
         vl = len(vector)
-        channels = allocate_array(shape=(mc, max(ml, vl)))
+        channels = allocate_array(shape=(mc, max(ml, vl)), dtype=result_dtype(matrix, vector))
         for c, channel in zip(matrix, channels):
             channel[:] = numpy.convolve(c, vector, mode="same")
         return channels, sum(offsets) + (min(ml, vl) - 1) // 2
@@ -108,7 +114,7 @@ class SameConvolution(Convolution):
         """
         ac, al = a.shape
         bc, bl = b.shape
-        channels = allocate_array(shape=(min(ac, bc), max(al, bl)))
+        channels = allocate_array(shape=(min(ac, bc), max(al, bl)), dtype=result_dtype(a, b))
         for c, d, channel in zip(a, b, channels):
             channel[:] = numpy.convolve(c, d, mode="same")
         return channels, sum(offsets) + (min(al, bl) - 1) // 2
@@ -128,7 +134,7 @@ class ValidConvolution(Convolution):
         """
         mc, ml = matrix.shape
         vl = len(vector)
-        channels = allocate_array(shape=(mc, abs(ml - vl) + 1))
+        channels = allocate_array(shape=(mc, abs(ml - vl) + 1), dtype=result_dtype(matrix, vector))
         for c, channel in zip(matrix, channels):
             channel[:] = numpy.convolve(c, vector, mode="valid")
         return channels, sum(offsets) + (min(ml, vl) - 1)
@@ -142,7 +148,7 @@ class ValidConvolution(Convolution):
         """
         ac, al = a.shape
         bc, bl = b.shape
-        channels = allocate_array(shape=(min(ac, bc), abs(al - bl) + 1))
+        channels = allocate_array(shape=(min(ac, bc), abs(al - bl) + 1), dtype=result_dtype(a, b))
         for c, d, channel in zip(a, b, channels):
             channel[:] = numpy.convolve(c, d, mode="valid")
         return channels, sum(offsets) + (min(al, bl) - 1)
@@ -170,10 +176,10 @@ class SpectrumConvolution(Convolution):
         if vl < pl:
             vector = pad_vector(vector, vl, pl)
         # compute the convolution
-        ms = numpy.fft.rfft(matrix)
-        vs = numpy.fft.rfft(vector)
-        channels = allocate_array(shape=(mc, rl))
-        channels[:] = numpy.fft.irfft(ms * vs)[:, 0:rl]
+        ms = rfft(matrix)
+        vs = rfft(vector)
+        channels = allocate_array(shape=(mc, rl), dtype=result_dtype(matrix, vector))
+        channels[:] = irfft(ms * vs)[:, 0:rl]
         return channels, sum(offsets)
 
     @staticmethod
@@ -194,10 +200,10 @@ class SpectrumConvolution(Convolution):
         if bl < pl:
             b = pad_matrix(b, bl, c, pl)
         # compute the convolution
-        as_ = numpy.fft.rfft(a[0:c])
-        bs = numpy.fft.rfft(b[0:c])
-        channels = allocate_array(shape=(c, rl))
-        channels[:] = numpy.fft.irfft(as_ * bs)[:, 0:rl]
+        as_ = rfft(a[0:c])
+        bs = rfft(b[0:c])
+        channels = allocate_array(shape=(c, rl), dtype=result_dtype(a, b))
+        channels[:] = irfft(as_ * bs)[:, 0:rl]
         return channels, sum(offsets)
 
 
@@ -216,16 +222,16 @@ class SpectrumPaddedConvolution(Convolution):
         """
         mc, ml = matrix.shape
         vl = len(vector)
-        rl = ml + vl - 1                        # result length
-        pl = rl + 1 if rl % 2 == 1 else rl + 2  # padded length
+        rl = ml + vl - 1        # result length
+        pl = fft_length(rl)     # padded length
         # pad the arrays
         matrix = pad_matrix(matrix, ml, mc, pl)
         vector = pad_vector(vector, vl, pl)
         # compute the convolution
-        ms = numpy.fft.rfft(matrix)
-        vs = numpy.fft.rfft(vector)
-        channels = allocate_array(shape=(mc, rl))
-        channels[:] = numpy.fft.irfft(ms * vs)[:, 0:rl]
+        ms = rfft(matrix)
+        vs = rfft(vector)
+        channels = allocate_array(shape=(mc, rl), dtype=result_dtype(matrix, vector))
+        channels[:] = irfft(ms * vs)[:, 0:rl]
         return channels, sum(offsets)
 
     @staticmethod
@@ -238,16 +244,97 @@ class SpectrumPaddedConvolution(Convolution):
         ac, al = a.shape
         bc, bl = b.shape
         c = min(ac, bc)
-        rl = al + bl - 1                        # result length
-        pl = rl + 1 if rl % 2 == 1 else rl + 2  # padded length
+        rl = al + bl - 1        # result length
+        pl = fft_length(rl)     # padded length
         # pad the arrays
         a = pad_matrix(a, al, c, pl)
         b = pad_matrix(b, bl, c, pl)
         # compute the convolution
-        as_ = numpy.fft.rfft(a[0:c])
-        bs = numpy.fft.rfft(b[0:c])
-        channels = allocate_array(shape=(c, rl))
-        channels[:] = numpy.fft.irfft(as_ * bs)[:, 0:rl]
+        as_ = rfft(a[0:c])
+        bs = rfft(b[0:c])
+        channels = allocate_array(shape=(c, rl), dtype=result_dtype(a, b))
+        channels[:] = irfft(as_ * bs)[:, 0:rl]
+        return channels, sum(offsets)
+
+    @staticmethod
+    def with_kernel(matrix, kernel, offsets):
+        """
+        :param matrix: a two dimensional :func:`numpy.array`
+        :param kernel: a :class:`~sumpf.ConvolutionKernel` instance, whose spectrum is cached
+        :param offsets: a tuple with the offsets of the signals, from which the given data is taken
+        """
+        mc, ml = matrix.shape
+        c = number_of_kernel_result_channels(mc, len(kernel.channels()))
+        rl = ml + kernel.length() - 1   # result length
+        pl = fft_length(rl)             # padded length
+        # compute the convolution
+        ms = rfft(pad_matrix(matrix, ml, min(mc, c), pl))
+        ks = kernel.spectrum(pl)
+        channels = allocate_array(shape=(c, rl), dtype=result_dtype(matrix, kernel.channels()))
+        channels[:] = irfft(ms * ks[0:c])[:, 0:rl]
+        return channels, sum(offsets)
+
+
+class PartitionedConvolution(Convolution):
+    """A helper class, that computes convolutions with a uniformly partitioned
+    overlap-save algorithm. The shorter one of the two operands is split into
+    partitions of the block length, which are transformed to the frequency domain
+    once. The longer operand is then processed block by block, so that the memory
+    for the transformations is bounded by the block length rather than by the
+    length of the signals. The result is the same as that of the ``SPECTRUM_PADDED``
+    mode except for rounding errors.
+
+    Other than the other convolution classes, this class has to be instantiated,
+    because the block length is stored in the instance.
+    """
+
+    def __init__(self, block_length=None):
+        """
+        :param block_length: the length of the blocks, in which the data is processed.
+                             If None, the block length is derived from the length
+                             of the shorter operand.
+        """
+        if block_length is not None and block_length < 1:
+            raise ValueError(f"The block length must be a positive integer, not {block_length}")
+        self.__block_length = block_length
+
+    def with_vector(self, matrix, vector, offsets):   # pylint: disable=arguments-differ; these methods have to be instance methods, because the block length is stored in the instance
+        """
+        :param matrix: a two dimensional :func:`numpy.array`
+        :param vector: a one dimensional :func:`numpy.array`
+        :param offsets: a tuple with the offsets of the signals, from which the given data is taken
+        """
+        mc, ml = matrix.shape
+        vl = len(vector)
+        channels = allocate_array(shape=(mc, ml + vl - 1), dtype=result_dtype(matrix, vector))
+        if vl <= ml:
+            partitioned_overlap_save(inputs=matrix, kernels=numpy.reshape(vector, (1, vl)), block_length=self.__block_length, out=channels)
+        else:
+            partitioned_overlap_save(inputs=numpy.reshape(vector, (1, vl)), kernels=matrix, block_length=self.__block_length, out=channels)
+        return channels, sum(offsets)
+
+    def with_vector2(self, vector, matrix, offsets):  # pylint: disable=arguments-differ; these methods have to be instance methods, because the block length is stored in the instance
+        """
+        :param vector: a one dimensional :func:`numpy.array`
+        :param matrix: a two dimensional :func:`numpy.array`
+        :param offsets: a tuple with the offsets of the signals, from which the given data is taken
+        """
+        return self.with_vector(matrix, vector, offsets)
+
+    def with_matrix(self, a, b, offsets):
+        """
+        :param a: a two dimensional :func:`numpy.array`
+        :param b: a two dimensional :func:`numpy.array`
+        :param offsets: a tuple with the offsets of the signals, from which the given data is taken
+        """
+        ac, al = a.shape
+        bc, bl = b.shape
+        c = min(ac, bc)
+        channels = allocate_array(shape=(c, al + bl - 1), dtype=result_dtype(a, b))
+        if bl <= al:
+            partitioned_overlap_save(inputs=a[0:c], kernels=b[0:c], block_length=self.__block_length, out=channels)
+        else:
+            partitioned_overlap_save(inputs=b[0:c], kernels=a[0:c], block_length=self.__block_length, out=channels)
         return channels, sum(offsets)
 
 
@@ -264,7 +351,7 @@ class FullCorrelation:
         :param offsets: a tuple with the offsets of the signals, from which the given data is taken
         """
         mc, ml = matrix.shape
-        channels = allocate_array(shape=(mc, ml + len(vector) - 1))
+        channels = allocate_array(shape=(mc, ml + len(vector) - 1), dtype=result_dtype(matrix, vector))
         for c, channel in zip(matrix, channels):
             channel[:] = numpy.correlate(c, vector, mode="full")[::-1]
         return channels, offsets[1] - offsets[0] - ml + 1
@@ -278,7 +365,7 @@ class FullCorrelation:
         """
         mc, ml = matrix.shape
         vl = len(vector)
-        channels = allocate_array(shape=(mc, ml + vl - 1))
+        channels = allocate_array(shape=(mc, ml + vl - 1), dtype=result_dtype(vector, matrix))
         for c, channel in zip(matrix, channels):
             channel[:] = numpy.correlate(vector, c, mode="full")[::-1]
         return channels, offsets[1] - offsets[0] - vl + 1
@@ -292,7 +379,7 @@ class FullCorrelation:
         """
         ac, al = a.shape
         bc, bl = b.shape
-        channels = allocate_array(shape=(min(ac, bc), al + bl - 1))
+        channels = allocate_array(shape=(min(ac, bc), al + bl - 1), dtype=result_dtype(a, b))
         for c, d, channel in zip(a, b, channels):
             channel[:] = numpy.correlate(c, d, mode="full")[::-1]
         return channels, offsets[1] - offsets[0] - al + 1
@@ -313,7 +400,7 @@ class SameCorrelation:
         mc, ml = matrix.shape
         vl = len(vector)
         rl = max(ml, vl)
-        channels = allocate_array(shape=(mc, rl))
+        channels = allocate_array(shape=(mc, rl), dtype=result_dtype(matrix, vector))
         for c, channel in zip(matrix, channels):
             channel[:] = numpy.convolve(c[::-1], vector, mode="same")
         return channels, offsets[1] - offsets[0] + vl - rl - min(ml, vl) // 2
@@ -328,7 +415,7 @@ class SameCorrelation:
         vl = len(vector)
         mc, ml = matrix.shape
         rl = max(ml, vl)
-        channels = allocate_array(shape=(mc, rl))
+        channels = allocate_array(shape=(mc, rl), dtype=result_dtype(vector, matrix))
         vector = vector[::-1]
         for c, channel in zip(matrix, channels):
             channel[:] = numpy.convolve(vector, c, mode="same")
@@ -344,7 +431,7 @@ class SameCorrelation:
         ac, al = a.shape
         bc, bl = b.shape
         rl = max(al, bl)
-        channels = allocate_array(shape=(min(ac, bc), rl))
+        channels = allocate_array(shape=(min(ac, bc), rl), dtype=result_dtype(a, b))
         for c, d, channel in zip(a, b, channels):
             channel[:] = numpy.convolve(c[::-1], d, mode="same")
         return channels, offsets[1] - offsets[0] + bl - rl - min(al, bl) // 2
@@ -365,7 +452,7 @@ class ValidCorrelation:
         mc, ml = matrix.shape
         vl = len(vector)
         rl = abs(ml - vl) + 1
-        channels = allocate_array(shape=(mc, rl))
+        channels = allocate_array(shape=(mc, rl), dtype=result_dtype(matrix, vector))
         for c, channel in zip(matrix, channels):
             channel[:] = numpy.correlate(c, vector, mode="valid")[::-1]
         return channels, offsets[1] - offsets[0] - (ml - vl + rl) // 2
@@ -380,7 +467,7 @@ class ValidCorrelation:
         vl = len(vector)
         mc, ml = matrix.shape
         rl = abs(vl - ml) + 1
-        channels = allocate_array(shape=(mc, rl))
+        channels = allocate_array(shape=(mc, rl), dtype=result_dtype(vector, matrix))
         for c, channel in zip(matrix, channels):
             channel[:] = numpy.correlate(vector, c, mode="valid")[::-1]
         return channels, offsets[1] - offsets[0] - (vl - ml + rl) // 2
@@ -395,7 +482,7 @@ class ValidCorrelation:
         ac, al = a.shape
         bc, bl = b.shape
         rl = abs(al - bl) + 1
-        channels = allocate_array(shape=(min(ac, bc), rl))
+        channels = allocate_array(shape=(min(ac, bc), rl), dtype=result_dtype(a, b))
         for c, d, channel in zip(a, b, channels):
             channel[:] = numpy.correlate(c, d, mode="valid")[::-1]
         return channels, offsets[1] - offsets[0] - (al - bl + rl) // 2
@@ -428,10 +515,10 @@ class SpectrumCorrelation:
         else:
             vector = cycle_vector(vector, vl, -1)
         # compute the correlation
-        ms = numpy.fft.rfft(matrix).conjugate()
-        vs = numpy.fft.rfft(vector)
-        channels = allocate_array(shape=(mc, rl))
-        channels[:] = numpy.fft.irfft(ms * vs)[:, -rl:]
+        ms = rfft(matrix).conjugate()
+        vs = rfft(vector)
+        channels = allocate_array(shape=(mc, rl), dtype=result_dtype(matrix, vector))
+        channels[:] = irfft(ms * vs)[:, -rl:]
         return channels, offsets[1] - offsets[0] - ml + 1
 
     @staticmethod
@@ -456,10 +543,10 @@ class SpectrumCorrelation:
         else:
             matrix = cycle_matrix(matrix, vl, mc, -1)
         # compute the correlation
-        vs = numpy.fft.rfft(vector).conjugate()
-        ms = numpy.fft.rfft(matrix)
-        channels = allocate_array(shape=(mc, rl))
-        channels[:] = numpy.fft.irfft(vs * ms)[:, -rl:]
+        vs = rfft(vector).conjugate()
+        ms = rfft(matrix)
+        channels = allocate_array(shape=(mc, rl), dtype=result_dtype(vector, matrix))
+        channels[:] = irfft(vs * ms)[:, -rl:]
         return channels, offsets[1] - offsets[0] - vl + 1
 
     @staticmethod
@@ -485,10 +572,10 @@ class SpectrumCorrelation:
         else:
             b = cycle_matrix(b, bl, c, -1)
         # compute the correlation
-        as_ = numpy.fft.rfft(a[0:c]).conjugate()
-        bs = numpy.fft.rfft(b[0:c])
-        channels = allocate_array(shape=(c, rl))
-        channels[:] = numpy.fft.irfft(as_ * bs)[:, -rl:]
+        as_ = rfft(a[0:c]).conjugate()
+        bs = rfft(b[0:c])
+        channels = allocate_array(shape=(c, rl), dtype=result_dtype(a, b))
+        channels[:] = irfft(as_ * bs)[:, -rl:]
         return channels, offsets[1] - offsets[0] - al + 1
 
 
@@ -507,20 +594,16 @@ class SpectrumPaddedCorrelation:
         """
         mc, ml = matrix.shape
         vl = len(vector)
-        rl = ml + vl - 1    # result length
+        rl = ml + vl - 1        # result length
+        pl = fft_length(rl)     # padded length
         # pad the arrays
-        if rl % 2 == 1:
-            pl = rl + 1
-            matrix = pad_and_shift_matrix(matrix, ml, mc, pl, 1)
-        else:
-            pl = rl + 2
-            matrix = pad_and_shift_matrix(matrix, ml, mc, pl, 2)
+        matrix = pad_and_shift_matrix(matrix, ml, mc, pl, pl - rl)
         vector = shift_vector(vector, vl, pl)
         # compute the correlation
-        ms = numpy.fft.rfft(matrix).conjugate()
-        vs = numpy.fft.rfft(vector)
-        channels = allocate_array(shape=(mc, rl))
-        channels[:] = numpy.fft.irfft(ms * vs)[:, 0:rl]
+        ms = rfft(matrix).conjugate()
+        vs = rfft(vector)
+        channels = allocate_array(shape=(mc, rl), dtype=result_dtype(matrix, vector))
+        channels[:] = irfft(ms * vs)[:, 0:rl]
         return channels, offsets[1] - offsets[0] - ml + 1
 
     @staticmethod
@@ -532,20 +615,16 @@ class SpectrumPaddedCorrelation:
         """
         vl = len(vector)
         mc, ml = matrix.shape
-        rl = ml + vl - 1    # result length
+        rl = ml + vl - 1        # result length
+        pl = fft_length(rl)     # padded length
         # pad the arrays
-        if rl % 2 == 1:
-            pl = rl + 1
-            vector = pad_and_shift_vector(vector, vl, pl, 1)
-        else:
-            pl = rl + 2
-            vector = pad_and_shift_vector(vector, vl, pl, 2)
+        vector = pad_and_shift_vector(vector, vl, pl, pl - rl)
         matrix = shift_matrix(matrix, ml, mc, pl)
         # compute the correlation
-        vs = numpy.fft.rfft(vector).conjugate()
-        ms = numpy.fft.rfft(matrix)
-        channels = allocate_array(shape=(mc, rl))
-        channels[:] = numpy.fft.irfft(vs * ms)[:, 0:rl]
+        vs = rfft(vector).conjugate()
+        ms = rfft(matrix)
+        channels = allocate_array(shape=(mc, rl), dtype=result_dtype(vector, matrix))
+        channels[:] = irfft(vs * ms)[:, 0:rl]
         return channels, offsets[1] - offsets[0] - vl + 1
 
     @staticmethod
@@ -558,38 +637,386 @@ class SpectrumPaddedCorrelation:
         ac, al = a.shape
         bc, bl = b.shape
         c = min(ac, bc)
-        rl = al + bl - 1    # result length
+        rl = al + bl - 1        # result length
+        pl = fft_length(rl)     # padded length
         # pad the arrays
-        if rl % 2 == 1:
-            pl = rl + 1
-            a = pad_and_shift_matrix(a, al, c, pl, 1)
-        else:
-            pl = rl + 2
-            a = pad_and_shift_matrix(a, al, c, pl, 2)
+        a = pad_and_shift_matrix(a, al, c, pl, pl - rl)
         b = shift_matrix(b, bl, c, pl)
         # compute the correlation
-        as_ = numpy.fft.rfft(a[0:c]).conjugate()
-        bs = numpy.fft.rfft(b[0:c])
-        channels = allocate_array(shape=(c, rl))
-        channels[:] = numpy.fft.irfft(as_ * bs)[:, 0:rl]
+        as_ = rfft(a[0:c]).conjugate()
+        bs = rfft(b[0:c])
+        channels = allocate_array(shape=(c, rl), dtype=result_dtype(a, b))
+        channels[:] = irfft(as_ * bs)[:, 0:rl]
+        return channels, offsets[1] - offsets[0] - al + 1
+
+    @staticmethod
+    def with_kernel(matrix, kernel, offsets):
+        """
+        :param matrix: a two dimensional :func:`numpy.array`
+        :param kernel: a :class:`~sumpf.ConvolutionKernel` instance, whose spectrum is cached
+        :param offsets: a tuple with the offsets of the signals, from which the given data is taken
+        """
+        mc, ml = matrix.shape
+        c = number_of_kernel_result_channels(mc, len(kernel.channels()))
+        rl = ml + kernel.length() - 1   # result length
+        pl = fft_length(rl)             # padded length
+        # compute the correlation
+        ms = rfft(pad_and_shift_matrix(matrix, ml, min(mc, c), pl, pl - rl)).conjugate()
+        ks = kernel.spectrum(pl, shifted=True)
+        channels = allocate_array(shape=(c, rl), dtype=result_dtype(matrix, kernel.channels()))
+        channels[:] = irfft(ms * ks[0:c])[:, 0:rl]
+        return channels, offsets[1] - offsets[0] - ml + 1
+
+
+class PartitionedCorrelation:
+    """A helper class, that computes correlations with a uniformly partitioned
+    overlap-save algorithm. The correlation is computed as the convolution of
+    the reversed first operand with the second operand (see the
+    :class:`PartitionedConvolution` class).
+
+    Other than the other correlation classes, this class has to be instantiated,
+    because the block length is stored in the instance.
+    """
+
+    def __init__(self, block_length=None):
+        """
+        :param block_length: the length of the blocks, in which the data is processed.
+                             If None, the block length is derived from the length
+                             of the shorter operand.
+        """
+        self.__convolution = PartitionedConvolution(block_length)
+
+    def with_vector(self, matrix, vector, offsets):
+        """
+        :param matrix: a two dimensional :func:`numpy.array`
+        :param vector: a one dimensional :func:`numpy.array`
+        :param offsets: a tuple with the offsets of the signals, from which the given data is taken
+        """
+        ml = matrix.shape[1]
+        channels, _ = self.__convolution.with_vector(matrix[:, ::-1], vector, offsets)
+        return channels, offsets[1] - offsets[0] - ml + 1
+
+    def with_vector2(self, vector, matrix, offsets):
+        """
+        :param vector: a one dimensional :func:`numpy.array`
+        :param matrix: a two dimensional :func:`numpy.array`
+        :param offsets: a tuple with the offsets of the signals, from which the given data is taken
+        """
+        vl = len(vector)
+        channels, _ = self.__convolution.with_vector(matrix, vector[::-1], offsets)
+        return channels, offsets[1] - offsets[0] - vl + 1
+
+    def with_matrix(self, a, b, offsets):
+        """
+        :param a: a two dimensional :func:`numpy.array`
+        :param b: a two dimensional :func:`numpy.array`
+        :param offsets: a tuple with the offsets of the signals, from which the given data is taken
+        """
+        al = a.shape[1]
+        channels, _ = self.__convolution.with_matrix(a[:, ::-1], b, offsets)
         return channels, offsets[1] - offsets[0] - al + 1
 
 
+class AutomaticConvolution:
+    """A helper class for the ``AUTO_FULL``, ``AUTO_SAME`` and ``AUTO_VALID`` modes,
+    which chooses the fastest computation method with :func:`choose_convolution_method`.
+    If the direct computation is chosen, the respective helper class for the ``FULL``,
+    ``SAME`` or ``VALID`` mode is used. Otherwise, the full convolution or correlation
+    is computed in the frequency domain and the result is cropped to the length
+    and the offset of the respective direct mode.
+
+    This class is used for both the convolution and the correlation, so it has
+    to be instantiated with the dictionary of the respective implementations.
+    """
+
+    def __init__(self, implementations, mode, block_length=None):
+        """
+        :param implementations: either the ``convolution`` or the ``correlation`` dictionary
+        :param mode: the flag of the direct mode, whose results shall be computed,
+                     which is either ``FULL``, ``SAME`` or ``VALID``
+        :param block_length: the block length for the partitioned computation or None
+        """
+        self.__implementations = implementations
+        self.__mode = mode
+        self.__block_length = block_length
+
+    def with_vector(self, matrix, vector, offsets):
+        """
+        :param matrix: a two dimensional :func:`numpy.array`
+        :param vector: a one dimensional :func:`numpy.array`
+        :param offsets: a tuple with the offsets of the signals, from which the given data is taken
+        """
+        mc, ml = matrix.shape
+        implementation = self.__implementation(ml, len(vector), mc)
+        channels, offset = implementation.with_vector(matrix, vector, offsets)
+        return self.__crop(channels, offset, ml, len(vector))
+
+    def with_vector2(self, vector, matrix, offsets):
+        """
+        :param vector: a one dimensional :func:`numpy.array`
+        :param matrix: a two dimensional :func:`numpy.array`
+        :param offsets: a tuple with the offsets of the signals, from which the given data is taken
+        """
+        mc, ml = matrix.shape
+        implementation = self.__implementation(len(vector), ml, mc)
+        channels, offset = implementation.with_vector2(vector, matrix, offsets)
+        return self.__crop(channels, offset, len(vector), ml)
+
+    def with_matrix(self, a, b, offsets):
+        """
+        :param a: a two dimensional :func:`numpy.array`
+        :param b: a two dimensional :func:`numpy.array`
+        :param offsets: a tuple with the offsets of the signals, from which the given data is taken
+        """
+        ac, al = a.shape
+        bc, bl = b.shape
+        implementation = self.__implementation(al, bl, min(ac, bc))
+        channels, offset = implementation.with_matrix(a, b, offsets)
+        return self.__crop(channels, offset, al, bl)
+
+    def __implementation(self, length1, length2, channels):
+        method = choose_convolution_method(mode=self.__mode,
+                                           length1=length1,
+                                           length2=length2,
+                                           channels=channels,
+                                           block_length=self.__block_length)
+        return get_implementation(self.__implementations, method, self.__block_length)
+
+    def __crop(self, channels, offset, length1, length2):
+        full_length = length1 + length2 - 1
+        if channels.shape[1] != full_length or self.__mode is ConvolutionMode.FULL:
+            return channels, offset     # the result has been computed directly in the requested mode
+        shorter = min(length1, length2)
+        if self.__mode is ConvolutionMode.SAME:
+            start = (shorter - 1) // 2
+            length = max(length1, length2)
+        else:
+            start = shorter - 1
+            length = abs(length1 - length2) + 1
+        result = allocate_array(shape=(len(channels), length), dtype=channels.dtype)
+        result[:] = channels[:, start:start + length]
+        return result, offset + start
+
+
 convolution = {ConvolutionMode.FULL: FullConvolution,
                ConvolutionMode.SAME: SameConvolution,
                ConvolutionMode.VALID: ValidConvolution,
                ConvolutionMode.SPECTRUM: SpectrumConvolution,
-               ConvolutionMode.SPECTRUM_PADDED: SpectrumPaddedConvolution}
+               ConvolutionMode.SPECTRUM_PADDED: SpectrumPaddedConvolution,
+               ConvolutionMode.PARTITIONED: PartitionedConvolution()}
+convolution.update({ConvolutionMode.AUTO_FULL: AutomaticConvolution(convolution, ConvolutionMode.FULL),
+                    ConvolutionMode.AUTO_SAME: AutomaticConvolution(convolution, ConvolutionMode.SAME),
+                    ConvolutionMode.AUTO_VALID: AutomaticConvolution(convolution, ConvolutionMode.VALID)})
 correlation = {ConvolutionMode.FULL: FullCorrelation,
                ConvolutionMode.SAME: SameCorrelation,
                ConvolutionMode.VALID: ValidCorrelation,
                ConvolutionMode.SPECTRUM: SpectrumCorrelation,
-               ConvolutionMode.SPECTRUM_PADDED: SpectrumPaddedCorrelation}
+               ConvolutionMode.SPECTRUM_PADDED: SpectrumPaddedCorrelation,
+               ConvolutionMode.PARTITIONED: PartitionedCorrelation()}
+correlation.update({ConvolutionMode.AUTO_FULL: AutomaticConvolution(correlation, ConvolutionMode.FULL),
+                    ConvolutionMode.AUTO_SAME: AutomaticConvolution(correlation, ConvolutionMode.SAME),
+                    ConvolutionMode.AUTO_VALID: AutomaticConvolution(correlation, ConvolutionMode.VALID)})
+_automatic_modes = {ConvolutionMode.AUTO_FULL: ConvolutionMode.FULL,
+                    ConvolutionMode.AUTO_SAME: ConvolutionMode.SAME,
+                    ConvolutionMode.AUTO_VALID: ConvolutionMode.VALID}
+
+
+def get_implementation(implementations, mode, block_length=None):
+    """Returns the helper class, that computes a convolution or a correlation
+    in the given mode.
+
+    :param implementations: either the ``convolution`` or the ``correlation`` dictionary
+    :param mode: a flag from the :class:`~sumpf._internal._enums.ConvolutionMode` enumeration
+    :param block_length: the block length for the ``PARTITIONED`` mode or None
+                         for an automatically chosen block length. This parameter
+                         is also used by the automatic modes, if they choose the
+                         partitioned computation, and it is ignored by the other modes.
+    :returns: an object with the methods ``with_vector``, ``with_vector2`` and ``with_matrix``
+    """
+    if block_length is not None:
+        if mode is ConvolutionMode.PARTITIONED:
+            if implementations is correlation:
+                return PartitionedCorrelation(block_length)
+            else:
+                return PartitionedConvolution(block_length)
+        elif mode in _automatic_modes:
+            return AutomaticConvolution(implementations, _automatic_modes[mode], block_length)
+    return implementations[mode]
+
+
+def choose_convolution_method(mode, length1, length2, channels, block_length=None):
+    """Estimates the durations of the computation methods for a convolution or
+    a correlation with the cost model, whose coefficients are set in
+    :attr:`sumpf.config.convolution_costs`, and returns the mode of the fastest
+    method. The estimation depends only on the lengths of the operands and on
+    the number of channels of the result, so that the convolution with a single
+    channel and the convolution with multiple identical channels are computed
+    with the same method.
+
+    :param mode: the flag of the direct mode, whose results shall be computed,
+                 which is either ``FULL``, ``SAME`` or ``VALID``
+    :param length1: the length of the first operand
+    :param length2: the length of the second operand
+    :param channels: the number of channels of the result
+    :param block_length: the block length for the partitioned computation or None
+    :returns: either the given mode for the direct computation, ``SPECTRUM_PADDED``
+              or ``PARTITIONED``
+    """
+    costs = sumpf.config.convolution_costs
+    fast_length = get_fft_backend().fast_length
+    shorter, longer = sorted((length1, length2))
+    full_length = length1 + length2 - 1
+    # the direct computation with numpy.convolve, that is called once per channel
+    if mode is ConvolutionMode.FULL:
+        result_length = full_length
+    elif mode is ConvolutionMode.SAME:
+        result_length = longer
+    else:
+        result_length = longer - shorter + 1
+    direct = channels * (result_length * (shorter * costs["direct"] + costs["direct_sample"]) + costs["call"])
+    # the multiplication of the padded spectrums, which includes the padding of
+    # both operands, the multiplication and the copying of the result
+    padded_length = fast_length(full_length)
+    transform = padded_length * math.log2(padded_length) * costs["transform"]
+    elementwise = (2 * padded_length + (padded_length // 2 + 1) + full_length) * costs["elementwise"]
+    spectrum = channels * (3 * transform + elementwise) + 8 * costs["call"]
+    # the partitioned overlap-save algorithm, which includes the shifting of the
+    # frame, the multiply-accumulate with each partition and the copying of the result
+    if block_length is None:
+        block_length = default_block_length(shorter)
+    frame_length = fast_length(2 * block_length)
+    partitions = -(-shorter // block_length)
+    blocks = -(-full_length // block_length)
+    transform = frame_length * math.log2(frame_length) * costs["transform"]
+    elementwise = (frame_length + 2 * partitions * (frame_length // 2 + 1) + block_length) * costs["elementwise"]
+    partitioned = (channels * (partitions + 2 * blocks) * transform +
+                   channels * blocks * elementwise +
+                   (blocks * (2 * partitions + 6) + 8) * costs["call"])
+    # choose the fastest method
+    return min((direct, mode),
+               (spectrum, ConvolutionMode.SPECTRUM_PADDED),
+               (partitioned, ConvolutionMode.PARTITIONED),
+               key=lambda cost: cost[0])[1]
+
+
+def calibrate_convolution_costs(repetitions=20):
+    """Measures the coefficients of the cost model for choosing the computation
+    method of the automatic convolution modes on the current machine. The returned
+    dictionary can be assigned to :attr:`sumpf.config.convolution_costs`. The
+    transforms are measured with the backend, that is selected in :mod:`sumpf.config`.
+    This function is made public as :func:`sumpf.config.calibrate_convolution_costs`.
+
+    :param repetitions: the number of repetitions of each benchmark, of which the fastest one is evaluated
+    :returns: a dictionary with the coefficients of the cost model
+    """
+    def duration(function, *args):
+        durations = []
+        for _ in range(repetitions):
+            start = time.perf_counter()
+            function(*args)
+            durations.append(time.perf_counter() - start)
+        return min(durations)
+
+    generator = numpy.random.default_rng(0)
+    length = 2 ** 16
+    signal = generator.uniform(-1.0, 1.0, length)
+    short_kernel = generator.uniform(-1.0, 1.0, 2 ** 4)
+    long_kernel = generator.uniform(-1.0, 1.0, 2 ** 9)
+    spectrum = rfft(signal)
+    product = numpy.empty_like(spectrum)
+    scalar = numpy.ones(1)
+    call = duration(numpy.multiply, scalar, scalar, scalar)
+    short = max(duration(numpy.convolve, signal, short_kernel, "same") - call, 0.0) / length
+    long_ = max(duration(numpy.convolve, signal, long_kernel, "same") - call, 0.0) / length
+    direct = max(long_ - short, 0.0) / (len(long_kernel) - len(short_kernel))
+    return {"direct": direct,
+            "direct_sample": max(short - len(short_kernel) * direct, 0.0),
+            "transform": max(duration(rfft, signal) - call, 0.0) / (length * math.log2(length)),
+            "elementwise": max(duration(numpy.multiply, spectrum, spectrum, product) - call, 0.0) / len(spectrum),
+            "call": call}
+
+
+def result_dtype(*operands):
+    """A helper function, that returns the dtype of the result of a convolution
+    or correlation, which has single precision, if all operands have single precision.
+    """
+    return float_dtype(get_precision(*operands))
+
+
+def default_block_length(kernel_length):
+    """A helper function, that returns the block length for the partitioned
+    overlap-save algorithm, if no block length has been specified.
+    """
+    return min(max(64, 2 ** int(numpy.ceil(numpy.log2(kernel_length)))), 2 ** 13)
+
+
+def number_of_kernel_result_channels(matrix_channels, kernel_channels):
+    """A helper function, that computes the number of channels of the result of
+    a convolution or correlation with a :class:`~sumpf.ConvolutionKernel`.
+    A single channel is combined with all channels of the other data set, otherwise
+    the surplus channels of the data set with more channels are ignored.
+    """
+    if kernel_channels == 1:
+        return matrix_channels
+    elif matrix_channels == 1:
+        return kernel_channels
+    else:
+        return min(matrix_channels, kernel_channels)
+
+
+def partitioned_overlap_save(inputs, kernels, block_length, out, skip=0):
+    """A helper function, that computes the full convolution of the rows of
+    two two dimensional arrays with a uniformly partitioned overlap-save algorithm.
+    Either array may have only one row, in which case it is convolved with every
+    row of the other array.
+
+    :param inputs: a two dimensional array, that is processed block by block
+    :param kernels: a two dimensional array, that is split into partitions
+    :param block_length: the length of the blocks or None
+    :param out: the two dimensional array, to which the result shall be written
+    :param skip: the number of samples at the beginning of the result, which shall
+                 not be written to ``out``, so that ``out`` can be shorter than
+                 the full convolution
+    """
+    kc, kl = kernels.shape
+    il = inputs.shape[1]
+    rl = out.shape[1] + skip
+    if block_length is None:
+        block_length = default_block_length(kl)
+    frame_length = fft_length(2 * block_length)
+    partitions = -(-kl // block_length)
+    # transform the partitions of the kernels
+    padded = numpy.zeros(shape=(kc, partitions * block_length), dtype=kernels.dtype)
+    padded[:, 0:kl] = kernels
+    kernel_spectrums = rfft(padded.reshape(kc, partitions, block_length), n=frame_length).transpose(1, 0, 2)
+    # process the inputs block by block
+    spectrum_dtype = complex_dtype(get_precision(out))
+    frame = numpy.zeros(shape=(inputs.shape[0], frame_length), dtype=out.dtype)
+    delay_line = numpy.zeros(shape=(partitions, inputs.shape[0], frame_length // 2 + 1), dtype=spectrum_dtype)
+    accumulator = numpy.empty(shape=(out.shape[0], frame_length // 2 + 1), dtype=spectrum_dtype)
+    product = numpy.empty_like(accumulator)
+    for j, start in enumerate(range(0, rl, block_length)):
+        frame[:, 0:block_length] = frame[:, block_length:2 * block_length]
+        stop = min(start + block_length, il)
+        if start < stop:
+            frame[:, block_length:block_length + stop - start] = inputs[:, start:stop]
+            frame[:, block_length + stop - start:2 * block_length] = 0.0
+        else:
+            frame[:, block_length:2 * block_length] = 0.0
+        delay_line[j % partitions] = rfft(frame)
+        numpy.multiply(delay_line[j % partitions], kernel_spectrums[0], out=accumulator)
+        for k in range(1, min(partitions, j + 1)):
+            numpy.multiply(delay_line[(j - k) % partitions], kernel_spectrums[k], out=product)
+            accumulator += product
+        first = max(start, skip)
+        stop = min(start + block_length, rl)
+        if first < stop:
+            out[:, first - skip:stop - skip] = irfft(accumulator, n=frame_length)[:, block_length + first - start:block_length + stop - start]
 
 
 def pad_vector(vector, vector_length, padded_length):
     """A helper function for padding a one dimensional array with zeros."""
-    result = numpy.empty(padded_length)
+    result = numpy.empty(padded_length, dtype=vector.dtype)
     result[0:vector_length] = vector
     result[vector_length:] = 0.0
     return result
@@ -597,7 +1024,7 @@ def pad_vector(vector, vector_length, padded_length):
 
 def shift_vector(vector, vector_length, padded_length):
     """A helper function for padding a one dimensional array with zeros."""
-    result = numpy.empty(padded_length)
+    result = numpy.empty(padded_length, dtype=vector.dtype)
     result[0:-vector_length] = 0.0
     result[-vector_length:] = vector
     return result
@@ -606,7 +1033,7 @@ def shift_vector(vector, vector_length, padded_length):
 def pad_and_shift_vector(vector, vector_length, padded_length, shift):
     """A helper function for padding a one dimensional array with zeros."""
     vector_length1 = vector_length + shift
-    result = numpy.empty(padded_length)
+    result = numpy.empty(padded_length, dtype=vector.dtype)
     result[0:shift] = 0.0
     result[shift:vector_length1] = vector
     result[vector_length1:] = 0.0
@@ -615,7 +1042,7 @@ def pad_and_shift_vector(vector, vector_length, padded_length, shift):
 
 def cycle_vector(vector, vector_length, shift):
     """A helper function for cyclic shifting a one dimensional array."""
-    result = numpy.empty(vector_length)
+    result = numpy.empty(vector_length, dtype=vector.dtype)
     result[0:shift] = vector[-shift:]
     result[shift:] = vector[0:-shift]
     return result
@@ -626,7 +1053,7 @@ def pad_and_cycle_vector(vector, vector_length, padded_length, shift):
     This function must only be used for negative shifts. For correct handling of
     positive shifts, see the pad_and_shift_vector function.
     """
-    result = numpy.empty(padded_length)
+    result = numpy.empty(padded_length, dtype=vector.dtype)
     if vector_length > shift:
         vector_length1 = vector_length + shift
         result[0:vector_length1] = vector[-shift:]
@@ -642,7 +1069,7 @@ def shift_and_cycle_vector(vector, vector_length, padded_length, shift):
     This function must only be used for positive shifts. For correct handling of
     negative shifts, see the pad_and_shift_vector function.
     """
-    result = numpy.empty(padded_length)
+    result = numpy.empty(padded_length, dtype=vector.dtype)
     result[0:shift] = vector[-shift:]
     if vector_length > shift:
         vector_length1 = vector_length - shift
@@ -655,7 +1082,7 @@ def shift_and_cycle_vector(vector, vector_length, padded_length, shift):
 
 def pad_matrix(matrix, matrix_length, rows, padded_length):
     """A helper function for padding a two dimensional array with zeros."""
-    result = numpy.empty(shape=(rows, padded_length))
+    result = numpy.empty(shape=(rows, padded_length), dtype=matrix.dtype)
     result[:, 0:matrix_length] = matrix[0:rows]
     result[:, matrix_length:] = 0.0
     return result
@@ -663,7 +1090,7 @@ def pad_matrix(matrix, matrix_length, rows, padded_length):
 
 def shift_matrix(matrix, matrix_length, rows, padded_length):
     """A helper function for padding a two dimensional array with zeros."""
-    result = numpy.empty(shape=(rows, padded_length))
+    result = numpy.empty(shape=(rows, padded_length), dtype=matrix.dtype)
     result[:, 0:-matrix_length] = 0.0
     result[:, -matrix_length:] = matrix[0:rows]
     return result
@@ -672,7 +1099,7 @@ def shift_matrix(matrix, matrix_length, rows, padded_length):
 def pad_and_shift_matrix(matrix, matrix_length, rows, padded_length, shift):
     """A helper function for padding a two dimensional array with zeros."""
     matrix_length1 = matrix_length + shift
-    result = numpy.empty(shape=(rows, padded_length))
+    result = numpy.empty(shape=(rows, padded_length), dtype=matrix.dtype)
     result[:, 0:shift] = 0.0
     result[:, shift:matrix_length1] = matrix[0:rows]
     result[:, matrix_length1:] = 0.0
@@ -681,7 +1108,7 @@ def pad_and_shift_matrix(matrix, matrix_length, rows, padded_length, shift):
 
 def cycle_matrix(matrix, matrix_length, rows, shift):
     """A helper function for cyclic shifting a two dimensional array."""
-    result = numpy.empty(shape=(rows, matrix_length))
+    result = numpy.empty(shape=(rows, matrix_length), dtype=matrix.dtype)
     result[:, 0:shift] = matrix[0:rows, -shift:]
     result[:, shift:] = matrix[0:rows, 0:-shift]
     return result
@@ -692,7 +1119,7 @@ def pad_and_cycle_matrix(matrix, matrix_length, rows, padded_length, shift):
     This function must only be used for negative shifts. For correct handling of
     positive shifts, see the pad_and_shift_matrix function.
     """
-    result = numpy.empty(shape=(rows, padded_length))
+    result = numpy.empty(shape=(rows, padded_length), dtype=matrix.dtype)
     if matrix_length > shift:
         matrix_length1 = matrix_length + shift
         result[:, 0:matrix_length1] = matrix[0:rows, -shift:]
@@ -708,7 +1135,7 @@ def shift_and_cycle_matrix(matrix, matrix_length, rows, padded_length, shift):
     This function must only be used for positive shifts. For correct handling of
     negative shifts, see the pad_and_shift_matrix function.
     """
-    result = numpy.empty(shape=(rows, padded_length))
+    result = numpy.empty(shape=(rows, padded_length), dtype=matrix.dtype)
     result[:, 0:shift] = matrix[0:rows, -shift:]
     if matrix_length > shift:
         matrix_length1 = matrix_length - shift
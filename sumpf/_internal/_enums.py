@@ -19,6 +19,7 @@
 import enum
 
 __all__ = ("ConvolutionMode",
+           "FilterApplicationMethod",
            "MergeMode",
            "ShiftMode",
            "NuttallWindows", "FlatTopWindows",
@@ -38,12 +39,54 @@ class ConvolutionMode(enum.Enum):
     * ``SPECTRUM_PADDED`` also a multiplication in the frequency domain, but the
       zero padding of both signals will be long enough to avoid the effects of
       circular convolution/correlation.
+    * ``PARTITIONED`` computes the same result as ``SPECTRUM_PADDED`` with a uniformly
+      partitioned overlap-save algorithm. The data is processed in blocks, so that
+      the memory consumption depends on the block length rather than on the length
+      of the signals. This is beneficial for long signals.
+    * ``AUTO_FULL``, ``AUTO_SAME`` and ``AUTO_VALID`` compute the same results as
+      ``FULL``, ``SAME`` and ``VALID`` with the same lengths and offsets, except
+      for rounding errors. A cost model, whose coefficients are set in
+      :attr:`sumpf.config.convolution_costs`, chooses the fastest computation from
+      the direct convolution with :func:`numpy.convolve`, the multiplication of
+      the padded spectrums or the partitioned overlap-save algorithm.
     """
     FULL = enum.auto()
     SAME = enum.auto()
     VALID = enum.auto()
     SPECTRUM = enum.auto()
     SPECTRUM_PADDED = enum.auto()
+    PARTITIONED = enum.auto()
+    AUTO_FULL = enum.auto()
+    AUTO_SAME = enum.auto()
+    AUTO_VALID = enum.auto()
+
+
+class FilterApplicationMethod(enum.Enum):
+    """An enumeration of flags, which define how the :meth:`~sumpf.Filter.apply`
+    method applies a filter to a signal. The flags can also be specified by their
+    values, so ``"iir"`` is equivalent to ``IIR``:
+
+    * ``SPECTRUM`` transforms the signal to the frequency domain, multiplies its
+      spectrum with the sampled transfer function and transforms the result back
+      to the time domain. This is the same as multiplying the filter with the signal.
+      The filter is applied circularly, which means, that the end of the filtered
+      signal wraps around to its beginning.
+    * ``IIR`` converts the filter's transfer function to digital second order sections
+      with the bilinear transform and applies them in the time domain. This requires
+      the transfer function to be a rational function of ``s`` and it deviates
+      from the transfer function close to the Nyquist frequency, but the computation
+      time is proportional to the length of the signal and the filter can be applied
+      to consecutive blocks of a signal (see :class:`~sumpf.IIRProcessor`).
+    * ``FIR`` samples the filter's transfer function once with a fixed length
+      and converts it to a windowed FIR filter (see :meth:`~sumpf.Filter.fir_kernel`),
+      that is applied block by block with a partitioned overlap-save algorithm.
+      This works with all transfer functions and the memory for the transforms
+      only depends on the lengths of the blocks and the FIR filter, but the frequency
+      resolution of the filter is limited by the length of the FIR filter.
+    """
+    SPECTRUM = "spectrum"
+    IIR = "iir"
+    FIR = "fir"
 
 
 class MergeMode(enum.Enum):
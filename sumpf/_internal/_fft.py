@@ -0,0 +1,205 @@
+# This file is a part of the "SuMPF" package
+# Copyright (C) 2018-2019 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Contains the backends for the computation of fast Fourier transforms and
+functions, through which all transforms in *SuMPF* are computed."""
+
+import functools
+import numpy
+import sumpf
+
+__all__ = ("FFTBackend", "fft_backends", "get_fft_backend", "rfft", "irfft",
+           "fft_length", "fft_length_hooks")
+
+
+class FFTBackend:
+    """Base class for the backends, that compute the fast Fourier transforms.
+    Additional backends can be added to the :attr:`fft_backends` dictionary.
+    """
+
+    def rfft(self, a, n, axis, workers):
+        """Abstract method, that has to be implemented in derived classes.
+
+        :param a: the real valued input array
+        :param n: the length of the transformed data or None to use the input's length
+        :param axis: the axis, along which the transform shall be computed
+        :param workers: the number of workers for the parallel computation or None
+        :returns: the complex spectrum as an :func:`numpy.array`
+        """
+        raise NotImplementedError("This method should have been implemented in a derived class.")
+
+    def irfft(self, a, n, axis, workers):
+        """Abstract method, that has to be implemented in derived classes.
+
+        :param a: the complex input array
+        :param n: the length of the output data or None to use ``2 * (m - 1)``,
+                  where ``m`` is the input's length
+        :param axis: the axis, along which the transform shall be computed
+        :param workers: the number of workers for the parallel computation or None
+        :returns: the real valued inverse transform as an :func:`numpy.array`
+        """
+        raise NotImplementedError("This method should have been implemented in a derived class.")
+
+    def fast_length(self, minimum):
+        """Returns an even length, that is greater or equal to the given minimum
+        and for which the transforms can be computed efficiently. Backends, which
+        have different preferences for the lengths of the transforms, can override
+        this method. The default implementation returns the smallest even number,
+        that has no prime factors larger than 5.
+
+        :param minimum: the minimum length as an integer
+        :returns: the length of the transform as an integer
+        """
+        return _even_five_smooth_number(minimum)
+
+
+class NumpyFFT(FFTBackend):
+    """Computes the fast Fourier transforms with :mod:`numpy.fft`. This backend
+    is always available, but it does not support the parallel computation of
+    the transforms.
+    """
+
+    def rfft(self, a, n, axis, workers):   # pylint: disable=unused-argument; NumPy does not support parallel transforms
+        """Computes the transform with :func:`numpy.fft.rfft` (see :meth:`FFTBackend.rfft`)."""
+        return numpy.fft.rfft(a, n=n, axis=axis)
+
+    def irfft(self, a, n, axis, workers):  # pylint: disable=unused-argument; NumPy does not support parallel transforms
+        """Computes the transform with :func:`numpy.fft.irfft` (see :meth:`FFTBackend.irfft`)."""
+        return numpy.fft.irfft(a, n=n, axis=axis)
+
+
+class ScipyFFT(FFTBackend):
+    """Computes the fast Fourier transforms with :mod:`scipy.fft`, which can
+    distribute the transforms of multiple channels to multiple workers.
+    """
+
+    def __init__(self):
+        """Imports the :mod:`scipy.fft` module. If *SciPy* is not installed, this
+        constructor raises an :exc:`ImportError`.
+        """
+        import scipy.fft    # pylint: disable=import-outside-toplevel; SciPy is an optional dependency
+        self.__fft = scipy.fft
+
+    def rfft(self, a, n, axis, workers):
+        """Computes the transform with :func:`scipy.fft.rfft` (see :meth:`FFTBackend.rfft`)."""
+        return self.__fft.rfft(a, n=n, axis=axis, workers=workers)
+
+    def irfft(self, a, n, axis, workers):
+        """Computes the transform with :func:`scipy.fft.irfft` (see :meth:`FFTBackend.irfft`)."""
+        return self.__fft.irfft(a, n=n, axis=axis, workers=workers)
+
+
+fft_length_hooks = []  #: a list of callables, that are called with the minimum length and the chosen length, whenever :func:`fft_length` has planned the length of a transform
+fft_backends = {"numpy": NumpyFFT()}    #: a dictionary, that maps the names of the FFT backends to instances of :class:`FFTBackend`
+try:
+    fft_backends["scipy"] = ScipyFFT()
+except ImportError:
+    pass
+
+
+def get_fft_backend():
+    """Returns the backend for the fast Fourier transforms, that is selected by
+    the :attr:`sumpf.config.fft_backend` and :attr:`sumpf.config.fft_workers`
+    settings.
+
+    :returns: an :class:`FFTBackend` instance
+    """
+    name = sumpf.config.fft_backend
+    if name is None:
+        workers = sumpf.config.fft_workers
+        if workers is not None and workers != 1 and "scipy" in fft_backends:
+            name = "scipy"
+        else:
+            name = "numpy"
+    try:
+        return fft_backends[name]
+    except KeyError:
+        raise ValueError(f"Unknown or unavailable FFT backend: {name}. Available backends are: {', '.join(fft_backends)}")
+
+
+def rfft(a, n=None, axis=-1):
+    """Computes the fast Fourier transform of real valued data with the backend,
+    that is selected in :mod:`sumpf.config`. The transform of single precision
+    data is returned with single precision, even if the backend computes it with
+    double precision.
+
+    :param a: the real valued input array
+    :param n: the length of the transformed data or None to use the input's length
+    :param axis: the axis, along which the transform shall be computed
+    :returns: the complex spectrum as an :func:`numpy.array`
+    """
+    result = get_fft_backend().rfft(a, n=n, axis=axis, workers=sumpf.config.fft_workers)
+    return _keep_precision(a, result, numpy.complex64)
+
+
+def irfft(a, n=None, axis=-1):
+    """Computes the inverse fast Fourier transform, that results in real valued
+    data, with the backend, that is selected in :mod:`sumpf.config`. The transform
+    of single precision data is returned with single precision, even if the backend
+    computes it with double precision.
+
+    :param a: the complex input array
+    :param n: the length of the output data or None to use ``2 * (m - 1)``,
+              where ``m`` is the input's length
+    :param axis: the axis, along which the transform shall be computed
+    :returns: the real valued inverse transform as an :func:`numpy.array`
+    """
+    result = get_fft_backend().irfft(a, n=n, axis=axis, workers=sumpf.config.fft_workers)
+    return _keep_precision(a, result, numpy.float32)
+
+
+def fft_length(minimum):
+    """Plans the length of a transform of zero padded data, for which the padded
+    length only has to be greater or equal to a minimum length. The length is
+    chosen by the backend, that is selected in :mod:`sumpf.config`. Before
+    returning the chosen length, this function calls the callables in the
+    :attr:`fft_length_hooks` list with the minimum and the chosen length as
+    parameters.
+
+    :param minimum: the minimum length as an integer
+    :returns: the length of the transform as an integer
+    """
+    length = get_fft_backend().fast_length(minimum)
+    for hook in fft_length_hooks:
+        hook(minimum, length)
+    return length
+
+
+def _keep_precision(data, result, single_dtype):
+    """Casts the result of a transform to single precision, if the transformed
+    data has single precision.
+    """
+    if getattr(data, "dtype", None) in (numpy.float32, numpy.complex64) and result.dtype != single_dtype:
+        return result.astype(single_dtype)
+    return result
+
+
+@functools.lru_cache(maxsize=1024)
+def _even_five_smooth_number(minimum):
+    """Returns the smallest even number, that is greater or equal to the given
+    minimum and that has no prime factors larger than 5.
+    """
+    best = 1 << max(1, (minimum - 1).bit_length())  # the next power of two is always a valid choice
+    power_of_five = 1
+    while power_of_five < best:
+        odd_factor = power_of_five
+        while odd_factor < best:
+            quotient = -(-minimum // odd_factor)
+            candidate = odd_factor * max(2, 1 << (quotient - 1).bit_length())
+            best = min(best, candidate)
+            odd_factor *= 3
+        power_of_five *= 5
+    return best
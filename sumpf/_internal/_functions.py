@@ -17,30 +17,82 @@
 """Contains helper functions for common functionalities."""
 
 import collections
-import ctypes
-from multiprocessing import sharedctypes
 import numpy
 import sumpf
+from ._allocators import get_allocator
 from ._indexing import index
 
-__all__ = ("allocate_array", "get_window", "sanitize_labels", "scaling_factor")
+__all__ = ("allocate_array", "get_precision", "float_dtype", "complex_dtype",
+           "get_window", "sanitize_labels", "scaling_factor")
+
+_float_dtypes = {"single": numpy.float32, "double": numpy.float64}
+_complex_dtypes = {"single": numpy.complex64, "double": numpy.complex128}
 
 
 def allocate_array(shape, dtype=numpy.float64):
-    """Allocates a :func:`numpy.array` with the given shape and the given dtype in the shared memory.
+    """Allocates a :func:`numpy.array` with the given shape and the given dtype
+    with the allocator, that is selected by :attr:`sumpf.config.allocator` (see
+    :func:`~sumpf._internal.get_allocator`). The array is not initialized.
 
     :param shape: the shape of the requested array
     :param dtype: the dtype of the numbers, that are stored in the array (defaults to ``numpy.float64``
     :returns: a :func:`numpy.array`
     """
-    # compute the required memory
-    factor = numpy.dtype(dtype).itemsize // numpy.dtype(numpy.float64).itemsize
-    size = factor * int(numpy.prod(shape))
-    # allocate a flat array in the shared memory
-    flat_array = sharedctypes.RawArray(ctypes.c_double, size)
-    # cast the array into a NumPy array with the desired shape and dtype
-    shaped_array = numpy.frombuffer(flat_array, dtype=dtype).reshape(shape)
-    return shaped_array
+    return get_allocator().allocate(shape=shape, dtype=dtype)
+
+
+def get_precision(*operands):
+    """Returns the precision of the result of a computation with the given operands.
+    The result has single precision, if all floating point arrays among the operands
+    have single precision (:class:`numpy.float32` or :class:`numpy.complex64`).
+    If any of them has double precision, the result has double precision, too.
+    Operands, that are not floating point arrays, like numbers (including :mod:`numpy`
+    scalars), sequences or integer arrays, do not influence the precision. If no operand is a floating
+    point array, the precision from :attr:`sumpf.config.precision` is returned.
+
+    :param `*operands`: the operands of the computation
+    :returns: either ``"single"`` or ``"double"``
+    """
+    precision = None
+    for operand in operands:
+        dtype = getattr(operand, "dtype", None)
+        if dtype is not None and dtype.kind in "fc" and numpy.ndim(operand):
+            if dtype in (numpy.float32, numpy.complex64):
+                precision = "single"
+            else:
+                return "double"
+    if precision is None:
+        return sumpf.config.precision
+    return precision
+
+
+def float_dtype(precision=None):
+    """Returns the dtype for real valued samples with the given precision.
+
+    :param precision: ``"single"``, ``"double"`` or None for the precision from :attr:`sumpf.config.precision`
+    :returns: either :class:`numpy.float32` or :class:`numpy.float64`
+    """
+    return _float_dtypes[_check_precision(precision)]
+
+
+def complex_dtype(precision=None):
+    """Returns the dtype for complex samples with the given precision.
+
+    :param precision: ``"single"``, ``"double"`` or None for the precision from :attr:`sumpf.config.precision`
+    :returns: either :class:`numpy.complex64` or :class:`numpy.complex128`
+    """
+    return _complex_dtypes[_check_precision(precision)]
+
+
+def _check_precision(precision):
+    """Replaces None with the precision from :attr:`sumpf.config.precision` and
+    raises a :exc:`ValueError`, if the precision is invalid.
+    """
+    if precision is None:
+        precision = sumpf.config.precision
+    if precision not in _float_dtypes:
+        raise ValueError(f"Unknown precision: {precision!r}. The precision must be either 'single' or 'double'")
+    return precision
 
 
 def get_window(window, overlap, symmetric=True, sampling_rate=48000.0):
@@ -14,13 +14,13 @@
 # You should have received a copy of the GNU Lesser General Public License along
 # with this program. If not, see <http://www.gnu.org/licenses/>.
 
-"""Contains interpolation functions."""
+"""Contains interpolation functions and plans for the repeated interpolation at fixed x values."""
 
 import functools
 import numpy
 from ._enums import Interpolations
 
-__all__ = ("get", "zero", "one", "linear", "log_x", "log_y", "stairs_lin", "stairs_log")
+__all__ = ("Plan", "get", "zero", "one", "linear", "log_x", "log_y", "stairs_lin", "stairs_log")
 
 
 def get(flag):
@@ -230,13 +230,24 @@ def _stairs_lin(x, xs, ys):
     Other than in the other interpolation functions, this helper function expects
     x to be an array every time.
     """
+    return ys[_stairs_indices(x, xs)]
+
+
+def _stairs_indices(x, xs):
+    """A helper function, that computes the indices of the supporting points,
+    whose function values are used by the linear stairs interpolation.
+
+    :param x: an array of x values, where the function shall be evaluated
+    :param xs: an array of x values of the supporting points
+    :returns: an integer array of indices with the same length as x
+    """
     i = numpy.searchsorted(xs, x)
-    i[i >= len(ys)] -= 1
+    i[i >= len(xs)] -= 1
     left = x - xs[numpy.maximum(i - 1, 0)]
     right = x - xs[i]
     mask = (numpy.fabs(left) < numpy.fabs(right))
     i[mask] -= 1
-    return ys[i]
+    return i
 
 
 @interpolation
@@ -297,3 +308,194 @@ def stairs_log(x, xs, ys, scalar):
         mask = (x > maximum)
         result[mask] = ys[xs == maximum][0]
         return result
+
+
+class Plan:
+    """Precomputes the indices and weights, with which the function values of
+    supporting points are combined, when they are interpolated at a fixed set of
+    x values. A plan does not depend on the function values, so it can be applied
+    to many sets of function values, without repeating the index searches of the
+    interpolation functions. It can also evaluate many sets of function values
+    in one pass, if they are given as the rows of a two-dimensional array.
+
+    Like in the evaluation of a :class:`~sumpf.Bands` filter, the extrapolation
+    function is used for the x values outside the range of the supporting points,
+    while the interpolation function is used for all other x values. The results
+    are the same as with the interpolation functions of this module.
+    """
+
+    def __init__(self, x, xs, interpolation, extrapolation):
+        """
+        :param x: an array of x values, where the function shall be evaluated
+        :param xs: a non-empty array of x values of the supporting points in ascending order
+        :param interpolation: a flag from the :class:`~sumpf._internal.Interpolations` enumeration
+        :param extrapolation: a flag from the :class:`~sumpf._internal.Interpolations` enumeration
+        """
+        x = numpy.asarray(x)
+        self.__shape = x.shape
+        x = x.ravel()
+        outside = (x < xs[0]) | (xs[-1] < x)
+        self.__regions = []
+        for mask, flag in ((outside, extrapolation), (~outside, interpolation)):
+            indices = numpy.flatnonzero(mask)
+            if indices.size:
+                self.__regions.append((indices, _stencil(flag, x[indices], xs)))
+
+    def __call__(self, ys, out=None):
+        """Evaluates the interpolation for the given function values.
+
+        :param ys: an array of function values of the supporting points or a
+                   two-dimensional array, whose rows are sets of function values
+        :param out: an optional array, in which the result shall be stored. Its
+                    shape must be the shape of ``ys`` without the last dimension,
+                    followed by the shape of the x values.
+        :returns: the interpolated and extrapolated function values
+        """
+        ys = numpy.asarray(ys)
+        shape = ys.shape[0:-1] + self.__shape
+        if out is None:
+            out = numpy.empty(shape=shape, dtype=numpy.result_type(ys, numpy.float64))
+        result = out.reshape(ys.shape[0:-1] + (-1,))
+        for indices, stencil in self.__regions:
+            result[..., indices] = stencil(ys)
+        if not numpy.may_share_memory(result, out):  # reshaping has copied a non-contiguous array
+            out[...] = result.reshape(shape)
+        return out
+
+
+def _stencil(flag, x, xs):
+    """Precomputes the evaluation of an interpolation function for a plan.
+
+    :param flag: a flag from the :class:`~sumpf._internal.Interpolations` enumeration
+    :param x: a one-dimensional array of x values, where the function shall be evaluated
+    :param xs: an array of x values of the supporting points
+    :returns: a function, that maps an array of function values to the interpolated values
+    """
+    if flag is Interpolations.ZERO:
+        function = functools.partial(_constant, numpy.zeros, len(x))
+    elif flag is Interpolations.ONE:
+        function = functools.partial(_constant, numpy.ones, len(x))
+    elif flag is Interpolations.LINEAR:
+        function = _LinearStencil(x, xs)
+    elif flag is Interpolations.LOG_X:
+        function = _LinearStencil(numpy.log2(x), numpy.log2(xs))
+    elif flag is Interpolations.LOG_Y:
+        function = functools.partial(_logarithmic, _LinearStencil(x, xs))
+    elif flag is Interpolations.STAIRS_LIN:
+        function = functools.partial(_gather, _stairs_indices(x, xs))
+    elif flag is Interpolations.STAIRS_LOG:
+        indices = _stairs_indices(numpy.log2(x), numpy.log2(xs))
+        indices[x < xs.min()] = numpy.argmin(xs)
+        indices[x > xs.max()] = numpy.argmax(xs)
+        function = functools.partial(_gather, indices)
+    else:
+        raise ValueError(f"Unknown interpolation flag: {flag}. See sumpf.Bands.interpolations for available flags.")
+    # at the supporting points, the exact function values are returned (see the interpolation-decorator)
+    order = numpy.argsort(xs, kind="stable")
+    position = numpy.minimum(numpy.searchsorted(xs[order], x), len(xs) - 1)
+    exact = numpy.flatnonzero(xs[order[position]] == x)
+    if exact.size:
+        return functools.partial(_exact, function, exact, order[position[exact]])
+    return function
+
+
+def _constant(fill, length, ys):
+    """Returns an array with constant values for every set of function values."""
+    return fill(ys.shape[0:-1] + (length,), dtype=ys.dtype)
+
+
+def _gather(indices, ys):
+    """Returns the function values at the given indices."""
+    return ys[..., indices]
+
+
+def _logarithmic(stencil, ys):
+    """Applies a linear interpolation to the logarithm of the function values."""
+    return numpy.exp2(stencil(numpy.log2(ys)))
+
+
+def _exact(function, positions, indices, ys):
+    """Replaces the interpolated values at the supporting points with their exact function values."""
+    result = function(ys)
+    result[..., positions] = ys[..., indices]
+    return result
+
+
+class _LinearStencil:
+    """Precomputes the linear interpolation and extrapolation with the same algorithms
+    as :func:`_linear`. The interpolation between the supporting points replicates
+    :func:`numpy.interp`, so that the results are equal.
+    """
+
+    def __init__(self, x, xs):
+        """
+        :param x: a one-dimensional array of x values, where the function shall be evaluated
+        :param xs: an array of x values of the supporting points
+        """
+        self.__length = len(x)
+        self.__xs = xs
+        if len(xs) > 1:
+            self.__below = numpy.flatnonzero(x < xs[0])
+            self.__above = numpy.flatnonzero(x > xs[-1])
+            # like in _linear, the values are not extrapolated, if the minimum or maximum of x is NaN
+            self.__extrapolate_below = x.min() < xs[0]
+            self.__extrapolate_above = x.max() > xs[-1]
+            self.__x_below = x[self.__below]
+            self.__x_above = x[self.__above]
+            i = numpy.clip(numpy.searchsorted(xs, x, side="right") - 1, 0, len(xs) - 2)
+            self.__left = i
+            self.__right = i + 1
+            self.__width = xs[i + 1] - xs[i]
+            self.__offset = x - xs[i]
+            self.__rest = x - xs[i + 1]
+            self.__last = numpy.flatnonzero(x == xs[-1])
+
+    def __call__(self, ys):
+        """Evaluates the interpolation for the given function values.
+
+        :param ys: an array of function values or a two-dimensional array, whose
+                   rows are sets of function values
+        :returns: the interpolated values
+        """
+        xs = self.__xs
+        if len(xs) == 1:
+            result = numpy.empty(ys.shape[0:-1] + (self.__length,), dtype=ys.dtype)
+            result[:] = ys[..., 0:1]
+            return result
+        left = ys[..., self.__left]
+        right = ys[..., self.__right]
+        if numpy.iscomplexobj(left):
+            inverse = 1.0 / self.__width
+            result = numpy.empty(left.shape, dtype=left.dtype)
+            result.real = self.__interpolate((right.real - left.real) * inverse, left.real, right.real)
+            result.imag = self.__interpolate((right.imag - left.imag) * inverse, left.imag, right.imag)
+        else:
+            result = self.__interpolate((right - left) / self.__width, left, right)
+        result[..., self.__last] = ys[..., -1:]
+        if self.__extrapolate_below:
+            m = (ys[..., 1:2] - ys[..., 0:1]) / (xs[1] - xs[0])
+            n = ys[..., 0:1] - m * xs[0]
+            result[..., self.__below] = m * self.__x_below + n
+        else:
+            result[..., self.__below] = ys[..., 0:1]
+        if self.__extrapolate_above:
+            m = (ys[..., -1:] - ys[..., -2:-1]) / (xs[-1] - xs[-2])
+            n = ys[..., -1:] - m * xs[-1]
+            result[..., self.__above] = m * self.__x_above + n
+        else:
+            result[..., self.__above] = ys[..., -1:]
+        return result
+
+    def __interpolate(self, slope, left, right):
+        """Interpolates real values like :func:`numpy.interp`, which falls back to
+        computing the value from the right supporting point, if computing it from
+        the left one results in NaN.
+        """
+        result = slope * self.__offset + left
+        invalid = numpy.isnan(result)
+        if invalid.any():
+            fallback = slope * self.__rest + right
+            result[invalid] = fallback[invalid]
+            invalid = numpy.isnan(result) & (left == right)
+            result[invalid] = left[invalid]
+        return result
@@ -16,20 +16,77 @@
 
 """Contains helper functions and classes for the loading and saving data sets from/to files."""
 
+import itertools
 import os
+import numpy
 
-__all__ = ("read_file", "get_writer")
+__all__ = ("read_file", "get_writer", "sniff_binary_format", "sniff_text_format", "read_csv_table", "write_csv_table")
 
 
-def read_file(path, readers, reader_base_class):  # noqa; pylint: disable=too-many-branches; this function is spaghetti code, but the sequence of read attempts is easy to follow
+def sniff_binary_format(header):
+    """Identifies the format of a binary file by the signature at its beginning.
+
+    :param header: a bytes object with the first bytes of the file
+    :returns: the common file extension for the format (e.g. ``".wav"``) or None,
+              if the format could not be identified
+    """
+    if header[0:4] == b"RIFF" and header[8:12] == b"WAVE":
+        return ".wav"
+    elif header[0:4] == b"FORM" and header[8:12] in (b"AIFF", b"AIFC"):
+        return ".aiff"
+    elif header.startswith(b"fLaC"):
+        return ".flac"
+    elif header.startswith(b"OggS"):
+        return ".ogg"
+    elif header.startswith(b"\x93NUMPY"):
+        return ".npy"
+    elif header[0:4] in (b"PK\x03\x04", b"PK\x05\x06"):    # a zip archive, which is used by NumPy's npz files
+        return ".npz"
+    elif len(header) >= 2 and header[0] == 0x80 and 2 <= header[1] <= 5:   # the PROTO opcode of the pickle protocols 2 and newer
+        return ".pickle"
+    return None
+
+
+def sniff_text_format(header):
+    """Guesses the format of a text file from its first bytes.
+
+    :param header: a bytes object with the first bytes of the file
+    :returns: ``".json"``, if the text begins with an object or an array, ``".csv"``,
+              if the first line contains a comma, or None otherwise
+    """
+    if b"\x00" in header:
+        return None
+    try:
+        text = header.decode("utf-8-sig", errors="strict")
+    except UnicodeDecodeError as e:
+        if e.start < len(header) - 3:   # not just a character, which has been cut off at the end of the header
+            return None
+        text = header[0:e.start].decode("utf-8-sig")
+    text = text.lstrip()
+    if text[0:1] in ("{", "["):
+        return ".json"
+    elif "," in text.split("\n", 1)[0]:
+        return ".csv"
+    return None
+
+
+def read_file(path, readers, reader_base_class, **kwargs):  # noqa; pylint: disable=too-many-branches; this function is spaghetti code, but the sequence of read attempts is easy to follow
     """A helper function, that implements the basic algorithm for reading data
     sets from a file. The algorithm goes through the following steps:
 
+    0. identify the format of the file by the signature in its first bytes. If
+       this succeeds and a reader class claims to be able to load files of that
+       format, the file is treated as if it had the extension of that format.
+       If the file has an extension, that no reader class claims and the format
+       could not be identified by a signature, the format of text files is guessed
+       from the first characters.
     1. first, see if there is a reader, that has already been used for files with
        the extension of the given file before.
     2. if that fails, iterate over the reader classes, that claim to be able to
        load files with the extension of the given file and try them.
-    3. if that also fails, try all reader classes.
+    3. if that also fails, try all reader classes. This step is skipped, if the
+       format has been identified by a signature in step 0, since the file is
+       either corrupt or in a format, for which no reader is available.
     4. if everything has failed, raise an error.
 
     :param path: the path to the file, that shall be loaded
@@ -39,11 +96,25 @@ def read_file(path, readers, reader_base_class):  # noqa; pylint: disable=too-ma
                     the given file, that reader will be added to the dictionary.
     :param reader_base_class: the base class for the readers. This function iterates
                               over sub-classes of this class in the steps 2. and 3..
+    :param `**kwargs`: additional keyword arguments, that are passed to the readers
     :returns: the loaded data set
     """
     exception = None
-    # check if a reader for the given file type has already been instantiated
+    # identify the file format by the first bytes of the file
     extension = os.path.splitext(path)[-1]
+    try:
+        with open(path, "rb") as f:
+            header = f.read(512)
+    except OSError as e:
+        raise ValueError(f"failed to read file '{path}'") from e
+    identified = sniff_binary_format(header)
+    if any(identified in cls.extensions for cls in reader_base_class.__subclasses__()):
+        extension = identified
+    else:
+        identified = None
+        if not any(extension in cls.extensions for cls in reader_base_class.__subclasses__()):
+            extension = sniff_text_format(header) or extension
+    # check if a reader for the given file type has already been instantiated
     if extension in readers:
         readers_list = readers[extension]
     else:
@@ -51,7 +122,7 @@ def read_file(path, readers, reader_base_class):  # noqa; pylint: disable=too-ma
     # try to open the file with an already instantiated reader
     for reader in readers_list:
         try:
-            result = reader(path)
+            result = reader(path, **kwargs)
         except Exception as e:  # pylint: disable=broad-except; if anything goes wrong, the reading shall be attempted with another reader
             exception = e if exception is None else exception
         else:
@@ -66,26 +137,28 @@ def read_file(path, readers, reader_base_class):  # noqa; pylint: disable=too-ma
             else:
                 readers_list.append(reader)
                 try:
-                    result = reader(path)
+                    result = reader(path, **kwargs)
                 except Exception as e:  # pylint: disable=broad-except; if anything goes wrong, the reading shall be attempted with another reader
                     exception = e if exception is None else exception
                 else:
                     return result
-    # try to open the file with a reader, that is not associated with the file type
-    for cls in reader_base_class.__subclasses__():
-        if extension not in cls.extensions and not any([isinstance(r, cls) for r in readers_list]):
-            try:
-                reader = cls()
-            except ImportError:
-                continue
-            else:
+    # try to open the file with a reader, that is not associated with the file type,
+    # unless the file type has been identified by its signature
+    if identified is None:
+        for cls in reader_base_class.__subclasses__():
+            if extension not in cls.extensions and not any([isinstance(r, cls) for r in readers_list]):
                 try:
-                    result = reader(path)
-                except Exception as e:  # pylint: disable=broad-except; if anything goes wrong, the reading shall be attempted with another reader
-                    exception = e if exception is None else exception
+                    reader = cls()
+                except ImportError:
+                    continue
                 else:
-                    readers_list.append(reader)
-                    return result
+                    try:
+                        result = reader(path, **kwargs)
+                    except Exception as e:  # pylint: disable=broad-except; if anything goes wrong, the reading shall be attempted with another reader
+                        exception = e if exception is None else exception
+                    else:
+                        readers_list.append(reader)
+                        return result
     # if all attempts to read the file failed, raise an error
     raise ValueError(f"failed to read file '{path}'") from exception
 
@@ -119,3 +192,90 @@ def get_writer(file_format, writers, writer_base_class):
                     writers[file_format] = writer
                     return writer
         raise ValueError(f"file format cannot be written: {file_format}")
+
+
+def read_csv_table(path, dtype, chunk_size=2 ** 16):
+    """Reads a CSV file with numbers and an optional header row. The numbers are
+    parsed in chunks of rows with :func:`numpy.loadtxt` and copied to an array,
+    that has been allocated for all rows of the file, so that the memory for
+    parsing the file does not grow with its size.
+
+    :param path: the path of the file
+    :param dtype: the dtype of the numbers (e.g. ``float`` or ``complex``)
+    :param chunk_size: the number of rows, that are parsed at once
+    :returns: a tuple of the header row as a list of strings or None, if the
+              file has no header, and a two-dimensional array with a row for each
+              column of the file
+    """
+    import csv
+    # count the lines in the file to allocate the array for the numbers, which
+    # is cropped to the actual number of rows after parsing
+    lines = 0
+    last = b"\n"
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(2 ** 20), b""):
+            lines += block.count(b"\n")
+            last = block[-1:]
+    if last != b"\n":
+        lines += 1
+    # parse the numbers
+    with open(path, newline="") as f:
+        header = next(csv.reader(f), [""])  # the reader consumes only the lines of the first row
+        try:
+            float(header[0])
+        except ValueError:
+            pass
+        else:
+            header = None
+            f.seek(0)
+        table = numpy.empty(shape=(0, 0), dtype=dtype)
+        length = 0
+        while True:
+            rows = list(itertools.islice(f, chunk_size))
+            chunk = [r for r in rows if r.strip()]
+            if chunk:
+                numbers = numpy.loadtxt(chunk, delimiter=",", dtype=dtype, ndmin=2)
+                if not length:
+                    table = numpy.empty(shape=(numbers.shape[1], max(lines, len(numbers))), dtype=numbers.dtype)
+                elif length + len(numbers) > table.shape[1]:    # the lines are separated by other line breaks than "\n"
+                    table = numpy.concatenate((table[:, 0:length], numbers.transpose()), axis=1)
+                    length += len(numbers)
+                    continue
+                table[:, length:length + len(numbers)] = numbers.transpose()
+                length += len(numbers)
+            if len(rows) < chunk_size:
+                return header, table[:, 0:length]
+
+
+def write_csv_table(path, header, columns, chunk_size=2 ** 16):
+    """Writes numbers and a header row to a CSV file. The numbers are formatted
+    in chunks of rows with the shortest representation, from which the exact
+    value can be restored in the precision of its column, like the :mod:`csv`
+    module does.
+
+    :param path: the path of the file
+    :param header: a sequence of strings for the header row
+    :param columns: a sequence of one-dimensional arrays of the same length for
+                    the columns of the file
+    :param chunk_size: the number of rows, that are formatted at once
+    """
+    import csv
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        terminator = writer.dialect.lineterminator
+        for i in range(0, len(columns[0]), chunk_size):
+            rows = zip(*(_format_numbers(c[i:i + chunk_size]) for c in columns))
+            f.write("".join(",".join(row) + terminator for row in rows))
+
+
+def _format_numbers(array):
+    """Formats the numbers in the given array with the shortest representation,
+    from which their exact value can be restored in the precision of the array.
+
+    :param array: a one-dimensional array
+    :returns: a list of strings
+    """
+    if array.dtype in (numpy.float32, numpy.complex64):
+        return [str(x) for x in array]  # the string of a NumPy scalar is only as long as necessary for its precision
+    return [repr(x) for x in array.tolist()]
@@ -17,9 +17,11 @@
 """Contains classes and helper functions to load signals from a file."""
 
 import os
+import struct
 import numpy
 import sumpf
-from .._functions import allocate_array
+from .._functions import allocate_array, float_dtype, get_precision
+from ._functions import read_csv_table
 
 __all__ = ("readers", "Reader")
 
@@ -29,10 +31,11 @@ readers = {}    # maps file extensions to reader instances, that can be used for
 def from_dict(dictionary):
     """Deserializes a signal from a dictionary."""
     if "channels" in dictionary:
-        channels = allocate_array(shape=numpy.shape(dictionary["channels"]))
+        channels = allocate_array(shape=numpy.shape(dictionary["channels"]),
+                                  dtype=float_dtype(get_precision(dictionary["channels"])))
         channels[:, :] = dictionary["channels"]
     else:
-        channels = numpy.empty(shape=(1, 0))
+        channels = numpy.empty(shape=(1, 0), dtype=float_dtype())
     return sumpf.Signal(channels=channels,
                         sampling_rate=dictionary.get("sampling_rate", 48000.0),
                         offset=dictionary.get("offset", 0),
@@ -50,7 +53,10 @@ def from_rows(time_column, data_rows, labels):
     :returns: the deserialized signal
     """
     if len(data_rows) and len(data_rows[0]):    # pylint: disable=len-as-condition; data_rows can be a NumPy array
-        sorted_time_row = sorted(time_column)
+        if numpy.ndim(time_column) == 1 and numpy.all(numpy.diff(time_column) >= 0.0):
+            sorted_time_row = time_column   # avoid sorting large arrays in Python, if they are sorted already
+        else:
+            sorted_time_row = sorted(time_column)
         minimum_time = sorted_time_row[0]
         maximum_time = sorted_time_row[-1]
         if len(sorted_time_row) <= 1:
@@ -58,14 +64,14 @@ def from_rows(time_column, data_rows, labels):
                 sampling_rate = 48000.0
             else:
                 sampling_rate = 1.0 / abs(minimum_time)
+            offset = int(round(minimum_time * sampling_rate))
         else:
-            sampling_rate = (len(sorted_time_row) - 1) / (maximum_time - minimum_time)
-        offset = int(round(minimum_time * sampling_rate))
+            sampling_rate, offset = sampling_parameters(minimum_time, maximum_time, len(sorted_time_row))
         if numpy.array_equal(time_column, sorted_time_row):
             sorted_data_rows = data_rows
         else:
             sorted_data_rows = [[e for _, e in sorted(zip(time_column, data_row))] for data_row in data_rows]
-        channels = allocate_array(shape=numpy.shape(sorted_data_rows))
+        channels = allocate_array(shape=numpy.shape(sorted_data_rows), dtype=float_dtype(get_precision(data_rows)))
         channels[:] = sorted_data_rows
         if len(labels) < len(channels):
             labels = tuple(labels) + ("",) * (len(channels) - len(labels))
@@ -76,11 +82,87 @@ def from_rows(time_column, data_rows, labels):
         return sumpf.Signal()
 
 
+def sampling_parameters(first, last, length):
+    """Computes the sampling rate and the offset of a signal from the first and
+    the last value of its time column.
+
+    If the time values have single precision, the sampling rate, that is computed
+    from them, is only accurate to about seven digits. In this case, the sampling
+    rate is rounded to the fewest significant digits, with which it reproduces
+    the given time values, so that common sampling rates like 44100Hz are restored
+    exactly.
+
+    :param first: the time of the first sample
+    :param last: the time of the last sample
+    :param length: the number of samples, which has to be greater than one
+    :returns: a tuple ``(sampling_rate, offset)``
+    """
+    sampling_rate = (length - 1) / (float(last) - float(first))
+    if isinstance(first, numpy.float32) and isinstance(last, numpy.float32):
+        for digits in range(1, 10):
+            candidate = float(f"{sampling_rate:.{digits}g}")
+            offset = int(round(float(first) * candidate))
+            if numpy.float32(offset / candidate) == first and numpy.float32((offset + length - 1) / candidate) == last:
+                return candidate, offset
+    return sampling_rate, int(round(float(first) * sampling_rate))
+
+
+def sample_range(start, stop, length):
+    """Computes the indices of the first and behind the last sample of an excerpt
+    of a file. Like for slicing, negative indices count from the end of the file
+    and indices beyond the file are clipped.
+
+    :param start: the index of the first sample or None
+    :param stop: the index behind the last sample or None
+    :param length: the number of samples per channel in the file
+    :returns: a tuple of two integers
+    """
+    begin, end, _ = slice(start, stop).indices(length)
+    return begin, max(begin, end)
+
+
+def channel_selection(channels, number_of_channels):
+    """Computes the index for selecting channels from an array with all channels
+    of a file.
+
+    :param channels: a sequence of channel indices or None for all channels
+    :param number_of_channels: the number of channels in the file
+    :returns: a tuple of the index for the array and an array with the non-negative
+              indices of the selected channels
+    """
+    key = slice(None) if channels is None else list(channels)
+    return key, numpy.arange(number_of_channels)[key]
+
+
+def select(signal, start, stop, channels):
+    """Selects an excerpt from a signal, that has been loaded from a file. This
+    is used by readers, which cannot load an excerpt without loading the whole
+    file.
+
+    :param signal: the :class:`~sumpf.Signal` with all samples and channels of the file
+    :param start: the index of the first sample or None
+    :param stop: the index behind the last sample or None
+    :param channels: a sequence of channel indices or None for all channels
+    :returns: a :class:`~sumpf.Signal` instance
+    """
+    if not start and stop is None and channels is None:
+        return signal
+    begin, end = sample_range(start, stop, signal.length())
+    key, indices = channel_selection(channels, len(signal))
+    labels = signal.labels()
+    return sumpf.Signal(channels=signal.channels()[key, begin:end],
+                        sampling_rate=signal.sampling_rate(),
+                        offset=signal.offset() + begin,
+                        labels=[labels[i] for i in indices])
+
+
 class Reader:
     """Base class for readers, that load :class:`~sumpf.Signal` instances from a file.
 
     Derived classes must implement the ``__call__`` method, that accepts the path to
-    the file and returns the loaded signal. If anything goes wrong, the method
+    the file and returns the loaded signal. The method also has to accept the
+    keyword arguments ``start``, ``stop`` and ``channels`` for loading an excerpt
+    of the file (see :meth:`sumpf.Signal.load`). If anything goes wrong, the method
     shall raise an error (instead of returning None).
     """
 
@@ -91,67 +173,73 @@ class CsvReader(Reader):
     """
     extensions = (".csv",)
 
-    def __call__(self, path):
+    def __call__(self, path, start=0, stop=None, channels=None):
         """Attempts to load a :class:`~sumpf.Signal` from the given path.
 
         :param path: the path of the file, from which the signal shall be loaded
+        :param start: the index of the first sample, that shall be loaded
+        :param stop: the index behind the last sample, that shall be loaded or None
+        :param channels: a sequence of the indices of the channels, that shall
+                         be loaded or None for all channels
         :returns: a :class:`~sumpf.Signal` instance
         """
-        import csv
-        with open(path, newline="") as f:
-            reader = csv.reader(f)
-            rows = []
-            time_samples = []
-            first_row = next(reader)
-            try:
-                time_samples.append(float(first_row[0]))
-                rows.append([float(c) for c in first_row[1:]])
-            except ValueError:
-                labels = tuple(first_row[1:])
-            else:
-                labels = ()
-            for row in reader:
-                time_samples.append(float(row[0]))
-                rows.append([float(c) for c in row[1:]])
-            return from_rows(time_column=time_samples,
-                             data_rows=numpy.transpose(rows),
-                             labels=labels)
+        header, table = read_csv_table(path, dtype=numpy.float64)
+        signal = from_rows(time_column=table[0] if len(table) else table,
+                           data_rows=table[1:],
+                           labels=() if header is None else tuple(header[1:]))
+        return select(signal, start, stop, channels)
 
 
 class JsonReader(Reader):
     """Reads a JSON representation of a signal from a file."""
     extensions = (".json", ".js")
 
-    def __call__(self, path):
+    def __call__(self, path, start=0, stop=None, channels=None):
         """Attempts to load a :class:`~sumpf.Signal` from the given path.
 
         :param path: the path of the file, from which the signal shall be loaded
+        :param start: the index of the first sample, that shall be loaded
+        :param stop: the index behind the last sample, that shall be loaded or None
+        :param channels: a sequence of the indices of the channels, that shall
+                         be loaded or None for all channels
         :returns: a :class:`~sumpf.Signal` instance
         """
         import json
         with open(path) as f:
-            return from_dict(json.load(f))
+            return select(from_dict(json.load(f)), start, stop, channels)
 
 
 class NumpyReader(Reader):
     """Reads a signal from a :mod:`numpy` file."""
     extensions = (".npz", ".npy")
 
-    def __call__(self, path):
+    def __call__(self, path, start=0, stop=None, channels=None):
         """Attempts to load a :class:`~sumpf.Signal` from the given path.
 
         :param path: the path of the file, from which the signal shall be loaded
+        :param start: the index of the first sample, that shall be loaded
+        :param stop: the index behind the last sample, that shall be loaded or None
+        :param channels: a sequence of the indices of the channels, that shall
+                         be loaded or None for all channels
         :returns: a :class:`~sumpf.Signal` instance
         """
-        try:
-            with numpy.load(path) as data:
-                return from_dict(data)
-        except AttributeError:  # npy files cannot be opened with a context manager
-            array = numpy.load(path)
-            filename = os.path.split(path)[-1]
-            return from_rows(time_column=array[0],
-                             data_rows=array[1:],
-                             labels=[f"{filename} {i}" for i in range(1, array.shape[0])])
+        data = numpy.load(path, mmap_mode="r")
+        if isinstance(data, numpy.ndarray):
+            if not start and stop is None and channels is None:
+                filename = os.path.split(path)[-1]
+                return from_rows(time_column=data[0],
+                                 data_rows=data[1:],
+                                 labels=[f"{filename} {i}" for i in range(1, data.shape[0])])
+            # read only the selected part of the memory mapped file
+            excerpt = select(_map_numpy(path), start, stop, channels)
+            samples = allocate_array(shape=excerpt.shape(), dtype=float_dtype())
+            samples[:] = excerpt.channels()
+            return sumpf.Signal(channels=samples,
+                                sampling_rate=excerpt.sampling_rate(),
+                                offset=excerpt.offset(),
+                                labels=excerpt.labels())
+        with data:
+            return select(from_dict(data), start, stop, channels)
 
 
 class PickleReader(Reader):
@@ -166,17 +254,21 @@ class PickleReader(Reader):
     """
     extensions = (".pickle",)
 
-    def __call__(self, path):
+    def __call__(self, path, start=0, stop=None, channels=None):
         """Attempts to load a :class:`~sumpf.Signal` from the given path.
 
         :param path: the path of the file, from which the signal shall be loaded
+        :param start: the index of the first sample, that shall be loaded
+        :param stop: the index behind the last sample, that shall be loaded or None
+        :param channels: a sequence of the indices of the channels, that shall
+                         be loaded or None for all channels
         :returns: a :class:`~sumpf.Signal` instance
         """
         import pickle
         with open(path, "rb") as f:
             result = pickle.load(f)
             assert isinstance(result, sumpf.Signal)
-            return result
+            return select(result, start, stop, channels)
 
 
 class StandardLibraryReader:
@@ -188,52 +280,270 @@ class StandardLibraryReader:
         :param module: the module (e.g. :mod:`wave` or :mod:`aifc`)
         :param sample_width_mapping: a dictionary, that maps the number of bytes
                                      per sample to a character for the :func:`struct.unpack`
-                                     format string.
+                                     format string. Three byte samples are decoded
+                                     with the four byte integer type of the given
+                                     character (e.g. ``"i"``).
         :param endianness: "<" for little endian, ">" for big endian
         """
         self.__module = module
         self.__sample_width_mapping = sample_width_mapping
         self.__endianness = endianness
 
-    def __call__(self, path):
+    def __call__(self, path, start=0, stop=None, channels=None):
         """Attempts to load a :class:`~sumpf.Signal` from the given path.
 
         :param path: the path of the file, from which the signal shall be loaded
+        :param start: the index of the first sample, that shall be loaded
+        :param stop: the index behind the last sample, that shall be loaded or None
+        :param channels: a sequence of the indices of the channels, that shall
+                         be loaded or None for all channels
         :returns: a :class:`~sumpf.Signal` instance
         """
-        import struct
-        chunk_size = 2048
+        chunk_size = 2 ** 16
         with self.__module.open(path, mode="rb") as f:
             number_of_channels = f.getnchannels()
-            number_of_samples = f.getnframes()
-            sample_mask = self.__sample_width_mapping[f.getsampwidth()]
+            begin, end = sample_range(start, stop, f.getnframes())
+            number_of_samples = end - begin
+            key, indices = channel_selection(channels, number_of_channels)
+            sample_width = f.getsampwidth()
+            sample_mask = self.__sample_width_mapping[sample_width]
             signed = sample_mask.islower()  # specifies, if the integers in the file are signed or not
-            channels = allocate_array(shape=(number_of_channels, number_of_samples))
-            total_chunk_size = (number_of_channels * chunk_size)
-            mask = f"{self.__endianness}{total_chunk_size}{sample_mask}"
-            factor = 1.0 / (2 ** (8 * f.getsampwidth() - 1))    # maps the maximum value of the integers from the file to 1.0
+            dtype = numpy.dtype(f"{self.__endianness}{sample_mask}")
+            result = allocate_array(shape=(len(indices), number_of_samples), dtype=float_dtype())
+            factor = 1.0 / (2 ** (8 * sample_width - 1))    # maps the maximum value of the integers from the file to 1.0
+            if begin:
+                f.setpos(begin)
             i = 0
-            while i + chunk_size < number_of_samples:
-                chunk = struct.unpack(mask, f.readframes(chunk_size))
-                decoded = numpy.multiply(chunk, factor)
-                for c in range(number_of_channels):
-                    channels[c, i:i + chunk_size] = decoded[c:None:number_of_channels]
-                i += chunk_size
-            remaining_samples = number_of_samples - i
-            if remaining_samples:
-                remaining_chunk_size = (number_of_channels * remaining_samples)
-                remaining_mask = f"{self.__endianness}{remaining_chunk_size}{sample_mask}"
-                chunk = struct.unpack(remaining_mask, f.readframes(remaining_samples))
-                decoded = numpy.multiply(chunk, factor)
-                for c in range(number_of_channels):
-                    channels[c, i:] = decoded[c:None:number_of_channels]
+            while i < number_of_samples:
+                data = f.readframes(min(chunk_size, number_of_samples - i))
+                samples = decode_integers(data, sample_width, dtype).reshape((-1, number_of_channels))
+                if not samples.size:
+                    raise ValueError(f"The file {path} ended after {begin + i} of {begin + number_of_samples} samples")
+                numpy.multiply(samples[:, key], factor, out=result[:, i:i + len(samples)].transpose())
+                i += len(samples)
             if not signed:
-                channels -= 1.0
+                result -= 1.0
             filename = os.path.split(path)[-1]
-            return sumpf.Signal(channels=channels,
+            return sumpf.Signal(channels=result,
                                 sampling_rate=float(f.getframerate()),
-                                offset=0,
-                                labels=[f"{filename} {i}" for i in range(1, number_of_channels + 1)])
+                                offset=begin,
+                                labels=[f"{filename} {i}" for i in indices + 1])
+
+
+def decode_integers(data, sample_width, dtype):
+    """Decodes a bytes object with interleaved integer samples, as they are returned
+    by the ``readframes`` methods of the :mod:`wave` and :mod:`aifc` modules.
+
+    :param data: a bytes object
+    :param sample_width: the number of bytes per sample (1, 2, 3 or 4)
+    :param dtype: the :class:`numpy.dtype` of the integers with the byte order
+                  of the file. For three byte samples, this has to be a four byte
+                  integer type.
+    :returns: a one-dimensional integer array, that shares the memory with ``data``,
+              except for three byte samples
+    """
+    if sample_width != 3:
+        return numpy.frombuffer(data, dtype=dtype)
+    return widen_integers(numpy.frombuffer(data, dtype=numpy.uint8).reshape((-1, 3)), dtype)
+
+
+def widen_integers(triplets, dtype):
+    """Converts three byte integers to four byte integers.
+
+    :param triplets: an array of bytes, whose last axis has the length three
+    :param dtype: the :class:`numpy.dtype` of four byte integers with the byte
+                  order of the three byte integers
+    :returns: an integer array without the last axis of ``triplets``
+    """
+    # pad the three byte samples to four bytes, so that the sample is in the three
+    # most significant bytes, and shift it back, which also extends the sign
+    padded = numpy.zeros(shape=triplets.shape[0:-1] + (4,), dtype=numpy.uint8)
+    if dtype.str.startswith(">"):
+        padded[..., 0:3] = triplets
+    else:
+        padded[..., 1:4] = triplets
+    return padded.view(dtype)[..., 0] >> 8
+
+
+class ScaledChannels(numpy.lib.mixins.NDArrayOperatorsMixin):
+    """A read-only, two-dimensional array-like object, that converts the integer
+    samples from a memory mapped file to floating point values, when they are
+    accessed.
+
+    Indexing returns a :func:`numpy.array` with the converted samples of the selection,
+    so that only the selected part of the file is read. Other uses, like passing
+    the object to :mod:`numpy` functions, applying operators or calling methods
+    of :class:`numpy.ndarray`, convert all samples.
+    """
+
+    def __init__(self, samples, sample_width, signed, dtype):
+        """
+        :param samples: an integer array with a row for each channel. For three
+                        byte samples, this is an array of bytes with an additional
+                        last axis of length three.
+        :param sample_width: the number of bytes per sample (1, 2, 3 or 4)
+        :param signed: True, if the integers are signed, False otherwise
+        :param dtype: the floating point dtype of the converted samples
+        """
+        self.__samples = samples
+        self.__sample_width = sample_width
+        self.__signed = signed
+        self.__integer_dtype = numpy.dtype(f"{samples.dtype.str[0]}i4")
+        self.__factor = 1.0 / (2 ** (8 * sample_width - 1))    # maps the maximum value of the integers from the file to 1.0
+        self.dtype = numpy.dtype(dtype)     #: the dtype of the converted samples
+        self.shape = tuple(samples.shape[0:2])  #: the number of channels and samples per channel
+        self.ndim = 2                       #: the number of dimensions
+        self.size = self.shape[0] * self.shape[1]   #: the total number of samples
+
+    def __len__(self):
+        """Returns the number of channels."""
+        return self.shape[0]
+
+    def __getitem__(self, key):
+        """Reads and converts the selected samples.
+
+        :param key: an index, a slice or a tuple of indices or slices like for a :func:`numpy.array`
+        :returns: a :func:`numpy.array` or a scalar
+        """
+        if self.__sample_width == 3:
+            if not isinstance(key, tuple):
+                key = (key,)
+            integers = widen_integers(self.__samples[key + (slice(None),)], self.__integer_dtype)
+        else:
+            integers = self.__samples[key]
+        result = numpy.empty(shape=numpy.shape(integers), dtype=self.dtype)
+        numpy.multiply(integers, self.__factor, out=result)
+        if not self.__signed:
+            result -= 1.0
+        return result if result.ndim else result[()]
+
+    def __array__(self, dtype=None, copy=None):     # pylint: disable=unused-argument; the result is always a new array
+        """Converts all samples.
+
+        :param dtype: an optional dtype for the result
+        :param copy: neglected, since the result is always a new array
+        :returns: a :func:`numpy.array`
+        """
+        result = self[...]
+        if dtype is not None:
+            return result.astype(dtype)
+        return result
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        """Implements the support for :mod:`numpy`'s ufuncs and the operators
+        by applying the ufunc to the converted samples."""
+        if any(o is self for o in kwargs.get("out", ())):
+            raise ValueError("The channels of a memory mapped signal are read-only")
+        inputs = tuple(numpy.asarray(i) if isinstance(i, ScaledChannels) else i for i in inputs)
+        return getattr(ufunc, method)(*inputs, **kwargs)
+
+    def __getattr__(self, name):
+        """Delegates the access to other attributes of :class:`numpy.ndarray` to
+        an array with all converted samples."""
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(numpy.asarray(self), name)
+
+
+def map_file(path):
+    """Maps a signal file into memory instead of reading it. The samples are
+    only read from the file, when they are accessed, so that opening large files
+    is fast and requires little memory. The channels of the returned signal are
+    read-only.
+
+    This is supported for :mod:`numpy` array files (``.npy``) with a sorted time
+    column, like they are written by the :class:`~sumpf._internal._persistence._signal_writers.NumpyNpyWriter`,
+    and for uncompressed WAV files. Floating point samples are mapped directly,
+    while integer samples are converted on access (see :class:`ScaledChannels`).
+
+    :param path: the path of the file
+    :raises ValueError: if the file cannot be mapped into memory
+    :returns: a :class:`~sumpf.Signal` instance
+    """
+    with open(path, "rb") as f:
+        header = f.read(12)
+    if header.startswith(b"\x93NUMPY"):
+        return _map_numpy(path)
+    elif header[0:4] == b"RIFF" and header[8:12] == b"WAVE":
+        return _map_wave(path)
+    raise ValueError(f"The file {path} cannot be mapped into memory")
+
+
+def _map_numpy(path):
+    """Maps a :mod:`numpy` array file with a time column into memory.
+
+    :param path: the path of the file
+    :returns: a :class:`~sumpf.Signal` instance
+    """
+    array = numpy.load(path, mmap_mode="r")
+    if array.ndim != 2 or not array.shape[0]:
+        raise ValueError(f"The file {path} does not contain a time column and channels")
+    filename = os.path.split(path)[-1]
+    labels = [f"{filename} {i}" for i in range(1, array.shape[0])]
+    length = array.shape[1]
+    if len(array) == 1 or length < 2:     # the sampling rate cannot be computed from the time column
+        signal = from_rows(time_column=array[0], data_rows=array[1:], labels=labels)
+        signal.channels().flags.writeable = False
+        return signal
+    sampling_rate, offset = sampling_parameters(array[0, 0], array[0, -1], length)
+    return sumpf.Signal(channels=numpy.asarray(array[1:]),
+                        sampling_rate=sampling_rate,
+                        offset=offset,
+                        labels=labels)
+
+
+def _map_wave(path):
+    """Maps the data chunk of an uncompressed WAV file into memory.
+
+    :param path: the path of the file
+    :returns: a :class:`~sumpf.Signal` instance
+    """
+    fmt = None
+    with open(path, "rb") as f:
+        f.seek(12)
+        while True:
+            header = f.read(8)
+            if len(header) < 8:
+                raise ValueError(f"The file {path} has no data chunk")
+            name = header[0:4]
+            size = int.from_bytes(header[4:8], "little")
+            if name == b"data":
+                offset = f.tell()
+                break
+            elif name == b"fmt ":
+                fmt = f.read(size + size % 2)   # chunks are padded to an even number of bytes
+            else:
+                f.seek(size + size % 2, os.SEEK_CUR)
+        file_size = os.fstat(f.fileno()).st_size
+    if fmt is None:
+        raise ValueError(f"The file {path} has no format chunk")
+    tag, number_of_channels, sampling_rate, _, block_align, bits = struct.unpack("<HHIIHH", fmt[0:16])
+    if tag == 0xFFFE:   # WAVE_FORMAT_EXTENSIBLE, the actual format is in the first bytes of the sub format GUID
+        tag = struct.unpack("<H", fmt[24:26])[0]
+    sample_width = block_align // number_of_channels
+    number_of_samples = min(size, file_size - offset) // block_align
+    filename = os.path.split(path)[-1]
+    labels = [f"{filename} {i}" for i in range(1, number_of_channels + 1)]
+    if tag == 3 and sample_width in (4, 8):     # WAVE_FORMAT_IEEE_FLOAT
+        dtype = numpy.dtype(f"<f{sample_width}")
+    elif tag == 1 and sample_width in (1, 2, 3, 4) and bits <= 8 * sample_width:   # WAVE_FORMAT_PCM
+        dtype = numpy.dtype({1: "u1", 2: "<i2", 3: "u1", 4: "<i4"}[sample_width])
+    else:
+        raise ValueError(f"The samples in the file {path} cannot be mapped into memory")
+    if number_of_samples == 0:
+        return sumpf.Signal(channels=numpy.empty(shape=(number_of_channels, 0), dtype=float_dtype()),
+                            sampling_rate=float(sampling_rate),
+                            labels=labels)
+    shape = (number_of_samples, number_of_channels, 3) if sample_width == 3 else (number_of_samples, number_of_channels)
+    samples = numpy.memmap(path, dtype=dtype, mode="r", offset=offset, shape=shape)
+    if tag == 3:
+        channels = numpy.asarray(samples).transpose()
+    else:
+        channels = ScaledChannels(samples=numpy.swapaxes(samples, 0, 1),
+                                  sample_width=sample_width,
+                                  signed=sample_width != 1,
+                                  dtype=float_dtype())
+    return sumpf.Signal(channels=channels, sampling_rate=float(sampling_rate), labels=labels)
 
 
 class WaveReader(StandardLibraryReader, Reader):
@@ -244,19 +554,19 @@ class WaveReader(StandardLibraryReader, Reader):
         import wave
         StandardLibraryReader.__init__(self,
                                        module=wave,
-                                       sample_width_mapping={1: "B", 2: "h", 4: "i"},
+                                       sample_width_mapping={1: "B", 2: "h", 3: "i", 4: "i"},
                                        endianness="<")
 
 
 class AifcReader(StandardLibraryReader, Reader):
     """Loads integer aiff files with the help of the :mod:`aifc` module."""
-    extensions = (".wav",)
+    extensions = (".aiff", ".aifc", ".aif")
 
     def __init__(self):
         import aifc
         StandardLibraryReader.__init__(self,
                                        module=aifc,
-                                       sample_width_mapping={1: "b", 2: "h", 4: "i"},
+                                       sample_width_mapping={1: "b", 2: "h", 3: "i", 4: "i"},
                                        endianness=">")
 
 
@@ -268,18 +578,28 @@ class SoundfileReader(Reader):
     def __init__(self):
         import soundfile  # noqa; pylint: disable=unused-import; this shall raise an ImportError, if the soundfile library cannot be imported
 
-    def __call__(self, path):
+    def __call__(self, path, start=0, stop=None, channels=None):
         """Attempts to load a :class:`~sumpf.Signal` from the given path.
 
         :param path: the path of the file, from which the signal shall be loaded
+        :param start: the index of the first sample, that shall be loaded
+        :param stop: the index behind the last sample, that shall be loaded or None
+        :param channels: a sequence of the indices of the channels, that shall
+                         be loaded or None for all channels
         :returns: a :class:`~sumpf.Signal` instance
         """
         import soundfile
         with soundfile.SoundFile(path) as f:
-            channels = allocate_array(shape=(f.channels, f.frames))
-            channels.transpose()[:] = f.read().reshape((f.frames, f.channels))
+            begin, end = sample_range(start, stop, f.frames)
+            key, indices = channel_selection(channels, f.channels)
+            dtype = float_dtype()
+            if begin:
+                f.seek(begin)
+            samples = f.read(frames=end - begin, dtype=numpy.dtype(dtype).name, always_2d=True)
+            result = allocate_array(shape=(len(indices), len(samples)), dtype=dtype)
+            result.transpose()[:] = samples[:, key]
             filename = os.path.split(path)[-1]
-            return sumpf.Signal(channels=channels,
+            return sumpf.Signal(channels=result,
                                 sampling_rate=float(f.samplerate),
-                                offset=0,
-                                labels=[f"{filename} {i}" for i in range(1, f.channels + 1)])
+                                offset=begin,
+                                labels=[f"{filename} {i}" for i in indices + 1])
@@ -17,10 +17,13 @@
 """Contains classes and helper functions to save signals to a file."""
 
 import enum
+import os
+import struct
 import numpy
 from ._auto_writer import AutoWriter
+from . import _functions as functions
 
-__all__ = ("Formats", "Writer")
+__all__ = ("Formats", "Writer", "Stream", "open_stream")
 
 
 class Formats(enum.Enum):
@@ -94,6 +97,10 @@ class Writer:
 
     Derived classes must have a static attribute ``formats``, which contains a
     tuple of file formats, that can be written with instances of that class.
+
+    Derived classes, that support writing a signal incrementally, implement an
+    ``open`` method, that accepts the path, the sampling rate, the number of channels
+    and the offset of the signal and returns a :class:`Stream` instance.
     """
 
     def __init__(self, file_format):
@@ -112,9 +119,55 @@ writers[Formats.AUTO] = AutoWriter(file_extension_mapping=file_extension_mapping
                                    writer_base_class=Writer)
 
 
+class Stream:
+    """A file, to which the samples of a signal are written incrementally. Instances
+    of this class are returned by the ``open`` methods of the writers.
+    """
+
+    def __init__(self, write, close):
+        """
+        :param write: a function, that writes a two-dimensional array of samples
+                      with a row for each channel to the file
+        :param close: a function, that finalizes and closes the file
+        """
+        self.write = write  #: writes a two-dimensional array of samples with a row for each channel to the file
+        self.close = close  #: finalizes the file (e.g. by updating its header) and closes it
+
+
+def open_stream(path, file_format, sampling_rate, number_of_channels, offset):
+    """Opens a file, to which the samples of a signal can be written incrementally.
+    If the file format is ``AUTO``, the formats, which are associated with the
+    file extension, are tried in the order of the :data:`file_extension_mapping`.
+
+    :param path: the path of the file
+    :param file_format: a flag from the :class:`Formats` enumeration
+    :param sampling_rate: the sampling rate of the signal
+    :param number_of_channels: the number of channels of the signal
+    :param offset: the offset of the first sample of the signal
+    :raises ValueError: if the file format does not support writing incrementally
+                        or if it cannot be determined from the file extension
+    :returns: a :class:`Stream` instance
+    """
+    if file_format == Formats.AUTO:
+        extension = os.path.splitext(path)[-1]
+        if extension not in file_extension_mapping:
+            raise ValueError(f"file format for extension '{extension}' cannot be determined")
+        candidates = file_extension_mapping[extension]
+    else:
+        candidates = (file_format,)
+    for candidate in candidates:
+        try:
+            writer = functions.get_writer(candidate, writers, Writer)
+        except ValueError:  # no library found for writing the format
+            continue
+        if hasattr(writer, "open"):
+            return writer.open(path, sampling_rate, number_of_channels, offset)
+    raise ValueError(f"the signal cannot be written incrementally to the file '{path}'")
+
+
 def as_dict(signal):
     """Serializes a signal to a dictionary."""
-    return {"channels": [[s for s in c] for c in signal.channels()],
+    return {"channels": [[float(s) for s in c] for c in signal.channels()],
             "sampling_rate": signal.sampling_rate(),
             "offset": signal.offset(),
             "labels": signal.labels()}
@@ -132,14 +185,9 @@ class CsvWriter(Writer):
         :param data: the :class:`~sumpf.Signal` instance
         :param path: the path of the file, in which the signal shall be saved
         """
-        import csv
-        with open(path, "w", newline="") as f:
-            columns = ["time"]
-            columns.extend(signal.labels())
-            writer = csv.writer(f)
-            writer.writerow(columns)
-            for t, row in zip(signal.time_samples(), signal.channels().transpose()):
-                writer.writerow((t, *row))
+        functions.write_csv_table(path,
+                                  header=("time",) + signal.labels(),
+                                  columns=(signal.time_samples(), *signal.channels()))
 
 
 class JsonWriter(Writer):
@@ -159,7 +207,10 @@ class JsonWriter(Writer):
 
 class NumpyNpyWriter(Writer):
     """Saves the signal in a :mod:`numpy` array file, in which the first column contains
-    the time samples.
+    the time samples. The array has the data type of the signal's channels, so
+    that the time samples of single precision signals have single precision,
+    too. This can prevent the exact restoration of the sampling rate and the
+    offset of short signals with a large offset.
     """
     formats = (Formats.NUMPY_NPY,)
 
@@ -169,12 +220,62 @@ class NumpyNpyWriter(Writer):
         :param data: the :class:`~sumpf.Signal` instance
         :param path: the path of the file, in which the signal shall be saved
         """
-        array = numpy.empty(shape=(len(signal) + 1, signal.length()))
+        array = numpy.empty(shape=(len(signal) + 1, signal.length()), dtype=signal.channels().dtype)
         array[0, :] = signal.time_samples()
         array[1:, :] = signal.channels()
         with open(path, "wb") as f:
             numpy.save(f, array)
 
+    def open(self, path, sampling_rate, number_of_channels, offset):   # pylint: disable=no-self-use; the method is part of the writers' interface
+        """Opens a file, to which the samples of a signal can be written incrementally.
+
+        The array in the file is stored in column-major order, so that the time
+        sample and the samples of all channels at that time are contiguous in the
+        file and new samples can be appended without moving the previously written
+        ones. The shape and the data type of the array in the header are updated,
+        when the file is closed. The data type is that of the first block's samples.
+        The samples are the same as if the complete signal had been saved at once,
+        but the time samples are computed as the sample indices divided by the
+        sampling rate, which can differ in the last digit from the evenly spaced
+        time samples of :meth:`~sumpf.Signal.time_samples`.
+
+        :param path: the path of the file
+        :param sampling_rate: the sampling rate of the signal
+        :param number_of_channels: the number of channels of the signal
+        :param offset: the offset of the first sample of the signal
+        :returns: a :class:`Stream` instance
+        """
+        f = open(path, "wb")
+        rows = number_of_channels + 1
+        length = 0
+        dtype = None
+
+        def header(length):
+            descr = "<f8" if dtype is None else dtype.str
+            dictionary = repr({"descr": descr, "fortran_order": True, "shape": (rows, length)})
+            return b"\x93NUMPY\x01\x00" + struct.pack("<H", header_size - 10) + dictionary.ljust(header_size - 11).encode("latin1") + b"\n"
+
+        # reserve enough space for the header, that it can be updated with any length
+        header_size = 64 * ((len(repr({"descr": "<f8", "fortran_order": True, "shape": (rows, 2 ** 64)})) + 11 + 63) // 64)
+        f.write(header(0))
+
+        def write(channels):
+            nonlocal length, dtype
+            if dtype is None:
+                dtype = numpy.dtype(numpy.float32 if channels.dtype == numpy.float32 else numpy.float64).newbyteorder("<")
+            frames = numpy.empty(shape=(channels.shape[1], rows), dtype=dtype)
+            frames[:, 0] = numpy.arange(offset + length, offset + length + channels.shape[1]) / sampling_rate
+            frames[:, 1:] = channels.transpose()
+            f.write(frames.tobytes())
+            length += channels.shape[1]
+
+        def close():
+            f.seek(0)
+            f.write(header(length))
+            f.close()
+
+        return Stream(write=write, close=close)
+
 
 class NumpyNpzWriter(Writer):
     """Saves the signal in a compressed :mod:`numpy` binary file."""
@@ -221,8 +322,8 @@ class PickleWriter(Writer):
 class StandardLibraryWriter:
     """A base class, that contains common code to implement saving a file with
     the help of the builtin :mod:`wave` and :mod:`aifc` modules."""
-    formats = (Formats.WAV_INT32, Formats.WAV_INT16, Formats.WAV_UINT8,
-               Formats.AIFF_INT32, Formats.AIFF_INT16, Formats.AIFF_INT8)
+    formats = (Formats.WAV_INT32, Formats.WAV_INT24, Formats.WAV_INT16, Formats.WAV_UINT8,
+               Formats.AIFF_INT32, Formats.AIFF_INT24, Formats.AIFF_INT16, Formats.AIFF_INT8)
 
     def __init__(self, module, bits, signed, endianness):
         """
@@ -234,12 +335,17 @@ class StandardLibraryWriter:
         import math
         self.__module = module
         self.__bytes_per_sample = int(math.ceil(bits / 8))
-        self.__sample_mask = {32: "i", 16: "h", 8: "b"}[bits]
-        if not signed:
-            self.__sample_mask = self.__sample_mask.upper()
+        kind = "i" if signed else "u"
+        if self.__bytes_per_sample == 3:    # three byte samples are encoded as four byte integers, whose padding byte is removed
+            self.__dtype = numpy.dtype(f"{endianness}{kind}4")
+        else:
+            self.__dtype = numpy.dtype(f"{endianness}{kind}{self.__bytes_per_sample}")
         self.__factor = 2 ** (bits - 1)
         self.__signed = signed
-        self.__endianness = endianness
+        if signed:
+            self.__range = (-2 ** (bits - 1), 2 ** (bits - 1) - 1)
+        else:
+            self.__range = (0, 2 ** bits - 1)
 
     def __call__(self, signal, path):
         """Saves the given signal in the given file path.
@@ -247,46 +353,67 @@ class StandardLibraryWriter:
         :param data: the :class:`~sumpf.Signal` instance
         :param path: the path of the file, in which the signal shall be saved
         """
-        import struct
         number_of_channels, number_of_samples = signal.shape()
-        chunk_size = 2048
-        total_chunk_size = (number_of_channels * chunk_size)
-        mask = f"{self.__endianness}{total_chunk_size}{self.__sample_mask}"
-        array = numpy.empty(number_of_channels * chunk_size)
+        chunk_size = 2 ** 16
         with self.__module.open(path, "wb") as f:
             f.setnchannels(number_of_channels)
             f.setsampwidth(self.__bytes_per_sample)
             f.setframerate(max(1, int(round(signal.sampling_rate()))))
-            i = 0
-            while i + chunk_size <= signal.length():
-                for c in range(number_of_channels):
-                    array[c:None:number_of_channels] = signal.channels()[c, i:i + chunk_size]
-                if not self.__signed:
-                    array += 1.0
-                array *= self.__factor
-                chunk = struct.pack(mask, *numpy.round(array).astype(int))
-                f.writeframes(chunk)
-                i += chunk_size
-            remaining_samples = number_of_samples - i
-            if remaining_samples:
-                remaining_chunk_size = number_of_channels * remaining_samples
-                mask = f"{self.__endianness}{remaining_chunk_size}{self.__sample_mask}"
-                if len(array) < remaining_chunk_size:
-                    array = numpy.empty(remaining_chunk_size)
-                else:
-                    array = array[0:remaining_chunk_size]
-                for c in range(number_of_channels):
-                    array[c:None:number_of_channels] = signal.channels()[c, i:]
-                if not self.__signed:
-                    array += 1.0
-                array *= self.__factor
-                chunk = struct.pack(mask, *numpy.round(array).astype(int))
-                f.writeframes(chunk)
+            f.setnframes(number_of_samples)     # avoids patching the header after every chunk
+            for i in range(0, number_of_samples, chunk_size):
+                f.writeframes(self.__encode(signal.channels()[:, i:i + chunk_size]))
+
+    def open(self, path, sampling_rate, number_of_channels, offset):   # pylint: disable=unused-argument; the offset cannot be stored in the file
+        """Opens a file, to which the samples of a signal can be written incrementally.
+        The header of the file is updated by the :mod:`wave` or :mod:`aifc` module,
+        when the file is closed.
+
+        :param path: the path of the file
+        :param sampling_rate: the sampling rate of the signal
+        :param number_of_channels: the number of channels of the signal
+        :param offset: neglected, since the offset cannot be stored in the file
+        :returns: a :class:`Stream` instance
+        """
+        chunk_size = 2 ** 16
+        f = self.__module.open(path, "wb")
+        f.setnchannels(number_of_channels)
+        f.setsampwidth(self.__bytes_per_sample)
+        f.setframerate(max(1, int(round(sampling_rate))))
+
+        def write(channels):
+            for i in range(0, channels.shape[1], chunk_size):
+                f.writeframes(self.__encode(channels[:, i:i + chunk_size]))
+
+        return Stream(write=write, close=f.close)
+
+    def __encode(self, channels):
+        """Converts a block of samples to the bytes of interleaved integers.
+
+        :param channels: a two-dimensional array of samples
+        :returns: a bytes object
+        """
+        array = numpy.empty(shape=channels.shape[::-1])
+        array[:] = channels.transpose()     # interleave the channels
+        if not self.__signed:
+            array += 1.0
+        array *= self.__factor
+        numpy.round(array, out=array)
+        if numpy.isnan(array).any():
+            raise ValueError("Samples with the value NaN cannot be saved as integers")
+        numpy.clip(array, *self.__range, out=array)
+        integers = array.astype(self.__dtype)
+        if self.__bytes_per_sample == 3:
+            octets = integers.view(numpy.uint8).reshape((-1, 4))
+            if self.__dtype.str.startswith(">"):
+                return octets[:, 1:4].tobytes()
+            else:
+                return octets[:, 0:3].tobytes()
+        return integers.tobytes()
 
 
 class WaveWriter(StandardLibraryWriter, Writer):
     """Saves integer wav files with the help of the :mod:`wave` module."""
-    formats = (Formats.WAV_INT32, Formats.WAV_INT16, Formats.WAV_UINT8)
+    formats = (Formats.WAV_INT32, Formats.WAV_INT24, Formats.WAV_INT16, Formats.WAV_UINT8)
 
     def __init__(self, file_format):
         """
@@ -298,6 +425,8 @@ class WaveWriter(StandardLibraryWriter, Writer):
         Writer.__init__(self, file_format)
         if file_format == Formats.WAV_INT32:
             StandardLibraryWriter.__init__(self, module=wave, bits=32, signed=True, endianness="<")
+        elif file_format == Formats.WAV_INT24:
+            StandardLibraryWriter.__init__(self, module=wave, bits=24, signed=True, endianness="<")
         elif file_format == Formats.WAV_INT16:
             StandardLibraryWriter.__init__(self, module=wave, bits=16, signed=True, endianness="<")
         elif file_format == Formats.WAV_UINT8:
@@ -306,7 +435,7 @@ class WaveWriter(StandardLibraryWriter, Writer):
 
 class AifcWriter(StandardLibraryWriter, Writer):
     """Saves integer aiff files with the help of the :mod:`aifc` module."""
-    formats = (Formats.AIFF_INT32, Formats.AIFF_INT16, Formats.AIFF_INT8)
+    formats = (Formats.AIFF_INT32, Formats.AIFF_INT24, Formats.AIFF_INT16, Formats.AIFF_INT8)
 
     def __init__(self, file_format):
         """
@@ -318,6 +447,8 @@ class AifcWriter(StandardLibraryWriter, Writer):
         Writer.__init__(self, file_format)
         if file_format == Formats.AIFF_INT32:
             StandardLibraryWriter.__init__(self, module=aifc, bits=32, signed=True, endianness=">")
+        elif file_format == Formats.AIFF_INT24:
+            StandardLibraryWriter.__init__(self, module=aifc, bits=24, signed=True, endianness=">")
         elif file_format == Formats.AIFF_INT16:
             StandardLibraryWriter.__init__(self, module=aifc, bits=16, signed=True, endianness=">")
         elif file_format == Formats.AIFF_INT8:
@@ -381,6 +512,25 @@ class SoundfileWriter(Writer):
                         subtype=self.__subtype,
                         format=self.__format)
 
+    def open(self, path, sampling_rate, number_of_channels, offset):   # pylint: disable=unused-argument; the offset cannot be stored in the file
+        """Opens a file, to which the samples of a signal can be written incrementally.
+        The header of the file is updated by ``libsndfile``, when the file is closed.
+
+        :param path: the path of the file
+        :param sampling_rate: the sampling rate of the signal
+        :param number_of_channels: the number of channels of the signal
+        :param offset: neglected, since the offset cannot be stored in the file
+        :returns: a :class:`Stream` instance
+        """
+        import soundfile
+        f = soundfile.SoundFile(path,
+                                mode="w",
+                                samplerate=self.__sampling_rate_conversion(sampling_rate),
+                                channels=number_of_channels,
+                                subtype=self.__subtype,
+                                format=self.__format)
+        return Stream(write=lambda channels: f.write(channels.transpose()), close=f.close)
+
     def __int_greater_zero(self, sampling_rate):    # pylint: disable=no-self-use; this "function" should be connected with this class and not as public as a static method
         """Converts the input signal's sampling rate to the nearest integer, that
         is greater than zero.
@@ -18,7 +18,7 @@
 
 import numpy
 import sumpf
-from .._functions import allocate_array
+from .._functions import allocate_array, complex_dtype, get_precision
 
 __all__ = ("readers", "Reader")
 
@@ -67,18 +67,18 @@ class JsonReader(Reader):
                             channels = allocate_array(shape=(number_of_channels,
                                                              number_of_bins,
                                                              number_of_samples),
-                                                      dtype=numpy.complex128)
+                                                      dtype=complex_dtype())
                             for i, c in enumerate(data["channels"]):
                                 numpy.multiply(1j, c["imaginary"], out=channels[i])
                                 numpy.add(channels[i], c["real"], out=channels[i])
                         else:
-                            channels = numpy.empty(shape=(1, 0), dtype=numpy.complex128)
+                            channels = numpy.empty(shape=(1, 0), dtype=complex_dtype())
                     else:
-                        channels = numpy.empty(shape=(1, 0), dtype=numpy.complex128)
+                        channels = numpy.empty(shape=(1, 0), dtype=complex_dtype())
                 else:
-                    channels = numpy.empty(shape=(1, 0), dtype=numpy.complex128)
+                    channels = numpy.empty(shape=(1, 0), dtype=complex_dtype())
             else:
-                channels = numpy.empty(shape=(1, 0), dtype=numpy.complex128)
+                channels = numpy.empty(shape=(1, 0), dtype=complex_dtype())
             return from_dict(channels, data)
 
 
@@ -93,7 +93,8 @@ class NumpyReader(Reader):
         :returns: a :class:`~sumpf.Spectrum` instance
         """
         with numpy.load(path) as data:
-            channels = allocate_array(shape=data["channels"].shape, dtype=numpy.complex128)
+            channels = allocate_array(shape=data["channels"].shape,
+                                      dtype=complex_dtype(get_precision(data["channels"])))
             channels[:] = data["channels"]
             return from_dict(channels, data)
 
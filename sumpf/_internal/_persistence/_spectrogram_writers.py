@@ -79,8 +79,8 @@ def as_dict(spectrogram):
     """Serializes a spectrogram to a dictionary."""
     channels = []
     for c in spectrogram.channels():
-        channel = {"real": [tuple(s) for s in numpy.real(c)],
-                   "imaginary": [tuple(s) for s in numpy.imag(c)]}
+        channel = {"real": [tuple(map(float, s)) for s in numpy.real(c)],
+                   "imaginary": [tuple(map(float, s)) for s in numpy.imag(c)]}
         channels.append(channel)
     return {"channels": channels,
             "resolution": spectrogram.resolution(),
@@ -19,7 +19,8 @@
 import os
 import numpy
 import sumpf
-from .._functions import allocate_array
+from .._functions import allocate_array, complex_dtype, get_precision
+from ._functions import read_csv_table
 
 __all__ = ("readers", "Reader")
 
@@ -45,7 +46,10 @@ def from_rows(frequency_column, data_rows, labels):     # pylint: disable=too-ma
     """
     if len(data_rows) and len(data_rows[0]):    # pylint: disable=len-as-condition; data_rows can be a NumPy array
         # determine the resolution
-        sorted_frequency_row = sorted(frequency_column)
+        if numpy.ndim(frequency_column) == 1 and numpy.all(numpy.diff(frequency_column) >= 0.0):
+            sorted_frequency_row = frequency_column     # avoid sorting large arrays in Python, if they are sorted already
+        else:
+            sorted_frequency_row = sorted(frequency_column)
         minimum_frequency = sorted_frequency_row[0]
         maximum_frequency = sorted_frequency_row[-1]
         if len(sorted_frequency_row) <= 1:
@@ -64,15 +68,15 @@ def from_rows(frequency_column, data_rows, labels):     # pylint: disable=too-ma
             sorted_data_rows = [[e for _, e in sorted(zip(frequency_column, data_row))] for data_row in data_rows]
         # create the channels
         if offset == 0:
-            channels = allocate_array(shape=numpy.shape(sorted_data_rows), dtype=numpy.complex128)
+            channels = allocate_array(shape=numpy.shape(sorted_data_rows), dtype=complex_dtype())
             channels[:] = sorted_data_rows
         elif offset < 0:
             channels = allocate_array(shape=numpy.subtract(numpy.shape(sorted_data_rows), (0, offset)),
-                                      dtype=numpy.complex128)
+                                      dtype=complex_dtype())
             channels[:] = sorted_data_rows[:, offset:]
         else:
             channels = allocate_array(shape=numpy.add(numpy.shape(sorted_data_rows), (0, offset)),
-                                      dtype=numpy.complex128)
+                                      dtype=complex_dtype())
             channels[:, 0:offset] = 0.0 + 0j
             channels[:, offset:] = sorted_data_rows[:]
         # extend the labels if necessary
@@ -108,26 +112,15 @@ class CsvReader(Reader):
         :param path: the path of the file, from which the spectrum shall be loaded
         :returns: a :class:`~sumpf.Spectrum` instance
         """
-        import csv
-        with open(path, newline="") as f:
-            reader = csv.reader(f)
-            rows = []
-            frequency_samples = []
-            first_row = next(reader)
-            try:
-                frequency_samples.append(float(first_row[0]))
-                rows.append([complex(c) for c in first_row[1:]])
-            except ValueError:
-                labels = tuple(first_row[1:])
-            else:
-                filename = os.path.split(path)[-1]
-                labels = [f"{filename} {i}" for i in range(1, len(first_row))]
-            for row in reader:
-                frequency_samples.append(float(row[0]))
-                rows.append([complex(c) for c in row[1:]])
-            return from_rows(frequency_column=frequency_samples,
-                             data_rows=numpy.transpose(rows),
-                             labels=labels)
+        header, table = read_csv_table(path, dtype=numpy.complex128)
+        if header is None:
+            filename = os.path.split(path)[-1]
+            labels = [f"{filename} {i}" for i in range(1, len(table))]
+        else:
+            labels = tuple(header[1:])
+        return from_rows(frequency_column=table[0].real if len(table) else table,
+                         data_rows=table[1:],
+                         labels=labels)
 
 
 class JsonReader(Reader):
@@ -148,16 +141,16 @@ class JsonReader(Reader):
                 if number_of_channels:
                     number_of_samples = len(data["channels"][0]["real"])
                     if number_of_samples:
-                        channels = allocate_array(shape=(number_of_channels, number_of_samples), dtype=numpy.complex128)
+                        channels = allocate_array(shape=(number_of_channels, number_of_samples), dtype=complex_dtype())
                         for i, c in enumerate(data["channels"]):
                             numpy.multiply(1j, c["imaginary"], out=channels[i])
                             numpy.add(channels[i], c["real"], out=channels[i])
                     else:
-                        channels = numpy.empty(shape=(1, 0), dtype=numpy.complex128)
+                        channels = numpy.empty(shape=(1, 0), dtype=complex_dtype())
                 else:
-                    channels = numpy.empty(shape=(1, 0), dtype=numpy.complex128)
+                    channels = numpy.empty(shape=(1, 0), dtype=complex_dtype())
             else:
-                channels = numpy.empty(shape=(1, 0), dtype=numpy.complex128)
+                channels = numpy.empty(shape=(1, 0), dtype=complex_dtype())
             return from_dict(channels, data)
 
 
@@ -173,7 +166,8 @@ class NumpyReader(Reader):
         """
         try:
             with numpy.load(path) as data:
-                channels = allocate_array(shape=data["channels"].shape, dtype=numpy.complex128)
+                channels = allocate_array(shape=data["channels"].shape,
+                                          dtype=complex_dtype(get_precision(data["channels"])))
                 channels[:] = data["channels"]
                 return from_dict(channels, data)
         except AttributeError:  # npy files cannot be opened with a context manager
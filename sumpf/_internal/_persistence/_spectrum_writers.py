@@ -19,6 +19,7 @@
 import enum
 import numpy
 from ._auto_writer import AutoWriter
+from ._functions import write_csv_table
 
 __all__ = ("Formats", "Writer")
 
@@ -83,8 +84,8 @@ def as_dict(spectrum):
     """Serializes a spectrum to a dictionary."""
     channels = []
     for c in spectrum.channels():
-        channel = {"real": [s for s in numpy.real(c)],
-                   "imaginary": [s for s in numpy.imag(c)]}
+        channel = {"real": [float(s) for s in numpy.real(c)],
+                   "imaginary": [float(s) for s in numpy.imag(c)]}
         channels.append(channel)
     return {"channels": channels,
             "resolution": spectrum.resolution(),
@@ -103,14 +104,9 @@ class CsvWriter(Writer):
         :param data: the :class:`~sumpf.Spectrum` instance
         :param path: the path of the file, in which the spectrum shall be saved
         """
-        import csv
-        with open(path, "w", newline="") as f:
-            columns = ["frequency"]
-            columns.extend(spectrum.labels())
-            writer = csv.writer(f)
-            writer.writerow(columns)
-            for t, row in zip(spectrum.frequency_samples(), spectrum.channels().transpose()):
-                writer.writerow((t, *row))
+        write_csv_table(path,
+                        header=("frequency",) + spectrum.labels(),
+                        columns=(spectrum.frequency_samples(), *spectrum.channels()))
 
 
 class JsonWriter(Writer):
@@ -0,0 +1,139 @@
+# This file is a part of the "SuMPF" package
+# Copyright (C) 2018-2019 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Contains process-wide settings for the computations in *SuMPF*.
+
+The settings are module attributes, that can be changed by assigning a new value
+to them (e.g. ``sumpf.config.fft_workers = 8``). For changing them only temporarily,
+the :func:`~sumpf.config.override` context manager can be used.
+"""
+
+import contextlib
+import sys
+
+__all__ = ("fft_backend", "fft_workers", "convolution_costs", "precision", "allocator",
+           "filter_cache_size", "filter_cache_bytes", "override", "calibrate_convolution_costs")
+
+#: the name of the backend for the fast Fourier transforms (see :attr:`sumpf._internal.fft_backends`
+#: for the available backends). If None, :mod:`scipy.fft` is used, when it is
+#: installed and more than one worker has been requested with :attr:`fft_workers`.
+#: Otherwise, the transforms are computed with :mod:`numpy.fft`.
+fft_backend = None
+
+#: the number of workers for computing the fast Fourier transforms of multiple
+#: channels in parallel. None for the backend's default, which is a single
+#: worker. Negative numbers are counted backwards from the number of CPU cores,
+#: so that -1 uses all cores. This setting is ignored by backends, that do not
+#: support parallel computation, like the one of :mod:`numpy.fft`.
+fft_workers = None
+
+#: the coefficients of the cost model, with which the ``AUTO_FULL``, ``AUTO_SAME``
+#: and ``AUTO_VALID`` convolution modes choose the computation method (see
+#: :class:`~sumpf._internal._enums.ConvolutionMode`). The coefficients are durations
+#: in seconds: ``"direct"`` for a multiply-accumulate operation of the direct
+#: convolution, ``"direct_sample"`` for the overhead per computed sample of the
+#: direct convolution, ``"transform"`` for a real valued fast Fourier transform
+#: per ``n*log2(n)``, ``"elementwise"`` for an element-wise operation on an array,
+#: like a complex multiplication or a copy, and ``"call"`` for the overhead of
+#: calling a :mod:`numpy` function. The defaults are rough estimates for a recent
+#: desktop computer. The coefficients for the target machine can be measured
+#: with :func:`calibrate_convolution_costs`.
+convolution_costs = {"direct": 1e-10,
+                     "direct_sample": 1.2e-8,
+                     "transform": 1.3e-9,
+                     "elementwise": 9e-10,
+                     "call": 1.5e-6}
+
+#: the default precision of the floating point numbers in newly created data sets,
+#: which is either ``"double"`` for :class:`numpy.float64` and :class:`numpy.complex128`
+#: or ``"single"`` for :class:`numpy.float32` and :class:`numpy.complex64`. This
+#: setting is used by generators like :class:`~sumpf.SineWave` or :meth:`sumpf.Filter.spectrum`
+#: and when loading data from files, that do not specify the precision (e.g. integer
+#: wav files). Computations with existing data sets keep their precision, so that
+#: a single precision signal is not converted to double precision silently. The
+#: precision of an individual data set can be changed with its ``to_precision`` method.
+precision = "double"
+
+#: the name of the strategy, with which the arrays for the channels of the data
+#: sets and for intermediate results are allocated (see :attr:`sumpf._internal.allocators`).
+#: ``"shared"`` allocates zero initialized arrays in shared memory, so that they
+#: can be passed to other processes without copying. ``"numpy"`` allocates each
+#: array with :func:`numpy.empty`. ``"pool"`` recycles the buffers of arrays, that
+#: are no longer used, which saves allocations in loops, but the recycled buffers
+#: are neither zero initialized nor in shared memory and the pool keeps up to
+#: 256MiB of unused buffers after the arrays have been freed (see :class:`sumpf._internal.PoolAllocator`).
+#: The statistics about the allocated memory can be retrieved with
+#: ``sumpf._internal.get_allocator().statistics()``.
+allocator = "shared"
+
+#: the maximum number of sampled filters, that are kept in the cache of :meth:`sumpf.Filter.spectrum`
+#: (see :attr:`sumpf.Filter.spectrum_cache`). When the cache is full, the least
+#: recently used spectrums are removed. A size of zero disables the cache.
+filter_cache_size = 64
+
+#: the maximum number of bytes, that the channels of the sampled filters in the
+#: cache of :meth:`sumpf.Filter.spectrum` may occupy in total. When this limit is
+#: exceeded, the least recently used spectrums are removed. Spectrums, which are
+#: larger than this limit, are not cached at all. A limit of zero disables the cache.
+filter_cache_bytes = 2 ** 26
+
+
+@contextlib.contextmanager
+def override(**settings):
+    """A context manager, that changes the given settings temporarily and restores
+    their previous values, when the context is left.
+
+    >>> import sumpf
+    >>> with sumpf.config.override(fft_workers=4):
+    ...     sumpf.config.fft_workers
+    4
+    >>> sumpf.config.fft_workers is None
+    True
+
+    :param `**settings`: the new values of the settings as keyword arguments
+    """
+    module = sys.modules[__name__]
+    for name in settings:
+        if name not in __all__ or name in ("override", "calibrate_convolution_costs"):
+            raise AttributeError(f"{name} is not a setting of SuMPF")
+    previous = {name: getattr(module, name) for name in settings}
+    try:
+        for name, value in settings.items():
+            setattr(module, name, value)
+        yield
+    finally:
+        for name, value in previous.items():
+            setattr(module, name, value)
+
+
+def calibrate_convolution_costs(repetitions=20):
+    """Measures the coefficients of the cost model for choosing the computation
+    method of the automatic convolution modes on the current machine (see
+    :attr:`convolution_costs`). The transforms are measured with the backend,
+    that is selected by :attr:`fft_backend`.
+
+    >>> import sumpf
+    >>> costs = sumpf.config.calibrate_convolution_costs(repetitions=2)
+    >>> sorted(costs)
+    ['call', 'direct', 'direct_sample', 'elementwise', 'transform']
+    >>> sumpf.config.convolution_costs = costs  # doctest: +SKIP
+
+    :param repetitions: the number of repetitions of each benchmark, of which the fastest one is evaluated
+    :returns: a dictionary with the coefficients of the cost model, that can be
+              assigned to :attr:`convolution_costs`
+    """
+    import sumpf._internal as sumpf_internal    # pylint: disable=import-outside-toplevel; importing sumpf._internal at the module level would cause a cyclic import
+    return sumpf_internal.calibrate_convolution_costs(repetitions=repetitions)
@@ -0,0 +1,529 @@
+# This file is a part of the "SuMPF" package
+# Copyright (C) 2018-2019 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Contains functions for distributing computations with *SuMPF*'s data sets
+to a pool of worker processes.
+
+The data sets are not pickled, when they are passed to the worker processes.
+Instead, their channels are stored in named shared memory, which the workers
+map into their address space without copying. Only a small :class:`SharedDataHandle`
+with the name of the shared memory block and the metadata of the data set is
+sent through the pipe. The resulting data sets of the workers are returned the
+same way. Channels, that already reside in such a shared memory block, like the
+channels of the results of a previous call of :func:`map` or of :func:`share`,
+are passed on without copying them again.
+
+The functions, that are distributed to the worker processes, have to be picklable,
+which excludes lambda functions and locally defined functions. For calling a
+method of the data sets, the :class:`Method` class can be used.
+
+>>> import sumpf
+>>> signal = sumpf.MergeSignals([sumpf.SineWave(frequency=f, length=1000) for f in (480.0, 960.0)]).output()
+>>> levels = sumpf.parallel.map(sumpf.parallel.Method("level"), [signal[0], signal[1]], processes=2)
+>>> [round(float(level[0]), 3) for level in levels]
+[0.707, 0.707]
+
+Many files can be loaded or saved concurrently with :func:`load_many` and
+:func:`save_many`.
+"""
+
+import concurrent.futures
+import multiprocessing
+import os
+from multiprocessing import shared_memory
+import threading
+import weakref
+import numpy
+import sumpf
+
+__all__ = ("map", "map_channels", "share", "load_many", "save_many", "Method", "FileResult", "SharedDataHandle")
+
+_segments = {}  # maps the ids of the arrays, that span a shared memory block, to weak references of the arrays and the names of the blocks
+_lock = threading.Lock()
+_text_extensions = (".csv", ".json", ".js")     # files with these extensions are read and written by pure Python code, which is faster in worker processes
+
+
+def map(function, iterable, processes=None, pool=None):     # pylint: disable=redefined-builtin; the name shall resemble that of the built-in map function
+    """Calls the given function with every item of the given iterable in a pool
+    of worker processes and returns the results in a list.
+
+    :class:`~sumpf.Signal`, :class:`~sumpf.Spectrum` and :class:`~sumpf.Spectrogram`
+    instances among the items and the results are passed through shared memory.
+    This also applies to data sets in tuples, lists and dictionaries and to the
+    parameters of a :class:`Method`. The channels of the items are copied to
+    a newly created shared memory block, unless they already reside in one, that
+    has been created by this module (see :func:`share`). This also applies to
+    arrays, that have been allocated in shared memory by the ``"shared"`` allocator
+    (see :attr:`sumpf.config.allocator`), because that memory is only accessible
+    for processes, which have been forked after the allocation. Data sets, that
+    are passed to multiple calls of this function, can be copied to shared
+    memory once with :func:`share`.
+
+    :param function: a picklable callable, that accepts an item of the iterable
+                     as its only parameter
+    :param iterable: an iterable of the items, that shall be processed in parallel.
+                     These can for example be data sets or paths to files, that
+                     shall be loaded and processed by the workers.
+    :param processes: the number of worker processes or None to use the number
+                      of CPU cores. This is ignored, if a pool is given.
+    :param pool: an optional :class:`multiprocessing.pool.Pool` instance, so that
+                 the worker processes can be reused for multiple calls of this
+                 function. If None, a pool is created for this call.
+    :returns: a list of the results
+    """
+    segments = []   # the shared memory blocks, that are created for passing the items to the workers
+    try:
+        shared_function = _share(function, segments)
+        tasks = [(shared_function, _share(item, segments)) for item in iterable]
+        if pool is None:
+            processes = min(processes or multiprocessing.cpu_count(), max(len(tasks), 1))
+            with multiprocessing.Pool(processes=processes) as new_pool:
+                results = new_pool.map(_call, tasks)
+        else:
+            results = pool.map(_call, tasks)
+        return [_restore(r, take_ownership=True) for r in results]
+    finally:
+        for segment in segments:
+            segment.close()
+            segment.unlink()
+
+
+def map_channels(function, data, processes=None, pool=None):
+    """Splits the given data set into its channels, calls the given function with
+    each single channel data set in a pool of worker processes and merges the
+    resulting data sets.
+
+    >>> import sumpf
+    >>> signal = sumpf.MergeSignals([sumpf.SineWave(frequency=f, length=1000) for f in (480.0, 960.0)]).output()
+    >>> stft = sumpf.parallel.Method("short_time_fourier_transform", window=64)
+    >>> sumpf.parallel.map_channels(stft, signal, processes=2).shape()
+    (2, 33, 33)
+
+    :param function: a picklable callable, that accepts a data set with one channel
+                     as its only parameter and returns a data set. The returned
+                     data sets must be of the same type for all channels.
+    :param data: a :class:`~sumpf.Signal`, :class:`~sumpf.Spectrum` or :class:`~sumpf.Spectrogram`
+    :param processes: the number of worker processes or None to use the number of CPU cores
+    :param pool: an optional :class:`multiprocessing.pool.Pool` instance (see :func:`map`)
+    :returns: the merged data set
+    """
+    results = map(function, [data[c] for c in range(len(data))], processes=processes, pool=pool)
+    if len(results) == 1:
+        return results[0]
+    elif isinstance(results[0], sumpf.Signal):
+        return sumpf.MergeSignals(results).output()
+    elif isinstance(results[0], sumpf.Spectrum):
+        return sumpf.MergeSpectrums(results).output()
+    else:
+        return _merge_spectrograms(results)
+
+
+def share(data):
+    """Returns a copy of the given data set, whose channels are stored in a named
+    shared memory block, so that the data set can be passed to the worker processes
+    of :func:`map` and :func:`map_channels` without copying its channels for each
+    call. The shared memory block is removed, when the returned data set and
+    all views of its channels have been garbage collected.
+
+    >>> import sumpf
+    >>> signal = sumpf.SineWave(length=1000)
+    >>> shared = sumpf.parallel.share(signal)
+    >>> shared == signal
+    True
+    >>> levels = sumpf.parallel.map(sumpf.parallel.Method("level"), [shared, shared], processes=2)
+
+    :param data: a :class:`~sumpf.Signal`, :class:`~sumpf.Spectrum` or :class:`~sumpf.Spectrogram`
+    :returns: a data set of the same type with equal channels and metadata
+    """
+    if _find_segment(data.channels()) is not None:
+        return data
+    segments = []
+    handle = _share(data, segments)
+    for segment in segments:
+        segment.close()     # the returned data set maps the block by its name and takes over its ownership
+    return _restore(handle, take_ownership=True)
+
+
+def load_many(paths, kind=None, workers=None, ordered=True, memory_limit=None):
+    """Loads many files concurrently and returns an iterator, that yields a
+    :class:`FileResult` for each file.
+
+    Binary files are loaded in a pool of threads, since their decoders (e.g. the
+    ones of :mod:`numpy` or ``libsndfile``) spend most of their time in code,
+    that does not hold Python's global interpreter lock. CSV and JSON files are
+    parsed by pure Python code, so they are loaded in a pool of worker processes,
+    from which the loaded data sets are returned through shared memory.
+
+    Errors do not stop the loading of the other files. Instead, they are reported
+    in the :attr:`~FileResult.error` attribute of the respective result.
+
+    >>> import os, tempfile, sumpf
+    >>> with tempfile.TemporaryDirectory() as directory:
+    ...     paths = [os.path.join(directory, f"{i}.npz") for i in range(3)]
+    ...     _ = sumpf.save_many([(sumpf.SineWave(length=i + 1), p) for i, p in enumerate(paths)])
+    ...     [r.data.length() for r in sumpf.load_many(paths, workers=2)]
+    [1, 2, 3]
+
+    :param paths: a sequence of file paths
+    :param kind: the class of the data sets, that shall be loaded. Its static
+                 ``load`` method is used for loading the files. If None, the
+                 files are loaded as :class:`~sumpf.Signal` instances.
+    :param workers: the number of threads and the number of worker processes
+                    or None to choose them depending on the number of CPU cores
+    :param ordered: True, if the results shall be yielded in the order of the
+                    paths, False, if they shall be yielded as soon as they are loaded
+    :param memory_limit: an optional number of bytes, which limits the total size
+                         of the files, that are being loaded or whose results have
+                         not been yielded yet. One file is always loaded, even
+                         if it exceeds the limit.
+    :returns: an iterator of :class:`FileResult` instances
+    """
+    load = (sumpf.Signal if kind is None else kind).load
+    tasks = []
+    for path in paths:
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            size = 0    # the error is reported, when the file is loaded
+        tasks.append((path, load, path, size, os.path.splitext(path)[-1] in _text_extensions))
+    return _run(tasks, workers=workers, ordered=ordered, memory_limit=memory_limit)
+
+
+def save_many(items, workers=None, ordered=True, memory_limit=None):
+    """Saves many data sets concurrently and returns a list with a :class:`FileResult`
+    for each data set. Like :func:`load_many`, this function writes CSV and JSON
+    files in a pool of worker processes and all other files in a pool of threads.
+
+    :param items: an iterable of tuples with a data set and a file path and an
+                  optional file format flag, that is passed to the data set's
+                  ``save`` method
+    :param workers: the number of threads and the number of worker processes
+                    or None to choose them depending on the number of CPU cores
+    :param ordered: True, if the results shall be in the order of the items,
+                    False, if they shall be in the order, in which the files have
+                    been written
+    :param memory_limit: an optional number of bytes, which limits the total size
+                         of the channels of the data sets, which are written simultaneously
+    :returns: a list of :class:`FileResult` instances
+    """
+    tasks = []
+    for data, path, *file_format in items:
+        try:
+            size = data.channels().nbytes
+        except AttributeError:  # filters do not have channels
+            size = 0
+        text = os.path.splitext(path)[-1] in _text_extensions or any(f.name in ("TEXT_CSV", "TEXT_JSON") for f in file_format)
+        tasks.append((path, Method("save", path, *file_format), data, size, text))
+    results = list(_run(tasks, workers=workers, ordered=ordered, memory_limit=memory_limit))
+    for result in results:
+        result.data = tasks[result.index][2]    # the save method returns the data set, but the one, which has been given, shall be returned
+    return results
+
+
+class FileResult:
+    """The result of loading or saving a file with :func:`load_many` or :func:`save_many`."""
+
+    def __init__(self, index, path, data, error):
+        """
+        :param index: the position of the file in the sequence of files
+        :param path: the path of the file
+        :param data: the loaded or saved data set or None, if an error occurred
+        :param error: the exception, that has been raised, or None
+        """
+        self.index = index  #: the position of the file in the sequence of files
+        self.path = path    #: the path of the file
+        self.data = data    #: the loaded or saved data set or None, if an error occurred
+        self.error = error  #: the exception, that has been raised while loading or saving the file, or None
+
+
+class Method:
+    """A picklable callable, that calls the method with the given name of the object,
+    with which it is called. The parameters for the method are given to the constructor.
+
+    >>> import numpy, sumpf
+    >>> convolve = sumpf.parallel.Method("convolve", sumpf.Signal(channels=numpy.array([(1.0, 0.5)])), mode=sumpf.Signal.convolution_modes.FULL)
+    >>> convolve(sumpf.Signal(channels=numpy.array([(1.0, 0.0, 2.0)]))).channels()
+    array([[1. , 0.5, 2. , 1. ]])
+    """
+
+    def __init__(self, name, *args, **kwargs):
+        """
+        :param name: the name of the method as a string
+        :param `*args,**kwargs`: the parameters for the method
+        """
+        self.__name = name
+        self.__args = args
+        self.__kwargs = kwargs
+
+    def __call__(self, obj):
+        """Calls the method of the given object.
+
+        :param obj: the object, whose method shall be called
+        :returns: the result of the method
+        """
+        return getattr(obj, self.__name)(*self.__args, **self.__kwargs)
+
+    def _map_parameters(self, function):
+        """Protected helper method, that returns a copy of this instance, in which
+        the given function has been applied to the parameters of the method.
+
+        :param function: a function, that accepts and returns a tuple or a dictionary
+        :returns: a :class:`Method` instance
+        """
+        return Method(self.__name, *function(self.__args), **function(self.__kwargs))
+
+
+class SharedDataHandle:
+    """A picklable reference to a data set, whose channels are stored in a named
+    block of shared memory.
+    """
+
+    def __init__(self, data, channels, segment, offset, new):
+        """
+        :param data: the :class:`~sumpf.Signal`, :class:`~sumpf.Spectrum` or
+                     :class:`~sumpf.Spectrogram`, whose metadata shall be stored
+        :param channels: the array in the shared memory block, that contains the channels
+        :param segment: the name of the shared memory block
+        :param offset: the position of the channels' first sample in the shared memory block in bytes
+        :param new: True, if the shared memory block has been created for this handle,
+                    False, if it has been created earlier and is owned by another handle
+        """
+        self.segment = segment
+        self.offset = offset
+        self.new = new
+        self.shape = channels.shape
+        self.strides = channels.strides
+        self.dtype = channels.dtype.str
+        if isinstance(data, sumpf.Signal):
+            self.cls = sumpf.Signal
+            self.metadata = {"sampling_rate": data.sampling_rate(), "offset": data.offset(), "labels": data.labels()}
+        elif isinstance(data, sumpf.Spectrum):
+            self.cls = sumpf.Spectrum
+            self.metadata = {"resolution": data.resolution(), "labels": data.labels()}
+        else:
+            self.cls = sumpf.Spectrogram
+            self.metadata = {"resolution": data.resolution(),
+                             "sampling_rate": data.sampling_rate(),
+                             "offset": data.offset(),
+                             "labels": data.labels()}
+
+    def load(self, owner=False):
+        """Creates a data set, whose channels are mapped from the shared memory
+        block without copying them. The shared memory block is closed, when the
+        channels and all arrays, that are derived from them, are garbage collected.
+
+        :param owner: True, if the shared memory block shall also be removed, when
+                      the channels are garbage collected. This must only be set
+                      in one process.
+        :returns: a :class:`~sumpf.Signal`, :class:`~sumpf.Spectrum` or :class:`~sumpf.Spectrogram`
+        """
+        flat = _map_segment(shared_memory.SharedMemory(name=self.segment), unlink=owner)
+        channels = numpy.ndarray(shape=self.shape, dtype=self.dtype, buffer=flat, offset=self.offset, strides=self.strides)
+        return self.cls(channels=channels, **self.metadata)
+
+
+class _SegmentBuffer:
+    """Exposes the memory of a shared memory block through the array interface
+    without exporting a buffer, so that the block can be closed, as soon as the
+    last array, that refers to an instance of this class, has been garbage collected.
+    """
+
+    def __init__(self, segment):
+        self.segment = segment
+        self.__array_interface__ = {"data": (numpy.frombuffer(segment.buf, dtype=numpy.uint8).ctypes.data, False),
+                                    "shape": (segment.size,),
+                                    "typestr": "|u1",
+                                    "version": 3}
+
+
+def _map_segment(segment, unlink):
+    """Returns a flat array of bytes, that spans the given shared memory block.
+    The block is closed, when the array and all views of it have been garbage collected.
+    """
+    flat = numpy.asarray(_SegmentBuffer(segment))
+    with _lock:
+        _segments[id(flat)] = (weakref.ref(flat), segment.name)
+    weakref.finalize(flat, _release_segment, id(flat), segment, unlink)
+    return flat
+
+
+def _release_segment(key, segment, unlink):
+    """Closes a shared memory block and removes it, if it is owned by this process."""
+    with _lock:
+        _segments.pop(key, None)
+    segment.close()
+    if unlink:
+        segment.unlink()
+
+
+def _find_segment(channels):
+    """Returns the name of the shared memory block, in which the given array is
+    stored, and the array's offset in that block or None, if the array is not stored
+    in a shared memory block, that has been mapped by this module.
+    """
+    root = channels
+    while isinstance(root.base, numpy.ndarray):
+        root = root.base
+    with _lock:
+        reference, name = _segments.get(id(root), (None, None))
+    if reference is None or reference() is not root:
+        return None
+    return name, channels.ctypes.data - root.ctypes.data
+
+
+def _share(item, segments):
+    """Replaces the data sets in the given item with handles to their channels in
+    shared memory. Newly created shared memory blocks are appended to the given list.
+    """
+    if isinstance(item, (sumpf.Signal, sumpf.Spectrum, sumpf.Spectrogram)):
+        channels = item.channels()
+        found = _find_segment(channels)
+        if found is not None:
+            name, offset = found
+            return SharedDataHandle(item, channels, name, offset, new=False)
+        segment = shared_memory.SharedMemory(create=True, size=max(channels.nbytes, 1))
+        segments.append(segment)
+        copy = numpy.ndarray(shape=channels.shape, dtype=channels.dtype, buffer=segment.buf)
+        copy[:] = channels
+        handle = SharedDataHandle(item, copy, segment.name, 0, new=True)
+        del copy    # release the buffer, so that the segment can be closed
+        return handle
+    elif isinstance(item, Method):
+        return item._map_parameters(lambda p: _share(p, segments))      # pylint: disable=protected-access; the helper method shall not be part of the public interface
+    elif isinstance(item, tuple):
+        return tuple(_share(i, segments) for i in item)
+    elif isinstance(item, list):
+        return [_share(i, segments) for i in item]
+    elif isinstance(item, dict):
+        return {k: _share(v, segments) for k, v in item.items()}
+    return item
+
+
+def _restore(item, take_ownership):
+    """Replaces the handles in the given item with the data sets, that they refer to.
+    If take_ownership is True, the newly created shared memory blocks are removed,
+    when the restored data sets are garbage collected.
+    """
+    if isinstance(item, SharedDataHandle):
+        return item.load(owner=take_ownership and item.new)
+    elif isinstance(item, Method):
+        return item._map_parameters(lambda p: _restore(p, take_ownership))  # pylint: disable=protected-access; the helper method shall not be part of the public interface
+    elif isinstance(item, tuple):
+        return tuple(_restore(i, take_ownership) for i in item)
+    elif isinstance(item, list):
+        return [_restore(i, take_ownership) for i in item]
+    elif isinstance(item, dict):
+        return {k: _restore(v, take_ownership) for k, v in item.items()}
+    return item
+
+
+def _call(task):
+    """Calls the function of a task in a worker process and shares the result."""
+    function, item = task
+    result = _restore(function, take_ownership=False)(_restore(item, take_ownership=False))
+    segments = []
+    shared = _share(result, segments)
+    for segment in segments:
+        segment.close()     # the parent process takes over the ownership of the shared memory blocks
+    return shared
+
+
+def _run(tasks, workers, ordered, memory_limit):    # noqa; pylint: disable=too-many-branches,too-many-locals; the scheduling is easier to follow in one function
+    """Executes the given tasks in a pool of threads or a pool of worker processes
+    and yields a :class:`FileResult` for each task.
+
+    :param tasks: a list of tuples with the path of the file, a function, the
+                  parameter for the function, the estimated memory in bytes and
+                  a flag, if the task shall be executed in a worker process
+    :param workers: the number of threads and processes or None
+    :param ordered: True, if the results shall be yielded in the order of the tasks
+    :param memory_limit: the maximum memory for the tasks, whose results have not
+                         been yielded yet, or None
+    """
+    threads = None
+    processes = None
+    pending = {}        # maps futures to the indices of their tasks and the shared memory blocks of their arguments
+    done = {}           # maps indices to the results, that have not been yielded yet
+    in_flight = 0       # the memory of the tasks, that have been submitted and whose results have not been yielded yet
+    submitted = 0
+    yielded = 0
+    concurrency = 2 * (workers or multiprocessing.cpu_count())     # enough tasks to keep the pools busy without submitting all at once
+    try:
+        while yielded < len(tasks):
+            # submit tasks
+            while submitted < len(tasks) and len(pending) < concurrency:
+                _, function, parameter, size, in_process = tasks[submitted]
+                if memory_limit is not None and in_flight and in_flight + size > memory_limit:
+                    break
+                if in_process:
+                    if processes is None:
+                        processes = concurrent.futures.ProcessPoolExecutor(max_workers=workers)
+                    segments = []
+                    future = processes.submit(_call, (_share(function, segments), _share(parameter, segments)))
+                else:
+                    if threads is None:
+                        threads = concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+                    segments = None
+                    future = threads.submit(function, parameter)
+                pending[future] = (submitted, segments)
+                in_flight += size
+                submitted += 1
+            # collect the results
+            finished, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in finished:
+                index, segments = pending.pop(future)
+                try:
+                    data = future.result()
+                    if segments is not None:
+                        data = _restore(data, take_ownership=True)
+                except Exception as e:     # pylint: disable=broad-except; the error shall be reported in the result
+                    done[index] = FileResult(index=index, path=tasks[index][0], data=None, error=e)
+                else:
+                    done[index] = FileResult(index=index, path=tasks[index][0], data=data, error=None)
+                for segment in segments or ():
+                    segment.close()
+                    segment.unlink()
+            # yield the results
+            indices = range(yielded, yielded + len(done)) if ordered else sorted(done)
+            for index in indices:
+                if index not in done:
+                    break
+                in_flight -= tasks[index][3]
+                yielded += 1
+                yield done.pop(index)
+    finally:
+        for pool in (threads, processes):
+            if pool is not None:
+                pool.shutdown(wait=True, cancel_futures=True)
+        for future, (_, segments) in pending.items():
+            if segments is not None and not future.cancelled() and future.exception() is None:
+                _restore(future.result(), take_ownership=True)  # removes the shared memory blocks of the result
+            for segment in segments or ():
+                segment.close()
+                segment.unlink()
+
+
+def _merge_spectrograms(spectrograms):
+    """Merges the channels of spectrograms with the same number of frequencies and samples."""
+    first = spectrograms[0]
+    if any(s.shape()[1:] != first.shape()[1:] for s in spectrograms):
+        raise ValueError("Only spectrograms with the same number of frequencies and samples can be merged")
+    channels = numpy.concatenate([s.channels() for s in spectrograms])
+    return sumpf.Spectrogram(channels=channels,
+                             resolution=first.resolution(),
+                             sampling_rate=first.sampling_rate(),
+                             offset=first.offset(),
+                             labels=sum((s.labels() for s in spectrograms), ()))
@@ -0,0 +1,69 @@
+# This file is a part of the "SuMPF" package
+# Copyright (C) 2018-2019 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests for the SignalAssembler class"""
+
+import hypothesis
+import numpy
+import sumpf
+import tests
+
+
+def test_manual():
+    """Tests the overlap-add of manually generated blocks."""
+    assembler = sumpf.SignalAssembler(length=5, number_of_channels=2, sampling_rate=2.0, offset=3, labels=("a", "b"))
+    assert assembler.output() == sumpf.Signal(channels=numpy.zeros((2, 5)), sampling_rate=2.0, offset=3, labels=("a", "b"))
+    assembler.add(sumpf.Signal(channels=numpy.array([(1.0, 2.0, 3.0)]), offset=2))                     # single channel, cropped at the beginning
+    assembler.add(sumpf.Signal(channels=numpy.array([(1.0, 1.0, 1.0), (2.0, 2.0, 2.0)]), offset=5))    # overlapping and cropped at the end
+    assembler.add(sumpf.Signal(channels=numpy.array([(9.0, 9.0)]), offset=-3))                         # completely outside
+    output = assembler.output()
+    assert (output.channels() == [(2.0, 3.0, 1.0, 1.0, 1.0), (2.0, 3.0, 2.0, 2.0, 2.0)]).all()
+    assert output.sampling_rate() == 2.0
+    assert output.offset() == 3
+    assert output.labels() == ("a", "b")
+
+
+@hypothesis.given(signal=tests.strategies.signals(min_channels=1),
+                  half=hypothesis.strategies.integers(min_value=1, max_value=20))
+def test_overlap_add(signal, half):
+    """Tests the reassembly of a signal, that has been split into blocks with 50%
+    overlap, which have been weighted with a triangular window."""
+    channels = numpy.zeros(shape=(len(signal), signal.length() + 2 * half))
+    channels[:, half:half + signal.length()] = signal.channels()
+    padded = sumpf.Signal(channels=channels, sampling_rate=signal.sampling_rate(), offset=signal.offset() - half)
+    window = 1.0 - numpy.abs(numpy.arange(2 * half) - half) / half
+    assembler = sumpf.SignalAssembler(length=signal.length(),
+                                      number_of_channels=len(signal),
+                                      sampling_rate=signal.sampling_rate(),
+                                      offset=signal.offset(),
+                                      labels=signal.labels())
+    for block in padded.blocks(block_length=2 * half, overlap=0.5):
+        assembler.add(block * window)
+    assert tests.compare_signals_approx(assembler.output(), signal)
+
+
+def test_precision():
+    """Tests if the assembled signal has the precision of the added blocks."""
+    signal = sumpf.Signal(channels=numpy.random.normal(size=(2, 100)), labels=("a", "b")).to_precision("single")
+    for precision in ("single", "double"):
+        with sumpf.config.override(precision=precision):
+            assembler = sumpf.SignalAssembler(length=signal.length(), number_of_channels=len(signal))
+            for block in signal.blocks(block_length=32):
+                assembler.add(block)
+            assert assembler.output().channels().dtype == numpy.float32
+            assert (assembler.output().channels() == signal.channels()).all()
+    with sumpf.config.override(precision="single"):
+        assert sumpf.SignalAssembler(length=10).output().channels().dtype == numpy.float32
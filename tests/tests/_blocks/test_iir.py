@@ -0,0 +1,99 @@
+# This file is a part of the "SuMPF" package
+# Copyright (C) 2018-2019 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests for the IIRProcessor class"""
+
+import hypothesis
+import numpy
+import pytest
+import sumpf
+import tests
+
+
+@hypothesis.given(signal=tests.strategies.signals(min_length=1, max_length=200, min_value=-1e3, max_value=1e3),
+                  number_of_filter_channels=hypothesis.strategies.integers(min_value=1, max_value=3),
+                  lengths=hypothesis.strategies.lists(hypothesis.strategies.integers(min_value=1, max_value=50), max_size=10))
+@hypothesis.settings(deadline=None)
+def test_block_wise_filtering(signal, number_of_filter_channels, lengths):
+    """Compares the block-wise filtering with the filtering of the whole signal."""
+    scipy_signal = pytest.importorskip("scipy.signal")
+    filter_ = sumpf.Filter(transfer_functions=[sumpf.ButterworthFilter(cutoff_frequency=signal.sampling_rate() / (i + 4),
+                                                                       order=i + 1,
+                                                                       highpass=bool(i % 2)).transfer_functions()[0]
+                                               for i in range(number_of_filter_channels)])
+    processor = sumpf.IIRProcessor(filter_, sampling_rate=signal.sampling_rate())
+    # filter the whole signal
+    result = processor.process(signal)
+    assert result.sampling_rate() == signal.sampling_rate()
+    assert result.offset() == signal.offset()
+    assert result.labels()[0:len(signal)] == signal.labels()[0:len(result)]
+    sections = filter_.second_order_sections(signal.sampling_rate())
+    if len(filter_) == 1:
+        assert len(result) == len(signal)
+        reference = scipy_signal.sosfilt(sections[0], signal.channels(), axis=1)
+    elif len(signal) == 1:
+        assert len(result) == len(filter_)
+        reference = [scipy_signal.sosfilt(s, signal.channels()[0]) for s in sections]
+    else:
+        assert len(result) == len(signal)
+        reference = numpy.array(signal.channels())
+        for i, s in enumerate(sections[0:len(signal)]):
+            reference[i] = scipy_signal.sosfilt(s, signal.channels()[i])
+    assert numpy.array_equal(result.channels(), reference)
+    # filter the signal in blocks
+    processor.reset()
+    blocks = []
+    position = 0
+    for length in lengths + [signal.length()]:
+        if position < signal.length():
+            blocks.append(processor.process(signal[:, position:position + length]))
+            position += length
+    assert numpy.allclose(numpy.concatenate([b.channels() for b in blocks], axis=1), reference, rtol=1e-10, atol=1e-10)
+
+
+def test_errors_and_precision():
+    """Tests the errors for invalid inputs and if the processor keeps the precision of the signal."""
+    pytest.importorskip("scipy.signal")
+    processor = sumpf.IIRProcessor(sumpf.ButterworthFilter(order=3), sampling_rate=8000.0)
+    assert processor.sampling_rate() == 8000.0
+    signal = sumpf.Signal(channels=numpy.random.normal(size=(2, 100)), sampling_rate=8000.0)
+    assert processor.process(signal.to_precision("single")).channels().dtype == numpy.float32
+    with pytest.raises(ValueError):
+        processor.process(signal[0])
+    with pytest.raises(ValueError):
+        processor.process(sumpf.Signal(channels=numpy.ones((2, 10)), sampling_rate=48000.0))
+    processor.reset()
+    assert processor.process(signal[0]).channels().dtype == numpy.float64
+    with pytest.raises(ValueError):
+        sumpf.IIRProcessor(sumpf.DelayFilter(delay=1e-3))
+
+
+def test_empty_signal():
+    """Tests if filtering an empty chunk returns an empty signal and keeps the states of the filters."""
+    pytest.importorskip("scipy.signal")
+    signal = sumpf.Signal(channels=numpy.random.normal(size=(2, 100)), sampling_rate=8000.0)
+    empty = sumpf.Signal(channels=numpy.empty((2, 0)), sampling_rate=8000.0)
+    for filter_ in (sumpf.ButterworthFilter(order=3),
+                    sumpf.Filter(transfer_functions=sumpf.ButterworthFilter(order=3).transfer_functions() * 2)):
+        processor = sumpf.IIRProcessor(filter_, sampling_rate=8000.0)
+        result = processor.process(empty)
+        assert result.length() == 0
+        assert len(result) == 2
+        reference = processor.process(signal[:, 0:50]).channels()
+        assert processor.process(empty).length() == 0
+        reference = numpy.concatenate((reference, processor.process(signal[:, 50:]).channels()), axis=1)
+        processor.reset()
+        assert numpy.array_equal(reference, processor.process(signal).channels())
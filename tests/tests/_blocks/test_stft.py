@@ -0,0 +1,92 @@
+# This file is a part of the "SuMPF" package
+# Copyright (C) 2018-2019 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests for the StreamingSTFT and StreamingISTFT classes"""
+
+import hypothesis
+import numpy
+import sumpf
+import sumpf._internal as sumpf_internal
+import tests
+
+
+def _chunks(data, lengths):
+    """Splits the given signal or spectrogram in chunks with the given lengths."""
+    position = 0
+    for length in lengths:
+        if position >= data.length():
+            break
+        yield data[(slice(None),) * (len(data.shape()) - 1) + (slice(position, position + length),)]
+        position += length
+    if position < data.length():
+        yield data[(slice(None),) * (len(data.shape()) - 1) + (slice(position, None),)]
+
+
+@hypothesis.given(signal=tests.strategies.signals(min_length=40, max_length=200, min_value=-1e3, max_value=1e3),
+                  window_length=hypothesis.strategies.integers(min_value=2, max_value=40),
+                  overlap=hypothesis.strategies.floats(min_value=0.0, max_value=0.9),
+                  pad=hypothesis.strategies.booleans(),
+                  lengths=hypothesis.strategies.lists(hypothesis.strategies.integers(min_value=1, max_value=50), max_size=10))
+@hypothesis.settings(deadline=None)
+def test_streaming_stft(signal, window_length, overlap, pad, lengths):
+    """Compares the streaming transforms with the short time Fourier transform
+    of the Signal class and its inverse in the Spectrogram class."""
+    hypothesis.assume(sumpf_internal.index(overlap, window_length) < window_length)
+    reference = signal.short_time_fourier_transform(window=window_length, overlap=overlap, pad=pad)
+    stft = sumpf.StreamingSTFT(window=window_length, overlap=overlap, pad=pad)
+    frames = [stft.process(chunk) for chunk in _chunks(signal, lengths)]
+    frames.append(stft.flush())
+    assert numpy.array_equal(numpy.concatenate([f.channels() for f in frames], axis=2), reference.channels())
+    for f in frames:
+        assert f.resolution() == reference.resolution()
+        assert f.sampling_rate() == reference.sampling_rate()
+        assert f.labels() == reference.labels()
+    assert [f.offset() for f in frames] == list(numpy.cumsum([reference.offset()] + [f.length() for f in frames[0:-1]]))
+    # inverse transform
+    hypothesis.assume(reference.length() > 0)
+    signal = reference.inverse_short_time_fourier_transform(window=window_length, overlap=overlap, pad=pad)
+    istft = sumpf.StreamingISTFT(window=window_length, overlap=overlap, pad=pad)
+    blocks = [istft.process(chunk) for chunk in _chunks(reference, lengths)]
+    blocks.append(istft.flush())
+    assert numpy.array_equal(numpy.concatenate([b.channels() for b in blocks], axis=1), signal.channels())
+    for b in blocks:
+        assert b.sampling_rate() == signal.sampling_rate()
+        assert b.labels() == signal.labels()
+    assert [b.offset() for b in blocks] == list(numpy.cumsum([signal.offset()] + [b.length() for b in blocks[0:-1]]))
+
+
+def test_reuse_and_precision():
+    """Tests if the streaming transforms can be reused after flushing them and
+    if they keep the precision of the data."""
+    stft = sumpf.StreamingSTFT(window=16)
+    istft = sumpf.StreamingISTFT(window=16)
+    for precision, dtype in (("double", numpy.complex128), ("single", numpy.complex64)):
+        signal = sumpf.Signal(channels=numpy.random.normal(size=(2, 100)), offset=5).to_precision(precision)
+        reference = signal.short_time_fourier_transform(window=16)
+        first = stft.process(signal[:, 0:50])
+        second = stft.process(signal[:, 50:])
+        last = stft.flush()
+        for frames in (first, second, last):
+            assert frames.channels().dtype == dtype
+        assert numpy.array_equal(numpy.concatenate([first.channels(), second.channels(), last.channels()], axis=2),
+                                 reference.channels())
+        inverse = istft.process(reference)
+        rest = istft.flush()
+        for samples in (inverse, rest):
+            assert samples.channels().dtype == signal.channels().dtype
+        assert numpy.array_equal(numpy.concatenate([inverse.channels(), rest.channels()], axis=1),
+                                 reference.inverse_short_time_fourier_transform(window=16).channels())
+
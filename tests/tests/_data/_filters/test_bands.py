@@ -199,3 +199,19 @@ def test_db_conversion(bands, reference, factor):
         if factor != 0.0:
             assert bands.to_db(reference, factor) == db
             assert db.from_db(reference, factor) == lin
+
+
+@pytest.mark.filterwarnings("ignore:invalid value", "ignore:divide by zero", "ignore:overflow")
+@hypothesis.given(xs=hypothesis.extra.numpy.arrays(dtype=numpy.float64, shape=4, elements=hypothesis.strategies.floats(min_value=0.0, max_value=1e4), unique=True),             # pylint: disable=line-too-long
+                  ys=hypothesis.extra.numpy.arrays(dtype=numpy.float64, shape=(3, 4), elements=hypothesis.strategies.floats(min_value=-1e10, max_value=1e10)),                 # pylint: disable=line-too-long
+                  interpolation=hypothesis.strategies.sampled_from(sumpf.Bands.interpolations),
+                  extrapolation=hypothesis.strategies.sampled_from(sumpf.Bands.interpolations),
+                  resolution=hypothesis.strategies.floats(min_value=1.0, max_value=1e3))
+def test_multi_channel_evaluation(xs, ys, interpolation, extrapolation, resolution):
+    """Tests if evaluating the channels of a bands filter with equal supporting
+    points in one pass gives the same results as evaluating them individually."""
+    bands = sumpf.Bands(bands=[dict(zip(xs, y)) for y in ys], interpolations=interpolation, extrapolations=extrapolation)
+    spectrum = bands.spectrum(resolution=resolution, length=100)
+    for tf, channel in zip(bands.transfer_functions(), spectrum.channels()):
+        reference = sumpf.Filter(transfer_functions=(tf, sumpf.Filter.Constant(0.0))).spectrum(resolution=resolution, length=100)
+        assert numpy.array_equal(channel, reference.channels()[0], equal_nan=True)
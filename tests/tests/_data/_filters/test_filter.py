@@ -17,6 +17,7 @@
 """Tests for the Filter class"""
 
 import logging
+import math
 import hypothesis
 import hypothesis.strategies as st
 import numpy
@@ -339,6 +340,21 @@ def test_multiply_with_signal_or_spectrum(filter_, signal):
         assert filtered_spectrum3 == filtered_spectrum2
 
 
+def test_multiply_keeps_precision():
+    """Tests if multiplying a filter with a signal or a spectrum keeps the precision of the data set."""
+    filter_ = sumpf.ButterworthFilter(cutoff_frequency=500.0, order=4)
+    signal = sumpf.SineWave(length=1000).to_precision("single")
+    spectrum = signal.fourier_transform()
+    assert spectrum.channels().dtype == numpy.complex64
+    for data in (signal, spectrum):
+        assert (filter_ * data).channels().dtype == data.channels().dtype
+        assert (data * filter_).channels().dtype == data.channels().dtype
+    double = sumpf.SineWave(length=1000)
+    with sumpf.config.override(precision="single"):
+        assert (filter_ * double).channels().dtype == numpy.float64
+        assert (filter_ * double.fourier_transform()).channels().dtype == numpy.complex128
+
+
 @pytest.mark.filterwarnings("ignore:overflow", "ignore:invalid value", "ignore:divide by zero")
 @hypothesis.given(filter1=tests.strategies.filters(),
                   filter2=tests.strategies.filters(),
@@ -465,3 +481,188 @@ def test_constructor_parameters(parameters, frequency):
 #######################
 
 # the "spectrum"-method is already tested in test_call
+
+
+@pytest.mark.filterwarnings("ignore:overflow", "ignore:invalid value", "ignore:divide by zero")
+@hypothesis.given(filter_=tests.strategies.filters(),
+                  signal=tests.strategies.signals(min_length=2))
+def test_apply_spectrum(filter_, signal):
+    """Tests if applying a filter with the spectrum method is equivalent to multiplying it with the signal."""
+    try:
+        reference = filter_ * signal
+    except ValueError:  # the data sets have a different channel count, while none has only one channel
+        with pytest.raises(ValueError):
+            filter_.apply(signal)
+    else:
+        for method in (sumpf.Filter.application_methods.SPECTRUM, "spectrum"):
+            result = filter_.apply(signal, method=method)
+            assert numpy.array_equal(numpy.nan_to_num(result.channels()), numpy.nan_to_num(reference.channels()))
+
+
+@pytest.mark.parametrize("filter_", [sumpf.ButterworthFilter(cutoff_frequency=1000.0, order=5),
+                                     sumpf.ButterworthFilter(cutoff_frequency=3000.0, order=4, highpass=True),
+                                     sumpf.Chebyshev1Filter(cutoff_frequency=200.0, ripple=1.0, order=4),
+                                     sumpf.Chebyshev1Filter(cutoff_frequency=5000.0, ripple=3.0, order=3, highpass=True),
+                                     sumpf.ButterworthFilter(order=2) * sumpf.Chebyshev1Filter(order=2) - 0.5,
+                                     sumpf.Filter(transfer_functions=(sumpf.Filter.Polynomial((1.0, 3.0)) /
+                                                                      sumpf.Filter.Polynomial((2.0, 1.0, 4.0)),))])
+def test_second_order_sections(filter_):
+    """Compares the frequency responses of the IIR filters, that are created with
+    the bilinear transform, with the frequency warped transfer functions."""
+    scipy_signal = pytest.importorskip("scipy.signal")
+    sampling_rate = 44100.0
+    sections = filter_.second_order_sections(sampling_rate)
+    assert len(sections) == len(filter_)
+    for s, f in zip(sections, filter_.transfer_functions()):
+        assert s.shape[1] == 6
+        frequencies, response = scipy_signal.sosfreqz(s, worN=100, fs=sampling_rate)
+        warped = sampling_rate / math.pi * numpy.tan(math.pi * frequencies / sampling_rate)
+        reference = sumpf.Filter(transfer_functions=(f,))(warped)[0]
+        assert response == pytest.approx(reference, abs=1e-6)
+    # apply the filter
+    signal = sumpf.Signal(channels=numpy.random.normal(size=(2, 300)), sampling_rate=sampling_rate, offset=7, labels=("a", "b"))
+    filtered = filter_.apply(signal, method="iir")
+    assert filtered.sampling_rate() == sampling_rate
+    assert filtered.offset() == signal.offset()
+    assert filtered.labels() == signal.labels()
+    assert numpy.array_equal(filtered.channels(), scipy_signal.sosfilt(sections[0], signal.channels(), axis=1))
+
+
+def test_second_order_sections_errors():
+    """Tests if filters, which cannot be converted to IIR filters, raise errors."""
+    pytest.importorskip("scipy.signal")
+    signal = sumpf.Signal(channels=numpy.ones((1, 10)))
+    for filter_ in (sumpf.DelayFilter(delay=1e-3),                                             # an exponential function
+                    abs(sumpf.ButterworthFilter()),                                            # not a rational function
+                    sumpf.Filter(transfer_functions=(sumpf.Filter.Polynomial((1.0, 0.0)),)),   # more zeros than poles
+                    sumpf.Filter(transfer_functions=(sumpf.Filter.Constant(1.0j),))):   # a complex gain
+        with pytest.raises(ValueError):
+            filter_.second_order_sections(sampling_rate=48000.0)
+        with pytest.raises(ValueError):
+            filter_.apply(signal, method=sumpf.Filter.application_methods.IIR)
+    with pytest.raises(ValueError):
+        sumpf.ButterworthFilter().apply(signal, method="no method")
+
+
+@hypothesis.given(signal=tests.strategies.signals(min_length=1, max_length=300, min_value=-1e3, max_value=1e3),
+                  number_of_filter_channels=st.integers(min_value=1, max_value=3),
+                  block_length=st.one_of(st.none(), st.integers(min_value=1, max_value=100)),
+                  kernel_length=st.integers(min_value=1, max_value=64).map(lambda x: 2 * x))
+@hypothesis.settings(deadline=None)
+def test_apply_fir(signal, number_of_filter_channels, block_length, kernel_length):
+    """Compares the block-wise application of a filter as an FIR filter with the convolution with the FIR kernel."""
+    filter_ = sumpf.Filter(transfer_functions=[sumpf.ButterworthFilter(cutoff_frequency=signal.sampling_rate() / (i + 4),
+                                                                       order=i + 1).transfer_functions()[0]
+                                               for i in range(number_of_filter_channels)])
+    kernel = filter_.fir_kernel(sampling_rate=signal.sampling_rate(), length=kernel_length)
+    assert kernel.length() == kernel_length
+    assert kernel.offset() == -(kernel_length // 2)
+    assert len(kernel) == len(filter_)
+    result = filter_.apply(signal, method="fir", block_length=block_length, kernel_length=kernel_length)
+    assert result.length() == signal.length()
+    assert result.sampling_rate() == signal.sampling_rate()
+    assert result.offset() == signal.offset()
+    convolution = sumpf.Signal(channels=signal.channels()).convolve(kernel, mode=sumpf.Signal.convolution_modes.FULL)
+    reference = convolution.channels()[:, kernel_length // 2:kernel_length // 2 + signal.length()]
+    if len(filter_) == 1 or len(signal) == 1:
+        assert len(result) == max(len(signal), len(filter_))
+        assert result.channels() == pytest.approx(reference, abs=1e-8)
+    else:
+        assert len(result) == len(signal)
+        filtered = min(len(signal), len(filter_))
+        assert result.channels()[0:filtered] == pytest.approx(reference[0:filtered], abs=1e-8)
+        assert numpy.array_equal(result.channels()[filtered:], signal.channels()[filtered:])
+    # a block length selects the FIR method
+    if block_length is not None:
+        assert numpy.array_equal(filter_.apply(signal, block_length=block_length, kernel_length=kernel_length).channels(), result.channels())
+
+
+def test_fir_kernel():
+    """Tests the FIR kernel of a delay filter and the errors for invalid kernel lengths."""
+    kernel = sumpf.DelayFilter(delay=0.01).fir_kernel(sampling_rate=1000.0, length=64)
+    assert numpy.argmax(kernel.channels()[0]) - 32 == 10
+    assert kernel.channels()[0][42] == pytest.approx(numpy.hanning(65)[42])
+    assert kernel.labels() == sumpf.DelayFilter(delay=0.01).labels()
+    assert sumpf.ButterworthFilter().fir_kernel(48000.0, precision="single").channels().dtype == numpy.float32
+    for length in (0, 7):
+        with pytest.raises(ValueError):
+            sumpf.ButterworthFilter().fir_kernel(sampling_rate=48000.0, length=length)
+
+
+def test_simplify():
+    """Tests if simplifying a filter collapses its rational transfer functions without changing their values."""
+    filter_ = sumpf.Filter(transfer_functions=(sumpf.ButterworthFilter(cutoff_frequency=500.0, order=12, highpass=True).transfer_functions()[0],
+                                               sumpf.Chebyshev1Filter(cutoff_frequency=50.0, order=4).transfer_functions()[0] * sumpf.Filter.Constant(2.0) - sumpf.Filter.Constant(1.0),
+                                               sumpf.DelayFilter(delay=1e-3).transfer_functions()[0]),
+                           labels=("highpass", "lowpass", "delay"))
+    simplified = filter_.simplify()
+    assert simplified.labels() == filter_.labels()
+    for tf in simplified.transfer_functions()[0:2]:
+        assert isinstance(tf, sumpf_internal.filter_terms.Quotient)
+        assert isinstance(tf.denominator, sumpf_internal.filter_terms.Polynomial)
+    assert simplified.transfer_functions()[2] == filter_.transfer_functions()[2]
+    reference = filter_.spectrum(resolution=10.0, length=2000)
+    spectrum = simplified.spectrum(resolution=10.0, length=2000)
+    assert spectrum.channels()[:, 1:] == pytest.approx(reference.channels()[:, 1:], rel=1e-9)
+
+
+def test_spectrum_cache():
+    """Tests the caching of the sampled transfer functions."""
+    cache = sumpf.Filter.spectrum_cache
+    cache.clear()
+    cache.reset_statistics()
+    filter_ = sumpf.ButterworthFilter(cutoff_frequency=500.0, order=4)
+    spectrum1 = filter_.spectrum(resolution=10.0, length=100)
+    assert not spectrum1.channels().flags.writeable
+    key_size = sum(len(k) for k in sumpf._data._filters._base._cache.structural_key(filter_.transfer_functions()))  # pylint: disable=protected-access
+    assert cache.statistics() == {"hits": 0, "misses": 1, "entries": 1, "bytes": spectrum1.channels().nbytes + key_size}
+    # an equal filter, that has been created independently, shares the cached channels
+    spectrum2 = sumpf.Filter(transfer_functions=filter_.transfer_functions(), labels=("other",)).spectrum(resolution=10.0, length=100)
+    assert spectrum2.channels() is spectrum1.channels()
+    assert spectrum2.labels() == ("other",)
+    assert cache.statistics()["hits"] == 1
+    # other parameters or other filters are not served from the cache
+    filter_.spectrum(resolution=10.0, length=101)
+    filter_.spectrum(resolution=10.0, length=100, precision="single")
+    sumpf.ButterworthFilter(cutoff_frequency=501.0, order=4).spectrum(resolution=10.0, length=100)
+    assert cache.statistics()["misses"] == 4
+    assert cache.statistics()["entries"] == 4
+    # filters, whose parameters only differ in digits, which are hidden in the default representation of arrays
+    bands1 = sumpf.Bands({1.0: 1.0})
+    bands2 = sumpf.Bands({1.0: 1.0 + 1e-12})
+    assert bands1.spectrum(resolution=1.0, length=3).channels()[0, 2] != bands2.spectrum(resolution=1.0, length=3).channels()[0, 2]
+    cache.invalidate(bands1)
+    cache.invalidate(bands2)
+    # invalidation
+    cache.invalidate(filter_)
+    assert cache.statistics()["entries"] == 1
+    spectrum3 = filter_.spectrum(resolution=10.0, length=100)
+    assert spectrum3.channels() is not spectrum1.channels()
+    assert numpy.array_equal(spectrum3.channels(), spectrum1.channels())
+    # the size limit
+    with sumpf.config.override(filter_cache_size=2):
+        for length in range(10, 15):
+            filter_.spectrum(resolution=10.0, length=length)
+        assert cache.statistics()["entries"] == 2
+        assert filter_.spectrum(resolution=10.0, length=14).channels() is filter_.spectrum(resolution=10.0, length=14).channels()
+    with sumpf.config.override(filter_cache_size=0):
+        filter_.spectrum(resolution=10.0, length=100)
+        assert cache.statistics()["entries"] == 0
+    # the memory limit
+    cache.clear()
+    filter_.spectrum(resolution=10.0, length=100)
+    entry = cache.statistics()["bytes"]
+    with sumpf.config.override(filter_cache_bytes=2 * entry):
+        for length in (101, 102, 103):
+            filter_.spectrum(resolution=10.0, length=length)
+            assert cache.statistics()["bytes"] <= 2 * entry
+        assert cache.statistics()["entries"] == 1
+        large = filter_.spectrum(resolution=10.0, length=1000)
+        assert cache.statistics()["entries"] == 1
+        assert large.channels().flags.writeable    # channels, which are not cached, are not made read-only
+        assert filter_.spectrum(resolution=10.0, length=1000).channels() is not large.channels()
+    # the keys are hashes, whose size does not depend on the size of the filter
+    bands = sumpf.Bands({f: 1.0 for f in range(1, 100001)})
+    assert [len(k) for k in sumpf._data._filters._base._cache.structural_key(bands.transfer_functions())] == [32]  # pylint: disable=protected-access
+    cache.clear()
+    assert cache.statistics()["entries"] == 0
@@ -18,8 +18,13 @@
 
 import json
 import hypothesis
+import numpy
+import pytest
+import sumpf
 import tests
 from sumpf import _internal as sumpf_internal
+from sumpf._data._filters._base import _compiler as compiler
+from sumpf._data._filters._base._s import S
 
 
 @hypothesis.given(tests.strategies.terms)
@@ -29,3 +34,60 @@ def test_as_dict(term):
     assert json.dumps(dictionary) is not None   # the dictionaries should be serializable to a JSON string
     restored = sumpf_internal.filter_readers.term_from_dict(dictionary)
     assert restored == term
+
+
+@pytest.mark.filterwarnings("ignore:overflow", "ignore:invalid value", "ignore:divide by zero", "ignore:'where' used without 'out'")
+@hypothesis.given(tests.strategies.terms)
+def test_compiled_evaluation(term):
+    """Tests if the compiled evaluation of a term gives the same result as calling the term."""
+    frequencies = numpy.linspace(0.0, 1000.0, 11)
+    reference = numpy.empty(len(frequencies), dtype=numpy.complex128)
+    term(S(frequencies), out=reference)
+    program = compiler.compile_term(term)
+    result = numpy.empty_like(reference)
+    assert program(S(frequencies), out=result) is result
+    assert numpy.array_equal(result, reference, equal_nan=True)
+    # with preallocated buffers
+    buffers = [numpy.empty_like(reference) for _ in range(program.buffers())]
+    result = numpy.empty_like(reference)
+    program(S(frequencies), out=result, buffers=buffers)
+    assert numpy.array_equal(result, reference, equal_nan=True)
+
+
+@pytest.mark.parametrize("term", [sumpf.Filter.Constant(2.5),
+                                  sumpf.Filter.Polynomial((1.0, 2.0, 3.0), transform=True),
+                                  ~sumpf.Filter.Polynomial((0.5, 1.0)) - sumpf.Filter.Constant(0.5),
+                                  sumpf.ButterworthFilter(cutoff_frequency=300.0, order=9).transfer_functions()[0],
+                                  sumpf.Chebyshev1Filter(cutoff_frequency=2000.0, order=5, highpass=True).transfer_functions()[0],
+                                  sumpf.Filter.Sum((sumpf.Filter.Polynomial((1e-3, 1.0)) / sumpf.Filter.Polynomial((2e-4, 1.0)),
+                                                    -sumpf.Filter.Polynomial((1e-4, 3.0), transform=True),
+                                                    sumpf.Filter.Constant(1.0j)), transform=True),
+                                  sumpf.Filter.Quotient(sumpf.Filter.Polynomial((1e-3, 1.0), transform=True),
+                                                        sumpf.Filter.Product((sumpf.Filter.Polynomial((1e-4, 1.0)),
+                                                                              sumpf.Filter.Polynomial((2e-5, 1e-2, 1.0), transform=True),
+                                                                              sumpf.Filter.Polynomial((1.0, 3.0)))))])
+def test_to_rational(term):
+    """Tests if collapsing a rational term to a quotient of polynomials does not change its values."""
+    rational = term.to_rational()
+    assert isinstance(rational, (sumpf_internal.filter_terms.Constant,
+                                 sumpf_internal.filter_terms.Polynomial,
+                                 sumpf_internal.filter_terms.Quotient))
+    if isinstance(rational, sumpf_internal.filter_terms.Quotient):
+        assert isinstance(rational.numerator, (sumpf_internal.filter_terms.Constant, sumpf_internal.filter_terms.Polynomial))
+        assert isinstance(rational.denominator, sumpf_internal.filter_terms.Polynomial)
+        assert not rational.numerator.transform and not rational.denominator.transform
+        assert rational.denominator.coefficients[0] == 1.0
+    frequencies = numpy.linspace(10.0, 10000.0, 50)
+    assert rational(S(frequencies)) == pytest.approx(term(S(frequencies)), rel=1e-9)
+
+
+def test_to_rational_errors():
+    """Tests the errors for terms, that cannot be collapsed to a quotient of polynomials."""
+    for term in (sumpf.Filter.Exp(-1e-3),
+                 abs(sumpf.Filter.Polynomial((1.0, 2.0))),
+                 sumpf.Filter.Polynomial((1.0, 2.0)) * sumpf.DelayFilter(delay=1e-3).transfer_functions()[0]):
+        with pytest.raises(ValueError):
+            term.to_rational()
+    with pytest.raises(ZeroDivisionError):
+        sumpf.Filter.Quotient(sumpf.Filter.Constant(1.0), sumpf.Filter.Constant(0.0)).to_rational()
+    assert sumpf.Filter.Difference(sumpf.Filter.Polynomial((1.0, 2.0)), sumpf.Filter.Polynomial((1.0, 1.0))).to_rational() == sumpf.Filter.Constant(1.0)
@@ -0,0 +1,71 @@
+# This file is a part of the "SuMPF" package
+# Copyright (C) 2018-2019 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests for the ConvolutionKernel class"""
+
+import hypothesis
+import numpy
+import pytest
+import sumpf
+import sumpf._internal as sumpf_internal
+import tests
+
+
+@hypothesis.given(signal=tests.strategies.signals(min_value=-1.0, max_value=1.0),
+                  kernel=tests.strategies.signals(min_value=-1.0, max_value=1.0),
+                  mode=hypothesis.strategies.sampled_from(sumpf.Signal.convolution_modes))
+def test_convolution_and_correlation(signal, kernel, mode):
+    """Tests if the convolution and the correlation with a kernel give the same results as with the kernel's signal."""
+    convolution_kernel = sumpf.ConvolutionKernel(kernel)
+    assert convolution_kernel.signal() is kernel
+    for method in (sumpf.Signal.convolve, sumpf.Signal.correlate):
+        result = method(signal, convolution_kernel, mode=mode)
+        reference = method(signal, kernel, mode=mode)
+        assert result.shape() == reference.shape()
+        assert result.offset() == reference.offset()
+        assert result.sampling_rate() == reference.sampling_rate()
+        assert result.labels() == reference.labels()
+        assert result.channels() == pytest.approx(reference.channels())
+
+
+def test_cache():
+    """Tests if the kernel's spectrums are cached for each length of the transform."""
+    kernel = sumpf.ConvolutionKernel(sumpf.Signal(channels=numpy.ones(shape=(1, 100))))
+    assert kernel.cached_lengths() == ()
+    signal1 = sumpf.Signal(channels=numpy.ones(shape=(2, 500)))
+    signal2 = sumpf.Signal(channels=numpy.ones(shape=(2, 1000)))
+    length1 = sumpf_internal.fft_length(599)
+    length2 = sumpf_internal.fft_length(1099)
+    signal1.convolve(kernel)
+    assert kernel.cached_lengths() == (length1,)
+    spectrum = kernel.spectrum(length1)
+    signal1.convolve(kernel)
+    assert kernel.spectrum(length1) is spectrum
+    signal2.correlate(kernel)
+    assert kernel.cached_lengths() == (length1, length2)
+    kernel.clear_cache()
+    assert kernel.cached_lengths() == ()
+    # the size limit
+    kernel = sumpf.ConvolutionKernel(sumpf.Signal(channels=numpy.ones(shape=(1, 100))), cache_size=2)
+    spectrum = kernel.spectrum(256)
+    kernel.spectrum(512)
+    assert kernel.spectrum(256) is spectrum     # move the spectrum for 256 samples to the end of the cache
+    kernel.spectrum(1024)
+    assert kernel.cached_lengths() == (256, 1024)
+    assert kernel.spectrum(256) is spectrum
+    kernel = sumpf.ConvolutionKernel(sumpf.Signal(channels=numpy.ones(shape=(1, 100))), cache_size=0)
+    assert numpy.array_equal(kernel.spectrum(256), spectrum)
+    assert kernel.cached_lengths() == ()
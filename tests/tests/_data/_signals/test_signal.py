@@ -627,6 +627,51 @@ def test_pad(signal, length, value):
         assert padded == signal
 
 
+@hypothesis.given(tests.strategies.signals(min_value=-1e3, max_value=1e3))
+def test_to_precision(signal):
+    """Tests the conversion of a signal's precision."""
+    assert signal.precision() == "double"
+    assert signal.to_precision("double") is signal
+    single = signal.to_precision("single")
+    assert single.precision() == "single"
+    assert single.channels().dtype == numpy.float32
+    assert single.to_precision("single") is single
+    assert single.sampling_rate() == signal.sampling_rate()
+    assert single.offset() == signal.offset()
+    assert single.labels() == signal.labels()
+    assert numpy.array_equal(single.channels(), signal.channels().astype(numpy.float32))
+    with sumpf.config.override(precision="single"):
+        assert signal.to_precision(None) == single
+    with pytest.raises(ValueError):
+        signal.to_precision("half")
+
+
+def test_single_precision_computations():
+    """Tests if the computations with single precision signals keep their precision,
+    unless they are combined with double precision data."""
+    signal = sumpf.Signal(channels=numpy.array([[1.0, 2.0, 3.0, 4.0], [4.0, 3.0, 2.0, 1.0]], dtype=numpy.float32),
+                          offset=3)
+    double = signal.to_precision("double")
+    single_results = [abs(signal), -signal, ~signal,
+                      signal + signal, signal * 2.0, 2.0 - signal, signal / [1.0, 2.0, 3.0, 4.0],
+                      signal.pad(7), signal.shift(2, mode=sumpf.Signal.shift_modes.CROP),
+                      signal.shift(-2, mode=sumpf.Signal.shift_modes.PAD),
+                      signal.fourier_transform().inverse_fourier_transform()]
+    single_results.extend(signal.convolve(signal[0], mode=m) for m in sumpf.Signal.convolution_modes)
+    single_results.extend(signal.correlate(signal, mode=m) for m in sumpf.Signal.convolution_modes)
+    for result in single_results:
+        assert result.channels().dtype == numpy.float32
+    assert signal.fourier_transform().channels().dtype == numpy.complex64
+    assert signal.short_time_fourier_transform(window=2, overlap=0).channels().dtype == numpy.complex64
+    for result in (signal + double,
+                   double * signal,
+                   signal + numpy.ones(4),
+                   signal.convolve(double, mode=sumpf.Signal.convolution_modes.SPECTRUM_PADDED),
+                   signal.correlate(double, mode=sumpf.Signal.convolution_modes.FULL)):
+        assert result.channels().dtype == numpy.float64
+    assert (signal + signal).channels() == pytest.approx((double + double).channels())
+
+
 @hypothesis.given(signal=tests.strategies.signals(),
                   shift=hypothesis.strategies.integers(min_value=-100, max_value=100))
 def test_shift(signal, shift):
@@ -679,6 +724,58 @@ def test_shift(signal, shift):
     assert shifted.offset() == signal.offset()
     assert shifted.labels() == signal.labels()
 
+
+@hypothesis.given(signal=tests.strategies.signals(),
+                  block_length=hypothesis.strategies.integers(min_value=1, max_value=40),
+                  overlap=hypothesis.strategies.integers(min_value=0, max_value=39),
+                  pad=hypothesis.strategies.booleans())
+def test_blocks(signal, block_length, overlap, pad):
+    """Tests the generator for splitting a signal into blocks."""
+    hypothesis.assume(overlap < block_length)
+    step = block_length - overlap
+    blocks = list(signal.blocks(block_length, overlap, pad))
+    for i, block in enumerate(blocks):
+        start = i * step
+        assert block.length() == block_length
+        assert block.offset() == signal.offset() + start
+        assert block.sampling_rate() == signal.sampling_rate()
+        assert block.labels() == signal.labels()
+        if start + block_length <= signal.length():
+            assert block == signal[:, start:start + block_length]
+            assert numpy.shares_memory(block.channels(), signal.channels())
+        else:
+            assert pad
+            remaining = signal.length() - start
+            assert (block.channels()[:, 0:remaining] == signal.channels()[:, start:]).all()
+            assert (block.channels()[:, remaining:] == 0.0).all()
+    # check that all samples are covered, if the signal is padded, and that there are no superfluous blocks
+    covered = len(blocks) * step + overlap if blocks else 0
+    if pad:
+        assert covered >= signal.length()
+        assert len(blocks) <= 1 or covered - step < signal.length()
+    elif signal.length() < block_length:
+        assert not blocks
+    else:
+        assert len(blocks) == (signal.length() - block_length) // step + 1
+    # the blocks can be reassembled to the original signal
+    if not overlap:
+        assembler = sumpf.SignalAssembler(length=signal.length(),
+                                          number_of_channels=len(signal),
+                                          sampling_rate=signal.sampling_rate(),
+                                          offset=signal.offset(),
+                                          labels=signal.labels())
+        for block in blocks:
+            assembler.add(block)
+        if pad:
+            assert assembler.output() == signal
+        else:
+            assert assembler.output()[:, 0:covered] == signal[:, 0:covered]
+    # invalid parameters
+    with pytest.raises(ValueError):
+        next(signal.blocks(0))
+    with pytest.raises(ValueError):
+        next(signal.blocks(block_length, block_length))
+
 #############################
 # signal processing methods #
 #############################
@@ -16,10 +16,12 @@
 
 """Tests for the convolution and correlation methods of the Signal class"""
 
+import math
 import numpy
 import hypothesis
 import pytest
 import sumpf
+import sumpf._internal as sumpf_internal
 import tests
 
 
@@ -120,8 +122,9 @@ def test_convolve_with_multiple_channels(signal1, signal2, mode):   # pylint: di
         assert array_convolution.offset() == signal1.offset()
     elif mode == sumpf.Signal.convolution_modes.SPECTRUM_PADDED:
         length = signal1.length() + signal2.length() - 1
-        padded1 = signal1[0:number_of_channels].pad(length + 2 if length % 2 == 0 else length + 1)
-        padded2 = signal2[0:number_of_channels].pad(length + 2 if length % 2 == 0 else length + 1)
+        padded_length = sumpf_internal.fft_length(length)
+        padded1 = signal1[0:number_of_channels].pad(padded_length)
+        padded2 = signal2[0:number_of_channels].pad(padded_length)
         spectrum1 = padded1.shift(None).fourier_transform()
         spectrum2 = padded2.shift(None).fourier_transform()
         reference = (spectrum1 * spectrum2).inverse_fourier_transform()[:, 0:length]
@@ -129,6 +132,19 @@ def test_convolve_with_multiple_channels(signal1, signal2, mode):   # pylint: di
         assert (array_convolution.channels() == reference.channels()).all()
         assert signal_convolution.offset() == signal1.offset() + signal2.offset()
         assert array_convolution.offset() == signal1.offset()
+    elif mode == sumpf.Signal.convolution_modes.PARTITIONED:
+        length = signal1.length() + signal2.length() - 1
+        assert signal_convolution.shape() == (number_of_channels, length)
+        assert array_convolution.shape() == (number_of_channels, length)
+        assert signal_convolution.offset() == signal1.offset() + signal2.offset()
+        assert array_convolution.offset() == signal1.offset()
+    elif mode in (sumpf.Signal.convolution_modes.AUTO_FULL, sumpf.Signal.convolution_modes.AUTO_SAME, sumpf.Signal.convolution_modes.AUTO_VALID):
+        direct_mode = getattr(sumpf.Signal.convolution_modes, mode.name[5:])
+        reference = signal1.convolve(signal2, mode=direct_mode)
+        assert signal_convolution.shape() == reference.shape()
+        assert array_convolution.shape() == reference.shape()
+        assert signal_convolution.offset() == reference.offset()
+        assert array_convolution.offset() == reference.offset() - signal2.offset()
     else:
         raise RuntimeError(f"Unknown mode: {mode}")
 
@@ -165,6 +181,32 @@ def test_convolve_spectrum_padded(signal1, signal2):
     assert padded.channels() == pytest.approx(full.channels())
 
 
+@hypothesis.given(signal1=tests.strategies.signals(min_value=-1.0, max_value=1.0),
+                  signal2=tests.strategies.signals(min_value=-1.0, max_value=1.0),
+                  block_length=hypothesis.strategies.one_of(hypothesis.strategies.none(), hypothesis.strategies.integers(min_value=1, max_value=32)))
+def test_convolve_partitioned(signal1, signal2, block_length):
+    """Compares the partitioned convolution with the frequency domain multiplication of padded signals."""
+    partitioned = signal1.convolve(signal2, mode=sumpf.Signal.convolution_modes.PARTITIONED, block_length=block_length)
+    padded = signal1.convolve(signal2, mode=sumpf.Signal.convolution_modes.SPECTRUM_PADDED)
+    assert partitioned.offset() == padded.offset()
+    assert partitioned.channels() == pytest.approx(padded.channels())
+
+
+@hypothesis.given(signal1=tests.strategies.signals(min_value=-1.0, max_value=1.0),
+                  signal2=tests.strategies.signals(min_value=-1.0, max_value=1.0),
+                  direct_mode=hypothesis.strategies.sampled_from((sumpf.Signal.convolution_modes.FULL, sumpf.Signal.convolution_modes.SAME, sumpf.Signal.convolution_modes.VALID)),
+                  costs=hypothesis.strategies.sampled_from(({}, {"direct": math.inf}, {"transform": math.inf})))
+def test_convolve_automatic(signal1, signal2, direct_mode, costs):
+    """Compares the automatic convolution modes with the respective direct modes, while forcing different computation methods."""
+    mode = getattr(sumpf.Signal.convolution_modes, f"AUTO_{direct_mode.name}")
+    direct = signal1.convolve(signal2, mode=direct_mode)
+    with sumpf.config.override(convolution_costs={**sumpf.config.convolution_costs, **costs}):
+        automatic = signal1.convolve(signal2, mode=mode)
+    assert automatic.shape() == direct.shape()
+    assert automatic.offset() == direct.offset()
+    assert automatic.channels() == pytest.approx(direct.channels())
+
+
 @hypothesis.given(signal=tests.strategies.signals(),
                   number=hypothesis.strategies.floats(min_value=-1e100, max_value=1e100),
                   mode=hypothesis.strategies.sampled_from(sumpf.Signal.convolution_modes))
@@ -276,12 +318,8 @@ def test_correlate_with_multiple_channels(signal1, signal2, mode):  # pylint: di
         assert array_correlation.offset() == -signal1.offset() - signal1.length() + 1
     elif mode == sumpf.Signal.convolution_modes.SPECTRUM_PADDED:
         length = signal1.length() + signal2.length() - 1
-        if length % 2 == 0:
-            padded_length = length + 2
-            padded1 = signal1[0:number_of_channels].shift(2, sumpf.Signal.shift_modes.PAD).pad(padded_length)
-        else:
-            padded_length = length + 1
-            padded1 = signal1[0:number_of_channels].shift(1, sumpf.Signal.shift_modes.PAD).pad(padded_length)
+        padded_length = sumpf_internal.fft_length(length)
+        padded1 = signal1[0:number_of_channels].shift(padded_length - length, sumpf.Signal.shift_modes.PAD).pad(padded_length)
         padded2 = signal2[0:number_of_channels].shift(padded_length - signal2.length(), sumpf.Signal.shift_modes.PAD)
         spectrum1 = padded1.shift(None).fourier_transform().conjugate()
         spectrum2 = padded2.shift(None).fourier_transform()
@@ -290,6 +328,19 @@ def test_correlate_with_multiple_channels(signal1, signal2, mode):  # pylint: di
         assert (array_correlation.channels() == reference.channels()).all()
         assert signal_correlation.offset() == signal2.offset() - signal1.offset() - signal1.length() + 1
         assert array_correlation.offset() == -signal1.offset() - signal1.length() + 1
+    elif mode == sumpf.Signal.convolution_modes.PARTITIONED:
+        length = signal1.length() + signal2.length() - 1
+        assert signal_correlation.shape() == (number_of_channels, length)
+        assert array_correlation.shape() == (number_of_channels, length)
+        assert signal_correlation.offset() == signal2.offset() - signal1.offset() - signal1.length() + 1
+        assert array_correlation.offset() == -signal1.offset() - signal1.length() + 1
+    elif mode in (sumpf.Signal.convolution_modes.AUTO_FULL, sumpf.Signal.convolution_modes.AUTO_SAME, sumpf.Signal.convolution_modes.AUTO_VALID):
+        direct_mode = getattr(sumpf.Signal.convolution_modes, mode.name[5:])
+        reference = signal1.correlate(signal2, mode=direct_mode)
+        assert signal_correlation.shape() == reference.shape()
+        assert array_correlation.shape() == reference.shape()
+        assert signal_correlation.offset() == reference.offset()
+        assert array_correlation.offset() == reference.offset() - signal2.offset()
     else:
         raise RuntimeError(f"Unknown mode: {mode}")
 
@@ -327,6 +378,32 @@ def test_correlate_spectrum_padded(signal1, signal2):
     assert padded.channels() == pytest.approx(full.channels())
 
 
+@hypothesis.given(signal1=tests.strategies.signals(min_value=-1.0, max_value=1.0),
+                  signal2=tests.strategies.signals(min_value=-1.0, max_value=1.0),
+                  block_length=hypothesis.strategies.one_of(hypothesis.strategies.none(), hypothesis.strategies.integers(min_value=1, max_value=32)))
+def test_correlate_partitioned(signal1, signal2, block_length):
+    """Compares the partitioned correlation with the frequency domain multiplication of padded signals."""
+    partitioned = signal1.correlate(signal2, mode=sumpf.Signal.convolution_modes.PARTITIONED, block_length=block_length)
+    padded = signal1.correlate(signal2, mode=sumpf.Signal.convolution_modes.SPECTRUM_PADDED)
+    assert partitioned.offset() == padded.offset()
+    assert partitioned.channels() == pytest.approx(padded.channels())
+
+
+@hypothesis.given(signal1=tests.strategies.signals(min_value=-1.0, max_value=1.0),
+                  signal2=tests.strategies.signals(min_value=-1.0, max_value=1.0),
+                  direct_mode=hypothesis.strategies.sampled_from((sumpf.Signal.convolution_modes.FULL, sumpf.Signal.convolution_modes.SAME, sumpf.Signal.convolution_modes.VALID)),
+                  costs=hypothesis.strategies.sampled_from(({}, {"direct": math.inf}, {"transform": math.inf})))
+def test_correlate_automatic(signal1, signal2, direct_mode, costs):
+    """Compares the automatic correlation modes with the respective direct modes, while forcing different computation methods."""
+    mode = getattr(sumpf.Signal.convolution_modes, f"AUTO_{direct_mode.name}")
+    direct = signal1.correlate(signal2, mode=direct_mode)
+    with sumpf.config.override(convolution_costs={**sumpf.config.convolution_costs, **costs}):
+        automatic = signal1.correlate(signal2, mode=mode)
+    assert automatic.shape() == direct.shape()
+    assert automatic.offset() == direct.offset()
+    assert automatic.channels() == pytest.approx(direct.channels())
+
+
 @hypothesis.given(signal1=tests.strategies.signals(min_value=-10.0, max_value=10.0),
                   signal2=tests.strategies.signals(min_value=-10.0, max_value=10.0),
                   mode=hypothesis.strategies.sampled_from(sumpf.Signal.convolution_modes))
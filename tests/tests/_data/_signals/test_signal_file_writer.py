@@ -0,0 +1,115 @@
+# This file is a part of the "SuMPF" package
+# Copyright (C) 2018-2019 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Contains tests for the SignalFileWriter class."""
+
+import os
+import tempfile
+import hypothesis
+import numpy
+import pytest
+import sumpf
+import tests
+
+
+@hypothesis.given(signal=tests.strategies.signals(max_channels=5, min_value=-255 / 256, max_value=254 / 256),
+                  block_length=hypothesis.strategies.integers(min_value=1, max_value=20))
+@hypothesis.settings(deadline=None)
+def test_incremental_writing(signal, block_length):
+    """Tests if writing a signal block by block results in the same file content as saving it at once."""
+    file_formats = [(sumpf.Signal.file_formats.NUMPY_NPY, ".npy"),
+                    (sumpf.Signal.file_formats.WAV_INT16, ".wav"),
+                    (sumpf.Signal.file_formats.AIFF_INT24, ".aiff")]
+    try:
+        import soundfile    # noqa; pylint: disable=unused-import; this shall raise an ImportError, if the soundfile library cannot be imported
+    except ImportError:
+        pass
+    else:
+        file_formats.append((sumpf.Signal.file_formats.WAV_FLOAT32, ".wav"))
+        file_formats.append((sumpf.Signal.file_formats.FLAC_INT16, ".flac"))
+    with tempfile.TemporaryDirectory() as d:
+        for file_format, ending in file_formats:
+            path = os.path.join(d, "incremental" + ending)
+            reference_path = os.path.join(d, "complete" + ending)
+            with sumpf.SignalFileWriter(path, file_format) as writer:
+                for i in range(0, signal.length(), block_length):
+                    writer.append(signal[:, i:i + block_length])
+            assert writer.length() == signal.length()
+            signal.save(reference_path, file_format)
+            loaded = sumpf.Signal.load(path)
+            reference = sumpf.Signal.load(reference_path)
+            if signal.length():
+                assert loaded.shape() == reference.shape()
+                assert (loaded.channels() == reference.channels()).all()
+                assert loaded.offset() == reference.offset()
+                assert loaded.sampling_rate() == pytest.approx(reference.sampling_rate())
+            else:
+                assert loaded.length() == 0
+            os.remove(path)
+            os.remove(reference_path)
+
+
+def test_errors():
+    """Tests if the writer raises errors for invalid blocks and file formats."""
+    with tempfile.TemporaryDirectory() as d:
+        path = os.path.join(d, "test_file.wav")
+        with sumpf.SignalFileWriter(path) as writer:
+            writer.append(sumpf.SineWave(sampling_rate=44100.0, length=100))
+            with pytest.raises(ValueError):
+                writer.append(sumpf.SineWave(sampling_rate=48000.0, length=100))
+            with pytest.raises(ValueError):
+                writer.append(sumpf.MergeSignals([sumpf.SineWave(sampling_rate=44100.0, length=100)] * 2).output())
+        with pytest.raises(ValueError):
+            writer.append(sumpf.SineWave(sampling_rate=44100.0, length=100))
+        assert sumpf.Signal.load(path).length() == 100
+        with pytest.raises(ValueError):
+            sumpf.SignalFileWriter(os.path.join(d, "test_file.json")).append(sumpf.SineWave())
+        with pytest.raises(ValueError):
+            sumpf.SignalFileWriter(os.path.join(d, "test_file"), sumpf.Signal.file_formats.TEXT_CSV).append(sumpf.SineWave())
+
+
+def test_exception_in_context():
+    """Tests if an exception, which is raised in the context of a writer, is not hidden by errors from closing the file."""
+    with tempfile.TemporaryDirectory() as d:
+        # no block has been appended, so closing the writer would attempt to create an empty JSON file, which is not supported
+        path = os.path.join(d, "test_file.json")
+        with pytest.raises(RuntimeError):
+            with sumpf.SignalFileWriter(path):
+                raise RuntimeError("original exception")
+        assert not os.path.exists(path)
+        # the blocks, that have been appended before the exception, are saved
+        path = os.path.join(d, "test_file.wav")
+        with pytest.raises(RuntimeError):
+            with sumpf.SignalFileWriter(path) as writer:
+                writer.append(sumpf.SineWave(sampling_rate=44100.0, length=100))
+                raise RuntimeError("original exception")
+        assert sumpf.Signal.load(path).length() == 100
+
+
+def test_npy_precision():
+    """Tests if NPY files, that are written incrementally, have the precision of the written blocks."""
+    with tempfile.TemporaryDirectory() as d:
+        path = os.path.join(d, "test_file.npy")
+        for dtype in (numpy.float32, numpy.float64):
+            signal = sumpf.Signal(channels=numpy.random.normal(size=(2, 1000)).astype(dtype), sampling_rate=44100.0, offset=5)
+            with sumpf.SignalFileWriter(path) as writer:
+                for start in range(0, signal.length(), 300):
+                    writer.append(signal[:, start:start + 300])
+            loaded = sumpf.Signal.load(path)
+            assert loaded.channels().dtype == dtype
+            assert (loaded.channels() == signal.channels()).all()
+            assert loaded.sampling_rate() == signal.sampling_rate()
+            assert loaded.offset() == signal.offset()
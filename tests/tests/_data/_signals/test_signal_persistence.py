@@ -19,6 +19,7 @@
 import os
 import tempfile
 import hypothesis
+import numpy
 import pytest
 import sumpf
 from sumpf._internal import signal_writers, signal_readers
@@ -48,6 +49,27 @@ def test_exact_formats_with_metadata(signal):
                 os.remove(path)
 
 
+@hypothesis.given(tests.strategies.signals(max_channels=9, min_value=-1e30, max_value=1e30))
+def test_single_precision(signal):
+    """Tests if the precision of single precision signals is retained by the formats, that store the data type."""
+    signal = signal.to_precision("single")
+    with tempfile.TemporaryDirectory() as d:
+        path = os.path.join(d, "test_file")
+        for Reader, Writer in [(signal_readers.NumpyReader, signal_writers.NumpyNpzWriter),
+                               (signal_readers.PickleReader, signal_writers.PickleWriter)]:
+            Writer(Writer.formats[0])(signal, path)
+            loaded = Reader()(path)
+            assert loaded.channels().dtype == signal.channels().dtype
+            assert loaded == signal
+            os.remove(path)
+        signal_writers.JsonWriter(sumpf.Signal.file_formats.TEXT_JSON)(signal, path)
+        loaded = signal_readers.JsonReader()(path)
+        assert loaded.precision() == "double"
+        assert (loaded.channels() == signal.channels()).all()
+        with sumpf.config.override(precision="single"):
+            assert signal_readers.JsonReader()(path) == signal
+
+
 @hypothesis.given(tests.strategies.signals(max_channels=9))
 def test_exact_with_time_column(signal):
     """Tests formats, from which a signal can be restored almost exactly with
@@ -119,14 +141,16 @@ def test_lossless_formats(signal):
     except ImportError:
         formats = {sumpf.Signal.file_formats.WAV_UINT8: ([signal_readers.WaveReader], [signal_writers.WaveWriter], 8, 65535),
                    sumpf.Signal.file_formats.WAV_INT16: ([signal_readers.WaveReader], [signal_writers.WaveWriter], 16, 65535),
+                   sumpf.Signal.file_formats.WAV_INT24: ([signal_readers.WaveReader], [signal_writers.WaveWriter], 24, 65535),
                    sumpf.Signal.file_formats.WAV_INT32: ([signal_readers.WaveReader], [signal_writers.WaveWriter], 32, 65535),
                    sumpf.Signal.file_formats.AIFF_INT8: ([signal_readers.AifcReader], [signal_writers.AifcWriter], 8, 65535),
                    sumpf.Signal.file_formats.AIFF_INT16: ([signal_readers.AifcReader], [signal_writers.AifcWriter], 16, 65535),
+                   sumpf.Signal.file_formats.AIFF_INT24: ([signal_readers.AifcReader], [signal_writers.AifcWriter], 24, 65535),
                    sumpf.Signal.file_formats.AIFF_INT32: ([signal_readers.AifcReader], [signal_writers.AifcWriter], 32, 65535)}
     else:
         formats = {sumpf.Signal.file_formats.WAV_UINT8: ([signal_readers.SoundfileReader, signal_readers.WaveReader], [signal_writers.SoundfileWriter, signal_writers.WaveWriter], 8, 65535),
                    sumpf.Signal.file_formats.WAV_INT16: ([signal_readers.SoundfileReader, signal_readers.WaveReader], [signal_writers.SoundfileWriter, signal_writers.WaveWriter], 16, 65535),
-                   sumpf.Signal.file_formats.WAV_INT24: ([signal_readers.SoundfileReader], [signal_writers.SoundfileWriter], 24, 65535),
+                   sumpf.Signal.file_formats.WAV_INT24: ([signal_readers.SoundfileReader, signal_readers.WaveReader], [signal_writers.SoundfileWriter, signal_writers.WaveWriter], 24, 65535),
                    sumpf.Signal.file_formats.WAV_INT32: ([signal_readers.SoundfileReader, signal_readers.WaveReader], [signal_writers.SoundfileWriter, signal_writers.WaveWriter], 32, 65535),
                    sumpf.Signal.file_formats.WAV_FLOAT32: ([signal_readers.SoundfileReader], [signal_writers.SoundfileWriter], 32.0, 65535),
                    sumpf.Signal.file_formats.WAV_ULAW: ([signal_readers.SoundfileReader], [signal_writers.SoundfileWriter], -8, 65535),
@@ -134,7 +158,7 @@ def test_lossless_formats(signal):
                    sumpf.Signal.file_formats.AIFF_UINT8: ([signal_readers.SoundfileReader], [signal_writers.SoundfileWriter], 8, 65535),
                    sumpf.Signal.file_formats.AIFF_INT8: ([signal_readers.SoundfileReader, signal_readers.AifcReader], [signal_writers.SoundfileWriter, signal_writers.AifcWriter], 8, 65535),
                    sumpf.Signal.file_formats.AIFF_INT16: ([signal_readers.SoundfileReader, signal_readers.AifcReader], [signal_writers.SoundfileWriter, signal_writers.AifcWriter], 16, 65535),
-                   sumpf.Signal.file_formats.AIFF_INT24: ([signal_readers.SoundfileReader], [signal_writers.SoundfileWriter], 24, 65535),
+                   sumpf.Signal.file_formats.AIFF_INT24: ([signal_readers.SoundfileReader, signal_readers.AifcReader], [signal_writers.SoundfileWriter, signal_writers.AifcWriter], 24, 65535),
                    sumpf.Signal.file_formats.AIFF_INT32: ([signal_readers.SoundfileReader, signal_readers.AifcReader], [signal_writers.SoundfileWriter, signal_writers.AifcWriter], 32, 65535),
                    sumpf.Signal.file_formats.AIFF_FLOAT32: ([signal_readers.SoundfileReader], [signal_writers.SoundfileWriter], 32.0, 65535),
                    sumpf.Signal.file_formats.AIFF_ULAW: ([signal_readers.SoundfileReader], [signal_writers.SoundfileWriter], -8, 65535),
@@ -286,3 +310,178 @@ def test_autodetect_format_on_saving():
             assert (reader_loaded.channels() == reference.channels()).all()
             os.remove(auto_path)
             os.remove(reference_path)
+
+
+@hypothesis.given(tests.strategies.signals(max_channels=9, min_value=-255 / 256, max_value=254 / 256))
+@hypothesis.settings(deadline=None)
+def test_memory_mapped_wave_files(signal):
+    """Tests if memory mapping a WAV file yields the same signal as reading it."""
+    with tempfile.TemporaryDirectory() as d:
+        path = os.path.join(d, "test_file")
+        for file_format in signal_writers.WaveWriter.formats:
+            signal_writers.WaveWriter(file_format)(signal, path)
+            loaded = signal_readers.WaveReader()(path)
+            mapped = sumpf.Signal.load(path, mmap=True)
+            assert mapped.shape() == loaded.shape()
+            assert mapped.sampling_rate() == loaded.sampling_rate()
+            assert mapped.labels() == loaded.labels()
+            assert (mapped.channels() == loaded.channels()).all()
+            if signal.length():
+                assert mapped.channels()[-1, 0] == loaded.channels()[-1, 0]
+                assert (mapped.channels()[:, 1::2] == loaded.channels()[:, 1::2]).all()
+            with pytest.raises(Exception):
+                mapped.channels()[0, 0] = 0.0
+            del mapped
+            os.remove(path)
+
+
+@hypothesis.given(tests.strategies.signals(max_channels=9))
+def test_memory_mapped_numpy_files(signal):
+    """Tests if memory mapping a NPY file restores the signal."""
+    with tempfile.TemporaryDirectory() as d:
+        path = os.path.join(d, "test_file")
+        signal_writers.NumpyNpyWriter(sumpf.Signal.file_formats.NUMPY_NPY)(signal, path)
+        mapped = sumpf.Signal.load(path, mmap=True)
+        assert (mapped.channels() == signal.channels()).all()
+        assert not mapped.channels().flags.writeable
+        if signal.length() > 1:
+            factor = abs(signal.offset() / 1e15)
+            offset_margin = int(round(abs(signal.offset()) * factor))
+            assert mapped.sampling_rate() == pytest.approx(signal.sampling_rate(), rel=max(factor, 1e-10))
+            assert signal.offset() - offset_margin <= mapped.offset() <= signal.offset() + offset_margin
+        assert mapped.labels() == tuple(f"test_file {index}" for index in range(1, len(signal) + 1))
+        del mapped
+
+
+def test_memory_mapping_unsupported_files():
+    """Tests if memory mapping a file, that cannot be mapped, raises an error."""
+    with tempfile.TemporaryDirectory() as d:
+        path = os.path.join(d, "test_file")
+        sumpf.ExponentialSweep().save(path, sumpf.Signal.file_formats.TEXT_JSON)
+        with pytest.raises(ValueError):
+            sumpf.Signal.load(path, mmap=True)
+
+
+@hypothesis.given(signal=tests.strategies.signals(max_channels=5, min_value=-255 / 256, max_value=254 / 256),
+                  start=hypothesis.strategies.integers(min_value=-20, max_value=20),
+                  stop=hypothesis.strategies.one_of(hypothesis.strategies.none(), hypothesis.strategies.integers(min_value=-20, max_value=20)),
+                  channels=hypothesis.strategies.one_of(hypothesis.strategies.none(), hypothesis.strategies.lists(hypothesis.strategies.integers(min_value=0, max_value=4), min_size=1, max_size=4)))
+@hypothesis.settings(deadline=None)
+def test_excerpts(signal, start, stop, channels):
+    """Tests if loading an excerpt of a file yields the same as loading the whole file and slicing the loaded signal."""
+    if channels is not None:
+        channels = [c % len(signal) for c in channels]
+    formats = [(signal_readers.CsvReader, signal_writers.CsvWriter, sumpf.Signal.file_formats.TEXT_CSV),
+               (signal_readers.JsonReader, signal_writers.JsonWriter, sumpf.Signal.file_formats.TEXT_JSON),
+               (signal_readers.NumpyReader, signal_writers.NumpyNpzWriter, sumpf.Signal.file_formats.NUMPY_NPZ),
+               (signal_readers.NumpyReader, signal_writers.NumpyNpyWriter, sumpf.Signal.file_formats.NUMPY_NPY),
+               (signal_readers.PickleReader, signal_writers.PickleWriter, sumpf.Signal.file_formats.PYTHON_PICKLE),
+               (signal_readers.WaveReader, signal_writers.WaveWriter, sumpf.Signal.file_formats.WAV_INT16),
+               (signal_readers.AifcReader, signal_writers.AifcWriter, sumpf.Signal.file_formats.AIFF_INT24)]
+    try:
+        import soundfile    # noqa; pylint: disable=unused-import; this shall raise an ImportError, if the soundfile library cannot be imported
+    except ImportError:
+        pass
+    else:
+        formats.append((signal_readers.SoundfileReader, signal_writers.SoundfileWriter, sumpf.Signal.file_formats.WAV_FLOAT32))
+    with tempfile.TemporaryDirectory() as d:
+        path = os.path.join(d, "test_file")
+        for Reader, Writer, file_format in formats:
+            Writer(file_format)(signal, path)
+            complete = Reader()(path)
+            excerpt = Reader()(path, start=start, stop=stop, channels=channels)
+            begin, end, _ = slice(start, stop).indices(complete.length())
+            end = max(begin, end)
+            selection = list(range(len(complete))) if channels is None else channels
+            assert excerpt.length() == end - begin
+            assert len(excerpt) == len(selection)
+            assert (excerpt.channels() == complete.channels()[selection, begin:end]).all()
+            assert excerpt.sampling_rate() == complete.sampling_rate()
+            assert excerpt.offset() == complete.offset() + begin
+            assert excerpt.labels() == tuple(complete.labels()[c] for c in selection)
+            os.remove(path)
+
+
+def test_identify_format_by_content():
+    """Tests if the file format is identified by the file's content, when the file extension is misleading."""
+    signal = sumpf.ExponentialSweep(length=2 ** 12) * 0.9
+    with tempfile.TemporaryDirectory() as d:
+        for file_format in (sumpf.Signal.file_formats.TEXT_CSV,
+                            sumpf.Signal.file_formats.TEXT_JSON,
+                            sumpf.Signal.file_formats.NUMPY_NPZ,
+                            sumpf.Signal.file_formats.NUMPY_NPY,
+                            sumpf.Signal.file_formats.PYTHON_PICKLE,
+                            sumpf.Signal.file_formats.WAV_INT16,
+                            sumpf.Signal.file_formats.AIFF_INT16):
+            for name in ("test_file.dat", "test_file.wav", "test_file.aiff"):
+                path = os.path.join(d, name)
+                signal.save(path, file_format)
+                loaded = sumpf.Signal.load(path)
+                assert loaded.shape() == signal.shape()
+                os.remove(path)
+        # a corrupt file with a signature is not passed to the readers for other formats
+        path = os.path.join(d, "test_file.csv")
+        with open(path, "wb") as f:
+            f.write(b"RIFF\x00\x00\x00\x00WAVE")
+        with pytest.raises(ValueError):
+            sumpf.Signal.load(path)
+
+
+@hypothesis.given(signal=tests.strategies.signals(max_channels=5),
+                  chunk_size=hypothesis.strategies.integers(min_value=1, max_value=10))
+def test_csv_chunks(signal, chunk_size):
+    """Tests if writing and parsing CSV files in chunks works independently of the chunk size and the line breaks."""
+    from sumpf._internal import read_csv_table, write_csv_table  # pylint: disable=import-outside-toplevel; the helper functions are tested directly
+    columns = (signal.time_samples(), *signal.channels())
+    with tempfile.TemporaryDirectory() as d:
+        path = os.path.join(d, "test_file.csv")
+        write_csv_table(path, header=("time",) + signal.labels(), columns=columns, chunk_size=chunk_size)
+        header, table = read_csv_table(path, dtype=float, chunk_size=chunk_size)
+        assert tuple(header) == ("time",) + signal.labels()
+        assert (table == columns).all()
+        # a file without a header, with empty lines and with other line breaks
+        with open(path, newline="") as f:
+            lines = f.read().split("\r\n")[1:]
+        with open(path, "w", newline="") as f:
+            f.write("\r".join(lines) + "\n\n")
+        header, table = read_csv_table(path, dtype=float, chunk_size=chunk_size)
+        assert header is None
+        assert table.shape == ((len(signal) + 1, signal.length()) if signal.length() else (0, 0))
+        assert (table == columns).all()
+
+
+def test_csv_single_precision():
+    """Tests if the numbers of single precision signals are written to CSV files
+    with the shortest representation, that identifies their single precision value."""
+    from sumpf._internal import write_csv_table  # pylint: disable=import-outside-toplevel; the helper function is tested directly
+    signal = sumpf.Signal(channels=numpy.array([[0.1, -2.5, 1.0 / 3.0]], dtype=numpy.float32), sampling_rate=10.0, labels=("Signal",))
+    with tempfile.TemporaryDirectory() as d:
+        path = os.path.join(d, "test_file.csv")
+        signal.save(path, file_format=sumpf.Signal.file_formats.TEXT_CSV)
+        with open(path, newline="") as f:
+            assert f.read() == "time,Signal\r\n0.0,0.1\r\n0.1,-2.5\r\n0.2,0.33333334\r\n"
+        loaded = sumpf.Signal.load(path)
+        assert (loaded.channels().astype(numpy.float32) == signal.channels()).all()
+        # complex numbers
+        write_csv_table(path, header=("a", "b"), columns=(numpy.array([0.1, 0.2]), numpy.array([0.1 + 0.2j, 1.0], dtype=numpy.complex64)))
+        with open(path, newline="") as f:
+            assert f.read() == "a,b\r\n0.1,(0.1+0.2j)\r\n0.2,(1+0j)\r\n"
+
+
+def test_npy_single_precision():
+    """Tests if single precision signals are saved to and loaded from NPY files without converting them to double precision."""
+    with tempfile.TemporaryDirectory() as d:
+        path = os.path.join(d, "test_file.npy")
+        for sampling_rate, offset in ((44100.0, 0), (48000.0, 17), (8000.0, -3)):
+            signal = sumpf.Signal(channels=numpy.random.normal(size=(2, 1000)).astype(numpy.float32), sampling_rate=sampling_rate, offset=offset)
+            signal.save(path, file_format=sumpf.Signal.file_formats.NUMPY_NPY)
+            assert numpy.load(path).dtype == numpy.float32
+            for loaded in (sumpf.Signal.load(path), sumpf.Signal.load(path, mmap=True)):
+                assert loaded.channels().dtype == numpy.float32
+                assert (loaded.channels() == signal.channels()).all()
+                assert loaded.sampling_rate() == sampling_rate
+                assert loaded.offset() == offset
+            del loaded
+        sumpf.SineWave(length=100).save(path, file_format=sumpf.Signal.file_formats.NUMPY_NPY)
+        with sumpf.config.override(precision="single"):     # double precision files are loaded with double precision
+            assert sumpf.Signal.load(path).channels().dtype == numpy.float64
@@ -706,6 +706,27 @@ def test_shift(spectrogram, shift):
     assert shifted.labels() == spectrogram.labels()
 
 
+@hypothesis.given(tests.strategies.spectrograms(max_magnitude=1e3))
+def test_to_precision(spectrogram):
+    """Tests the conversion of a spectrogram's precision."""
+    assert spectrogram.precision() == "double"
+    assert spectrogram.to_precision("double") is spectrogram
+    single = spectrogram.to_precision("single")
+    assert single.precision() == "single"
+    assert single.channels().dtype == numpy.complex64
+    assert single.to_precision("single") is single
+    assert single.resolution() == spectrogram.resolution()
+    assert single.sampling_rate() == spectrogram.sampling_rate()
+    assert single.offset() == spectrogram.offset()
+    assert single.labels() == spectrogram.labels()
+    assert numpy.array_equal(single.channels(), spectrogram.channels().astype(numpy.complex64))
+    assert abs(single).precision() == "single"
+    for result in (-single, single + single, single * 2.0, single.pad(3), single.conjugate(),
+                   single.shift(1, mode=sumpf.Spectrogram.shift_modes.CYCLE)):
+        assert result.channels().dtype == numpy.complex64
+    assert (single + spectrogram).channels().dtype == numpy.complex128
+
+
 @hypothesis.given(tests.strategies.spectrograms())
 def test_conjugate(spectrogram):
     """Tests computing the complex conjugate of a spectrogram."""
@@ -468,6 +468,25 @@ def test_pad(spectrum, length, value):
         assert padded == spectrum
 
 
+@hypothesis.given(tests.strategies.spectrums(max_magnitude=1e3))
+def test_to_precision(spectrum):
+    """Tests the conversion of a spectrum's precision."""
+    assert spectrum.precision() == "double"
+    assert spectrum.to_precision("double") is spectrum
+    single = spectrum.to_precision("single")
+    assert single.precision() == "single"
+    assert single.channels().dtype == numpy.complex64
+    assert single.to_precision("single") is single
+    assert single.resolution() == spectrum.resolution()
+    assert single.labels() == spectrum.labels()
+    assert numpy.array_equal(single.channels(), spectrum.channels().astype(numpy.complex64))
+    for result in (abs(single), single.inverse_fourier_transform()):
+        assert result.precision() == "single"
+    for result in (-single, single + single, single * 2.0, 1.0 - single, single.pad(3), single.conjugate()):
+        assert result.channels().dtype == numpy.complex64
+    assert (single + spectrum).channels().dtype == numpy.complex128
+
+
 @hypothesis.given(tests.strategies.spectrums())
 def test_conjugate(spectrum):
     """Tests computing the complex conjugate of a spectrum."""
@@ -0,0 +1,110 @@
+# This file is a part of the "SuMPF" package
+# Copyright (C) 2018-2019 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests the strategies for allocating arrays"""
+
+import gc
+import numpy
+import pytest
+import sumpf
+import sumpf._internal as sumpf_internal
+
+
+def test_allocator_selection():
+    """Tests if the allocator is selected according to the setting in sumpf.config."""
+    assert sumpf_internal.get_allocator() is sumpf_internal.allocators["shared"]
+    for name, allocator in sumpf_internal.allocators.items():
+        with sumpf.config.override(allocator=name):
+            assert sumpf_internal.get_allocator() is allocator
+            array = sumpf_internal.allocate_array(shape=(2, 3), dtype=numpy.complex64)
+            assert array.shape == (2, 3)
+            assert array.dtype == numpy.complex64
+    with sumpf.config.override(allocator="nonexistent"):
+        with pytest.raises(ValueError):
+            sumpf_internal.allocate_array(shape=(2, 3))
+
+
+def test_statistics():
+    """Tests the statistics about the allocated memory."""
+    for allocator in (sumpf_internal.NumpyAllocator(), sumpf_internal.SharedMemoryAllocator()):
+        array1 = allocator.allocate(shape=(2, 8), dtype=numpy.float64)
+        array2 = allocator.allocate(shape=(4,), dtype=numpy.float64)
+        assert allocator.statistics() == {"allocated": 160, "reused": 0, "in_use": 160, "peak": 160}
+        del array1
+        gc.collect()
+        assert allocator.statistics() == {"allocated": 160, "reused": 0, "in_use": 32, "peak": 160}
+        allocator.reset_statistics()
+        assert allocator.statistics() == {"allocated": 0, "reused": 0, "in_use": 32, "peak": 32}
+        del array2
+
+
+def test_pool_recycling():
+    """Tests if the pool allocator recycles the buffers of arrays, that are no longer used."""
+    allocator = sumpf_internal.PoolAllocator()
+    array = allocator.allocate(shape=(2, 100), dtype=numpy.float64)
+    size = allocator.size_class(1600)
+    assert allocator.statistics() == {"allocated": size, "reused": 0, "in_use": size, "peak": size}
+    del array
+    gc.collect()
+    assert allocator.pooled_bytes() == size
+    array = allocator.allocate(shape=(1550,), dtype=numpy.uint8)
+    assert allocator.pooled_bytes() == 0
+    assert allocator.statistics() == {"allocated": size, "reused": size, "in_use": size, "peak": size}
+    # the buffer must not be recycled as long as a view on the array exists
+    view = array[10:20]
+    del array
+    gc.collect()
+    assert allocator.pooled_bytes() == 0
+    other = allocator.allocate(shape=(1550,), dtype=numpy.uint8)
+    assert not numpy.shares_memory(view, other)
+    del view, other
+    gc.collect()
+    assert allocator.pooled_bytes() == 2 * size
+    allocator.clear()
+    assert allocator.pooled_bytes() == 0
+
+
+def test_pool_limit():
+    """Tests if the pool allocator frees the buffers, that would exceed the maximum size of the pool."""
+    allocator = sumpf_internal.PoolAllocator(maximum_pooled_bytes=1024)
+    arrays = [allocator.allocate(shape=(64,), dtype=numpy.float64) for _ in range(3)]
+    del arrays
+    gc.collect()
+    assert allocator.pooled_bytes() == 1024
+
+
+def test_size_classes():
+    """Tests the size classes of the pool allocator."""
+    assert sumpf_internal.PoolAllocator.size_class(0) == sumpf_internal.PoolAllocator.minimum_size
+    previous = sumpf_internal.PoolAllocator.minimum_size
+    for size in range(previous + 1, 2 ** 16):
+        size_class = sumpf_internal.PoolAllocator.size_class(size)
+        assert size_class >= size
+        assert size_class >= previous
+        assert size_class <= 1.25 * size
+        previous = size_class
+
+
+def test_data_sets_with_pool_allocator():
+    """Tests if the channels of data sets, that are computed with recycled buffers, are correct."""
+    signal = sumpf.Signal(channels=numpy.array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]]))
+    reference = signal.channels() * 2.0 + 1.0
+    for _ in range(5):
+        result = signal * 2.0 + 1.0
+        assert (result.channels() == reference).all()
+        padded = result.pad(5)
+        assert (padded.channels()[:, 0:3] == reference).all()
+        assert (padded.channels()[:, 3:] == 0.0).all()
@@ -0,0 +1,67 @@
+# This file is a part of the "SuMPF" package
+# Copyright (C) 2018-2019 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests the cost model, with which the automatic convolution modes choose the computation method"""
+
+import math
+import numpy
+import pytest
+import sumpf
+import sumpf._internal as sumpf_internal
+
+
+def test_choose_convolution_method():
+    """Tests if the cost model chooses the expected methods in clear-cut cases."""
+    modes = sumpf.Signal.convolution_modes
+    for mode in (modes.FULL, modes.SAME, modes.VALID):
+        assert sumpf_internal.choose_convolution_method(mode, 1000, 3, channels=1) is mode
+        assert sumpf_internal.choose_convolution_method(mode, 2 ** 16, 2 ** 15, channels=1) in (modes.SPECTRUM_PADDED, modes.PARTITIONED)
+        costs = {"direct": math.inf, "direct_sample": 0.0, "transform": 1.0, "elementwise": 1.0, "call": 0.0}
+        with sumpf.config.override(convolution_costs=costs):
+            assert sumpf_internal.choose_convolution_method(mode, 20000, 10, channels=1) is modes.PARTITIONED
+            assert sumpf_internal.choose_convolution_method(mode, 100, 100, channels=1) is modes.SPECTRUM_PADDED
+    # two operands of the same length have a valid convolution with only one sample
+    assert sumpf_internal.choose_convolution_method(modes.VALID, 2 ** 16, 2 ** 16, channels=1) is modes.VALID
+
+
+def test_partitioned_automatic_convolution():
+    """Tests the cropping of the result of the partitioned computation to the length and offset of the direct modes."""
+    modes = sumpf.Signal.convolution_modes
+    generator = numpy.random.default_rng(0)
+    signal = sumpf.Signal(channels=generator.uniform(-1.0, 1.0, (2, 20000)), offset=-7)
+    kernel = sumpf.Signal(channels=generator.uniform(-1.0, 1.0, (1, 10)), offset=3)
+    costs = {"direct": math.inf, "direct_sample": 0.0, "transform": 1.0, "elementwise": 1.0, "call": 0.0}
+    for direct_mode, automatic_mode in ((modes.FULL, modes.AUTO_FULL), (modes.SAME, modes.AUTO_SAME), (modes.VALID, modes.AUTO_VALID)):
+        for a, b in ((signal, kernel), (kernel, signal)):
+            with sumpf.config.override(convolution_costs=costs):
+                convolution = a.convolve(b, mode=automatic_mode)
+                correlation = a.correlate(b, mode=automatic_mode)
+            for result, reference in ((convolution, a.convolve(b, mode=direct_mode)),
+                                      (correlation, a.correlate(b, mode=direct_mode))):
+                assert result.shape() == reference.shape()
+                assert result.offset() == reference.offset()
+                assert result.channels() == pytest.approx(reference.channels())
+
+
+def test_calibrate_convolution_costs():
+    """Tests if the calibration returns a valid set of coefficients for the cost model."""
+    for calibrate in (sumpf_internal.calibrate_convolution_costs, sumpf.config.calibrate_convolution_costs):
+        costs = calibrate(repetitions=1)
+        assert set(costs) == set(sumpf.config.convolution_costs)
+        assert all(c >= 0.0 for c in costs.values())
+    with pytest.raises(AttributeError):
+        with sumpf.config.override(calibrate_convolution_costs=None):
+            pass
@@ -0,0 +1,110 @@
+# This file is a part of the "SuMPF" package
+# Copyright (C) 2018-2019 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests the selection of the backends for the fast Fourier transforms"""
+
+import hypothesis
+import numpy
+import pytest
+import sumpf
+import sumpf._internal as sumpf_internal
+import tests
+
+
+def test_backend_selection():
+    """Tests if the FFT backend is selected according to the settings in sumpf.config."""
+    assert isinstance(sumpf_internal.get_fft_backend(), sumpf_internal._fft.NumpyFFT)                   # pylint: disable=protected-access
+    with sumpf.config.override(fft_backend="numpy", fft_workers=4):
+        assert isinstance(sumpf_internal.get_fft_backend(), sumpf_internal._fft.NumpyFFT)               # pylint: disable=protected-access
+    if "scipy" in sumpf_internal.fft_backends:
+        with sumpf.config.override(fft_workers=4):
+            assert isinstance(sumpf_internal.get_fft_backend(), sumpf_internal._fft.ScipyFFT)           # pylint: disable=protected-access
+    with sumpf.config.override(fft_backend="nonexistent"):
+        with pytest.raises(ValueError):
+            sumpf_internal.get_fft_backend()
+    assert sumpf.config.fft_backend is None
+    assert sumpf.config.fft_workers is None
+
+
+def test_override():
+    """Tests if the override context manager restores the previous settings, even if an exception is raised."""
+    sumpf.config.fft_workers = 2
+    try:
+        with pytest.raises(RuntimeError):
+            with sumpf.config.override(fft_workers=-1):
+                assert sumpf.config.fft_workers == -1
+                raise RuntimeError()
+        assert sumpf.config.fft_workers == 2
+        with pytest.raises(AttributeError):
+            with sumpf.config.override(nonexistent=3):
+                pass
+    finally:
+        sumpf.config.fft_workers = None
+
+
+@hypothesis.given(signal=tests.strategies.signals(min_value=-1.0, max_value=1.0, min_length=2))
+def test_backends(signal):
+    """Tests if all backends compute the same transforms."""
+    reference = numpy.fft.rfft(signal.channels())
+    for backend in sumpf_internal.fft_backends:
+        for workers in (None, 1, 2):
+            with sumpf.config.override(fft_backend=backend, fft_workers=workers):
+                spectrum = sumpf_internal.rfft(signal.channels())
+                assert spectrum == pytest.approx(reference)
+                assert sumpf_internal.irfft(spectrum, n=signal.length()) == pytest.approx(signal.channels())
+
+
+@hypothesis.given(minimum=hypothesis.strategies.integers(min_value=1, max_value=2 ** 24))
+def test_fft_length(minimum):
+    """Tests if the planned lengths for the transforms are the smallest even numbers without prime factors larger than five."""
+    def is_even_five_smooth(number):
+        if number % 2 == 1:
+            return False
+        for factor in (2, 3, 5):
+            while number % factor == 0:
+                number //= factor
+        return number == 1
+    length = sumpf_internal.fft_length(minimum)
+    assert length >= minimum
+    assert is_even_five_smooth(length)
+    assert not any(is_even_five_smooth(n) for n in range(minimum, length))
+
+
+def test_fft_length_hooks():
+    """Tests if the hooks for inspecting the planned lengths are called by the padded spectral convolution."""
+    lengths = []
+    sumpf_internal.fft_length_hooks.append(lambda minimum, length: lengths.append((minimum, length)))
+    try:
+        signal1 = sumpf.Signal(channels=numpy.ones(shape=(2, 500)))
+        signal2 = sumpf.Signal(channels=numpy.ones(shape=(2, 510)))
+        signal1.convolve(signal2, mode=sumpf.Signal.convolution_modes.SPECTRUM_PADDED)
+        signal1.correlate(signal2, mode=sumpf.Signal.convolution_modes.SPECTRUM_PADDED)
+        assert lengths == [(1009, 1024), (1009, 1024)]
+    finally:
+        sumpf_internal.fft_length_hooks.clear()
+
+
+def test_single_precision():
+    """Tests if the transforms of single precision data return single precision results."""
+    for backend in sumpf_internal.fft_backends:
+        with sumpf.config.override(fft_backend=backend):
+            data = numpy.arange(16, dtype=numpy.float32).reshape(2, 8)
+            spectrum = sumpf_internal.rfft(data)
+            assert spectrum.dtype == numpy.complex64
+            result = sumpf_internal.irfft(spectrum)
+            assert result.dtype == numpy.float32
+            assert result == pytest.approx(data, abs=1e-5)
+            assert sumpf_internal.rfft(data.astype(numpy.float64)).dtype == numpy.complex128
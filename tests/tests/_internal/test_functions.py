@@ -18,6 +18,7 @@
 
 import hypothesis
 import numpy
+import pytest
 import sumpf
 import sumpf._internal as sumpf_internal
 import tests
@@ -43,3 +44,45 @@ def test_scaling_factor(window_classes, plateau, sampling_rate, length, symmetri
     signal = sumpf.MergeSignals(windows).output()
     reference = numpy.array([w.scaling_factor(overlap) for w in windows])
     assert numpy.array_equal(sumpf_internal.scaling_factor(signal, overlap), reference)
+
+
+def test_allocate_array():
+    """Tests the allocation of arrays with different data types."""
+    for dtype in (numpy.float64, numpy.float32, numpy.complex128, numpy.complex64, numpy.int16):
+        for shape in ((3, 5), (2, 3, 7), (0,), (1, 0)):
+            array = sumpf_internal.allocate_array(shape=shape, dtype=dtype)
+            assert array.shape == shape
+            assert array.dtype == dtype
+            array[:] = 1
+            assert (array == 1).all()
+
+
+def test_precision():
+    """Tests the functions for determining the precision of computations and the
+    precision setting in the configuration."""
+    single = numpy.ones(3, dtype=numpy.float32)
+    double = numpy.ones(3)
+    assert sumpf_internal.get_precision() == "double"
+    assert sumpf_internal.get_precision(single) == "single"
+    assert sumpf_internal.get_precision(single, single.astype(numpy.complex64), 2.0) == "single"
+    assert sumpf_internal.get_precision(single, double) == "double"
+    assert sumpf_internal.get_precision(2.0, [1.0, 2.0], numpy.arange(3)) == "double"
+    assert sumpf_internal.float_dtype("single") is numpy.float32
+    assert sumpf_internal.complex_dtype("double") is numpy.complex128
+    with pytest.raises(ValueError):
+        sumpf_internal.float_dtype("quadruple")
+    with sumpf.config.override(precision="single"):
+        assert sumpf_internal.get_precision(2.0, numpy.arange(3)) == "single"
+        assert sumpf_internal.get_precision(double) == "double"
+        assert sumpf_internal.float_dtype() is numpy.float32
+        assert sumpf_internal.complex_dtype() is numpy.complex64
+        for signal in (sumpf.ConstantSignal(length=4),
+                       sumpf.SineWave(length=4),
+                       sumpf.GaussianNoise(length=4),
+                       sumpf.HannWindow(length=4),
+                       sumpf.ExponentialSweep(length=4)):
+            assert signal.precision() == "single"
+        for spectrum in (sumpf.RudinShapiroNoiseSpectrum(length=4),
+                         sumpf.ButterworthFilter().spectrum(resolution=1.0, length=4)):
+            assert spectrum.precision() == "single"
+        assert sumpf.ButterworthFilter().spectrum(resolution=1.0, length=4, precision="double").precision() == "double"
@@ -174,3 +174,31 @@ def test_extrapolation(xs, ys, interpolation, delta_x):
         assert func(x1, xs, ys) == ys[1]
     else:
         raise ValueError(f"Unknown interpolation: {interpolation}.")
+
+
+@pytest.mark.filterwarnings("ignore:divide by zero", "ignore:invalid value", "ignore:overflow")
+@hypothesis.given(interpolation=hypothesis.strategies.sampled_from(sumpf_internal.Interpolations),
+                  extrapolation=hypothesis.strategies.sampled_from(sumpf_internal.Interpolations),
+                  data=hypothesis.strategies.lists(elements=hypothesis.strategies.tuples(hypothesis.strategies.floats(min_value=0.0, max_value=1e15),                       # pylint: disable=line-too-long
+                                                                                         hypothesis.strategies.complex_numbers(min_magnitude=0.0, max_magnitude=1e15)),     # pylint: disable=line-too-long
+                                                   min_size=1, max_size=2 ** 6,
+                                                   unique_by=lambda t: t[0]),
+                  x=hypothesis.strategies.lists(elements=hypothesis.strategies.floats(min_value=0.0, max_value=1e15), min_size=0, max_size=2 ** 8))                        # pylint: disable=line-too-long
+def test_plan(interpolation, extrapolation, data, x):
+    """Tests if an interpolation plan returns the same results as the interpolation functions."""
+    xs, ys = xs_ys(data, interpolation)
+    x = numpy.concatenate((x, xs))
+    # compute the reference like in the Bands term
+    reference = numpy.empty(len(x), dtype=numpy.complex128)
+    mask = (x < xs[0]) | (xs[-1] < x)
+    reference[mask] = sumpf_internal.interpolation.get(extrapolation)(x[mask], xs, ys)
+    reference[~mask] = sumpf_internal.interpolation.get(interpolation)(x[~mask], xs, ys)
+    # compare the result for a single set of function values
+    plan = sumpf_internal.interpolation.Plan(x, xs, interpolation, extrapolation)
+    result = plan(ys, out=numpy.empty(len(x), dtype=numpy.complex128))
+    assert numpy.array_equal(result, reference, equal_nan=True)
+    # compare the result for multiple sets of function values
+    result = plan(numpy.array((ys, ys)))
+    assert result.shape == (2, len(x))
+    assert numpy.array_equal(result[0], reference, equal_nan=True)
+    assert numpy.array_equal(result[1], reference, equal_nan=True)
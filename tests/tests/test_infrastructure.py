@@ -21,6 +21,7 @@ import enum
 import inspect
 import os
 import re
+import sys
 import connectors
 import pytest
 import sumpf
@@ -62,7 +63,11 @@ def test_license():
 
 
 def test_sphinx_documentation():    # noqa: C901; pylint: disable=too-many-locals,too-many-branches,too-many-statements; alright, this is complex...
-    """Tests if all classes and their attributes are included in the *Sphinx* documentation."""
+    """Tests if all classes and their attributes are included in the *Sphinx* documentation.
+    Public submodules and the functions, that are imported from them, are considered
+    as documented, if the respective module is included with an ``automodule``
+    directive and a ``:members:`` field.
+    """
     # get all documented methods
     documentation = os.path.join("documentation", "reference")
     if not os.path.isdir(documentation):
@@ -70,19 +75,27 @@ def test_sphinx_documentation():    # noqa: C901; pylint: disable=too-many-local
     class_mask = re.compile(r"\s*\.\. autoclass:: *(sumpf\.(\w*\.)*\w*)")
     method_mask = re.compile(r"\s*\.\. automethod:: *(\w*)\(([\*\w, ]*)\)")
     attribute_mask = re.compile(r"\s*\.\. autoattribute:: *(\w*)")
+    module_mask = re.compile(r"\s*\.\. automodule:: *(sumpf\.(\w*\.)*\w*)")
     members_mask = re.compile(r"\s*:members:")
     documented_methods = {}
     documented_attributes = {}
+    documented_modules = set()
     with_members = set()
     for directory, _, files in os.walk(documentation):
         for filename in files:
             if os.path.splitext(filename)[-1] == ".rst":
                 with open(os.path.join(directory, filename)) as f:
                     current_class = None
+                    current_module = None
                     for l in f:
                         class_match = class_mask.match(l)
-                        if class_match:
+                        module_match = module_mask.match(l)
+                        if module_match:
+                            current_class = None
+                            current_module = module_match.group(1)
+                        elif class_match:
                             current_class = class_match.group(1)
+                            current_module = None
                             assert current_class not in documented_methods
                             documented_methods[current_class] = {}
                             assert current_class not in documented_attributes
@@ -92,6 +105,8 @@ def test_sphinx_documentation():    # noqa: C901; pylint: disable=too-many-local
                             if members_match:
                                 if current_class is not None:
                                     with_members.add(current_class)
+                                elif current_module is not None:
+                                    documented_modules.add(current_module)
                             else:
                                 method_match = method_mask.match(l)
                                 if method_match:
@@ -111,11 +126,19 @@ def test_sphinx_documentation():    # noqa: C901; pylint: disable=too-many-local
     implemented_attributes = {}
     for e in dir(sumpf):    # pylint: disable=too-many-nested-blocks
         if not e.startswith("_"):
+            o = getattr(sumpf, e)
+            if inspect.ismodule(o):
+                if o.__name__ not in documented_modules:
+                    pytest.fail(f"The module {o.__name__} is not included in the Sphinx documentation", pytrace=False)
+                continue
+            if inspect.isfunction(o):
+                if o.__module__ not in documented_modules or e not in getattr(sys.modules[o.__module__], "__all__", ()):
+                    pytest.fail(f"The function sumpf.{e} is not included in the Sphinx documentation", pytrace=False)
+                continue
             current_class = f"sumpf.{e}"
             implemented_methods[current_class] = {}
             implemented_connectors[current_class] = set()
             implemented_attributes[current_class] = set()
-            o = getattr(sumpf, e)
             for a in dir(o):
                 if not a.startswith("_"):
                     m = getattr(o, a)
@@ -0,0 +1,159 @@
+# This file is a part of the "SuMPF" package
+# Copyright (C) 2018-2019 Jonas Schulte-Coerne
+#
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the Free
+# Software Foundation, either version 3 of the License, or (at your option) any
+# later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more
+# details.
+#
+# You should have received a copy of the GNU Lesser General Public License along
+# with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Tests the functions for processing data sets in a pool of worker processes"""
+
+import gc
+import multiprocessing
+import os
+import tempfile
+import numpy
+import pytest
+import sumpf
+import sumpf.parallel
+
+
+@pytest.fixture(scope="module")
+def pool():
+    """Provides a pool of worker processes, that is shared by the tests in this module."""
+    with multiprocessing.Pool(processes=2) as worker_pool:
+        yield worker_pool
+
+
+def _signal(channels=2, length=100):
+    return sumpf.Signal(channels=numpy.random.normal(size=(channels, length)),
+                        sampling_rate=44100.0,
+                        offset=3,
+                        labels=tuple(f"Channel {c}" for c in range(channels)))
+
+
+def test_map_with_methods(pool):
+    """Tests if methods of the data sets can be called in the worker processes."""
+    signals = [_signal(), _signal(channels=1)]
+    kernel = _signal(channels=1, length=10)
+    # a method, which has a data set as parameter and returns a signal
+    convolve = sumpf.parallel.Method("convolve", kernel, mode=sumpf.Signal.convolution_modes.FULL)
+    results = sumpf.parallel.map(convolve, signals, pool=pool)
+    for signal, result in zip(signals, results):
+        assert result == signal.convolve(kernel, mode=sumpf.Signal.convolution_modes.FULL)
+    # a method, which returns a spectrogram
+    stft = sumpf.parallel.Method("short_time_fourier_transform", window=16)
+    for signal, result in zip(signals, sumpf.parallel.map(stft, signals, pool=pool)):
+        assert result == signal.short_time_fourier_transform(window=16)
+    # a method, which returns a signal from a spectrum
+    spectrums = [s.fourier_transform() for s in signals]
+    for spectrum, result in zip(spectrums, sumpf.parallel.map(sumpf.parallel.Method("inverse_fourier_transform"), spectrums, pool=pool)):
+        assert result == spectrum.inverse_fourier_transform()
+    # a method, which returns an array
+    for signal, result in zip(signals, sumpf.parallel.map(sumpf.parallel.Method("level"), signals, pool=pool)):
+        assert (result == signal.level()).all()
+
+
+def test_map_with_plain_items(pool):
+    """Tests if items, that are not data sets, are passed to the workers correctly."""
+    signals = sumpf.parallel.map(sumpf.ConstantSignal, [1.0, 2.0, 3.0], pool=pool)
+    for value, signal in zip((1.0, 2.0, 3.0), signals):
+        assert signal == sumpf.ConstantSignal(value)
+    assert sumpf.parallel.map(abs, [-1, 2, -3], pool=pool) == [1, 2, 3]
+    assert sumpf.parallel.map(abs, [], pool=pool) == []
+
+
+def test_map_channels(pool):
+    """Tests the parallel processing of the channels of a data set."""
+    signal = _signal(channels=3)
+    assert sumpf.parallel.map_channels(sumpf.parallel.Method("__mul__", 2.0), signal, pool=pool) == signal * 2.0
+    spectrum = signal.fourier_transform()
+    assert sumpf.parallel.map_channels(sumpf.parallel.Method("__abs__"), spectrum, pool=pool) == abs(spectrum)
+    stft = sumpf.parallel.Method("short_time_fourier_transform", window=16)
+    result = sumpf.parallel.map_channels(stft, signal, pool=pool)
+    reference = signal.short_time_fourier_transform(window=16)
+    assert (result.channels() == reference.channels()).all()
+    assert result.labels() == reference.labels()
+    assert sumpf.parallel.map_channels(stft, signal[0], pool=pool) == signal[0].short_time_fourier_transform(window=16)
+
+
+def test_shared_results(pool):
+    """Tests if the results of a previous computation are passed on without copying
+    them and if the shared memory is released, when it is no longer used."""
+    signals = [_signal(), _signal()]
+    results = sumpf.parallel.map(sumpf.parallel.Method("__mul__", 2.0), signals, pool=pool)
+    handles = [sumpf.parallel._share(r, segments=[]) for r in results]                  # pylint: disable=protected-access; the helper function is tested directly
+    assert not any(h.new for h in handles)
+    assert len({h.segment for h in handles}) == 2
+    # channels, that are sliced from a shared result, are referenced by an offset in the same block
+    segments = []
+    handle = sumpf.parallel._share(results[0][1], segments=segments)                    # pylint: disable=protected-access; the helper function is tested directly
+    assert not segments
+    assert handle.segment == handles[0].segment
+    assert handle.offset == results[0].channels().strides[0]
+    assert handle.load() == results[0][1]
+    # the results can be processed again
+    negated = sumpf.parallel.map(sumpf.parallel.Method("__neg__"), results, pool=pool)
+    for signal, result in zip(signals, negated):
+        assert result == signal * -2.0
+    # the shared memory is released with the results
+    del results, handle, negated, result
+    gc.collect()
+    assert not sumpf.parallel._segments                                                 # pylint: disable=protected-access; the registry is inspected directly
+
+
+def test_share(pool):
+    """Tests if data sets, that have been copied to shared memory with share, are
+    passed on without copying them again."""
+    signal = _signal()
+    shared = sumpf.parallel.share(signal)
+    assert shared == signal
+    assert sumpf.parallel.share(shared) is shared
+    segments = []
+    handle = sumpf.parallel._share(shared, segments=segments)                           # pylint: disable=protected-access; the helper function is tested directly
+    assert not segments
+    assert not handle.new
+    result, = sumpf.parallel.map(sumpf.parallel.Method("__neg__"), [shared], pool=pool)
+    assert result == -signal
+    # the shared memory is released with the data set
+    del shared, handle, result
+    gc.collect()
+    assert not sumpf.parallel._segments                                                 # pylint: disable=protected-access; the registry is inspected directly
+
+def test_load_and_save_many():
+    """Tests loading and saving many files concurrently in threads and worker processes."""
+    signals = [_signal(length=100 + i) for i in range(10)]
+    endings = (".npz", ".json", ".pickle", ".csv", ".npy")
+    with tempfile.TemporaryDirectory() as d:
+        paths = [os.path.join(d, f"{i}{endings[i % len(endings)]}") for i in range(len(signals))]
+        results = sumpf.save_many(zip(signals, paths), workers=2)
+        assert [r.index for r in results] == list(range(len(signals)))
+        assert all(r.error is None for r in results)
+        assert all(r.data is s for r, s in zip(results, signals))
+        # load the files in order
+        missing = os.path.join(d, "missing.npz")
+        results = list(sumpf.load_many(paths + [missing], workers=2))
+        assert [r.path for r in results] == paths + [missing]
+        for result, signal in zip(results, signals):
+            assert result.error is None
+            assert (result.data.channels() == signal.channels()).all()
+        assert results[-1].data is None
+        assert isinstance(results[-1].error, ValueError)
+        # load the files, as they are completed, with a memory limit, that forces loading them one after another
+        results = list(sumpf.load_many(paths, workers=2, ordered=False, memory_limit=1))
+        assert sorted(r.index for r in results) == list(range(len(signals)))
+        for result in results:
+            assert (result.data.channels() == signals[result.index].channels()).all()
+        # load spectrums
+        spectrums = [s.fourier_transform() for s in signals[0:2]]
+        sumpf.save_many([(s, os.path.join(d, f"spectrum{i}.json"), sumpf.Spectrum.file_formats.TEXT_JSON) for i, s in enumerate(spectrums)])
+        results = list(sumpf.load_many([os.path.join(d, f"spectrum{i}.json") for i in range(2)], kind=sumpf.Spectrum))
+        assert [r.data for r in results] == spectrums